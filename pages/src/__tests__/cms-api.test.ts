@@ -134,4 +134,13 @@ describe('fetchCMSLivePreview', () => {
 
     expect(getMock).toHaveBeenCalledWith('/cms/live-preview/..%2Fpreview%2Fevil/');
   });
+
+  it('asks only for changes after a held revision', async () => {
+    await fetchCMSLivePreview('11111111-1111-1111-1111-111111111111', 42);
+
+    expect(getMock).toHaveBeenCalledWith(
+      '/cms/live-preview/11111111-1111-1111-1111-111111111111/',
+      {params: {since: 42}},
+    );
+  });
 });
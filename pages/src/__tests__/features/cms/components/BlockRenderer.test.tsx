@@ -134,4 +134,26 @@ describe('BlockRenderer', () => {
     expect(images[1]).toHaveAttribute('decoding', 'async');
     expect(images[1]).not.toHaveAttribute('fetchpriority');
   });
+
+  it('offers CMS image renditions through a WebP <source> and a JPEG srcset', () => {
+    const blocks: CMSBlock[] = [
+      {
+        block_type: 'image_text',
+        sort_order: 0,
+        data: {
+          image_url: '/media/cms/assets/a/asset.png',
+          image_srcset: {webp: '/media/a-480w.webp 480w', jpeg: '/media/a-480w.jpeg 480w'},
+          body_html: '',
+        },
+      },
+    ];
+    const {container} = render(<BlockRenderer blocks={blocks} />);
+    const source = container.querySelector('picture > source');
+    expect(source).toHaveAttribute('type', 'image/webp');
+    expect(source).toHaveAttribute('srcset', '/media/a-480w.webp 480w');
+    const image = container.querySelector('picture > img');
+    expect(image).toHaveAttribute('src', '/media/cms/assets/a/asset.png');
+    expect(image).toHaveAttribute('srcset', '/media/a-480w.jpeg 480w');
+    expect(image).toHaveAttribute('sizes');
+  });
 });
@@ -7,6 +7,7 @@ const fetchCMSPage = vi.hoisted(() => vi.fn());
 const fetchCMSPreview = vi.hoisted(() => vi.fn());
 
 vi.mock('@/features/cms/api', () => ({
+  cmsLivePreviewEventsUrl: (pageId: string) => `/api/cms/live-preview/${pageId}/events/`,
   fetchCMSLivePreview,
   fetchCMSHomepage,
   fetchCMSPage,
@@ -72,6 +73,37 @@ describe('useCMSPage live polling', () => {
     expect(fetchCMSLivePreview).toHaveBeenCalledTimes(2);
     unmount();
   });
+
+  it('polls with the held revision and merges the returned delta', async () => {
+    fetchCMSLivePreview
+      .mockResolvedValueOnce({
+        route: '/about',
+        title: 'Draft',
+        rev: 7,
+        blocks: [
+          {block_type: 'rich_text', sort_order: 0, data: {body_html: '<p>one</p>'}},
+          {block_type: 'rich_text', sort_order: 1, data: {body_html: '<p>two</p>'}},
+        ],
+      })
+      .mockResolvedValue({
+        delta: true,
+        rev: 8,
+        since: 7,
+        fields: {title: 'Edited'},
+        blocks: {'1': {block_type: 'rich_text', sort_order: 1, data: {body_html: '<p>2</p>'}}},
+        block_count: 2,
+      });
+
+    const {result, unmount} = renderHook(() => useCMSPage('/about'));
+    await act(async () => {
+      await vi.advanceTimersByTimeAsync(1500);
+    });
+
+    expect(fetchCMSLivePreview).toHaveBeenLastCalledWith('preview-1', 7);
+    expect(result.current.page?.title).toBe('Edited');
+    expect(result.current.page?.blocks.map((block) => block.data.body_html)).toEqual(['<p>one</p>', '<p>2</p>']);
+    unmount();
+  });
 });
 
 describe('useCMSPage redirects', () => {
@@ -0,0 +1,54 @@
+import {afterEach, describe, expect, it} from 'vitest';
+
+import {applyLayoutStylesheet} from '@/features/layout/stylesheet';
+
+const layoutLinks = () =>
+  Array.from(document.head.querySelectorAll<HTMLLinkElement>('link[data-layout-stylesheet]'));
+
+const addFixedLink = () => {
+  const link = document.createElement('link');
+  link.rel = 'stylesheet';
+  link.href = '/api/layout/styles.css?v=6';
+  link.setAttribute('data-layout-stylesheet', '');
+  document.head.appendChild(link);
+  return link;
+};
+
+describe('applyLayoutStylesheet', () => {
+  afterEach(() => {
+    layoutLinks().forEach((link) => link.remove());
+  });
+
+  it('swaps the fixed link for the hashed URL once it loads', () => {
+    const fixed = addFixedLink();
+
+    applyLayoutStylesheet('/layout/stylesheet.0123456789abcdef.css');
+
+    const [, hashed] = layoutLinks();
+    expect(hashed.href).toMatch(/\/api\/layout\/stylesheet\.0123456789abcdef\.css$/);
+    expect(fixed.isConnected).toBe(true);
+
+    hashed.dispatchEvent(new Event('load'));
+
+    expect(layoutLinks()).toEqual([hashed]);
+  });
+
+  it('keeps the current stylesheet when the hashed one fails to load', () => {
+    const fixed = addFixedLink();
+
+    applyLayoutStylesheet('/layout/stylesheet.0123456789abcdef.css');
+    layoutLinks()[1].dispatchEvent(new Event('error'));
+
+    expect(layoutLinks()).toEqual([fixed]);
+  });
+
+  it('does nothing without a URL or when it is already linked', () => {
+    addFixedLink();
+
+    applyLayoutStylesheet(null);
+    applyLayoutStylesheet('/layout/stylesheet.0123456789abcdef.css');
+    applyLayoutStylesheet('/layout/stylesheet.0123456789abcdef.css');
+
+    expect(layoutLinks()).toHaveLength(2);
+  });
+});
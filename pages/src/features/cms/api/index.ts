@@ -233,15 +233,35 @@ export async function fetchCMSPreview(
   return response.data;
 }
 
+/** Fields and blocks changed since the revision a live-preview tab already holds. */
+export interface CMSLivePreviewDelta {
+  delta: true;
+  rev: number;
+  since: number;
+  fields: Partial<Omit<CMSPageResponse, 'blocks'>>;
+  blocks: Record<string, CMSBlock>;
+  block_count: number;
+  expires_at?: string;
+}
+
+export type CMSLivePreviewResponse = (CMSPageResponse & {rev?: number}) | CMSLivePreviewDelta;
+
 export async function fetchCMSLivePreview(
   pageId: string,
-): Promise<CMSPageResponse> {
-  const response = await api.get<CMSPageResponse>(
-    `/cms/live-preview/${encodeURIComponent(pageId)}/`,
-  );
+  since: number | null = null,
+): Promise<CMSLivePreviewResponse> {
+  const url = `/cms/live-preview/${encodeURIComponent(pageId)}/`;
+  const response = since === null
+    ? await api.get<CMSLivePreviewResponse>(url)
+    : await api.get<CMSLivePreviewResponse>(url, {params: {since}});
   return response.data;
 }
 
+export function cmsLivePreviewEventsUrl(pageId: string, since: number | null = null): string {
+  const query = since === null ? '' : `?since=${since}`;
+  return `${api.defaults.baseURL ?? ''}/cms/live-preview/${encodeURIComponent(pageId)}/events/${query}`;
+}
+
 export type CMSEmbedWidgetType = 'blocks' | 'app_route';
 
 export interface CMSEmbedResponse {
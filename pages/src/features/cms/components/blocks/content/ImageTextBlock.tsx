@@ -9,6 +9,8 @@ import software1280 from "@/assets/images/software-engineering-capstone-1280.web
 export interface ImageTextData {
   heading?: string;
   image_url?: string;
+  /** Resized renditions of an uploaded CMS image, as a srcset per format. */
+  image_srcset?: { webp?: string; jpeg?: string };
   image_alt?: string;
   image_position?: "top" | "left" | "right";
   body_html: string;
@@ -46,23 +48,34 @@ export const ImageTextBlock = ({
   priority?: boolean;
 }) => {
   const localImage = data.image_url ? LOCAL_IMAGES[data.image_url] : undefined;
+  const assetSrcSet = localImage ? undefined : data.image_srcset;
+  const sizes =
+    localImage || assetSrcSet ? "(max-width: 768px) 100vw, 1280px" : undefined;
+  const image = data.image_url && (
+    <img
+      src={localImage?.src ?? data.image_url}
+      srcSet={localImage?.srcSet ?? assetSrcSet?.jpeg}
+      sizes={sizes}
+      width={localImage?.width}
+      height={localImage?.height}
+      alt={data.image_alt || ""}
+      className="capstone-hero-image"
+      loading={priority ? "eager" : "lazy"}
+      decoding="async"
+      fetchPriority={priority ? "high" : undefined}
+    />
+  );
   return (
     <section className="cms-image-text">
       {data.heading && <h1 className="section-title">{data.heading}</h1>}
       <div className="capstone-content">
-        {data.image_url && (
-          <img
-            src={localImage?.src ?? data.image_url}
-            srcSet={localImage?.srcSet}
-            sizes={localImage ? "(max-width: 768px) 100vw, 1280px" : undefined}
-            width={localImage?.width}
-            height={localImage?.height}
-            alt={data.image_alt || ""}
-            className="capstone-hero-image"
-            loading={priority ? "eager" : "lazy"}
-            decoding="async"
-            fetchPriority={priority ? "high" : undefined}
-          />
+        {image && assetSrcSet?.webp ? (
+          <picture>
+            <source type="image/webp" srcSet={assetSrcSet.webp} sizes={sizes} />
+            {image}
+          </picture>
+        ) : (
+          image
         )}
         <SafeHtml html={data.body_html} />
       </div>
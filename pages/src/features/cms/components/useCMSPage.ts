@@ -1,6 +1,8 @@
 import { useEffect, useRef, useState } from 'react';
 import {
+  type CMSLivePreviewResponse,
   type CMSPageResponse,
+  cmsLivePreviewEventsUrl,
   fetchCMSLivePreview,
   fetchCMSHomepage,
   fetchCMSPage,
@@ -26,6 +28,20 @@ interface CMSPageState {
 
 const LIVE_PREVIEW_POLL_MS = 1500;
 
+/** Merge a live-preview response into the page already shown; null means a full refetch is needed. */
+function mergeLivePreview(
+  current: CMSPageResponse | null,
+  update: CMSLivePreviewResponse,
+): CMSPageResponse | null {
+  if (!('delta' in update)) return update;
+  if (!current) return null;
+  const blocks = current.blocks.slice(0, update.block_count);
+  for (const [index, block] of Object.entries(update.blocks)) {
+    blocks[Number(index)] = block;
+  }
+  return {...current, ...update.fields, blocks, expires_at: update.expires_at ?? current.expires_at};
+}
+
 export function useCMSPage(route: string, preview = false): UseCMSPageResult {
   const [state, setState] = useState<CMSPageState>({
     route: '',
@@ -90,33 +106,71 @@ export function useCMSPage(route: string, preview = false): UseCMSPageResult {
     };
   }, [route, preview, previewToken, livePreviewId, requestVersion]);
 
-  // Live preview: initial fetch + polling
+  // Live preview: initial fetch, then revision deltas over SSE (or polling with ?since=)
   useEffect(() => {
     if (!livePreviewId) return;
 
     let cancelled = false;
+    let current: CMSPageResponse | null = null;
+    let rev: number | null = null;
+    let events: EventSource | null = null;
+
+    const apply = (update: CMSLivePreviewResponse) => {
+      const next = mergeLivePreview(current, update);
+      if (!next) {
+        rev = null;
+        return;
+      }
+      current = next;
+      rev = update.rev ?? null;
+      setState({ route, page: next, redirectTo: null, error: null });
+    };
 
     const doFetch = async () => {
       try {
-        const data = await fetchCMSLivePreview(livePreviewId);
-        if (!cancelled) {
-          setState({ route, page: data, redirectTo: null, error: null });
-        }
+        const data = await fetchCMSLivePreview(livePreviewId, rev);
+        if (!cancelled) apply(data);
       } catch {
         // Keep showing whatever we already have; don't blank the page on transient errors
       } finally {
         // Schedule only after the current request settles, preventing an older
         // overlapping response from replacing a newer preview revision.
-        if (!cancelled) {
+        if (!cancelled && !events) {
           pollRef.current = setTimeout(doFetch, LIVE_PREVIEW_POLL_MS);
         }
       }
     };
 
-    void doFetch();
+    const subscribe = () => {
+      events = new EventSource(cmsLivePreviewEventsUrl(livePreviewId, rev));
+      events.addEventListener('preview', (event) => {
+        if (!cancelled) apply(JSON.parse((event as MessageEvent<string>).data));
+      });
+      events.onerror = () => {
+        // EventSource retries dropped streams itself; fall back to polling once it gives up.
+        if (events?.readyState === EventSource.CLOSED && !cancelled) {
+          events = null;
+          void doFetch();
+        }
+      };
+    };
+
+    if (typeof EventSource === 'undefined') {
+      void doFetch();
+    } else {
+      fetchCMSLivePreview(livePreviewId)
+        .then((data) => {
+          if (!cancelled) apply(data);
+        })
+        .catch(() => undefined)
+        .finally(() => {
+          if (!cancelled) subscribe();
+        });
+    }
 
     return () => {
       cancelled = true;
+      events?.close();
       if (pollRef.current) clearTimeout(pollRef.current);
     };
   }, [livePreviewId, route]);
@@ -72,6 +72,8 @@ export interface Menu {
 export interface LayoutData {
   menus: Menu[];
   footer: FooterContentResponse | null;
+  /** Content-hashed, immutable URL of the layout stylesheet (relative to the API base). */
+  stylesheet_url?: string | null;
 }
 
 /** Bump when cached JSON shape is incompatible. */
@@ -116,7 +118,7 @@ export function writeLayoutCache(data: LayoutData): void {
   try {
     const payload: StoredLayoutPayload = {
       v: LAYOUT_CACHE_VERSION,
-      data: {menus: data.menus, footer: data.footer},
+      data: {menus: data.menus, footer: data.footer, stylesheet_url: data.stylesheet_url},
     };
     window.sessionStorage.setItem(LAYOUT_CACHE_STORAGE_KEY, JSON.stringify(payload));
   } catch {
@@ -131,7 +133,11 @@ export const fetchLayoutData = async (): Promise<LayoutData> => {
   if (!layoutFetchInFlight) {
     layoutFetchInFlight = api
       .get<LayoutData>('/layout/')
-      .then((response) => ({menus: response.data.menus, footer: response.data.footer}))
+      .then((response) => ({
+        menus: response.data.menus,
+        footer: response.data.footer,
+        stylesheet_url: response.data.stylesheet_url,
+      }))
       .finally(() => {
         layoutFetchInFlight = null;
       });
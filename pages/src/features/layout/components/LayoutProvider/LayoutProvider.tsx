@@ -13,6 +13,7 @@ import {
   writeLayoutCache,
   type LayoutData,
 } from '@/features/layout/api';
+import { applyLayoutStylesheet } from '@/features/layout/stylesheet';
 import { LayoutContext, type LayoutContextValue, type LayoutLoadState } from './context';
 
 interface LayoutProviderProps {
@@ -21,7 +22,8 @@ interface LayoutProviderProps {
 
 // Note: CSS (design tokens + stylesheets) is delivered by the render-blocking
 // <link rel="stylesheet" href="/api/layout/styles.css?v=6"> in index.html.
-// React only handles menus/footer data — it no longer injects CSS into the DOM.
+// Once layout data arrives, that link is swapped for the content-hashed URL the
+// payload names (see applyLayoutStylesheet); React never injects CSS text itself.
 
 function getInitialLayoutFromStorage(): { data: LayoutData | null; state: LayoutLoadState } {
   const cached = readLayoutCache();
@@ -85,6 +87,11 @@ export const LayoutProvider = ({ children }: LayoutProviderProps) => {
     await request;
   });
 
+  const stylesheetUrl = layoutData?.stylesheet_url;
+  useEffect(() => {
+    applyLayoutStylesheet(stylesheetUrl);
+  }, [stylesheetUrl]);
+
   useEffect(() => {
     isUnmountedRef.current = false;
     void loadLayout();
@@ -0,0 +1,32 @@
+import { api } from '@/lib/api';
+
+// index.html links the fixed /api/layout/styles.css for first paint. Once the
+// layout payload names the content-hashed copy, the link is swapped for it:
+// that URL is immutable, so repeat visits load it from the browser cache, and a
+// new hash picks up a stylesheet change without waiting for the fixed URL to expire.
+const LAYOUT_STYLESHEET_SELECTOR = 'link[rel="stylesheet"][data-layout-stylesheet]';
+
+export function applyLayoutStylesheet(stylesheetUrl: string | null | undefined): void {
+  if (!stylesheetUrl || typeof document === 'undefined') {
+    return;
+  }
+  const href = new URL(api.getUri({ url: stylesheetUrl }), document.baseURI).href;
+  const current = Array.from(document.querySelectorAll<HTMLLinkElement>(LAYOUT_STYLESHEET_SELECTOR));
+  if (current.some((link) => link.href === href)) {
+    return;
+  }
+
+  const link = document.createElement('link');
+  link.rel = 'stylesheet';
+  link.href = href;
+  link.setAttribute('data-layout-stylesheet', '');
+  // Keep the old sheet applied until the new one has loaded, so the swap never unstyles the page.
+  link.addEventListener('load', () => current.forEach((old) => old.remove()), { once: true });
+  link.addEventListener('error', () => link.remove(), { once: true });
+  const anchor = current[current.length - 1];
+  if (anchor) {
+    anchor.after(link);
+  } else {
+    document.head.appendChild(link);
+  }
+}
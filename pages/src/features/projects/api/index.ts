@@ -57,6 +57,22 @@ export interface PastProjectArchiveQuery {
     semester?: string;
 }
 
+export interface ProjectFacetCount<T = string> {
+    value: T;
+    count: number;
+}
+
+export interface ProjectFacets {
+    search: string;
+    total: number;
+    facets: {
+        year: ProjectFacetCount<number>[];
+        season: (ProjectFacetCount<1 | 2> & {label: string})[];
+        semester: ProjectFacetCount[];
+        industry: ProjectFacetCount[];
+    };
+}
+
 export interface ProjectGridRow {
     id?: string;
     semester_label: string;
@@ -134,6 +150,8 @@ export interface PastProjectAISearchResponse {
         outputTokens?: number;
         totalTokens?: number;
     };
+    /** True when a repeat query was answered from the server-side result cache. */
+    cached?: boolean;
 }
 
 export const toProjectGridRow = (project: ProjectTableRow): ProjectGridRow => ({
@@ -184,6 +202,14 @@ export const fetchPastProjectArchive = async (
     return response.data;
 };
 
+export const fetchProjectFacets = async (search = '', signal?: AbortSignal): Promise<ProjectFacets> => {
+    const response = await api.get<ProjectFacets>('/projects/facets/', {
+        params: search ? {search} : {},
+        signal,
+    });
+    return response.data;
+};
+
 export const compactProjectToGridRow = (project: CompactPastProjectRow): ProjectGridRow => ({
     id: project.id,
     semester_label: formatSemesterLabel(project.semester_label),
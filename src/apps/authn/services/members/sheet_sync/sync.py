@@ -3,6 +3,8 @@ import logging
 from django.db import transaction
 from django.utils import timezone
 
+from apps.core.services.google_sheets import call_with_backoff
+
 from .logs import record_sync_failure
 from .rows import build_header, build_row
 from .sheets import MemberSyncError
@@ -56,7 +58,7 @@ def _write_members(config) -> list[list[str]]:
     members = list(Member.objects.all().prefetch_related("contact_emails", "contact_phones").order_by("date_joined"))
     rows = [build_row(member) for member in members]
     worksheet = sync_api._get_worksheet(config)
-    worksheet.clear()
-    worksheet.update([build_header()] + rows, value_input_option="USER_ENTERED")
+    call_with_backoff(worksheet.clear)
+    call_with_backoff(worksheet.update, [build_header()] + rows, value_input_option="USER_ENTERED")
     logger.info("Full member sync: %d rows written to sheet.", len(rows))
     return rows
@@ -1,76 +1,76 @@
-"""Dashboard statistics for page-view analytics admin."""
+"""Dashboard statistics for page-view analytics admin.
 
+Figures come from the hourly and daily rollups, so they cover history whose
+raw rows were pruned. Unique visitors are distinct IPs per day, summed.
+"""
+
+from collections import Counter
 from datetime import timedelta
 
-from django.db.models import Count
-from django.db.models.functions import TruncDate, TruncHour
+from django.db.models import Sum
 from django.utils import timezone
 
-from apps.cms.models import PageView
+from apps.cms.models import PageViewDailyRollup, PageViewHourlyRollup
+from apps.cms.models.content.analytics import ALL_PATHS
 
 DASHBOARD_CACHE_KEY = "cms:analytics:dashboard"
 DASHBOARD_CACHE_TTL = 300
 
 
 def compute_dashboard_stats():
-    now = timezone.now()
+    now = timezone.localtime()
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     seven_days_ago = today_start - timedelta(days=6)
 
-    qs = PageView.objects.order_by()
+    site_days = PageViewDailyRollup.objects.filter(path=ALL_PATHS).order_by()
+    path_days = PageViewDailyRollup.objects.exclude(path=ALL_PATHS).order_by()
+    totals = site_days.aggregate(
+        views=Sum("views"),
+        visitors=Sum("unique_visitors"),
+        member_views=Sum("member_views"),
+        anonymous_views=Sum("anonymous_views"),
+    )
     stats = {
-        "total_views": qs.count(),
-        "today_views": qs.filter(timestamp__gte=today_start).count(),
-        "unique_paths": qs.values("path").distinct().count(),
-        "unique_visitors": qs.values("ip_address").distinct().count(),
-        "top_pages": list(qs.values("path").annotate(view_count=Count("id")).order_by("-view_count")[:10]),
+        "total_views": totals["views"] or 0,
+        "today_views": site_days.filter(day=today_start.date()).aggregate(views=Sum("views"))["views"] or 0,
+        "unique_paths": path_days.values("path").distinct().count(),
+        "unique_visitors": totals["visitors"] or 0,
+        "member_views": totals["member_views"] or 0,
+        "anonymous_views": totals["anonymous_views"] or 0,
+        "top_pages": list(path_days.values("path").annotate(view_count=Sum("views")).order_by("-view_count")[:10]),
     }
-    _add_daily_stats(stats, qs, seven_days_ago)
-    _add_hourly_stats(stats, qs, today_start)
-    stats["top_referrers"] = list(
-        qs.exclude(referrer="").values("referrer").annotate(ref_count=Count("id")).order_by("-ref_count")[:10]
-    )
+    _add_daily_stats(stats, site_days, seven_days_ago)
+    _add_hourly_stats(stats, today_start)
+    stats["top_referrers"] = _top_referrers(site_days)
     return stats
 
 
-def _add_daily_stats(stats, qs, seven_days_ago):
-    daily_views = (
-        qs.filter(timestamp__gte=seven_days_ago)
-        .annotate(date=TruncDate("timestamp"))
-        .values("date")
-        .annotate(count=Count("id"))
-        .order_by("date")
-    )
-    daily_map = {entry["date"]: entry["count"] for entry in daily_views}
+def _add_daily_stats(stats, site_days, seven_days_ago):
+    rows = {row.day: row for row in site_days.filter(day__gte=seven_days_ago.date())}
     last_7_days = []
     for i in range(7):
         day = (seven_days_ago + timedelta(days=i)).date()
-        last_7_days.append({"date": day, "count": daily_map.get(day, 0)})
+        last_7_days.append({"date": day, "count": rows[day].views if day in rows else 0})
     stats["last_7_days"] = last_7_days
     stats["max_daily_count"] = max((d["count"] for d in last_7_days), default=1) or 1
 
     week_views = sum(d["count"] for d in last_7_days)
     stats["week_views"] = week_views
     stats["avg_daily_views"] = round(week_views / 7, 1)
+    stats["last_7_days_visitors"] = [rows[d["date"]].unique_visitors if d["date"] in rows else 0 for d in last_7_days]
 
-    daily_visitors = (
-        qs.filter(timestamp__gte=seven_days_ago)
-        .annotate(date=TruncDate("timestamp"))
-        .values("date")
-        .annotate(visitor_count=Count("ip_address", distinct=True))
-        .order_by("date")
-    )
-    visitor_map = {entry["date"]: entry["visitor_count"] for entry in daily_visitors}
-    stats["last_7_days_visitors"] = [visitor_map.get(d["date"], 0) for d in last_7_days]
 
-
-def _add_hourly_stats(stats, qs, today_start):
-    hourly_qs = (
-        qs.filter(timestamp__gte=today_start)
-        .annotate(hour=TruncHour("timestamp"))
-        .values("hour")
-        .annotate(count=Count("id"))
-        .order_by("hour")
-    )
-    hourly_map = {entry["hour"].hour: entry["count"] for entry in hourly_qs}
+def _add_hourly_stats(stats, today_start):
+    hourly_qs = PageViewHourlyRollup.objects.filter(path=ALL_PATHS, hour__gte=today_start).order_by()
+    hourly_map = {timezone.localtime(row.hour).hour: row.views for row in hourly_qs}
     stats["hourly_views"] = [{"hour": h, "count": hourly_map.get(h, 0)} for h in range(24)]
+
+
+def _top_referrers(site_days, limit=10):
+    # Each day keeps its own top referrers, so this merge is exact for any
+    # referrer that made a day's list and a lower bound otherwise.
+    counts = Counter()
+    for top_referrers in site_days.values_list("top_referrers", flat=True):
+        for entry in top_referrers or []:
+            counts[entry["referrer"]] += entry["count"]
+    return [{"referrer": referrer, "ref_count": count} for referrer, count in counts.most_common(limit)]
@@ -264,7 +264,7 @@ class CMSPageAdmin(BaseModelAdmin):
         # per-app access before reading/exporting every page.
         if not self.has_view_permission(request):
             raise PermissionDenied("You do not have permission to export CMS pages.")
-        queryset = CMSPage.objects.prefetch_related("blocks").all()
+        queryset = CMSPage.objects.all()
         status_filter = request.GET.get("status")
         if status_filter in ("draft", "published", "archived"):
             queryset = queryset.filter(status=status_filter)
@@ -2,12 +2,12 @@
 
 import json
 
-from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import transaction
 
 from apps.cms.models import CMSBlock, CMSPage, validate_block_data
 from apps.cms.models.content.cms.block_types import normalize_block_data_for_storage
+from apps.cms.views.cms import clear_cms_page_cache
 
 
 def save_blocks_from_json(request, page, messages):
@@ -39,7 +39,7 @@ def save_blocks_from_json(request, page, messages):
             for block in pending_blocks:
                 block.page = locked_page
             CMSBlock.objects.bulk_create(pending_blocks)
-    transaction.on_commit(lambda: cache.delete(f"cms:page:{page.route}"))
+    transaction.on_commit(lambda: clear_cms_page_cache(page.route))
 
 
 def _build_pending_block(page, index, block_data, messages, request):
@@ -1,30 +1,44 @@
-import json
+import copy
+from collections import deque
+from itertools import islice
 
 from django.contrib import messages
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
-from django.http import HttpResponse
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
 from django.utils import timezone
 
 from apps.cms.models import BLOCK_TYPE_CHOICES, CMSBlock, CMSPage, validate_block_data
 from apps.cms.models.content.cms.block_types import normalize_block_data_for_storage
+from apps.cms.views.cms import clear_cms_page_cache
+from apps.core.utils.json_stream import JSONBundleError, JSONBundleFormatError, iter_json_bundle, stream_json_bundle
+
+# Pages read from the database per export query, and pages written per import transaction.
+EXPORT_CHUNK_SIZE = 100
+IMPORT_BATCH_SIZE = 50
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
 
 def export_pages_response(queryset):
-    content = json.dumps(
-        {
-            "version": 1,
-            "exported_at": timezone.now().isoformat(),
-            "pages": [serialize_page(page) for page in queryset.prefetch_related("blocks")],
-        },
+    """Stream the export one page at a time so a full-site export never sits in memory."""
+    pages = (
+        queryset.prefetch_related(None)
+        .prefetch_related(Prefetch("blocks", queryset=CMSBlock.objects.order_by("sort_order")))
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    content = stream_json_bundle(
+        {"version": 1, "exported_at": timezone.now().isoformat()},
+        "pages",
+        (serialize_page(page) for page in pages),
         indent=2,
         cls=DjangoJSONEncoder,
         ensure_ascii=False,
     )
-    response = HttpResponse(content, content_type="application/json")
+    response = StreamingHttpResponse(content, content_type="application/json")
     response["Content-Disposition"] = (
         f'attachment; filename="cms_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.json"'
     )
@@ -35,20 +49,25 @@ def render_json_import(
     admin_obj, request, *, title, template_name, pages_data=None, require_upload=False, validate_required=False
 ):
     context = {**admin_obj.admin_site.each_context(request), "title": title, "opts": admin_obj.model._meta}
+    action = request.POST.get("action") if request.method == "POST" else None
     if pages_data is None:
         if request.method != "POST":
             return render(request, template_name, context)
-        pages_data = load_uploaded_pages(request, context, template_name)
+        pages_data = load_uploaded_pages(request, context, template_name, check_whole_file=action == "execute")
         if pages_data is None:
             return render(request, template_name, context)
 
-    action = request.POST.get("action") if request.method == "POST" else None
-    results = process_page_data(
-        pages_data,
-        action=action or "dry_run",
-        default_status="published" if not require_upload else "draft",
-        validate_required=validate_required,
-    )
+    try:
+        results = process_page_data(
+            pages_data,
+            action=action or "dry_run",
+            default_status="published" if not require_upload else "draft",
+            validate_required=validate_required,
+        )
+    except JSONBundleError as exc:
+        # A dry run parses the upload while validating it; an executed one was parsed whole first.
+        messages.error(request, f"Invalid JSON file: {exc}")
+        return render(request, template_name, context)
 
     if action == "execute":
         success_count = sum(1 for result in results if result.get("success"))
@@ -62,7 +81,7 @@ def render_json_import(
     context.update(
         {
             "results": results,
-            "total_pages": len(pages_data) if not require_upload else None,
+            "total_pages": len(results) if not require_upload else None,
             "is_dry_run": action != "execute",
             "has_results": action is not None if not require_upload else True,
         }
@@ -70,40 +89,72 @@ def render_json_import(
     return render(request, template_name, context)
 
 
-def load_uploaded_pages(request, context, template_name):
+def load_uploaded_pages(request, context, template_name, *, check_whole_file=False):
+    """Return a lazy iterator over the uploaded pages, or ``None`` after reporting an error.
+
+    With ``check_whole_file`` the upload is first parsed to the end, one page at
+    a time, so a malformed file is rejected before an import writes any batch.
+    """
     json_file = request.FILES.get("json_file")
     if not json_file:
         messages.error(request, "Please select a JSON file to import.")
         return None
     try:
-        bundle = json.loads(json_file.read().decode("utf-8"))
-    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
-        messages.error(request, f"Invalid JSON file: {exc}")
-        return None
-    if not isinstance(bundle, dict) or not isinstance(bundle.get("pages"), list):
+        if check_whole_file:
+            _header, pages = iter_json_bundle(json_file.chunks(UPLOAD_CHUNK_SIZE), "pages")
+            deque(pages, maxlen=0)
+        _header, pages = iter_json_bundle(json_file.chunks(UPLOAD_CHUNK_SIZE), "pages")
+    except JSONBundleFormatError:
         messages.error(request, "Invalid format: expected a JSON object with a 'pages' list.")
         return None
-    return bundle["pages"]
+    except JSONBundleError as exc:
+        messages.error(request, f"Invalid JSON file: {exc}")
+        return None
+    return pages
 
 
 def process_page_data(pages_data, *, action, default_status, validate_required):
+    """Validate (and on ``execute``, write) pages in batches of ``IMPORT_BATCH_SIZE``.
+
+    ``pages_data`` may be a lazy iterator. Each executed batch runs in one
+    transaction with existing pages looked up and locked in one query; a page
+    that fails rolls back to its own savepoint without aborting the batch.
+    """
     block_type_keys = {choice[0] for choice in BLOCK_TYPE_CHOICES}
+    execute = action == "execute"
+    pages_data = iter(pages_data)
+    results = []
+    while batch := list(islice(pages_data, IMPORT_BATCH_SIZE)):
+        if execute:
+            with transaction.atomic():
+                results.extend(_process_batch(batch, block_type_keys, default_status, validate_required, execute))
+        else:
+            results.extend(_process_batch(batch, block_type_keys, default_status, validate_required, execute))
+    return results
+
+
+def _process_batch(batch, block_type_keys, default_status, validate_required, execute):
+    slugs = {page_data.get("slug") for page_data in batch if page_data.get("slug")}
+    existing_pages = CMSPage.objects.filter(slug__in=slugs)
+    if execute:
+        existing_pages = existing_pages.select_for_update()
+    existing_by_slug = {page.slug: page for page in existing_pages}
+
     results = []
-    for page_data in pages_data:
+    for page_data in batch:
         result, blocks_data, existing = validate_page_data(
             page_data,
             block_type_keys,
             validate_required,
             default_status=default_status,
+            existing_by_slug=existing_by_slug,
         )
-        if not result["errors"] and action == "execute":
+        if not result["errors"] and execute:
             try:
                 with transaction.atomic():
-                    if existing is not None:
-                        existing = CMSPage.objects.select_for_update().get(pk=existing.pk)
-                        list(CMSBlock.objects.select_for_update().filter(page=existing))
                     page = upsert_page(page_data, existing, default_status)
                     replace_page_blocks(page, blocks_data)
+                existing_by_slug[page.slug] = page
                 result["success"] = True
             except Exception as exc:  # noqa: BLE001
                 result["errors"].append(str(exc))
@@ -111,7 +162,7 @@ def process_page_data(pages_data, *, action, default_status, validate_required):
     return results
 
 
-def validate_page_data(page_data, block_type_keys, validate_required, default_status="draft"):
+def validate_page_data(page_data, block_type_keys, validate_required, default_status="draft", existing_by_slug=None):
     slug = page_data.get("slug", "")
     title = page_data.get("title", "")
     route = page_data.get("route", "")
@@ -132,10 +183,13 @@ def validate_page_data(page_data, block_type_keys, validate_required, default_st
             validate_block_data(block_type, block_data.get("data", {}))
         except Exception as exc:  # noqa: BLE001
             result["errors"].append(f"Block #{index + 1} ({block_type}): {exc}")
-    existing = CMSPage.objects.filter(slug=slug).first() if slug else None
+    if existing_by_slug is not None:
+        existing = existing_by_slug.get(slug) if slug else None
+    else:
+        existing = CMSPage.objects.filter(slug=slug).first() if slug else None
     result["action"] = "update" if existing else "create"
     if slug and route and title:
-        candidate = CMSPage.objects.get(pk=existing.pk) if existing else CMSPage()
+        candidate = copy.copy(existing) if existing else CMSPage()
         for field, value in _page_payload(page_data, default_status).items():
             setattr(candidate, field, value)
         try:
@@ -171,7 +225,6 @@ def upsert_page(page_data, existing, default_status):
             setattr(existing, key, value)
         existing.full_clean()
         existing.save()
-        existing.blocks.all().delete()
         return existing
     page = CMSPage(**payload)
     page.full_clean()
@@ -180,16 +233,19 @@ def upsert_page(page_data, existing, default_status):
 
 
 def replace_page_blocks(page, blocks_data):
-    for index, block_data in enumerate(blocks_data):
-        block_type = block_data.get("block_type")
-        CMSBlock.objects.create(
+    """Replace ``page``'s blocks with one delete and one insert."""
+    CMSBlock.objects.filter(page=page).delete()
+    CMSBlock.objects.bulk_create(
+        CMSBlock(
             page=page,
-            block_type=block_type,
+            block_type=block_data.get("block_type"),
             sort_order=block_data.get("sort_order", index),
             admin_label=block_data.get("admin_label", ""),
-            data=normalize_block_data_for_storage(block_type, block_data.get("data", {})),
+            data=normalize_block_data_for_storage(block_data.get("block_type"), block_data.get("data", {})),
         )
-    transaction.on_commit(lambda route=page.route: cache.delete(f"cms:page:{route}"))
+        for index, block_data in enumerate(blocks_data)
+    )
+    transaction.on_commit(lambda route=page.route: clear_cms_page_cache(route))
 
 
 def serialize_page(page):
@@ -208,6 +264,6 @@ def serialize_page(page):
                 "admin_label": block.admin_label,
                 "data": block.data,
             }
-            for block in page.blocks.all().order_by("sort_order")
+            for block in page.blocks.all()
         ],
     }
@@ -1,24 +1,21 @@
 """Stylesheet export helpers."""
 
-import json
-
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 
 import apps.cms.admin.layout.import_export as import_export_api
+from apps.core.utils.json_stream import stream_json_bundle
 
 
 def export_stylesheets_response(queryset):
-    content = json.dumps(
-        {
-            "version": import_export_api.STYLESHEET_BUNDLE_VERSION,
-            "exported_at": timezone.now().isoformat(),
-            "stylesheets": [serialize_stylesheet(sheet) for sheet in queryset.order_by("sort_order", "name")],
-        },
+    content = stream_json_bundle(
+        {"version": import_export_api.STYLESHEET_BUNDLE_VERSION, "exported_at": timezone.now().isoformat()},
+        "stylesheets",
+        (serialize_stylesheet(sheet) for sheet in queryset.order_by("sort_order", "name").iterator()),
         indent=2,
         ensure_ascii=False,
     )
-    response = HttpResponse(content, content_type="application/json")
+    response = StreamingHttpResponse(content, content_type="application/json")
     response["Content-Disposition"] = (
         f'attachment; filename="stylesheets_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.json"'
     )
@@ -1,31 +1,38 @@
 """Stylesheet import persistence helpers."""
 
-from django.core.cache import cache
 from django.db import transaction
 
 from apps.cms.models import StyleSheet
-from apps.cms.views.layout import LAYOUT_CACHE_KEY, LAYOUT_STYLESHEET_CACHE_KEY
+from apps.cms.services.cache_warming import schedule_cache_warm
+from apps.cms.views.layout import clear_layout_caches
+
+_UPDATE_FIELDS = ("display_name", "description", "css", "is_active", "sort_order")
 
 
 def sync_stylesheets(normalized_rows):
+    """Apply the import with one insert, one update and one delete."""
     import_names = [row["name"] for row in normalized_rows]
 
     with transaction.atomic():
-        existing_by_name = {sheet.name: sheet for sheet in StyleSheet.objects.filter(name__in=import_names)}
+        existing_by_name = {
+            sheet.name: sheet for sheet in StyleSheet.objects.select_for_update().filter(name__in=import_names)
+        }
+        created, updated = [], []
         for row in normalized_rows:
             stylesheet = existing_by_name.get(row["name"])
             if stylesheet is None:
-                StyleSheet.objects.create(**row)
+                created.append(StyleSheet(**row))
                 continue
-
             for field, value in row.items():
                 setattr(stylesheet, field, value)
-            stylesheet.save()
+            updated.append(stylesheet)
 
+        StyleSheet.objects.bulk_create(created)
+        StyleSheet.objects.bulk_update(updated, _UPDATE_FIELDS)
         StyleSheet.objects.exclude(name__in=import_names).delete()
-        transaction.on_commit(clear_layout_caches)
+        transaction.on_commit(_clear_and_warm)
 
 
-def clear_layout_caches():
-    cache.delete(LAYOUT_CACHE_KEY)
-    cache.delete(LAYOUT_STYLESHEET_CACHE_KEY)
+def _clear_and_warm():
+    clear_layout_caches()
+    schedule_cache_warm(layout=True)
@@ -1,13 +1,15 @@
 """Stylesheet import admin view helpers."""
 
-import json
-
 from django.contrib import messages
 from django.shortcuts import render
 
+from apps.core.utils.json_stream import JSONBundleError, JSONBundleFormatError, iter_json_bundle
+
 from .persistence import sync_stylesheets
 from .preview import mark_results_executed, preview_stylesheet_import
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 def render_stylesheet_import(admin_obj, request, *, title, template_name):
     context = {**admin_obj.admin_site.each_context(request), "title": title, "opts": admin_obj.model._meta}
@@ -19,7 +21,11 @@ def render_stylesheet_import(admin_obj, request, *, title, template_name):
         return render(request, template_name, context)
 
     action = request.POST.get("action") or "dry_run"
-    results, normalized_rows, has_errors = preview_stylesheet_import(stylesheets_data)
+    try:
+        results, normalized_rows, has_errors = preview_stylesheet_import(stylesheets_data)
+    except JSONBundleError as exc:
+        messages.error(request, f"Invalid JSON file: {exc}")
+        return render(request, template_name, context)
 
     if action == "execute":
         if has_errors:
@@ -43,11 +49,11 @@ def load_uploaded_stylesheets(request):
         messages.error(request, "Please select a JSON file to import.")
         return None
     try:
-        bundle = json.loads(json_file.read().decode("utf-8"))
-    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
-        messages.error(request, f"Invalid JSON file: {exc}")
-        return None
-    if not isinstance(bundle, dict) or not isinstance(bundle.get("stylesheets"), list):
+        _header, stylesheets = iter_json_bundle(json_file.chunks(UPLOAD_CHUNK_SIZE), "stylesheets")
+    except JSONBundleFormatError:
         messages.error(request, "Invalid format: expected a JSON object with a 'stylesheets' list.")
         return None
-    return bundle["stylesheets"]
+    except JSONBundleError as exc:
+        messages.error(request, f"Invalid JSON file: {exc}")
+        return None
+    return stylesheets
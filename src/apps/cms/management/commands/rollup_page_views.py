@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+
+from apps.cms.services.analytics import (
+    flush_sync,
+    prune_raw_page_views,
+    refresh_page_view_rollups,
+    repair_page_view_rollups,
+)
+from apps.cms.services.analytics.rollups import REPAIR_DAYS, raw_retention_days
+
+
+class Command(BaseCommand):
+    help = "Refresh recent page-view rollups and prune raw page views past the retention window."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=REPAIR_DAYS,
+            help=f"Recompute rollups for this many recent days (default: {REPAIR_DAYS}).",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute rollups for every raw page view still stored.",
+        )
+        parser.add_argument(
+            "--no-prune",
+            action="store_true",
+            help="Only refresh rollups; keep raw rows past the retention window.",
+        )
+
+    def handle(self, *args, **options):
+        flush_sync()
+        if options["all"]:
+            refreshed = refresh_page_view_rollups()
+        else:
+            refreshed = repair_page_view_rollups(days=options["days"], prune=False)
+        self.stdout.write(f"Refreshed {refreshed['hourly']} hourly and {refreshed['daily']} daily rollup row(s).")
+
+        if options["no_prune"]:
+            return
+        retention_days = raw_retention_days()
+        if not retention_days:
+            self.stdout.write("Raw retention is set to 0 (keep forever); nothing to prune.")
+            return
+        deleted = prune_raw_page_views(retention_days=retention_days)
+        self.stdout.write(self.style.SUCCESS(f"Removed {deleted} raw page view(s) older than {retention_days} day(s)."))
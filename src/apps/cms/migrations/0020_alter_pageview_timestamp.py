@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-19
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cms", "0019_route_redirect"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pageview",
+            name="timestamp",
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.10 on 2026-10-19
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cms", "0020_alter_pageview_timestamp"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PageViewDailyRollup",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("path", models.CharField(max_length=2048)),
+                ("views", models.PositiveIntegerField(default=0)),
+                ("unique_sessions", models.PositiveIntegerField(default=0)),
+                ("unique_visitors", models.PositiveIntegerField(default=0, help_text="Distinct IP addresses.")),
+                ("member_views", models.PositiveIntegerField(default=0)),
+                ("anonymous_views", models.PositiveIntegerField(default=0)),
+                (
+                    "top_referrers",
+                    models.JSONField(blank=True, default=list, help_text="[{referrer, count}], most frequent first."),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("day", models.DateField(help_text="Calendar day in the site time zone.")),
+            ],
+            options={
+                "verbose_name": "Page View Daily Rollup",
+                "verbose_name_plural": "Page View Daily Rollups",
+                "db_table": "analytics_pageview_daily",
+                "ordering": ["-day", "path"],
+                "indexes": [models.Index(fields=["day"], name="analytics_pv_daily_day_idx")],
+                "constraints": [
+                    models.UniqueConstraint(fields=("path", "day"), name="analytics_pageview_daily_path_day")
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="PageViewHourlyRollup",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("path", models.CharField(max_length=2048)),
+                ("views", models.PositiveIntegerField(default=0)),
+                ("unique_sessions", models.PositiveIntegerField(default=0)),
+                ("unique_visitors", models.PositiveIntegerField(default=0, help_text="Distinct IP addresses.")),
+                ("member_views", models.PositiveIntegerField(default=0)),
+                ("anonymous_views", models.PositiveIntegerField(default=0)),
+                (
+                    "top_referrers",
+                    models.JSONField(blank=True, default=list, help_text="[{referrer, count}], most frequent first."),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("hour", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name": "Page View Hourly Rollup",
+                "verbose_name_plural": "Page View Hourly Rollups",
+                "db_table": "analytics_pageview_hourly",
+                "ordering": ["-hour", "path"],
+                "indexes": [models.Index(fields=["hour"], name="analytics_pv_hourly_hour_idx")],
+                "constraints": [
+                    models.UniqueConstraint(fields=("path", "hour"), name="analytics_pageview_hourly_path_hour")
+                ],
+            },
+        ),
+    ]
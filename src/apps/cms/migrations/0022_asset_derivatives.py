@@ -0,0 +1,49 @@
+# Generated by Django 5.2.17 on 2026-10-19
+
+import apps.cms.models.media
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cms", "0021_page_view_rollups"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CMSAssetDerivative",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True, db_index=True)),
+                (
+                    "source_name",
+                    models.CharField(help_text="Asset file the rendition was generated from.", max_length=255),
+                ),
+                ("width", models.PositiveIntegerField()),
+                ("height", models.PositiveIntegerField()),
+                ("format", models.CharField(choices=[("webp", "WebP"), ("jpeg", "JPEG")], max_length=8)),
+                ("file", models.FileField(max_length=255, upload_to=apps.cms.models.media.derivative_upload_path)),
+                ("content_hash", models.CharField(max_length=64)),
+                (
+                    "asset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="derivatives", to="cms.cmsasset"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "CMS Asset Derivative",
+                "verbose_name_plural": "CMS Asset Derivatives",
+                "db_table": "cms_cmsassetderivative",
+                "ordering": ["asset", "format", "width"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("asset", "format", "width"), name="cms_asset_derivative_unique_size"
+                    )
+                ],
+            },
+        ),
+    ]
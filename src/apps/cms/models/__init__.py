@@ -18,12 +18,14 @@ from .content import (
     NewsFeedSource,
     NewsSyncLog,
     PageView,
+    PageViewDailyRollup,
+    PageViewHourlyRollup,
     RouteRedirect,
     SiteSettings,
     StyleSheet,
     validate_block_data,
 )
-from .media import CMSAsset
+from .media import CMSAsset, CMSAssetDerivative
 
 __all__ = [
     # Layout
@@ -38,6 +40,7 @@ __all__ = [
     "CMSEmbedWidget",
     "CMSEmbedAllowedHost",
     "CMSAsset",
+    "CMSAssetDerivative",
     "BLOCK_TYPE_CHOICES",
     "BLOCK_TYPE_KEYS",
     "BLOCK_SCHEMAS",
@@ -48,4 +51,6 @@ __all__ = [
     "NewsSyncLog",
     # Analytics
     "PageView",
+    "PageViewDailyRollup",
+    "PageViewHourlyRollup",
 ]
@@ -1,4 +1,4 @@
-from .analytics import PageView
+from .analytics import PageView, PageViewDailyRollup, PageViewHourlyRollup
 from .cms import (
     BLOCK_SCHEMAS,
     BLOCK_TYPE_CHOICES,
@@ -35,4 +35,6 @@ __all__ = [
     "NewsSyncLog",
     # Analytics
     "PageView",
+    "PageViewDailyRollup",
+    "PageViewHourlyRollup",
 ]
@@ -1,3 +1,4 @@
 from .page_view import PageView
+from .rollups import ALL_PATHS, PageViewDailyRollup, PageViewHourlyRollup
 
-__all__ = ["PageView"]
+__all__ = ["ALL_PATHS", "PageView", "PageViewDailyRollup", "PageViewHourlyRollup"]
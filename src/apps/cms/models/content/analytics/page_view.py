@@ -2,6 +2,7 @@ import uuid
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class PageView(models.Model):
@@ -25,7 +26,8 @@ class PageView(models.Model):
         related_name="page_views",
     )
     session_key = models.CharField(max_length=64, blank=True, default="", db_index=True)
-    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Set when the view is queued, not when the ingestion drain inserts it.
+    timestamp = models.DateTimeField(default=timezone.now, db_index=True)
 
     class Meta:
         db_table = "analytics_pageview"
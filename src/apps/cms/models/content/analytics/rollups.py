@@ -0,0 +1,67 @@
+import uuid
+
+from django.db import models
+
+# Rollup rows with this path aggregate every path in the bucket. Distinct
+# counts (sessions, visitors) cannot be summed across paths, so site-wide
+# figures are stored rather than derived.
+ALL_PATHS = "*"
+
+
+class PageViewRollupBase(models.Model):
+    """Counts shared by the hourly and daily page-view rollups.
+
+    Rollups are rebuilt from raw ``PageView`` rows (a drain only rescans the
+    hours it touched), so they outlive the raw rows pruned by the retention policy.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    path = models.CharField(max_length=2048)
+    views = models.PositiveIntegerField(default=0)
+    unique_sessions = models.PositiveIntegerField(default=0)
+    unique_visitors = models.PositiveIntegerField(default=0, help_text="Distinct IP addresses.")
+    member_views = models.PositiveIntegerField(default=0)
+    anonymous_views = models.PositiveIntegerField(default=0)
+    top_referrers = models.JSONField(default=list, blank=True, help_text="[{referrer, count}], most frequent first.")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
+class PageViewHourlyRollup(PageViewRollupBase):
+    hour = models.DateTimeField()
+
+    class Meta:
+        db_table = "analytics_pageview_hourly"
+        ordering = ["-hour", "path"]
+        verbose_name = "Page View Hourly Rollup"
+        verbose_name_plural = "Page View Hourly Rollups"
+        constraints = [
+            models.UniqueConstraint(fields=["path", "hour"], name="analytics_pageview_hourly_path_hour"),
+        ]
+        indexes = [
+            models.Index(fields=["hour"], name="analytics_pv_hourly_hour_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.path} @ {self.hour:%Y-%m-%d %H:00}"
+
+
+class PageViewDailyRollup(PageViewRollupBase):
+    day = models.DateField(help_text="Calendar day in the site time zone.")
+
+    class Meta:
+        db_table = "analytics_pageview_daily"
+        ordering = ["-day", "path"]
+        verbose_name = "Page View Daily Rollup"
+        verbose_name_plural = "Page View Daily Rollups"
+        constraints = [
+            models.UniqueConstraint(fields=["path", "day"], name="analytics_pageview_daily_path_day"),
+        ]
+        indexes = [
+            models.Index(fields=["day"], name="analytics_pv_daily_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.path} @ {self.day}"
@@ -1,6 +1,6 @@
 """Media models and helpers for CMS-managed assets."""
 
-import io
+import codecs
 import os
 import re
 import zipfile
@@ -16,6 +16,12 @@ DOCUMENT_ASSET_EXTENSIONS = ["pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx",
 ALLOWED_ASSET_EXTENSIONS = [*IMAGE_ASSET_EXTENSIONS, *DOCUMENT_ASSET_EXTENSIONS]
 MAX_ASSET_UPLOAD_BYTES = 20 * 1024 * 1024
 
+# Content checks read uploads in chunks of this size, so validating one upload
+# holds roughly one chunk in memory however large the file is.
+_SCAN_CHUNK_BYTES = 64 * 1024
+# Enough bytes for every magic-byte signature below (WebP needs 12).
+_MAGIC_HEADER_BYTES = 16
+
 # Magic-byte signatures for allowed file types
 _OFFICE_OOXML_ROOTS = {
     "docx": "word/",
@@ -23,7 +29,13 @@ _OFFICE_OOXML_ROOTS = {
     "pptx": "ppt/",
 }
 _OLE_COMPOUND_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_UTF8_BOM = b"\xef\xbb\xbf"
+_SVG_PREFIX_BYTES = 512
+_SVG_UNSAFE_MARKERS = (b"<script", b"javascript:")
+_SVG_MARKER_OVERLAP = max(len(marker) for marker in _SVG_UNSAFE_MARKERS) - 1
 _SVG_EVENT_HANDLER_RE = re.compile(rb"(?<![a-zA-Z0-9_-])on[a-z0-9_-]+\s*=", re.IGNORECASE)
+# An event-handler attribute that may still be completed by the next chunk.
+_SVG_EVENT_HANDLER_TAIL_RE = re.compile(rb"(?<![a-zA-Z0-9_-])o(?:n(?:[a-z0-9_-]+(\s*))?)?\Z", re.IGNORECASE)
 
 
 def _asset_extension(file):
@@ -31,16 +43,14 @@ def _asset_extension(file):
     return ext.lstrip(".").lower()
 
 
-def _read_file(file):
+def _iter_chunks(file):
+    """Yield the upload from its start in ``_SCAN_CHUNK_BYTES`` pieces; callers rewind it afterwards."""
     file.seek(0)
-    try:
-        content = file.read()
-    finally:
-        file.seek(0)
-    return content.encode() if isinstance(content, str) else content
+    while chunk := file.read(_SCAN_CHUNK_BYTES):
+        yield chunk.encode() if isinstance(chunk, str) else chunk
 
 
-def _read_header(file, size=8192):
+def _read_header(file, size=_MAGIC_HEADER_BYTES):
     file.seek(0)
     try:
         header = file.read(size)
@@ -91,25 +101,81 @@ def validate_asset_file_type(file):
 
 
 def _validate_svg_asset(file):
-    content = _read_file(file)
-    stripped = content.lstrip()
-    if stripped.startswith(b"\xef\xbb\xbf"):
-        stripped = stripped[3:].lstrip()
-    if not stripped.startswith((b"<?xml", b"<svg")) and b"<svg" not in stripped[:512].lower():
-        raise ValidationError("SVG file content is invalid.")
+    try:
+        prefix = _svg_prefix(_iter_chunks(file))
+        if not prefix.startswith((b"<?xml", b"<svg")) and b"<svg" not in prefix.lower():
+            raise ValidationError("SVG file content is invalid.")
+        if _svg_has_active_content(_iter_chunks(file)):
+            raise ValidationError("SVG contains scripts or inline event handlers and was rejected as unsafe.")
+    finally:
+        file.seek(0)
+
 
-    lowered = content.lower()
-    if b"<script" in lowered or b"javascript:" in lowered or _SVG_EVENT_HANDLER_RE.search(content):
-        raise ValidationError("SVG contains scripts or inline event handlers and was rejected as unsafe.")
+def _svg_prefix(chunks):
+    """Return the first bytes after leading whitespace and an optional UTF-8 BOM (itself followed by whitespace)."""
+    head = b""
+    stage = "leading"
+    for chunk in chunks:
+        head += chunk
+        if stage == "leading":
+            head = head.lstrip()
+            if len(head) < len(_UTF8_BOM) and _UTF8_BOM.startswith(head):
+                continue  # Empty so far, or a BOM split across chunks.
+            if head.startswith(_UTF8_BOM):
+                head = head[len(_UTF8_BOM) :]
+                stage = "after_bom"
+            else:
+                stage = "content"
+        if stage == "after_bom":
+            head = head.lstrip()
+            if head:
+                stage = "content"
+        if len(head) >= _SVG_PREFIX_BYTES:
+            break
+    return head[:_SVG_PREFIX_BYTES]
+
+
+def _svg_has_active_content(chunks):
+    """Scan for scripts, ``javascript:`` URLs and ``on*=`` handlers, including ones split across chunks.
+
+    Each chunk is searched together with a short carry from the previous one:
+    the last bytes that could begin a marker, and any trailing ``on<name><space>``
+    run that a later chunk could finish with ``=``. That run is kept as ``onx``
+    (plus one space if it had whitespace), which matches exactly like the
+    original however long it is. The byte before the carry is kept as
+    look-behind context only; searches start after it.
+    """
+    marker_tail = b""
+    context, run = b"", b""
+    for chunk in chunks:
+        lowered = marker_tail + chunk.lower()
+        if any(marker in lowered for marker in _SVG_UNSAFE_MARKERS):
+            return True
+        marker_tail = lowered[-_SVG_MARKER_OVERLAP:]
+
+        window = context + run + chunk
+        if _SVG_EVENT_HANDLER_RE.search(window, len(context)):
+            return True
+        partial = _SVG_EVENT_HANDLER_TAIL_RE.search(window, len(context))
+        if partial is None:
+            context, run = window[-1:], b""
+            continue
+        start = partial.start()
+        context, run = window[max(start - 1, 0) : start], window[start:]
+        if partial.group(1) is not None:
+            run = b"onx " if partial.group(1) else b"onx"
+    return False
 
 
 def _validate_ooxml_asset(file, ext):
-    content = _read_file(file)
+    # ZipFile seeks to the central directory and reads only the member names.
     try:
-        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        with zipfile.ZipFile(file) as archive:
             names = set(archive.namelist())
     except zipfile.BadZipFile as exc:
         raise ValidationError(f"{ext.upper()} file content is invalid.") from exc
+    finally:
+        file.seek(0)
 
     root = _OFFICE_OOXML_ROOTS[ext]
     if "[Content_Types].xml" not in names or not any(name.startswith(root) for name in names):
@@ -117,13 +183,26 @@ def _validate_ooxml_asset(file, ext):
 
 
 def _validate_text_asset(file):
-    content = _read_file(file)
-    if b"\x00" in content:
-        raise ValidationError("Text asset contains binary data.")
+    # A leading BOM is itself valid UTF-8, so plain UTF-8 accepts exactly what "utf-8-sig" does.
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    decode_error = None
     try:
-        content.decode("utf-8-sig")
+        for chunk in _iter_chunks(file):
+            if b"\x00" in chunk:
+                raise ValidationError("Text asset contains binary data.")
+            if decode_error is None:
+                try:
+                    decoder.decode(chunk)
+                except UnicodeDecodeError as exc:
+                    decode_error = exc  # Keep reading: binary data anywhere takes precedence.
+        if decode_error is None:
+            decoder.decode(b"", final=True)
     except UnicodeDecodeError as exc:
-        raise ValidationError("Text assets must be UTF-8 encoded.") from exc
+        decode_error = exc
+    finally:
+        file.seek(0)
+    if decode_error is not None:
+        raise ValidationError("Text assets must be UTF-8 encoded.") from decode_error
 
 
 def asset_upload_path(instance, filename):
@@ -160,3 +239,34 @@ class CMSAsset(ProjectControlModel):
         if not self.file:
             return ""
         return self.file.url
+
+
+def derivative_upload_path(instance, filename):
+    """Store derivatives in the same folder as their source asset."""
+    return os.path.join(os.path.dirname(instance.asset.file.name), filename)
+
+
+class CMSAssetDerivative(ProjectControlModel):
+    """A resized WebP/JPEG rendition of an image asset, served through ``srcset``."""
+
+    FORMAT_CHOICES = [("webp", "WebP"), ("jpeg", "JPEG")]
+
+    asset = models.ForeignKey(CMSAsset, on_delete=models.CASCADE, related_name="derivatives")
+    source_name = models.CharField(max_length=255, help_text="Asset file the rendition was generated from.")
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    format = models.CharField(max_length=8, choices=FORMAT_CHOICES)
+    file = models.FileField(upload_to=derivative_upload_path, max_length=255)
+    content_hash = models.CharField(max_length=64)
+
+    class Meta:
+        db_table = "cms_cmsassetderivative"
+        ordering = ["asset", "format", "width"]
+        verbose_name = "CMS Asset Derivative"
+        verbose_name_plural = "CMS Asset Derivatives"
+        constraints = [
+            models.UniqueConstraint(fields=["asset", "format", "width"], name="cms_asset_derivative_unique_size"),
+        ]
+
+    def __str__(self):
+        return f"{self.asset} ({self.width}w {self.format})"
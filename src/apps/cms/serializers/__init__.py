@@ -1,5 +1,5 @@
 from .analytics import PageViewCreateSerializer
-from .cms import CMSBlockSerializer, CMSPageSerializer
+from .cms import CMSBlockSerializer, CMSPageSerializer, serialize_blocks
 from .layout import FooterContentSerializer, MenuSerializer
 from .news import NewsArticleDetailSerializer, NewsArticleSerializer
 
@@ -8,6 +8,7 @@ __all__ = [
     "FooterContentSerializer",
     "CMSBlockSerializer",
     "CMSPageSerializer",
+    "serialize_blocks",
     "NewsArticleSerializer",
     "NewsArticleDetailSerializer",
     "PageViewCreateSerializer",
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from apps.cms.models import CMSBlock, CMSPage
+from apps.cms.services.media import add_image_srcsets, image_srcsets_for
 from apps.cms.services.sanitization.sanitize import sanitize_html
 
 
@@ -16,7 +17,20 @@ def _sanitize_block_data(data):
     return data
 
 
+def serialize_blocks(blocks):
+    """Serialize ``blocks`` with the image ``srcset`` maps resolved in one query for all of them."""
+    blocks = list(blocks)
+    srcsets = image_srcsets_for(block.data for block in blocks)
+    return CMSBlockSerializer(blocks, many=True, context={"image_srcsets": srcsets}).data
+
+
 class CMSBlockSerializer(serializers.ModelSerializer):
+    """Block payload with sanitized HTML and, beside each CMS image URL, its ``srcset`` map.
+
+    Pass ``image_srcsets`` in the context (see :func:`serialize_blocks`) when
+    serializing many blocks; otherwise each block looks up its own images.
+    """
+
     class Meta:
         model = CMSBlock
         fields = ["block_type", "sort_order", "data"]
@@ -24,7 +38,10 @@ class CMSBlockSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         data = super().to_representation(instance)
         if data.get("data"):
-            data["data"] = _sanitize_block_data(data["data"])
+            srcsets = self.context.get("image_srcsets")
+            if srcsets is None:
+                srcsets = image_srcsets_for([instance.data])
+            data["data"] = add_image_srcsets(_sanitize_block_data(data["data"]), srcsets)
         return data
 
 
@@ -40,5 +57,4 @@ class CMSPageSerializer(serializers.ModelSerializer):
         # CMSBlock.Meta.ordering is ["sort_order"], so .all() preserves order while
         # reusing the view's prefetch_related("blocks") cache; an explicit .order_by()
         # would re-query and defeat the prefetch.
-        blocks = obj.blocks.all()
-        return CMSBlockSerializer(blocks, many=True).data
+        return serialize_blocks(obj.blocks.all())
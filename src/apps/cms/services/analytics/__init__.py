@@ -1,3 +1,34 @@
-from .buffer import enqueue, flush_sync
+from .backends import (
+    MemoryStreamBackend,
+    PageViewIngestBackend,
+    RedisStreamBackend,
+    SpoolFileBackend,
+    get_ingest_backend,
+    set_ingest_backend,
+)
+from .buffer import drain_page_views, enqueue, flush_sync, ingestion_metrics
+from .rollups import (
+    prune_raw_page_views,
+    refresh_drained_rollups,
+    refresh_page_view_rollups,
+    repair_page_view_rollups,
+    rollup_queryset,
+)
 
-__all__ = ["enqueue", "flush_sync"]
+__all__ = [
+    "MemoryStreamBackend",
+    "PageViewIngestBackend",
+    "RedisStreamBackend",
+    "SpoolFileBackend",
+    "drain_page_views",
+    "enqueue",
+    "flush_sync",
+    "get_ingest_backend",
+    "ingestion_metrics",
+    "prune_raw_page_views",
+    "refresh_drained_rollups",
+    "refresh_page_view_rollups",
+    "repair_page_view_rollups",
+    "rollup_queryset",
+    "set_ingest_backend",
+]
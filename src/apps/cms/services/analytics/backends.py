@@ -0,0 +1,488 @@
+"""Pluggable ingestion backends for page-view analytics.
+
+Every backend is a bounded, at-least-once queue of JSON-serializable page-view
+records shared by every process that can reach it:
+
+* :class:`RedisStreamBackend` — a Redis stream read through a consumer group.
+  Any process (web or durable worker) can append and drain.
+* :class:`SpoolFileBackend` — an append-only NDJSON spool file shared by the web
+  processes of one host. Segments are rotated out atomically for draining.
+* :class:`MemoryStreamBackend` — a process-local stand-in with the same
+  read/ack/redelivery semantics as the Redis stream. Local development and
+  tests only.
+
+A drainer calls :meth:`read_batch`, inserts the records, then :meth:`ack`\\ s the
+receipts. Records that are read but never acknowledged (the drainer crashed
+or the insert failed) are delivered again, so a SIGKILL loses nothing that
+was already appended.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import IO, Any, NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+MAX_PENDING_RECORDS = 100_000
+_CLAIM_IDLE_SECONDS = 60
+_STATS_KEY_PREFIX = "analytics:pageview-ingest"
+
+
+class PageViewIngestBackend:
+    """Interface shared by every ingestion backend."""
+
+    name = ""
+
+    def append(self, record: dict[str, Any]) -> bool:
+        """Queue one record; return ``False`` (and count a drop) when full."""
+        raise NotImplementedError
+
+    def read_batch(self, limit: int) -> tuple[list[Any], list[dict[str, Any] | None]]:
+        """Return ``(receipts, records)`` for up to ``limit`` undelivered records.
+
+        A ``None`` record marks an entry that could not be decoded; it is still
+        acknowledged with its receipt so it is not redelivered forever.
+        """
+        raise NotImplementedError
+
+    def ack(self, receipts: list[Any]) -> None:
+        """Permanently remove delivered records."""
+        raise NotImplementedError
+
+    def release(self, receipts: list[Any]) -> None:
+        """Hand delivered-but-unprocessed records back for the next drain."""
+
+    def depth(self) -> int:
+        """Return the number of records waiting to be inserted."""
+        raise NotImplementedError
+
+    # -- statistics ---------------------------------------------------------
+
+    def record_drops(self, count: int) -> None:
+        if count:
+            _cache_incr(f"{_STATS_KEY_PREFIX}:{self.name}:dropped", count)
+
+    def dropped_total(self) -> int:
+        return int(cache.get(f"{_STATS_KEY_PREFIX}:{self.name}:dropped") or 0)
+
+    def record_flush(self, *, latency_seconds: float, inserted: int) -> None:
+        cache.set(
+            f"{_STATS_KEY_PREFIX}:{self.name}:last-flush",
+            {"latency_seconds": latency_seconds, "inserted": inserted, "at": time.time()},
+            timeout=None,
+        )
+
+    def last_flush(self) -> dict[str, float]:
+        return cache.get(f"{_STATS_KEY_PREFIX}:{self.name}:last-flush") or {}
+
+
+def _cache_incr(key: str, amount: int) -> None:
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        # Missing key: add() keeps a concurrent first increment from being lost.
+        if not cache.add(key, amount, timeout=None):
+            cache.incr(key, amount)
+
+
+def _encode(record: dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":"), default=str)
+
+
+def _decode(raw: bytes | str) -> dict[str, Any] | None:
+    try:
+        record = json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+class MemoryStreamBackend(PageViewIngestBackend):
+    """Process-local stand-in for the Redis stream (tests and local development)."""
+
+    name = "memory"
+
+    def __init__(self, *, max_pending: int = MAX_PENDING_RECORDS, claim_idle_seconds: float = _CLAIM_IDLE_SECONDS):
+        self.max_pending = max_pending
+        self.claim_idle_seconds = claim_idle_seconds
+        self._lock = threading.Lock()
+        self._queue: deque[tuple[str, dict[str, Any]]] = deque()
+        self._pending: dict[str, tuple[dict[str, Any], float]] = {}
+        self._dropped = 0
+        self._last_flush: dict[str, float] = {}
+
+    def append(self, record):
+        with self._lock:
+            if len(self._queue) + len(self._pending) >= self.max_pending:
+                self._dropped += 1
+                return False
+            self._queue.append((uuid.uuid4().hex, dict(record)))
+            return True
+
+    def read_batch(self, limit):
+        now = time.monotonic()
+        receipts: list[str] = []
+        records: list[dict[str, Any] | None] = []
+        with self._lock:
+            for receipt, (record, delivered_at) in list(self._pending.items()):
+                if len(receipts) >= limit:
+                    break
+                if now - delivered_at >= self.claim_idle_seconds:
+                    self._pending[receipt] = (record, now)
+                    receipts.append(receipt)
+                    records.append(record)
+            while self._queue and len(receipts) < limit:
+                receipt, record = self._queue.popleft()
+                self._pending[receipt] = (record, now)
+                receipts.append(receipt)
+                records.append(record)
+        return receipts, records
+
+    def ack(self, receipts):
+        with self._lock:
+            for receipt in receipts:
+                self._pending.pop(receipt, None)
+
+    def release(self, receipts):
+        with self._lock:
+            for receipt in reversed(receipts):
+                entry = self._pending.pop(receipt, None)
+                if entry is not None:
+                    self._queue.appendleft((receipt, entry[0]))
+
+    def depth(self):
+        with self._lock:
+            return len(self._queue) + len(self._pending)
+
+    def record_drops(self, count):
+        with self._lock:
+            self._dropped += count
+
+    def dropped_total(self):
+        with self._lock:
+            return self._dropped
+
+    def record_flush(self, *, latency_seconds, inserted):
+        self._last_flush = {"latency_seconds": latency_seconds, "inserted": inserted, "at": time.time()}
+
+    def last_flush(self):
+        return dict(self._last_flush)
+
+
+_REDIS_APPEND_SCRIPT = """
+if redis.call('XLEN', KEYS[1]) >= tonumber(ARGV[2]) then
+  redis.call('INCR', KEYS[2])
+  return 0
+end
+redis.call('XADD', KEYS[1], '*', 'v', ARGV[1])
+return 1
+"""
+
+
+class RedisStreamBackend(PageViewIngestBackend):
+    """Redis stream drained through a consumer group.
+
+    Appends are a single Lua round trip that refuses (and counts) records once
+    the stream is full. Entries read by a drainer that dies before ``XACK`` are
+    reclaimed with ``XAUTOCLAIM`` after ``claim_idle_seconds``.
+    """
+
+    name = "redis"
+    stream_key = "i2g:analytics:pageviews"
+    group = "pageview-drain"
+
+    def __init__(
+        self,
+        client=None,
+        *,
+        max_pending: int = MAX_PENDING_RECORDS,
+        claim_idle_seconds: float = _CLAIM_IDLE_SECONDS,
+    ):
+        self._client = client
+        self.max_pending = max_pending
+        self.claim_idle_seconds = claim_idle_seconds
+        self.consumer = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._group_ready = False
+        self._append_script = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            from django_redis import get_redis_connection
+
+            self._client = get_redis_connection("default")
+        return self._client
+
+    @property
+    def _dropped_key(self) -> str:
+        return f"{self.stream_key}:dropped"
+
+    def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            self.client.xgroup_create(self.stream_key, self.group, id="0", mkstream=True)
+        except Exception as exc:  # noqa: BLE001 - redis.ResponseError without importing redis here.
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self._group_ready = True
+
+    def append(self, record):
+        if self._append_script is None:
+            self._append_script = self.client.register_script(_REDIS_APPEND_SCRIPT)
+        return bool(
+            self._append_script(keys=[self.stream_key, self._dropped_key], args=[_encode(record), self.max_pending])
+        )
+
+    def read_batch(self, limit):
+        self._ensure_group()
+        entries: list[tuple[Any, dict]] = []
+        claimed = self.client.xautoclaim(
+            self.stream_key,
+            self.group,
+            self.consumer,
+            min_idle_time=int(self.claim_idle_seconds * 1000),
+            start_id="0-0",
+            count=limit,
+        )
+        entries.extend(entry for entry in claimed[1] if entry and entry[1] is not None)
+        if len(entries) < limit:
+            response = self.client.xreadgroup(
+                self.group, self.consumer, {self.stream_key: ">"}, count=limit - len(entries)
+            )
+            for _stream, stream_entries in response or []:
+                entries.extend(stream_entries)
+        receipts = [entry_id for entry_id, _fields in entries]
+        records = [_decode(fields.get(b"v", fields.get("v", b""))) for _entry_id, fields in entries]
+        return receipts, records
+
+    def ack(self, receipts):
+        if not receipts:
+            return
+        pipeline = self.client.pipeline()
+        pipeline.xack(self.stream_key, self.group, *receipts)
+        pipeline.xdel(self.stream_key, *receipts)
+        pipeline.execute()
+
+    def depth(self):
+        return int(self.client.xlen(self.stream_key))
+
+    def record_drops(self, count):
+        if count:
+            self.client.incrby(self._dropped_key, count)
+
+    def dropped_total(self):
+        return int(self.client.get(self._dropped_key) or 0)
+
+
+class _SpoolReceipt(NamedTuple):
+    segment: str
+    offset: int
+    at_end: bool
+    # Closing the file drops the ``flock`` that claims the batch.
+    lock_file: IO[str]
+
+
+class SpoolFileBackend(PageViewIngestBackend):
+    """Append-only NDJSON spool shared by the processes of one host.
+
+    Writers append one line per record to ``active.ndjson`` under a shared
+    ``flock``. A drainer renames the active file to a ``segment-*`` file and
+    takes an exclusive lock on it, which waits out any writer still holding
+    the old inode; a writer that finds its inode renamed away simply reopens.
+    Read progress is stored next to the segment, so a crash replays at most
+    the unacknowledged batch. One drainer at a time holds ``drain.lock`` from
+    :meth:`read_batch` until it acks or releases the batch.
+    """
+
+    name = "spool"
+    _ACTIVE = "active.ndjson"
+    _SEGMENT_GLOB = "segment-*.ndjson"
+
+    def __init__(self, directory: str | os.PathLike | None = None, *, max_bytes: int = 64 * 1024 * 1024):
+        self.directory = Path(
+            directory
+            or getattr(settings, "PAGEVIEW_SPOOL_DIR", "")
+            or Path(tempfile.gettempdir()) / "innovate-to-grow-pageviews"
+        )
+        self.max_bytes = max_bytes
+
+    @property
+    def active_path(self) -> Path:
+        return self.directory / self._ACTIVE
+
+    def _open_active_for_append(self) -> int:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        while True:
+            fd = os.open(self.active_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            fcntl.flock(fd, fcntl.LOCK_SH)
+            try:
+                if os.fstat(fd).st_ino == os.stat(self.active_path).st_ino:
+                    return fd
+            except FileNotFoundError:
+                pass
+            # Rotated between open() and flock(): retry on the new active file.
+            os.close(fd)
+
+    def append(self, record):
+        line = (_encode(record) + "\n").encode()
+        fd = self._open_active_for_append()
+        try:
+            if os.fstat(fd).st_size + len(line) > self.max_bytes:
+                dropped = True
+            else:
+                # One write() of an O_APPEND descriptor lands as a single record.
+                os.write(fd, line)
+                dropped = False
+        finally:
+            os.close(fd)
+        if dropped:
+            self.record_drops(1)
+        return not dropped
+
+    def _segments(self) -> list[Path]:
+        return sorted(self.directory.glob(self._SEGMENT_GLOB))
+
+    def _rotate(self) -> None:
+        try:
+            if self.active_path.stat().st_size == 0:
+                return
+            os.rename(self.active_path, self.directory / f"segment-{time.time_ns():020d}-{os.getpid()}.ndjson")
+        except FileNotFoundError:
+            return
+
+    @staticmethod
+    def _offset_path(segment: Path) -> Path:
+        return segment.with_suffix(".offset")
+
+    def _read_offset(self, segment: Path) -> int:
+        try:
+            return int(self._offset_path(segment).read_text() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _claim_drain_lock(self):
+        """Open and lock ``drain.lock``; ``None`` while another drainer holds it."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.directory / "drain.lock", "a")  # noqa: SIM115 - held until ack/release.
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def read_batch(self, limit):
+        # The drain lock stays held until the batch is acked or released, so a
+        # drainer in another process cannot read the same lines from the same
+        # offset while this batch is being inserted.
+        lock_file = self._claim_drain_lock()
+        if lock_file is None:
+            return [], []
+        try:
+            segments = self._segments()
+            if not segments:
+                self._rotate()
+                segments = self._segments()
+            if not segments:
+                lock_file.close()
+                return [], []
+            segment = segments[0]
+            offset = self._read_offset(segment)
+            records: list[dict[str, Any] | None] = []
+            with open(segment, "rb") as handle:
+                # Wait for writers that opened this inode before the rotation.
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                handle.seek(offset)
+                while len(records) < limit:
+                    line = handle.readline()
+                    if not line:
+                        break
+                    if not line.endswith(b"\n"):
+                        # A torn final line from a killed writer: drop it.
+                        offset = handle.tell()
+                        records.append(None)
+                        break
+                    records.append(_decode(line))
+                offset = handle.tell()
+                at_end = not handle.read(1)
+        except BaseException:
+            lock_file.close()
+            raise
+        return [_SpoolReceipt(str(segment), offset, at_end, lock_file)], records
+
+    def ack(self, receipts):
+        for receipt in receipts:
+            try:
+                segment = Path(receipt.segment)
+                if receipt.at_end:
+                    segment.unlink(missing_ok=True)
+                    self._offset_path(segment).unlink(missing_ok=True)
+                    continue
+                tmp_path = self._offset_path(segment).with_suffix(".offset.tmp")
+                tmp_path.write_text(str(receipt.offset))
+                os.replace(tmp_path, self._offset_path(segment))
+            finally:
+                receipt.lock_file.close()
+
+    def release(self, receipts):
+        # The stored offset was not advanced, so the next drain re-reads the batch.
+        for receipt in receipts:
+            receipt.lock_file.close()
+
+    def depth(self):
+        total = 0
+        paths = [*self._segments(), self.active_path]
+        for path in paths:
+            try:
+                with open(path, "rb") as handle:
+                    if path != self.active_path:
+                        handle.seek(self._read_offset(path))
+                    while chunk := handle.read(1024 * 1024):
+                        total += chunk.count(b"\n")
+            except FileNotFoundError:
+                continue
+        return total
+
+
+_BACKENDS = {
+    "memory": MemoryStreamBackend,
+    "redis": RedisStreamBackend,
+    "spool": SpoolFileBackend,
+}
+_backend: PageViewIngestBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_ingest_backend() -> PageViewIngestBackend:
+    """Return the process-wide backend selected by ``PAGEVIEW_INGEST_BACKEND``."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            name = getattr(settings, "PAGEVIEW_INGEST_BACKEND", "memory") or "memory"
+            try:
+                backend_class = _BACKENDS[name]
+            except KeyError:
+                raise ValueError(f"Unknown PAGEVIEW_INGEST_BACKEND {name!r}.") from None
+            _backend = backend_class()
+        return _backend
+
+
+def set_ingest_backend(backend: PageViewIngestBackend | None) -> None:
+    """Replace the process-wide backend (``None`` re-reads settings on next use)."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
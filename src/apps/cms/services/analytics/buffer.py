@@ -1,129 +1,295 @@
-"""In-memory write buffer for page-view analytics.
+"""Multi-process-safe write path for page-view analytics.
 
-Page views are enqueued into a thread-safe deque and bulk-inserted into the
-database either every ``_FLUSH_INTERVAL`` seconds or when the buffer reaches
-``_BATCH_SIZE`` entries, whichever comes first.  A synchronous drain runs at
-process exit via ``atexit`` to avoid data loss.
+Request handlers :func:`enqueue` page views onto the configured ingestion
+backend (see :mod:`.backends`) and return immediately. :func:`drain_page_views`
+moves queued records into ``PageView`` in large ``bulk_create`` batches and
+acknowledges them only after the insert succeeds, so a killed process loses
+nothing that was already queued (a crash between insert and acknowledgement
+can replay one batch). Each drain then refreshes the rollup buckets it wrote
+and, at most once per ``_ROLLUP_REPAIR_INTERVAL``, queues a
+``cms.pageview_rollup`` job that completes the daily distinct counts and
+prunes expired raw rows (in-process when the durable worker is disabled).
+
+Each process schedules at most one drain per ``_DRAIN_INTERVAL``. With a shared
+Redis stream and ``BACKGROUND_JOBS_ENABLED`` that is a ``cms.pageview_drain``
+durable job; otherwise a delayed in-process drain runs on a daemon timer.
+The spool backend always drains in-process because the spool file is local to
+the web host. ``flush_sync`` drains synchronously; the memory backend is
+also flushed at process exit.
 """
 
 import atexit
 import logging
 import threading
-from collections import deque
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, close_old_connections
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
-from django.db import DatabaseError
+from . import backends
+from .backends import get_ingest_backend
+from .rollups import refresh_drained_rollups, repair_page_view_rollups
 
 logger = logging.getLogger(__name__)
 
-_BATCH_SIZE = 100
-_FLUSH_INTERVAL = 5  # seconds
-_MAX_RETRIES = 2
-_MAX_BUFFER_SIZE = 10_000
+DRAIN_JOB_KIND = "cms.pageview_drain"
+ROLLUP_JOB_KIND = "cms.pageview_rollup"
+
+_DRAIN_BATCH_SIZE = 1000
+_DRAIN_INTERVAL = 5  # seconds
+_MAX_DRAIN_BATCHES = 50  # per drain, so one job cannot run unbounded
+_ROLLUP_REPAIR_INTERVAL = 3600  # seconds
+
+_RECORD_FIELDS = ("path", "referrer", "ip_address", "user_agent", "session_key")
 
-_buffer: deque[dict] = deque()
-_lock = threading.Lock()
+_schedule_lock = threading.Lock()
 _timer: threading.Timer | None = None
-_flush_done = threading.Event()
-_flush_done.set()
-_initialized = False
+_next_drain_at = 0.0
+_next_repair_at = 0.0
 
 
-def _do_bulk_insert(batch: list[dict]) -> None:
-    from apps.cms.models import PageView
+def _record_from(data: dict) -> dict:
+    member = data.get("member")
+    member_id = data.get("member_id", getattr(member, "pk", None))
+    timestamp = data.get("timestamp") or timezone.now()
+    return {
+        **{field: data.get(field) for field in _RECORD_FIELDS},
+        "member_id": str(member_id) if member_id is not None else None,
+        "timestamp": timestamp.isoformat() if isinstance(timestamp, datetime) else str(timestamp),
+    }
 
-    for attempt in range(_MAX_RETRIES):
-        try:
-            PageView.objects.bulk_create([PageView(**data) for data in batch])
-            return
-        except DatabaseError:
-            if attempt < _MAX_RETRIES - 1:
-                logger.warning("bulk-insert attempt %d failed, retrying", attempt + 1)
-            else:
-                logger.exception(
-                    "Failed to bulk-insert %d page views after %d attempts — dropping batch",
-                    len(batch),
-                    _MAX_RETRIES,
-                )
-
-
-def _flush():
-    with _lock:
-        if not _flush_done.is_set():
-            _schedule_flush_locked()
-            return
-        if not _buffer:
-            _schedule_flush_locked()
+
+def enqueue(data: dict) -> bool:
+    """Queue one page-view record; return ``False`` if it was dropped."""
+    backend = get_ingest_backend()
+    try:
+        accepted = backend.append(_record_from(data))
+    except Exception:  # noqa: BLE001 - analytics must never fail the request.
+        logger.exception("Could not queue page view on the %s ingestion backend", backend.name)
+        return False
+    if not accepted:
+        logger.warning("Page-view ingestion backend %s is full; dropped a page view", backend.name)
+    _schedule_drain(backend)
+    return accepted
+
+
+def _schedule_drain(backend) -> None:
+    global _next_drain_at, _timer
+
+    now = time.monotonic()
+    with _schedule_lock:
+        if now < _next_drain_at:
             return
-        _flush_done.clear()
-        batch = list(_buffer)
-        _buffer.clear()
+        _next_drain_at = now + _DRAIN_INTERVAL
+    if backend.name == "redis" and _enqueue_drain_job():
+        return
+    with _schedule_lock:
+        if _timer is None:
+            _timer = threading.Timer(_DRAIN_INTERVAL, _run_scheduled_drain)
+            _timer.daemon = True
+            _timer.start()
 
+
+def _enqueue_drain_job(*, dedupe_key: str | None = None, delay: float = _DRAIN_INTERVAL) -> bool:
+    from apps.core.services.background_jobs import enqueue_job, jobs_enabled
+
+    if not jobs_enabled():
+        return False
     try:
-        _do_bulk_insert(batch)
-    finally:
-        _flush_done.set()
-        with _lock:
-            _schedule_flush_locked()
+        # By default one job per interval across every process sharing the stream.
+        enqueue_job(
+            kind=DRAIN_JOB_KIND,
+            dedupe_key=dedupe_key or f"drain:{int(time.time() // _DRAIN_INTERVAL)}",
+            payload={},
+            available_at=timezone.now() + timedelta(seconds=delay),
+        )
+    except DatabaseError:
+        logger.exception("Could not schedule a page-view drain job; draining in-process")
+        return False
+    return True
 
 
-def _schedule_flush_locked():
+def _run_scheduled_drain() -> None:
     global _timer
-    if _timer is not None:
-        _timer.cancel()
-    _timer = threading.Timer(_FLUSH_INTERVAL, _flush)
-    _timer.daemon = True
-    _timer.start()
 
+    with _schedule_lock:
+        _timer = None
+    close_old_connections()
+    try:
+        drain_page_views()
+    except Exception:  # noqa: BLE001 - timer thread boundary.
+        logger.exception("Scheduled page-view drain failed; records stay queued")
+    finally:
+        close_old_connections()
 
-def _ensure_initialized():
-    global _initialized
-    if _initialized:
-        return
-    _initialized = True
-    _schedule_flush_locked()
 
+def _existing_member_ids(records: list[dict]) -> set[str]:
+    from apps.authn.models import Member
 
-def enqueue(data: dict) -> None:
-    """Add a page-view record to the in-memory buffer."""
-    with _lock:
-        _ensure_initialized()
-        _buffer.append(data)
+    member_ids = {record["member_id"] for record in records if record.get("member_id")}
+    if not member_ids:
+        return set()
+    return {str(pk) for pk in Member.objects.filter(pk__in=member_ids).values_list("pk", flat=True)}
 
-        if len(_buffer) > _MAX_BUFFER_SIZE:
-            overflow = len(_buffer) - _MAX_BUFFER_SIZE
-            for _ in range(overflow):
-                _buffer.popleft()
-            logger.warning("Analytics buffer overflow — dropped %d oldest entries", overflow)
 
-        should_flush = len(_buffer) >= _BATCH_SIZE
+def _page_view_from(record: dict, member_ids: set[str]):
+    from apps.cms.models import PageView
 
-    if should_flush:
-        threading.Thread(target=_flush, daemon=True).start()
+    timestamp = parse_datetime(record.get("timestamp") or "") or timezone.now()
+    if timezone.is_naive(timestamp):
+        timestamp = timezone.make_aware(timestamp)
+    member_id = record.get("member_id")
+    return PageView(
+        path=(record.get("path") or "")[:2048],
+        referrer=record.get("referrer") or "",
+        ip_address=record.get("ip_address") or None,
+        user_agent=record.get("user_agent") or "",
+        session_key=(record.get("session_key") or "")[:64],
+        # The member may have been deleted while the record was queued.
+        member_id=member_id if member_id in member_ids else None,
+        timestamp=timestamp,
+    )
 
 
-def flush_sync() -> None:
-    """Immediately flush all buffered records (blocking)."""
+def _refresh_rollups(oldest, newest) -> None:
+    try:
+        refresh_drained_rollups(oldest, newest)
+    except DatabaseError:
+        # The rows are stored; the next rollup repair recomputes the buckets.
+        logger.exception("Could not refresh page-view rollups for %s to %s", oldest, newest)
+    _schedule_rollup_repair()
+
+
+def _schedule_rollup_repair() -> None:
+    global _next_repair_at
+    from apps.core.services.background_jobs import enqueue_job, jobs_enabled
+    from apps.core.services.helpers.in_process import start_in_process_task
+
+    if not getattr(settings, "PAGEVIEW_ROLLUP_REPAIR_ENABLED", True):
+        return
+    now = time.monotonic()
+    with _schedule_lock:
+        if now < _next_repair_at:
+            return
+        _next_repair_at = now + _ROLLUP_REPAIR_INTERVAL
+    # One repair per interval across every process that drains.
+    dedupe_key = f"repair:{int(time.time() // _ROLLUP_REPAIR_INTERVAL)}"
+    if jobs_enabled():
+        try:
+            enqueue_job(kind=ROLLUP_JOB_KIND, dedupe_key=dedupe_key, payload={}, max_attempts=3)
+            return
+        except DatabaseError:
+            logger.exception("Could not schedule a page-view rollup repair job; repairing in-process")
+    if cache.add(f"analytics:pageview-rollup:{dedupe_key}", 1, _ROLLUP_REPAIR_INTERVAL):
+        start_in_process_task(repair_page_view_rollups, name="pageview-rollup-repair", best_effort_start=True)
+
+
+def drain_page_views(*, batch_size: int = _DRAIN_BATCH_SIZE, max_batches: int = _MAX_DRAIN_BATCHES) -> dict:
+    """Bulk-insert queued page views; return inserted/discarded counts.
+
+    ``backlog`` is true when ``max_batches`` ran out before the queue did.
+
+    A failed insert hands its batch back to the backend and re-raises, so the
+    records are retried by the next drain instead of being dropped.
+    """
     from apps.cms.models import PageView
 
-    global _timer, _initialized
+    backend = get_ingest_backend()
+    inserted = discarded = 0
+    oldest = newest = None
+    backlog = True
+    for _ in range(max_batches):
+        receipts, records = backend.read_batch(batch_size)
+        if not receipts:
+            backlog = False
+            break
+        valid = [record for record in records if record and record.get("path")]
+        discarded += len(records) - len(valid)
+        try:
+            member_ids = _existing_member_ids(valid)
+            rows = [_page_view_from(record, member_ids) for record in valid]
+            PageView.objects.bulk_create(rows, batch_size=batch_size)
+        except DatabaseError:
+            backend.release(receipts)
+            logger.exception("Failed to bulk-insert %d page views; they stay queued", len(valid))
+            raise
+        except BaseException:
+            backend.release(receipts)
+            raise
+        backend.ack(receipts)
+        inserted += len(rows)
+        if rows:
+            timestamps = [row.timestamp for row in rows]
+            oldest = min(timestamps) if oldest is None else min(oldest, *timestamps)
+            newest = max(timestamps) if newest is None else max(newest, *timestamps)
+
+    if discarded:
+        backend.record_drops(discarded)
+        logger.warning("Discarded %d malformed page-view records", discarded)
+    if inserted:
+        backend.record_flush(latency_seconds=max(0.0, (timezone.now() - oldest).total_seconds()), inserted=inserted)
+        _refresh_rollups(oldest, newest)
+    return {"inserted": inserted, "discarded": discarded, "backlog": backlog}
 
-    _flush_done.wait(timeout=10)
 
-    with _lock:
+def drain_page_views_job(job) -> None:
+    """Durable job handler for ``cms.pageview_drain``."""
+    from apps.core.services.background_jobs import TransientJobError
+
+    try:
+        result = drain_page_views()
+    except DatabaseError as exc:
+        raise TransientJobError("Page-view insert failed; records stay queued.") from exc
+    if result["backlog"]:
+        # More arrived than one job may insert: keep draining without waiting for traffic.
+        _enqueue_drain_job(dedupe_key=f"drain:after:{job.pk}", delay=0)
+
+
+def repair_page_view_rollups_job(job) -> None:
+    """Durable job handler for ``cms.pageview_rollup``."""
+    from apps.core.services.background_jobs import TransientJobError
+
+    try:
+        repair_page_view_rollups()
+    except DatabaseError as exc:
+        raise TransientJobError("Page-view rollup repair failed.") from exc
+
+
+def flush_sync() -> None:
+    """Drain every queued record now (blocking)."""
+    global _timer, _next_drain_at
+
+    with _schedule_lock:
         if _timer is not None:
             _timer.cancel()
             _timer = None
-        _initialized = False
-
-        if not _buffer:
-            return
-        batch = list(_buffer)
-        _buffer.clear()
-
+        _next_drain_at = 0.0
     try:
-        PageView.objects.bulk_create([PageView(**data) for data in batch])
+        drain_page_views(max_batches=1_000_000)
     except DatabaseError:
-        logger.exception("Failed to bulk-insert %d page views on flush_sync", len(batch))
+        logger.exception("Failed to drain page views on flush_sync")
+
+
+def ingestion_metrics() -> dict[str, float | int]:
+    """Return buffer depth, drop count and last flush latency for monitoring."""
+    backend = get_ingest_backend()
+    last_flush = backend.last_flush()
+    return {
+        "pageview_buffer_depth": backend.depth(),
+        "pageview_dropped_total": backend.dropped_total(),
+        "pageview_flush_latency_seconds": float(last_flush.get("latency_seconds", 0.0)),
+    }
+
+
+def _flush_at_exit() -> None:
+    # Only the per-process memory backend loses records at exit; the shared
+    # backends are durable and are drained by whichever process runs next.
+    if isinstance(backends._backend, backends.MemoryStreamBackend):
+        flush_sync()
 
 
-atexit.register(flush_sync)
+atexit.register(_flush_at_exit)
@@ -0,0 +1,283 @@
+"""Hourly and daily page-view rollups and raw-row retention.
+
+:func:`refresh_page_view_rollups` recomputes every rollup bucket that overlaps a
+time range from the raw ``PageView`` rows and upserts the results, so it is
+idempotent and safe to run from several drains at once. The ingestion drain
+calls :func:`refresh_drained_rollups` instead, which only rescans the hours it
+wrote. At most once an hour the drain also queues :func:`repair_page_view_rollups`,
+which recomputes a recent window, completing the daily distinct counts,
+backfills days recorded before the rollups existed and applies the raw-row
+retention policy; ``manage.py rollup_page_views`` does the same on demand.
+
+Refreshes only upsert. A bucket whose raw rows were already pruned produces no
+rows, so it can never overwrite a rollup with zeros.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter, defaultdict
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min, Q, Sum
+from django.db.models.functions import TruncDate, TruncHour
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+logger = logging.getLogger(__name__)
+
+TOP_REFERRERS = 10
+REPAIR_DAYS = 2
+_PRUNE_BATCH_SIZE = 5000
+_ROLLUP_FIELDS = (
+    "views",
+    "unique_sessions",
+    "unique_visitors",
+    "member_views",
+    "anonymous_views",
+    "top_referrers",
+    "updated_at",
+)
+# Daily fields that are sums of the hourly ones; distinct counts and top referrers are not.
+_ADDITIVE_FIELDS = ("views", "member_views", "anonymous_views")
+
+
+def _day_start(day) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _hour_start(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def _bucket_counts(qs, bucket_expr, group_by_path: bool):
+    keys = ["bucket", "path"] if group_by_path else ["bucket"]
+    counts = (
+        qs.annotate(bucket=bucket_expr)
+        .values(*keys)
+        .annotate(
+            views=Count("id"),
+            unique_sessions=Count("session_key", distinct=True, filter=~Q(session_key="")),
+            unique_visitors=Count("ip_address", distinct=True),
+            member_views=Count("id", filter=Q(member__isnull=False)),
+        )
+        .order_by()
+    )
+    referrers = (
+        qs.exclude(referrer="")
+        .annotate(bucket=bucket_expr)
+        .values(*keys, "referrer")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    top: dict[tuple, Counter] = defaultdict(Counter)
+    for row in referrers:
+        top[tuple(row[key] for key in keys)][row["referrer"]] += row["count"]
+    for row in counts:
+        key = tuple(row[k] for k in keys)
+        yield (
+            row["bucket"],
+            row["path"] if group_by_path else None,
+            {
+                "views": row["views"],
+                "unique_sessions": row["unique_sessions"],
+                "unique_visitors": row["unique_visitors"],
+                "member_views": row["member_views"],
+                "anonymous_views": row["views"] - row["member_views"],
+                "top_referrers": [
+                    {"referrer": referrer, "count": count} for referrer, count in top[key].most_common(TOP_REFERRERS)
+                ],
+            },
+        )
+
+
+def _refresh(model, bucket_field: str, bucket_expr, raw_qs) -> int:
+    from apps.cms.models.content.analytics import ALL_PATHS
+
+    now = timezone.now()
+    rows = []
+    for group_by_path in (True, False):
+        for bucket, path, values in _bucket_counts(raw_qs, bucket_expr, group_by_path):
+            rows.append(model(path=path or ALL_PATHS, **{bucket_field: bucket}, **values, updated_at=now))
+    if rows:
+        model.objects.bulk_create(
+            rows,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["path", bucket_field],
+            update_fields=list(_ROLLUP_FIELDS),
+        )
+    return len(rows)
+
+
+def refresh_page_view_rollups(start: datetime | None = None, end: datetime | None = None) -> dict[str, int]:
+    """Recompute the hourly and daily buckets that overlap ``[start, end]``.
+
+    Without bounds every bucket with raw rows is refreshed. Buckets are always
+    recomputed over whole hours and local days so distinct counts see them whole.
+    """
+    from apps.cms.models import PageView, PageViewDailyRollup, PageViewHourlyRollup
+
+    raw = PageView.objects.order_by()
+    if start is None:
+        start = raw.aggregate(oldest=Min("timestamp"))["oldest"]
+        if start is None:
+            return {"hourly": 0, "daily": 0}
+    hour_raw = raw.filter(timestamp__gte=_hour_start(start))
+    day_raw = raw.filter(timestamp__gte=_day_start(timezone.localtime(start).date()))
+    if end is not None:
+        hour_raw = hour_raw.filter(timestamp__lt=_hour_start(end) + timedelta(hours=1))
+        day_raw = day_raw.filter(timestamp__lt=_day_start(timezone.localtime(end).date() + timedelta(days=1)))
+
+    with transaction.atomic():
+        hourly = _refresh(PageViewHourlyRollup, "hour", TruncHour("timestamp"), hour_raw)
+        daily = _refresh(PageViewDailyRollup, "day", TruncDate("timestamp"), day_raw)
+    return {"hourly": hourly, "daily": daily}
+
+
+def refresh_drained_rollups(start: datetime, end: datetime) -> dict[str, int]:
+    """Refresh the buckets a drain of views stamped ``start``..``end`` touched.
+
+    Only the raw rows of the touched hours are rescanned. The daily rows of the
+    touched days get their additive counts summed from the hourly rollups, so a
+    drain costs the same late in a busy day as early on; their distinct counts
+    and top referrers are recomputed by :func:`repair_page_view_rollups`.
+    """
+    from apps.cms.models import PageView, PageViewHourlyRollup
+
+    hour_raw = PageView.objects.order_by().filter(
+        timestamp__gte=_hour_start(start), timestamp__lt=_hour_start(end) + timedelta(hours=1)
+    )
+    with transaction.atomic():
+        hourly = _refresh(PageViewHourlyRollup, "hour", TruncHour("timestamp"), hour_raw)
+        daily = _sum_daily_from_hourly(timezone.localtime(start).date(), timezone.localtime(end).date())
+    return {"hourly": hourly, "daily": daily}
+
+
+def _sum_daily_from_hourly(first_day, last_day) -> int:
+    from apps.cms.models import PageViewDailyRollup, PageViewHourlyRollup
+
+    sums = (
+        PageViewHourlyRollup.objects.filter(
+            hour__gte=_day_start(first_day), hour__lt=_day_start(last_day + timedelta(days=1))
+        )
+        .annotate(day=TruncDate("hour"))
+        .values("day", "path")
+        .annotate(**{field: Sum(field) for field in _ADDITIVE_FIELDS})
+        .order_by()
+    )
+    now = timezone.now()
+    rows = [PageViewDailyRollup(**row, updated_at=now) for row in sums]
+    if rows:
+        PageViewDailyRollup.objects.bulk_create(
+            rows,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["path", "day"],
+            update_fields=[*_ADDITIVE_FIELDS, "updated_at"],
+        )
+    return len(rows)
+
+
+def repair_page_view_rollups(*, days: int = REPAIR_DAYS, prune: bool = True) -> dict[str, int]:
+    """Recompute the last ``days`` of buckets from raw rows, then prune old raw rows.
+
+    When raw rows predate the earliest daily rollup (views recorded before the
+    rollups existed), the refresh starts from the oldest raw row instead, so the
+    first run backfills the history.
+    """
+    from apps.cms.models import PageView, PageViewDailyRollup
+
+    start = timezone.now() - timedelta(days=max(1, days))
+    oldest_raw = PageView.objects.aggregate(oldest=Min("timestamp"))["oldest"]
+    if oldest_raw is not None and oldest_raw < start:
+        first_day = PageViewDailyRollup.objects.aggregate(first=Min("day"))["first"]
+        if first_day is None or oldest_raw < _day_start(first_day):
+            logger.info("Backfilling page-view rollups from %s", oldest_raw)
+            start = oldest_raw
+    refreshed = refresh_page_view_rollups(start)
+    return {**refreshed, "pruned": prune_raw_page_views() if prune else 0}
+
+
+def raw_retention_days() -> int:
+    return max(0, int(getattr(settings, "PAGEVIEW_RAW_RETENTION_DAYS", 0) or 0))
+
+
+def prune_raw_page_views(*, retention_days: int | None = None, now: datetime | None = None) -> int:
+    """Delete raw page views older than the retention window; return the count.
+
+    Each day is rolled up once more before its raw rows go, so views that
+    bypassed the drain are not lost. ``0`` keeps raw rows forever.
+    """
+    from apps.cms.models import PageView
+
+    retention_days = raw_retention_days() if retention_days is None else retention_days
+    if not retention_days:
+        return 0
+    cutoff = _day_start(timezone.localtime(now or timezone.now()).date() - timedelta(days=retention_days))
+    oldest = PageView.objects.filter(timestamp__lt=cutoff).aggregate(oldest=Min("timestamp"))["oldest"]
+    if oldest is None:
+        return 0
+
+    refresh_page_view_rollups(oldest, cutoff - timedelta(microseconds=1))
+    deleted = 0
+    while True:
+        ids = list(
+            PageView.objects.filter(timestamp__lt=cutoff).order_by().values_list("pk", flat=True)[:_PRUNE_BATCH_SIZE]
+        )
+        if not ids:
+            break
+        deleted += PageView.objects.filter(pk__in=ids).delete()[0]
+    logger.info("Pruned %d raw page views older than %s", deleted, cutoff)
+    return deleted
+
+
+def rollup_queryset(
+    granularity: str = "day", *, path: str | None = None, date_from=None, date_to=None, site_wide: bool = False
+):
+    """Return per-path rollups (no site-wide rows) filtered like the raw queries.
+
+    ``date_from``/``date_to`` accept datetimes, dates or ISO strings. Daily
+    rollups are filtered by the local calendar day containing each bound.
+    ``site_wide`` returns only the ``ALL_PATHS`` rows instead (``path`` is ignored).
+    """
+    from apps.cms.models import PageViewDailyRollup, PageViewHourlyRollup
+    from apps.cms.models.content.analytics import ALL_PATHS
+
+    hourly = granularity == "hour"
+    manager = (PageViewHourlyRollup if hourly else PageViewDailyRollup).objects
+    if site_wide:
+        qs = manager.filter(path=ALL_PATHS)
+    else:
+        qs = manager.exclude(path=ALL_PATHS)
+        if path:
+            qs = qs.filter(path__icontains=path)
+    field = "hour" if hourly else "day"
+    for bound, lookup in ((date_from, "gte"), (date_to, "lte")):
+        value = _parse_bound(bound, hourly, lookup)
+        if value is not None:
+            qs = qs.filter(**{f"{field}__{lookup}": value})
+    return qs
+
+
+def _parse_bound(value, hourly: bool, lookup: str):
+    if value in (None, ""):
+        return None
+    if isinstance(value, str):
+        value = parse_datetime(value) or parse_date(value)
+        if value is None:
+            return None
+    if not isinstance(value, datetime):
+        if not hourly:
+            return value
+        value = (
+            _day_start(value) if lookup == "gte" else _day_start(value + timedelta(days=1)) - timedelta(microseconds=1)
+        )
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    if not hourly:
+        return timezone.localtime(value).date()
+    # An hour bucket is included when it overlaps the bound.
+    return value.replace(minute=0, second=0, microsecond=0) if lookup == "gte" else value
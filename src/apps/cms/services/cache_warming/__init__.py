@@ -0,0 +1,13 @@
+from .warming import (
+    WARM_JOB_KIND,
+    last_warm_metrics,
+    schedule_cache_warm,
+    warm_cms_caches,
+)
+
+__all__ = [
+    "WARM_JOB_KIND",
+    "last_warm_metrics",
+    "schedule_cache_warm",
+    "warm_cms_caches",
+]
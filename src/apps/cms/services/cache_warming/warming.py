@@ -0,0 +1,168 @@
+"""Commit-time warming of the public CMS caches.
+
+The CMS signal handlers retire cached payloads once a publish commits. They then
+call :func:`schedule_cache_warm`, which rebuilds the affected entries (changed
+routes, a renamed page's old route, the homepage, the layout payload and its
+stylesheet, and every embed widget) so the first visitors after a publish are
+served from cache instead of paying for serialization and sanitization.
+
+Requests are coalesced for a moment, so one admin save that touches a page and
+all of its blocks is warmed once. The rebuild runs as a durable
+``cms.cache_warm`` job when the outbox is enabled and on a background thread
+otherwise. Entries go through the same single-flight path as requests, so a
+visitor arriving mid-warm gets the stale copy rather than a second build.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError
+
+from apps.core.services.helpers.in_process import start_in_process_task
+
+logger = logging.getLogger(__name__)
+
+WARM_JOB_KIND = "cms.cache_warm"
+LAST_WARM_CACHE_KEY = "cms:cache-warm:last"
+WARM_COALESCE_SECONDS = 0.5
+
+_pending_lock = threading.Lock()
+_pending_routes: set[str] = set()
+_pending_flags = {"homepage": False, "layout": False, "embeds": False}
+_flush_scheduled = False
+
+
+def warming_enabled() -> bool:
+    return bool(getattr(settings, "CMS_CACHE_WARMING_ENABLED", True))
+
+
+def schedule_cache_warm(
+    routes: Iterable[str | None] = (),
+    *,
+    homepage: bool = False,
+    layout: bool = False,
+    embeds: bool = False,
+) -> None:
+    """Queue a rebuild of the given public CMS caches; call after the invalidating commit."""
+    global _flush_scheduled
+
+    routes = {route for route in routes if route}
+    if not warming_enabled() or not (routes or homepage or layout or embeds):
+        return
+    with _pending_lock:
+        _pending_routes.update(routes)
+        _pending_flags["homepage"] |= homepage
+        _pending_flags["layout"] |= layout
+        _pending_flags["embeds"] |= embeds
+        if _flush_scheduled:
+            return
+        _flush_scheduled = True
+    if start_in_process_task(_flush_pending, name="cms-cache-warm", best_effort_start=True) is None:
+        with _pending_lock:
+            _flush_scheduled = False
+
+
+def _take_pending() -> dict:
+    global _flush_scheduled
+
+    with _pending_lock:
+        payload = {"routes": sorted(_pending_routes), **_pending_flags}
+        _pending_routes.clear()
+        _pending_flags.update(homepage=False, layout=False, embeds=False)
+        _flush_scheduled = False
+    return payload
+
+
+def _flush_pending() -> None:
+    from apps.core.services.background_jobs import enqueue_job, jobs_enabled
+
+    time.sleep(WARM_COALESCE_SECONDS)
+    payload = _take_pending()
+    if jobs_enabled():
+        try:
+            enqueue_job(kind=WARM_JOB_KIND, dedupe_key=str(uuid.uuid4()), payload=payload, max_attempts=3)
+            return
+        except DatabaseError:
+            logger.exception("Could not queue CMS cache warming; warming in-process")
+    warm_cms_caches(payload["routes"], **{flag: payload[flag] for flag in _pending_flags})
+
+
+def warm_cms_caches(
+    routes: Iterable[str] = (),
+    *,
+    homepage: bool = False,
+    layout: bool = False,
+    embeds: bool = False,
+) -> dict:
+    """Rebuild the named public CMS cache entries and record how long it took.
+
+    ``embeds`` preloads every widget. Entries that are already cached are left
+    alone. Returns the number of entries attempted, how many now hold a
+    payload, and the duration.
+    """
+    from apps.cms.models import CMSEmbedWidget
+    from apps.cms.views.cms import homepage_data, published_page_data
+    from apps.cms.views.embed import embed_widget_data
+    from apps.cms.views.layout import layout_data, layout_stylesheet
+
+    targets = [(f"page {route}", lambda route=route: published_page_data(route)) for route in dict.fromkeys(routes)]
+    if homepage:
+        targets.append(("homepage", homepage_data))
+    if layout:
+        targets += [("layout", layout_data), ("layout stylesheet", layout_stylesheet)]
+    if embeds:
+        slugs = CMSEmbedWidget.objects.order_by("slug").values_list("slug", flat=True)
+        targets += [(f"embed {slug}", lambda slug=slug: embed_widget_data(slug)) for slug in slugs]
+
+    started = time.perf_counter()
+    warmed = 0
+    for label, build in targets:
+        try:
+            warmed += build() is not None
+        except DatabaseError:
+            raise
+        except Exception:  # noqa: BLE001 - one broken entry must not leave the rest cold.
+            logger.exception("Could not warm the CMS %s cache", label)
+    duration = time.perf_counter() - started
+
+    result = {"entries": len(targets), "warmed": warmed, "duration_seconds": round(duration, 4)}
+    logger.info("Warmed %d of %d CMS cache entries in %.3fs", warmed, len(targets), duration)
+    try:
+        cache.set(LAST_WARM_CACHE_KEY, {**result, "finished_at": time.time()}, timeout=None)
+    except Exception:  # noqa: BLE001 - metrics must not fail the warm itself.
+        logger.warning("Could not record CMS cache warming metrics", exc_info=True)
+    return result
+
+
+def warm_cms_caches_job(job) -> None:
+    """Durable job handler for ``cms.cache_warm``."""
+    from apps.core.services.background_jobs import TransientJobError
+
+    payload = job.payload or {}
+    try:
+        warm_cms_caches(
+            payload.get("routes") or (),
+            homepage=bool(payload.get("homepage")),
+            layout=bool(payload.get("layout")),
+            embeds=bool(payload.get("embeds")),
+        )
+    except DatabaseError as exc:
+        raise TransientJobError("CMS cache warming could not read the database.") from exc
+
+
+def last_warm_metrics() -> dict[str, float | int]:
+    """Return the duration and size of the most recent warm, for monitoring."""
+    last = cache.get(LAST_WARM_CACHE_KEY) or {}
+    if not last:
+        return {}
+    return {
+        "cms_cache_warm_seconds": float(last.get("duration_seconds", 0.0)),
+        "cms_cache_warm_entries": int(last.get("warmed", 0)),
+    }
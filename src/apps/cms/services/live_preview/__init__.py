@@ -0,0 +1,25 @@
+from .state import (
+    LIVE_PREVIEW_TTL,
+    MAX_PREVIEW_BYTES,
+    LivePreviewConflict,
+    LivePreviewError,
+    LivePreviewTooLarge,
+    apply_patch,
+    live_preview_key,
+    public_state,
+    replace_state,
+    state_since,
+)
+
+__all__ = [
+    "apply_patch",
+    "live_preview_key",
+    "public_state",
+    "replace_state",
+    "state_since",
+    "LivePreviewConflict",
+    "LivePreviewError",
+    "LivePreviewTooLarge",
+    "LIVE_PREVIEW_TTL",
+    "MAX_PREVIEW_BYTES",
+]
@@ -0,0 +1,180 @@
+"""Revisioned live-preview state shared by the page editor and its preview tabs.
+
+The editor pushes either its complete state or a patch against the revision
+it last saw; the assembled state lives in one cache entry per page together
+with the revision at which each page field and block last changed. Preview
+tabs ask for everything newer than the revision they hold and get back only
+the fields and blocks that changed.
+
+Revisions start from the clock when a state is first stored, so a cursor left
+over from an expired session is always older than the new session and the
+reader is sent the full state again.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+LIVE_PREVIEW_TTL = 600  # 10 minutes
+MAX_PREVIEW_BYTES = 512_000
+_REVISIONS = "_revisions"
+_RESERVED = frozenset({"blocks", "expires_at", "rev", _REVISIONS})
+
+
+class LivePreviewError(Exception):
+    status = 400
+
+
+class LivePreviewConflict(LivePreviewError):
+    """The patch was made against a revision that is no longer current."""
+
+    status = 409
+
+    def __init__(self, current_rev):
+        super().__init__("Preview revision is stale.")
+        self.current_rev = current_rev
+
+
+class LivePreviewTooLarge(LivePreviewError):
+    status = 413
+
+
+def live_preview_key(page_id) -> str:
+    return f"cms:live-preview:{page_id}"
+
+
+def _encoded_size(value) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError) as exc:
+        raise LivePreviewError("Payload is not serializable.") from exc
+
+
+def _new_state(previous: dict | None) -> tuple[dict, dict, int]:
+    revisions = (previous or {}).get(_REVISIONS)
+    if not revisions:
+        rev = time.time_ns() // 1_000_000
+        return {}, {"base": rev, "fields": {}, "blocks": [], "sizes": {}}, rev
+    return previous, revisions, revisions["rev"] + 1
+
+
+def _store(page_id, fields: dict, blocks: list, revisions: dict, rev: int) -> dict:
+    if sum(revisions["sizes"].values()) > MAX_PREVIEW_BYTES:
+        raise LivePreviewTooLarge("Preview payload too large.")
+    revisions["rev"] = rev
+    expires_at = (timezone.now() + timedelta(seconds=LIVE_PREVIEW_TTL)).isoformat()
+    state = {**fields, "blocks": blocks, "expires_at": expires_at, "rev": rev, _REVISIONS: revisions}
+    cache.set(live_preview_key(page_id), state, timeout=LIVE_PREVIEW_TTL)
+    return state
+
+
+def replace_state(page_id, data: dict) -> dict:
+    """Store the editor's complete state, bumping revisions only where it differs."""
+    data = {key: value for key, value in data.items() if key not in ("expires_at", "rev", _REVISIONS)}
+    if _encoded_size(data) > MAX_PREVIEW_BYTES:
+        raise LivePreviewTooLarge("Preview payload too large.")
+    blocks = data.pop("blocks", None)
+    if not isinstance(blocks, list):
+        blocks = []
+
+    previous, revisions, rev = _new_state(cache.get(live_preview_key(page_id)))
+    sizes = {"fields": _encoded_size(data)}
+    for name in {*data, *revisions["fields"]}:
+        if name not in previous or previous.get(name) != data.get(name):
+            revisions["fields"][name] = rev
+    old_blocks = previous.get("blocks") or []
+    block_revs = []
+    for index, block in enumerate(blocks):
+        unchanged = index < len(old_blocks) and old_blocks[index] == block
+        block_revs.append(revisions["blocks"][index] if unchanged else rev)
+        sizes[str(index)] = _encoded_size(block)
+    revisions.update(blocks=block_revs, sizes=sizes)
+    return _store(page_id, data, blocks, revisions, rev)
+
+
+def apply_patch(page_id, patch: dict) -> dict:
+    """Apply ``{"base_rev", "fields", "blocks", "block_count"}`` to the stored state.
+
+    ``blocks`` maps block indexes to replacement blocks and ``block_count``
+    truncates or extends the list; every index below the count must end up
+    with a block. Raises :class:`LivePreviewConflict` when ``base_rev`` is not
+    the stored revision, so the editor resends its complete state.
+    """
+    stored = cache.get(live_preview_key(page_id))
+    revisions = (stored or {}).get(_REVISIONS)
+    current_rev = revisions["rev"] if revisions else None
+    if current_rev is None or patch.get("base_rev") != current_rev:
+        raise LivePreviewConflict(current_rev)
+    fields = patch.get("fields") or {}
+    changed_blocks = patch.get("blocks") or {}
+    if not isinstance(fields, dict) or not isinstance(changed_blocks, dict):
+        raise LivePreviewError("Invalid preview patch.")
+
+    rev = current_rev + 1
+    state = {key: value for key, value in stored.items() if key not in _RESERVED}
+    blocks = list(stored.get("blocks") or [])
+    count = patch.get("block_count", len(blocks))
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        raise LivePreviewError("Invalid preview patch.")
+
+    for name, value in fields.items():
+        if name in _RESERVED or state.get(name) == value:
+            continue
+        state[name] = value
+        revisions["fields"][name] = rev
+    if fields:
+        revisions["sizes"]["fields"] = _encoded_size(state)
+
+    block_revs = revisions["blocks"][:count]
+    blocks = blocks[:count] + [None] * (count - len(blocks))
+    block_revs += [rev] * (count - len(block_revs))
+    for raw_index, block in changed_blocks.items():
+        try:
+            index = int(raw_index)
+        except (TypeError, ValueError):
+            raise LivePreviewError("Invalid preview patch.") from None
+        if not 0 <= index < count:
+            raise LivePreviewError("Invalid preview patch.")
+        if blocks[index] != block:
+            blocks[index] = block
+            block_revs[index] = rev
+            revisions["sizes"][str(index)] = _encoded_size(block)
+    if any(block is None for block in blocks):
+        raise LivePreviewError("Invalid preview patch.")
+    for key in [key for key in revisions["sizes"] if key != "fields" and int(key) >= count]:
+        del revisions["sizes"][key]
+    revisions["blocks"] = block_revs
+    return _store(page_id, state, blocks, revisions, rev)
+
+
+def public_state(state: dict) -> dict:
+    """Return ``state`` without its revision bookkeeping."""
+    return {key: value for key, value in state.items() if key != _REVISIONS}
+
+
+def state_since(state: dict, since: int):
+    """Return the fields and blocks changed after revision ``since``.
+
+    Returns ``None`` when ``since`` does not belong to the stored session (or the
+    state predates revisions), in which case the caller serves the full state.
+    """
+    revisions = state.get(_REVISIONS)
+    if not revisions or not revisions["base"] <= since <= revisions["rev"]:
+        return None
+    blocks = state.get("blocks") or []
+    return {
+        "delta": True,
+        "rev": revisions["rev"],
+        "since": since,
+        "fields": {name: state.get(name) for name, field_rev in revisions["fields"].items() if field_rev > since},
+        "blocks": {
+            str(index): blocks[index] for index, block_rev in enumerate(revisions["blocks"]) if block_rev > since
+        },
+        "block_count": len(blocks),
+        "expires_at": state.get("expires_at"),
+    }
@@ -0,0 +1,18 @@
+from .derivatives import (
+    BREAKPOINTS,
+    DERIVATIVE_JOB_KIND,
+    delete_derivative_files,
+    generate_asset_derivatives,
+    schedule_asset_derivatives,
+)
+from .srcset import add_image_srcsets, image_srcsets_for
+
+__all__ = [
+    "BREAKPOINTS",
+    "DERIVATIVE_JOB_KIND",
+    "add_image_srcsets",
+    "delete_derivative_files",
+    "generate_asset_derivatives",
+    "image_srcsets_for",
+    "schedule_asset_derivatives",
+]
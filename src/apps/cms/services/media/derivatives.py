@@ -0,0 +1,232 @@
+"""Responsive renditions of uploaded CMS images.
+
+Editors upload full-size originals, often multi-megabyte PNG or JPEG files. For
+every raster image asset this module writes width-bounded WebP copies (plus
+JPEG copies for images without transparency) at :data:`BREAKPOINTS`, next to
+the original and named by content hash, and records them as
+:class:`~apps.cms.models.CMSAssetDerivative` rows. The serializers then offer
+them to browsers as ``srcset`` candidates (see :mod:`.srcset`).
+
+Resizing is too slow for the upload request, so :func:`schedule_asset_derivatives`
+runs it as a durable ``cms.asset_derivatives`` job when the outbox is enabled
+and on a background thread otherwise. Once the renditions exist, the cached
+pages and embeds that show the image are rebuilt so they pick them up.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import DatabaseError, transaction
+from PIL import Image, ImageOps
+
+from apps.core.services.helpers.in_process import start_in_process_task
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_JOB_KIND = "cms.asset_derivatives"
+BREAKPOINTS = (480, 768, 1200, 1920)
+RASTER_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "webp"})
+_ENCODE_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+
+# Seconds a scheduled rendition run suppresses repeat requests from page renders.
+_SCHEDULE_TTL = 600
+
+_scheduled_lock = threading.Lock()
+_scheduled: dict[str, float] = {}  # dedupe key -> monotonic expiry
+
+
+def derivatives_enabled() -> bool:
+    return bool(getattr(settings, "CMS_IMAGE_DERIVATIVES_ENABLED", True))
+
+
+def has_raster_source(file_name: str) -> bool:
+    """Whether the asset file is an image Pillow should resize (SVG and GIF are served as-is)."""
+    return os.path.splitext(file_name or "")[1].lstrip(".").lower() in RASTER_EXTENSIONS
+
+
+def derivative_widths(width: int) -> list[int]:
+    """Breakpoints narrower than the original, plus the original width when it is below the largest."""
+    widths = [breakpoint for breakpoint in BREAKPOINTS if breakpoint < width]
+    return widths if width > BREAKPOINTS[-1] else [*widths, width]
+
+
+def schedule_asset_derivatives(asset_id, file_name: str) -> None:
+    """Queue rendition generation for one version of an asset file; call after it commits."""
+    from apps.core.services.background_jobs import enqueue_job, jobs_enabled
+
+    if not derivatives_enabled() or not has_raster_source(file_name):
+        return
+    dedupe_key = f"{asset_id}:{file_name}"
+    now = time.monotonic()
+    with _scheduled_lock:
+        if _scheduled.get(dedupe_key, 0.0) > now:
+            return
+        # Expiry lets a run that never finished (a lost thread, a dropped job) be scheduled again.
+        _scheduled[dedupe_key] = now + _SCHEDULE_TTL
+    if jobs_enabled():
+        try:
+            enqueue_job(
+                kind=DERIVATIVE_JOB_KIND, dedupe_key=dedupe_key, payload={"asset_id": str(asset_id)}, max_attempts=3
+            )
+            return
+        except DatabaseError:
+            logger.exception("Could not queue image derivatives for CMS asset %s; generating in-process", asset_id)
+    thread = start_in_process_task(
+        _generate_in_process, asset_id, dedupe_key, name="cms-asset-derivatives", best_effort_start=True
+    )
+    if thread is None:
+        _forget_scheduled(dedupe_key)
+
+
+def _forget_scheduled(dedupe_key: str) -> None:
+    with _scheduled_lock:
+        _scheduled.pop(dedupe_key, None)
+
+
+def _generate_in_process(asset_id, dedupe_key: str) -> None:
+    try:
+        generated = generate_asset_derivatives(asset_id)
+    except Exception:
+        # Failed: the next render that finds the renditions missing schedules another run.
+        _forget_scheduled(dedupe_key)
+        raise
+    if generated:
+        _forget_scheduled(dedupe_key)
+    # A file that cannot be decoded keeps its entry, so it is only retried once the TTL expires.
+
+
+def generate_asset_derivatives(asset_id) -> list:
+    """Write the renditions of the asset's current file and replace its previous ones.
+
+    Returns the derivative rows, or an empty list when the asset is gone, is not
+    a raster image, or cannot be decoded.
+    """
+    from apps.cms.models import CMSAsset, CMSAssetDerivative
+
+    asset = CMSAsset.objects.filter(pk=asset_id).first()
+    if asset is None or not asset.file or not has_raster_source(asset.file.name):
+        return []
+    source_name = asset.file.name
+    current = list(asset.derivatives.filter(source_name=source_name))
+    if current:
+        return current
+
+    try:
+        with asset.file.open("rb") as source:
+            image = ImageOps.exif_transpose(Image.open(source))
+            image.load()
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        logger.warning("Could not decode CMS asset %s for image derivatives: %s", asset_id, exc)
+        return []
+    # JPEG has no alpha channel, so transparent images only get WebP renditions.
+    has_alpha = image.mode in {"RGBA", "LA", "PA"} or "transparency" in image.info
+    image = image.convert("RGBA" if has_alpha else "RGB")
+    formats = ["webp"] if has_alpha else ["webp", "jpeg"]
+
+    written: list[str] = []
+    derivatives = [
+        _render(asset, source_name, image, width, image_format, written)
+        for image_format in formats
+        for width in derivative_widths(image.width)
+    ]
+    kept_names = {derivative.file.name for derivative in derivatives}
+    with transaction.atomic():
+        if not CMSAsset.objects.select_for_update().filter(pk=asset.pk, file=source_name).exists():
+            # The file was replaced while we were resizing; its own job renders the new one.
+            transaction.on_commit(lambda: _delete_files(written))
+            return []
+        stale = list(asset.derivatives.values_list("file", flat=True))
+        asset.derivatives.all().delete()
+        CMSAssetDerivative.objects.bulk_create(derivatives)
+        transaction.on_commit(lambda: _delete_files(name for name in stale if name not in kept_names))
+        transaction.on_commit(lambda: refresh_pages_using_asset(asset.pk))
+    logger.info("Generated %d image derivatives for CMS asset %s", len(derivatives), asset_id)
+    return derivatives
+
+
+def _render(asset, source_name: str, image, width: int, image_format: str, written: list[str]):
+    from apps.cms.models import CMSAssetDerivative
+
+    height = max(1, round(image.height * width / image.width))
+    resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    resized.save(buffer, **_ENCODE_OPTIONS[image_format])
+    content = buffer.getvalue()
+    content_hash = hashlib.sha256(content).hexdigest()
+
+    derivative = CMSAssetDerivative(
+        asset=asset,
+        source_name=source_name,
+        width=width,
+        height=height,
+        format=image_format,
+        content_hash=content_hash,
+    )
+    name = derivative.file.field.generate_filename(derivative, f"asset-{width}w.{content_hash[:12]}.{image_format}")
+    storage = derivative.file.storage
+    # Identical renditions keep their name, so cached pages and CDN copies stay valid.
+    if not storage.exists(name):
+        name = storage.save(name, ContentFile(content))
+        written.append(name)
+    derivative.file.name = name
+    return derivative
+
+
+def _delete_files(names) -> None:
+    from apps.cms.models import CMSAssetDerivative
+
+    storage = CMSAssetDerivative._meta.get_field("file").storage
+    for name in names:
+        try:
+            storage.delete(name)
+        except OSError:
+            logger.warning("Could not delete CMS image derivative %s", name, exc_info=True)
+
+
+def delete_derivative_files(asset_id) -> None:
+    """Remove the stored renditions of an asset that is being deleted."""
+    from apps.cms.models import CMSAssetDerivative
+
+    names = list(CMSAssetDerivative.objects.filter(asset_id=asset_id).values_list("file", flat=True))
+    if names:
+        transaction.on_commit(lambda: _delete_files(names))
+
+
+def refresh_pages_using_asset(asset_id) -> None:
+    """Retire and re-warm the cached pages and embeds whose blocks reference the asset."""
+    from apps.cms.models import CMSPage
+    from apps.cms.services.cache_warming import schedule_cache_warm
+    from apps.cms.views.cms import clear_cms_page_cache
+    from apps.cms.views.embed import clear_embed_caches
+
+    routes = list(
+        CMSPage.objects.filter(blocks__data__icontains=f"cms/assets/{asset_id}/")
+        .values_list("route", flat=True)
+        .distinct()
+    )
+    if not routes:
+        return
+    clear_cms_page_cache(*routes, homepage=True)
+    clear_embed_caches()
+    schedule_cache_warm(routes, homepage=True, embeds=True)
+
+
+def generate_asset_derivatives_job(job) -> None:
+    """Durable job handler for ``cms.asset_derivatives``."""
+    from apps.core.services.background_jobs import TransientJobError
+
+    try:
+        generate_asset_derivatives((job.payload or {}).get("asset_id"))
+    except DatabaseError as exc:
+        raise TransientJobError("Image derivatives could not be recorded.") from exc
@@ -0,0 +1,84 @@
+"""``srcset`` maps for CMS asset images referenced from block data.
+
+Blocks store plain image URLs (``image_url`` and friends). Serializers pass the
+block data of a whole page to :func:`image_srcsets_for`, which resolves every
+CMS asset URL in it with one query and returns the renditions recorded for
+each. Image assets that have none yet are queued for generation, so an image
+placed before the pipeline existed is resized on its first request.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+from django.db.models import F
+
+from .derivatives import derivatives_enabled, has_raster_source, schedule_asset_derivatives
+
+_ASSET_URL_RE = re.compile(
+    r"/cms/assets/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})/", re.IGNORECASE
+)
+
+
+def _iter_image_urls(data):
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if isinstance(value, str) and key.endswith("_url"):
+                yield value
+            else:
+                yield from _iter_image_urls(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from _iter_image_urls(item)
+
+
+def image_srcsets_for(block_data: Iterable) -> dict[str, dict[str, str]]:
+    """Map each CMS asset URL in ``block_data`` to ``{format: srcset}`` for its renditions."""
+    asset_ids_by_url = {}
+    for url in {url for data in block_data for url in _iter_image_urls(data)}:
+        match = _ASSET_URL_RE.search(url)
+        if match:
+            asset_ids_by_url[url] = match.group(1).lower()
+    if not asset_ids_by_url:
+        return {}
+
+    from apps.cms.models import CMSAsset, CMSAssetDerivative
+
+    asset_ids = set(asset_ids_by_url.values())
+    srcsets: dict[str, dict[str, list[str]]] = {}
+    derivatives = CMSAssetDerivative.objects.filter(asset_id__in=asset_ids, source_name=F("asset__file")).order_by(
+        "format", "width"
+    )
+    for derivative in derivatives:
+        srcsets.setdefault(str(derivative.asset_id), {}).setdefault(derivative.format, []).append(
+            f"{derivative.file.url} {derivative.width}w"
+        )
+
+    missing = asset_ids - srcsets.keys()
+    if missing and derivatives_enabled():
+        for asset_id, file_name in CMSAsset.objects.filter(pk__in=missing).values_list("pk", "file"):
+            if has_raster_source(file_name):
+                schedule_asset_derivatives(asset_id, file_name)
+
+    return {
+        url: {image_format: ", ".join(candidates) for image_format, candidates in srcsets[asset_id].items()}
+        for url, asset_id in asset_ids_by_url.items()
+        if asset_id in srcsets
+    }
+
+
+def add_image_srcsets(data, srcsets: dict[str, dict[str, str]]):
+    """Return block ``data`` with a ``<name>_srcset`` entry beside every ``<name>_url`` that has renditions."""
+    if not srcsets:
+        return data
+    if isinstance(data, list):
+        return [add_image_srcsets(item, srcsets) for item in data]
+    if not isinstance(data, dict):
+        return data
+    result = {}
+    for key, value in data.items():
+        result[key] = add_image_srcsets(value, srcsets)
+        if isinstance(value, str) and key.endswith("_url") and value in srcsets:
+            result[f"{key.removesuffix('_url')}_srcset"] = srcsets[value]
+    return result
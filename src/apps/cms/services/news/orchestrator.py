@@ -1,21 +1,31 @@
-"""Shared orchestration for configured news-feed synchronization."""
+"""Shared orchestration for configured news-feed synchronization.
+
+Sources are synchronized concurrently, one worker thread per source up to
+``_MAX_SOURCE_WORKERS``, so a run takes about as long as its slowest source.
+Every worker shares one :class:`~.scheduler.ScrapeScheduler`, which keeps the
+per-host request limits intact across sources. Audit rows are written on the
+calling thread once every source has finished.
+"""
 
 from __future__ import annotations
 
 import logging
 import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from django.db import transaction
+from django.db import close_old_connections, transaction
 from django.utils import timezone
 
 from apps.cms.models import NewsFeedSource, NewsSyncLog
 
+from .scheduler import ScrapeScheduler
 from .sync import sync_news
 
 logger = logging.getLogger(__name__)
 _DIAGNOSTIC_MAX_LENGTH = 2000
+_MAX_SOURCE_WORKERS = 4
 
 
 def _diagnostic_text(value: Any) -> str:
@@ -30,19 +40,40 @@ def _messages(result: dict[str, Any], key: str) -> list[str]:
     return [message for value in values if (message := _diagnostic_text(value))]
 
 
-def sync_feed_source(source: NewsFeedSource) -> dict[str, Any]:
-    """Synchronize one configured source and persist its attempt metadata."""
+def _attempt_source_sync(source: NewsFeedSource, scheduler: ScrapeScheduler | None) -> dict[str, Any]:
+    """Run ``sync_news`` for one source and time the attempt."""
     started_at = timezone.now()
     monotonic_started_at = time.monotonic()
 
     try:
-        raw_result = sync_news(feed_url=source.feed_url, source_key=source.source_key)
+        raw_result = sync_news(feed_url=source.feed_url, source_key=source.source_key, scheduler=scheduler)
     except Exception as exc:  # noqa: BLE001 - persist an audit row for an unexpected boundary failure.
         logger.exception("Unexpected news sync failure for source %s", source.source_key)
         raw_result = {"created": 0, "updated": 0, "errors": [str(exc)], "warnings": []}
 
-    duration_seconds = round(time.monotonic() - monotonic_started_at, 2)
-    completed_at = timezone.now()
+    return {
+        "raw_result": raw_result,
+        "started_at": started_at,
+        "duration_seconds": round(time.monotonic() - monotonic_started_at, 2),
+        "completed_at": timezone.now(),
+    }
+
+
+def _attempt_source_sync_in_thread(source: NewsFeedSource, scheduler: ScrapeScheduler) -> dict[str, Any]:
+    """Worker-thread entry point: give the attempt its own clean Django connection."""
+    close_old_connections()
+    try:
+        return _attempt_source_sync(source, scheduler)
+    finally:
+        close_old_connections()
+
+
+def _record_source_attempt(source: NewsFeedSource, attempt: dict[str, Any]) -> dict[str, Any]:
+    """Persist one attempt's metadata on the source and as a ``NewsSyncLog`` row."""
+    raw_result = attempt["raw_result"]
+    started_at = attempt["started_at"]
+    completed_at = attempt["completed_at"]
+    duration_seconds = attempt["duration_seconds"]
     created = int(raw_result.get("created") or 0)
     updated = int(raw_result.get("updated") or 0)
     errors = _messages(raw_result, "errors")
@@ -83,9 +114,27 @@ def sync_feed_source(source: NewsFeedSource) -> dict[str, Any]:
     }
 
 
+def sync_feed_source(source: NewsFeedSource, *, scheduler: ScrapeScheduler | None = None) -> dict[str, Any]:
+    """Synchronize one configured source and persist its attempt metadata."""
+    return _record_source_attempt(source, _attempt_source_sync(source, scheduler))
+
+
 def sync_feed_sources(sources: Iterable[NewsFeedSource]) -> dict[str, Any]:
     """Synchronize configured sources and return aggregate and per-source results."""
-    feed_results = [sync_feed_source(source) for source in sources]
+    sources = list(sources)
+    with ScrapeScheduler() as scheduler:
+        if len(sources) <= 1:
+            feed_results = [sync_feed_source(source, scheduler=scheduler) for source in sources]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(sources), _MAX_SOURCE_WORKERS),
+                thread_name_prefix="news-sync",
+            ) as pool:
+                attempts = list(pool.map(lambda source: _attempt_source_sync_in_thread(source, scheduler), sources))
+            feed_results = [
+                _record_source_attempt(source, attempt) for source, attempt in zip(sources, attempts, strict=True)
+            ]
+
     errors: list[str] = []
     warnings: list[str] = []
 
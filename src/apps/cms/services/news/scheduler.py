@@ -0,0 +1,109 @@
+"""Shared politeness scheduler for outbound news fetches.
+
+Several feed sources can be synchronized at the same time, and their article
+pages often live on the same host. A single :class:`ScrapeScheduler` is shared
+by every source in one run so that the per-host limits hold across sources:
+
+  * at most ``per_host_concurrency`` requests are in flight per host;
+  * consecutive request starts to one host are spaced by ``per_host_delay``;
+  * at most ``max_concurrency`` requests are in flight overall.
+
+Requests made inside :meth:`ScrapeScheduler.slot` reuse keep-alive connections
+from the scheduler's :class:`~.url_guard.ConnectionPool`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from .url_guard import ConnectionPool, pooled_connections
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_PER_HOST_CONCURRENCY = 2
+DEFAULT_PER_HOST_DELAY_SECONDS = 0.2
+
+
+def _host_of(url: str) -> str:
+    try:
+        return (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+class _HostState:
+    def __init__(self, concurrency: int):
+        self.semaphore = threading.BoundedSemaphore(concurrency)
+        self.next_start = 0.0
+
+
+class ScrapeScheduler:
+    """Bound concurrent and back-to-back requests per host and overall."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+        per_host_delay: float = DEFAULT_PER_HOST_DELAY_SECONDS,
+        connection_pool: ConnectionPool | None = None,
+    ):
+        if max_concurrency < 1 or per_host_concurrency < 1:
+            raise ValueError("Scheduler concurrency limits must be at least 1.")
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_delay = max(per_host_delay, 0.0)
+        self.connection_pool = connection_pool or ConnectionPool(max_idle_per_host=per_host_concurrency)
+        self._global = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+
+    def _host_state(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.per_host_concurrency)
+            return state
+
+    def _wait_for_turn(self, state: _HostState) -> None:
+        """Reserve the host's next start time, then sleep until it arrives."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, state.next_start)
+            state.next_start = start + self.per_host_delay
+        if start > now:
+            time.sleep(start - now)
+
+    def worker_count(self, urls: Iterable[str]) -> int:
+        """Return how many threads can usefully run ``urls`` under these limits."""
+        per_host: dict[str, int] = {}
+        for url in urls:
+            host = _host_of(url)
+            per_host[host] = per_host.get(host, 0) + 1
+        useful = sum(min(count, self.per_host_concurrency) for count in per_host.values())
+        return max(1, min(useful, self.max_concurrency))
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """Hold a request slot for ``url``'s host for the duration of the block.
+
+        The host slot is taken before the global one, so a request waiting on a
+        busy host never holds capacity another host could use.
+        """
+        state = self._host_state(_host_of(url))
+        with state.semaphore:
+            self._wait_for_turn(state)
+            with self._global, pooled_connections(self.connection_pool):
+                yield
+
+    def close(self) -> None:
+        self.connection_pool.close()
+
+    def __enter__(self) -> ScrapeScheduler:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
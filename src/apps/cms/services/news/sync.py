@@ -6,16 +6,18 @@ from defusedxml import ElementTree as DefusedET
 from defusedxml.common import DefusedXmlException
 from django.core.cache import cache
 from django.db import DatabaseError
+from django.utils import timezone
 
 from apps.cms.models import NewsArticle
 
-from .feed_parser import extract_image_url, extract_summary, fetch_feed, parse_feed_items, parse_pub_date
+from .feed_parser import FEED_URL, extract_image_url, extract_summary, fetch_feed, parse_feed_items, parse_pub_date
+from .scheduler import ScrapeScheduler
 from .scraper import scrape_article
 from .url_guard import has_allowed_scheme
 
 logger = logging.getLogger(__name__)
 
-_SCRAPER_MAX_WORKERS = 4
+_BULK_BATCH_SIZE = 200
 _DIAGNOSTIC_MAX_LENGTH = 2000
 
 
@@ -42,10 +44,11 @@ def _raw_feed_description(raw_payload: str) -> tuple[bool, str]:
     return True, description.text or ""
 
 
-def _scrape_one(article_id, source_url: str) -> tuple:
+def _scrape_one(article_id, source_url: str, scheduler: ScrapeScheduler) -> tuple:
     """Scrape one article and return its result without failing the worker pool."""
     try:
-        return article_id, scrape_article(source_url), None
+        with scheduler.slot(source_url):
+            return article_id, scrape_article(source_url), None
     except Exception as exc:  # noqa: BLE001
         warning = f"Failed to scrape article {article_id}: {_exception_text(exc)}"
         logger.warning("%s; using RSS content", warning)
@@ -84,8 +87,93 @@ def _apply_feed_defaults(article: NewsArticle, defaults: dict) -> list[str]:
     return changed_fields
 
 
-def sync_news(feed_url: str | None = None, source_key: str = "ucmerced") -> dict:
-    """Fetch an RSS feed and upsert articles, separating failures from warnings."""
+def _feed_item_defaults(item: dict, source_key: str, warnings: list[str]) -> tuple[str, dict] | None:
+    """Return ``(guid, defaults)`` for one feed item, or ``None`` when it must be skipped."""
+    item_label = _diagnostic_text(item.get("guid") or item.get("title") or "unknown")
+    guid = item["guid"] or item["link"]
+    if not guid:
+        warnings.append(f"Skipping item with no guid/link: {item_label}")
+        return None
+
+    published_at = parse_pub_date(item["pub_date"])
+    if not published_at:
+        warnings.append(f"Skipping item with invalid date: {_diagnostic_text(guid)}")
+        return None
+
+    raw = None
+    try:
+        raw_el = ET.Element("item")
+        for key, val in item.items():
+            child = ET.SubElement(raw_el, key)
+            child.text = val
+        raw = ET.tostring(raw_el, encoding="unicode")
+    except (TypeError, ValueError):
+        logger.debug("Failed to serialize raw XML for %s", item_label)
+        warnings.append(f"Failed to serialize raw XML for {_diagnostic_text(guid)}")
+
+    # The link is attacker-influenced (it comes straight from the remote
+    # feed). Only persist/scrape http(s) URLs so a file:// or javascript:
+    # link can never be stored as a rendered href or fetched by the
+    # scraper. The fetch itself is additionally IP/redirect-guarded.
+    raw_link = item["link"]
+    safe_link = raw_link[:1000] if has_allowed_scheme(raw_link) else ""
+
+    defaults = {
+        "title": item["title"][:500],
+        "source_url": safe_link,
+        "summary": extract_summary(item["description"]),
+        "image_url": extract_image_url(item["description"])[:1000],
+        "content": item["description"],
+        "author": item["creator"][:255],
+        "published_at": published_at,
+        "source": source_key,
+    }
+    if raw is not None:
+        defaults["raw_payload"] = raw
+    return guid, defaults
+
+
+def _bulk_update_articles(articles: list[NewsArticle], fields: set[str]) -> None:
+    """Write ``fields`` for ``articles`` in one batched ``UPDATE``, stamping ``updated_at``."""
+    now = timezone.now()
+    for article in articles:
+        article.updated_at = now
+    NewsArticle.objects.bulk_update(articles, sorted({*fields, "updated_at"}), batch_size=_BULK_BATCH_SIZE)
+
+
+def _surviving_article_ids(article_ids) -> set[object]:
+    """Return the subset of ``article_ids`` that still exist, in one query."""
+    return set(NewsArticle.objects.filter(pk__in=list(article_ids)).values_list("pk", flat=True))
+
+
+def _scraped_fields(scraped: dict) -> dict[str, str]:
+    return {
+        "hero_image_url": scraped.get("hero_image_url", "")[:1000],
+        "hero_caption": scraped.get("hero_caption", "")[:500],
+        "content": scraped["body_html"],
+    }
+
+
+def sync_news(
+    feed_url: str | None = None,
+    source_key: str = "ucmerced",
+    *,
+    scheduler: ScrapeScheduler | None = None,
+) -> dict:
+    """Fetch an RSS feed and upsert articles, separating failures from warnings.
+
+    Existing rows are prefetched by ``source_guid`` in one query, new and
+    changed rows are written with ``bulk_create``/``bulk_update``, and the
+    scraped page content is applied in a single batched update at the end.
+
+    Outbound requests go through ``scheduler`` so that concurrently syncing
+    sources share per-host politeness limits and keep-alive connections; a
+    private scheduler is used when none is given.
+    """
+    if scheduler is None:
+        with ScrapeScheduler() as private_scheduler:
+            return sync_news(feed_url, source_key, scheduler=private_scheduler)
+
     created = 0
     errors: list[str] = []
     warnings: list[str] = []
@@ -94,7 +182,8 @@ def sync_news(feed_url: str | None = None, source_key: str = "ucmerced") -> dict
     updated_article_ids: set[object] = set()
 
     try:
-        xml_bytes = fetch_feed(feed_url) if feed_url else fetch_feed()
+        with scheduler.slot(feed_url or FEED_URL):
+            xml_bytes = fetch_feed(feed_url) if feed_url else fetch_feed()
         items = parse_feed_items(xml_bytes)
     except Exception as exc:  # noqa: BLE001
         logger.exception("Failed to fetch/parse RSS feed")
@@ -120,102 +209,105 @@ def sync_news(feed_url: str | None = None, source_key: str = "ucmerced") -> dict
             "scrape_failed": 0,
         }
 
-    # Phase 1: parse feed items and upsert article rows.
-    articles_to_scrape: dict[object, str] = {}
-    processable_items = 0
-
+    # Phase 1: parse feed items, then upsert article rows in bulk.
+    parsed_items: list[tuple[str, dict]] = []
     for item in items:
         item_label = _diagnostic_text(item.get("guid") or item.get("title") or "unknown")
         try:
-            guid = item["guid"] or item["link"]
-            if not guid:
-                warnings.append(f"Skipping item with no guid/link: {item_label}")
-                continue
-
-            published_at = parse_pub_date(item["pub_date"])
-            if not published_at:
-                warnings.append(f"Skipping item with invalid date: {_diagnostic_text(guid)}")
-                continue
-
-            raw = None
-            try:
-                raw_el = ET.Element("item")
-                for key, val in item.items():
-                    child = ET.SubElement(raw_el, key)
-                    child.text = val
-                raw = ET.tostring(raw_el, encoding="unicode")
-            except (TypeError, ValueError):
-                logger.debug("Failed to serialize raw XML for %s", item_label)
-                warnings.append(f"Failed to serialize raw XML for {_diagnostic_text(guid)}")
-
-            # The link is attacker-influenced (it comes straight from the remote
-            # feed). Only persist/scrape http(s) URLs so a file:// or javascript:
-            # link can never be stored as a rendered href or fetched by the
-            # scraper. The fetch itself is additionally IP/redirect-guarded.
-            raw_link = item["link"]
-            safe_link = raw_link[:1000] if has_allowed_scheme(raw_link) else ""
-
-            defaults = {
-                "title": item["title"][:500],
-                "source_url": safe_link,
-                "summary": extract_summary(item["description"]),
-                "image_url": extract_image_url(item["description"])[:1000],
-                "content": item["description"],
-                "author": item["creator"][:255],
-                "published_at": published_at,
-                "source": source_key,
-            }
-            if raw is not None:
-                defaults["raw_payload"] = raw
+            parsed = _feed_item_defaults(item, source_key, warnings)
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            logger.exception("Error syncing item: %s", item_label)
+            warnings.append(f"Error syncing {item_label}: {_exception_text(exc)}")
+            continue
+        if parsed is not None:
+            parsed_items.append(parsed)
 
-            article, was_created = NewsArticle.objects.get_or_create(
-                source_guid=guid,
-                defaults=defaults,
+    articles: dict[str, NewsArticle] = {}
+    if parsed_items:
+        try:
+            articles = NewsArticle.objects.in_bulk(
+                list({guid for guid, _defaults in parsed_items}), field_name="source_guid"
             )
+        except DatabaseError as exc:
+            logger.exception("Database error loading existing news articles")
+            errors.append(f"Database error syncing feed items: {_exception_text(exc)}")
+            parsed_items = []
+
+    new_articles: dict[str, NewsArticle] = {}
+    changed_articles: dict[str, NewsArticle] = {}
+    changed_fields: set[str] = set()
+    processable_guids: dict[str, None] = {}
+
+    for guid, defaults in parsed_items:
+        if guid in new_articles:
+            # A repeated GUID within one feed: the last item wins, as before.
+            for field, value in defaults.items():
+                setattr(new_articles[guid], field, value)
+            continue
 
-            changed_fields: list[str] = []
-            if was_created:
-                created += 1
-                created_article_ids.add(article.pk)
-            else:
-                if article.source != source_key:
-                    error = (
-                        f"Source GUID collision for {_diagnostic_text(guid)}: "
-                        f"existing source '{_diagnostic_text(article.source)}' does not match "
-                        f"feed source '{_diagnostic_text(source_key)}'"
-                    )
-                    logger.error(error)
-                    errors.append(error)
-                    continue
-                changed_fields = _apply_feed_defaults(article, defaults)
-                if changed_fields:
-                    article.save(update_fields=changed_fields)
-                    updated_article_ids.add(article.pk)
-
-            processable_items += 1
-
-            # Refresh every valid article page. The page body/hero can change
-            # without any corresponding RSS item change, and transient scrape
-            # failures must be retried on the next synchronization.
-            if article.source_url:
-                articles_to_scrape[article.pk] = article.source_url
+        article = articles.get(guid)
+        if article is None:
+            article = NewsArticle(source_guid=guid, **defaults)
+            articles[guid] = article
+            new_articles[guid] = article
+        else:
+            if article.source != source_key:
+                error = (
+                    f"Source GUID collision for {_diagnostic_text(guid)}: "
+                    f"existing source '{_diagnostic_text(article.source)}' does not match "
+                    f"feed source '{_diagnostic_text(source_key)}'"
+                )
+                logger.error(error)
+                errors.append(error)
+                continue
+            fields = _apply_feed_defaults(article, defaults)
+            if fields:
+                changed_articles[guid] = article
+                changed_fields.update(fields)
+        processable_guids[guid] = None
 
+    if new_articles:
+        try:
+            NewsArticle.objects.bulk_create(list(new_articles.values()), batch_size=_BULK_BATCH_SIZE)
         except DatabaseError as exc:
-            logger.exception("Database error syncing item: %s", item_label)
-            errors.append(f"Database error syncing {item_label}: {_exception_text(exc)}")
-        except (OSError, ValueError, TypeError, KeyError) as exc:
-            logger.exception("Error syncing item: %s", item_label)
-            warnings.append(f"Error syncing {item_label}: {_exception_text(exc)}")
+            logger.exception("Database error creating %d news articles", len(new_articles))
+            errors.append(f"Database error syncing {len(new_articles)} new articles: {_exception_text(exc)}")
+            for guid in new_articles:
+                processable_guids.pop(guid, None)
+        else:
+            created = len(new_articles)
+            created_article_ids.update(article.pk for article in new_articles.values())
+
+    if changed_articles:
+        try:
+            _bulk_update_articles(list(changed_articles.values()), changed_fields)
+        except DatabaseError as exc:
+            logger.exception("Database error updating %d news articles", len(changed_articles))
+            errors.append(f"Database error syncing {len(changed_articles)} changed articles: {_exception_text(exc)}")
+        else:
+            updated_article_ids.update(article.pk for article in changed_articles.values())
 
+    processable_items = len(processable_guids)
     if processable_items == 0 and not errors:
         error = "RSS feed contained items, but none were processable"
         logger.error(error)
         errors.append(error)
 
+    # Refresh every valid article page. The page body/hero can change without
+    # any corresponding RSS item change, and transient scrape failures must be
+    # retried on the next synchronization.
+    articles_by_id = {articles[guid].pk: articles[guid] for guid in processable_guids}
+    articles_to_scrape = {
+        article_id: article.source_url for article_id, article in articles_by_id.items() if article.source_url
+    }
+
     # Phase 2: scrape full pages in parallel for richer content.
+    scraped_by_id: dict[object, dict[str, str]] = {}
     if articles_to_scrape:
-        with ThreadPoolExecutor(max_workers=_SCRAPER_MAX_WORKERS) as pool:
-            futures = {pool.submit(_scrape_one, art_id, url): art_id for art_id, url in articles_to_scrape.items()}
+        with ThreadPoolExecutor(max_workers=scheduler.worker_count(articles_to_scrape.values())) as pool:
+            futures = {
+                pool.submit(_scrape_one, art_id, url, scheduler): art_id for art_id, url in articles_to_scrape.items()
+            }
             for future in as_completed(futures):
                 try:
                     article_id, scraped, scrape_warning = future.result()
@@ -243,36 +335,46 @@ def sync_news(feed_url: str | None = None, source_key: str = "ucmerced") -> dict
                     continue
 
                 try:
-                    article = NewsArticle.objects.get(pk=article_id)
-                    scraped_fields = {
-                        "hero_image_url": scraped.get("hero_image_url", "")[:1000],
-                        "hero_caption": scraped.get("hero_caption", "")[:500],
-                        "content": scraped["body_html"],
-                    }
-                    update_fields = []
-                    for field, value in scraped_fields.items():
-                        if value and getattr(article, field) != value:
-                            setattr(article, field, value)
-                            update_fields.append(field)
-                    if update_fields:
-                        article.save(update_fields=update_fields)
-                        if article_id not in created_article_ids:
-                            updated_article_ids.add(article_id)
-                except NewsArticle.DoesNotExist:
-                    logger.warning("Article %s disappeared before scrape update", article_id)
-                    warnings.append(f"Article {article_id} disappeared before scrape update")
-                    scrape_failed += 1
-                except DatabaseError as exc:
-                    logger.exception("Database error applying scraped content for article %s", article_id)
-                    errors.append(
-                        f"Database error applying scraped content for article {article_id}: {_exception_text(exc)}"
-                    )
-                    scrape_failed += 1
+                    scraped_by_id[article_id] = _scraped_fields(scraped)
                 except Exception as exc:  # noqa: BLE001
                     logger.exception("Failed to apply scraped content for article %s", article_id)
                     warnings.append(f"Failed to apply scraped content for article {article_id}: {_exception_text(exc)}")
                     scrape_failed += 1
 
+    # Phase 3: apply all scrape results in one batched update.
+    if scraped_by_id:
+        try:
+            surviving_ids = _surviving_article_ids(scraped_by_id)
+            enriched_articles: list[NewsArticle] = []
+            enriched_fields: set[str] = set()
+            for article_id, scraped_fields in scraped_by_id.items():
+                if article_id not in surviving_ids:
+                    logger.warning("Article %s disappeared before scrape update", article_id)
+                    warnings.append(f"Article {article_id} disappeared before scrape update")
+                    scrape_failed += 1
+                    continue
+                article = articles_by_id[article_id]
+                fields = [
+                    field for field, value in scraped_fields.items() if value and getattr(article, field) != value
+                ]
+                if not fields:
+                    continue
+                for field in fields:
+                    setattr(article, field, scraped_fields[field])
+                enriched_articles.append(article)
+                enriched_fields.update(fields)
+            if enriched_articles:
+                _bulk_update_articles(enriched_articles, enriched_fields)
+                updated_article_ids.update(
+                    article.pk for article in enriched_articles if article.pk not in created_article_ids
+                )
+        except DatabaseError as exc:
+            logger.exception("Database error applying scraped content for %d articles", len(scraped_by_id))
+            errors.append(
+                f"Database error applying scraped content for {len(scraped_by_id)} articles: {_exception_text(exc)}"
+            )
+            scrape_failed += len(scraped_by_id)
+
     try:
         cache.delete("news:list")
     except Exception as exc:  # noqa: BLE001 - article writes succeeded; cache failure is non-fatal.
@@ -16,18 +16,29 @@ network/host primitive.
     ``getaddrinfo`` result, so there is no resolve-then-reconnect window for DNS
     rebinding (the connect target is a literal IP, never re-resolved);
   * re-applies the same checks to every redirect target.
+
+Inside :func:`pooled_connections` the same guarded connections are kept alive
+and reused for later requests to the same host. A reused socket is still the
+one that was pinned to a validated address when it was opened.
 """
 
 from __future__ import annotations
 
+import functools
 import http.client
 import ipaddress
 import socket
+import threading
 import urllib.request
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.error import URLError
 from urllib.parse import urlsplit
 
 _ALLOWED_SCHEMES = frozenset({"http", "https"})
 _DEFAULT_PORTS = {"http": 80, "https": 443}
+_MAX_IDLE_CONNECTIONS_PER_HOST = 4
 
 
 class UnsafeUrlError(ValueError):
@@ -162,17 +173,167 @@ class _ValidatingRedirectHandler(urllib.request.HTTPRedirectHandler):
         return super().redirect_request(req, fp, code, msg, headers, newurl)
 
 
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    """Response that hands its connection back to the pool when closed.
+
+    The connection is only reusable when the body was read to the end (so no
+    unread bytes remain on the socket) and the server did not ask to close.
+    """
+
+    _release = None
+
+    def close(self):
+        fully_read = self.fp is None
+        super().close()
+        release, self._release = self._release, None
+        if release is not None:
+            release(reusable=fully_read and not self.will_close)
+
+
+class _PooledGuardedHTTPConnection(_GuardedHTTPConnection):
+    response_class = _PooledHTTPResponse
+
+
+class _PooledGuardedHTTPSConnection(_GuardedHTTPSConnection):
+    response_class = _PooledHTTPResponse
+
+
+class ConnectionPool:
+    """Thread-safe store of idle keep-alive connections keyed by scheme and host.
+
+    A connection is checked out by one request at a time and returned when its
+    response is closed; anything that cannot be safely reused is closed instead.
+    """
+
+    def __init__(self, *, max_idle_per_host: int = _MAX_IDLE_CONNECTIONS_PER_HOST):
+        self.max_idle_per_host = max_idle_per_host
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = defaultdict(list)
+        self._closed = False
+        self.opened = 0
+        self.reused = 0
+
+    def acquire(self, key: tuple[str, str], factory) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.reused += 1
+                return idle.pop(), True
+            self.opened += 1
+        return factory(), False
+
+    def release(self, key: tuple[str, str], conn: http.client.HTTPConnection, *, reusable: bool) -> None:
+        with self._lock:
+            idle = self._idle[key]
+            if reusable and not self._closed and conn.sock is not None and len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            connections = [conn for idle in self._idle.values() for conn in idle]
+            self._idle.clear()
+        for conn in connections:
+            conn.close()
+
+
+_active_pool = threading.local()
+
+
+@contextmanager
+def pooled_connections(pool: ConnectionPool) -> Iterator[ConnectionPool]:
+    """Make ``safe_urlopen`` calls on this thread reuse connections from ``pool``."""
+    previous = getattr(_active_pool, "pool", None)
+    _active_pool.pool = pool
+    try:
+        yield pool
+    finally:
+        _active_pool.pool = previous
+
+
+def _pooled_open(handler, http_class, req, pool: ConnectionPool, **http_conn_args):
+    """Keep-alive counterpart of ``AbstractHTTPHandler.do_open``.
+
+    A request on a reused connection that the server has meanwhile closed is
+    retried once on a fresh (and freshly validated) connection.
+    """
+    host = req.host
+    if not host:
+        raise URLError("no host given")
+    key = (http_class.__name__, host)
+    headers = dict(req.unredirected_hdrs)
+    headers.update({k: v for k, v in req.headers.items() if k not in headers})
+    headers["Connection"] = "keep-alive"
+    headers = {name.title(): val for name, val in headers.items()}
+
+    while True:
+        conn, reused = pool.acquire(key, lambda: http_class(host, timeout=req.timeout, **http_conn_args))
+        conn.set_debuglevel(handler._debuglevel)
+        conn.timeout = req.timeout
+        try:
+            if conn.sock is not None:
+                conn.sock.settimeout(req.timeout)
+            conn.request(
+                req.get_method(),
+                req.selector,
+                req.data,
+                headers,
+                encode_chunked=req.has_header("Transfer-encoding"),
+            )
+            response = conn.getresponse()
+        except (OSError, http.client.HTTPException) as err:
+            conn.close()
+            if reused and not isinstance(err, TimeoutError):
+                continue
+            if isinstance(err, OSError):
+                raise URLError(err)
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        break
+
+    response.url = req.get_full_url()
+    response.msg = response.reason
+    response._release = functools.partial(pool.release, key, conn)
+    return response
+
+
+class _PooledGuardedHTTPHandler(urllib.request.HTTPHandler):
+    def __init__(self, pool: ConnectionPool):
+        super().__init__()
+        self.pool = pool
+
+    def http_open(self, req):
+        return _pooled_open(self, _PooledGuardedHTTPConnection, req, self.pool)
+
+
+class _PooledGuardedHTTPSHandler(urllib.request.HTTPSHandler):
+    def __init__(self, pool: ConnectionPool):
+        super().__init__()
+        self.pool = pool
+
+    def https_open(self, req):
+        return _pooled_open(self, _PooledGuardedHTTPSConnection, req, self.pool, context=self._context)
+
+
 def safe_urlopen(url: str, *, timeout: float, headers: dict | None = None):
     """Validate ``url`` (and every redirect) then open it through IP-pinned
     connections. Mirrors ``urlopen``'s context-manager return so callers can
-    ``with safe_urlopen(...) as resp:``."""
+    ``with safe_urlopen(...) as resp:``.
+
+    Inside :func:`pooled_connections` the connection is kept alive and returned
+    to that pool once the response has been read and closed."""
     validate_public_http_url(url)
     request = urllib.request.Request(url, headers=headers or {})
-    opener = urllib.request.build_opener(
-        _GuardedHTTPHandler(),
-        _GuardedHTTPSHandler(),
-        _ValidatingRedirectHandler(),
-    )
+    pool = getattr(_active_pool, "pool", None)
+    if pool is None:
+        handlers = (_GuardedHTTPHandler(), _GuardedHTTPSHandler())
+    else:
+        handlers = (_PooledGuardedHTTPHandler(pool), _PooledGuardedHTTPSHandler(pool))
+    opener = urllib.request.build_opener(*handlers, _ValidatingRedirectHandler())
     return opener.open(request, timeout=timeout)
 
 
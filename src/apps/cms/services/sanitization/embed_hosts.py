@@ -2,17 +2,19 @@
 
 Hosts come from the admin-managed `CMSEmbedAllowedHost` table. Entries may be
 exact (`docs.google.com`) or subdomain wildcards (`*.youtube.com`). Lookups are
-cached for a short TTL to keep block validation cheap.
+cached in the two-tier cache for a short TTL to keep block validation and the
+per-response CSP header cheap.
 """
 
 import hashlib
 import json
 from urllib.parse import urlparse
 
-from django.core.cache import cache
+from apps.core.services.cache import tiered_cache
 
 CACHE_KEY = "cms:embed-allowed-hosts:v1"
 CACHE_TTL = 60
+CACHE_TAG = "embed-hosts"
 
 
 class InvalidEmbedURL(ValueError):
@@ -41,16 +43,14 @@ def parse_embed_url(src: str) -> tuple[str, str]:
 
 
 def get_allowed_hosts() -> list[str]:
-    """Return the list of active allowed hostnames (cached)."""
-    cached = cache.get(CACHE_KEY)
-    if cached is not None:
-        return cached
+    """Return the list of active allowed hostnames (cached; do not mutate)."""
+    return tiered_cache.get_or_set(CACHE_KEY, _load_allowed_hosts, tags=(CACHE_TAG,), timeout=CACHE_TTL)
 
+
+def _load_allowed_hosts() -> list[str]:
     from apps.cms.models import CMSEmbedAllowedHost
 
-    hosts = list(CMSEmbedAllowedHost.objects.filter(is_active=True).values_list("hostname", flat=True))
-    cache.set(CACHE_KEY, hosts, CACHE_TTL)
-    return hosts
+    return list(CMSEmbedAllowedHost.objects.filter(is_active=True).values_list("hostname", flat=True))
 
 
 def get_allowed_hosts_snapshot() -> dict[str, object]:
@@ -62,7 +62,7 @@ def get_allowed_hosts_snapshot() -> dict[str, object]:
 
 
 def invalidate_cache() -> None:
-    cache.delete(CACHE_KEY)
+    tiered_cache.invalidate(CACHE_TAG, keys=(CACHE_KEY,))
 
 
 def is_host_allowed(host: str) -> bool:
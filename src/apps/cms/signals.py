@@ -4,18 +4,28 @@ Signal handlers for cache invalidation when layout or CMS content is updated.
 All cache deletions are deferred via ``transaction.on_commit`` so they execute
 only after the database transaction commits.  This prevents a race where a
 concurrent request re-caches stale data that hasn't been committed yet.
+Layout and page payloads live in the two-tier cache, so clearing them also
+bumps their tag revision and retires the process-local copies everywhere.
+Embed widget payloads are cleared on widget, source page, block and schedule
+changes. After clearing, the same callbacks queue a warm of the entries they
+retired (see :mod:`apps.cms.services.cache_warming`). A newly uploaded image
+asset queues its responsive renditions (see :mod:`apps.cms.services.media`).
 """
 
 import logging
 
 from django.core.cache import cache
 from django.db import transaction
-from django.db.models.signals import post_delete, post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
+from apps.event.models import CurrentProjectSchedule
+
 from .models import (
+    CMSAsset,
     CMSBlock,
     CMSEmbedAllowedHost,
+    CMSEmbedWidget,
     CMSPage,
     FooterContent,
     Menu,
@@ -24,19 +34,16 @@ from .models import (
     SiteSettings,
     StyleSheet,
 )
+from .services.cache_warming import schedule_cache_warm
+from .services.media import delete_derivative_files, schedule_asset_derivatives
 from .services.sanitization.embed_hosts import invalidate_cache as invalidate_embed_host_cache
-from .views.layout import LAYOUT_CACHE_KEY, LAYOUT_STYLESHEET_CACHE_KEY
-
-HOMEPAGE_CACHE_KEY = "cms:homepage"
+from .views.cms import clear_cms_page_cache
+from .views.embed import clear_embed_caches
+from .views.layout import clear_layout_caches
 
 logger = logging.getLogger(__name__)
 
 
-def _clear_layout_caches():
-    cache.delete(LAYOUT_CACHE_KEY)
-    cache.delete(LAYOUT_STYLESHEET_CACHE_KEY)
-
-
 @receiver([post_save, post_delete], sender=CMSEmbedAllowedHost)
 # noinspection PyUnusedLocal
 def invalidate_embed_host_policy(sender, instance, **kwargs):
@@ -53,9 +60,10 @@ def invalidate_layout_cache(sender, instance, **kwargs):
     """Clear layout caches when Menu, FooterContent, or SiteSettings change."""
 
     def _clear():
-        _clear_layout_caches()
+        clear_layout_caches()
         if sender is SiteSettings:
-            cache.delete(HOMEPAGE_CACHE_KEY)
+            clear_cms_page_cache(homepage=True)
+        schedule_cache_warm(homepage=sender is SiteSettings, layout=True)
 
     transaction.on_commit(_clear)
 
@@ -64,7 +72,12 @@ def invalidate_layout_cache(sender, instance, **kwargs):
 # noinspection PyUnusedLocal
 def invalidate_stylesheet_cache(sender, instance, **kwargs):
     """Clear layout caches when a StyleSheet is saved or deleted."""
-    transaction.on_commit(_clear_layout_caches)
+
+    def _clear():
+        clear_layout_caches()
+        schedule_cache_warm(layout=True)
+
+    transaction.on_commit(_clear)
 
 
 @receiver(pre_save, sender=CMSPage)
@@ -101,12 +114,16 @@ def invalidate_cms_page_cache(sender, instance, **kwargs):
     route = instance.route
     old_route = getattr(instance, "_old_route", None)
 
+    page_id = instance.pk
+
     def _clear():
-        cache.delete(f"cms:page:{route}")
-        cache.delete(HOMEPAGE_CACHE_KEY)
-        if old_route and old_route != route:
-            cache.delete(f"cms:page:{old_route}")
-        _clear_layout_caches()
+        stale_route = old_route if old_route != route else None
+        clear_cms_page_cache(route, stale_route, homepage=True)
+        clear_layout_caches()
+        embeds = _page_has_embeds(page_id)
+        if embeds:
+            clear_embed_caches()
+        schedule_cache_warm((route, stale_route), homepage=True, layout=True, embeds=embeds)
 
     transaction.on_commit(_clear)
 
@@ -120,12 +137,52 @@ def invalidate_cms_block_cache(sender, instance, **kwargs):
         return
 
     def _clear():
-        cache.delete(HOMEPAGE_CACHE_KEY)
-        try:
-            page = CMSPage.objects.get(pk=page_id)
-            cache.delete(f"cms:page:{page.route}")
-        except CMSPage.DoesNotExist:
-            pass
+        route = CMSPage.objects.filter(pk=page_id).values_list("route", flat=True).first()
+        clear_cms_page_cache(route, homepage=True)
+        embeds = _page_has_embeds(page_id)
+        if embeds:
+            clear_embed_caches()
+        schedule_cache_warm((route,), homepage=True, embeds=embeds)
+
+    transaction.on_commit(_clear)
+
+
+def _page_has_embeds(page_id) -> bool:
+    return CMSEmbedWidget.objects.filter(page_id=page_id).exists()
+
+
+@receiver(pre_save, sender=CMSEmbedWidget)
+# noinspection PyUnusedLocal
+def stash_old_embed_slug(sender, instance, **kwargs):
+    """Remember the old slug before save so a renamed widget's cache is cleared."""
+    if instance._state.adding:
+        instance._old_slug = None
+        return
+    instance._old_slug = CMSEmbedWidget.objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+
+
+@receiver([post_save, post_delete], sender=CMSEmbedWidget)
+# noinspection PyUnusedLocal
+def invalidate_embed_widget_cache(sender, instance, **kwargs):
+    """Clear embed payloads when a widget changes, then preload every widget."""
+    slugs = (instance.slug, getattr(instance, "_old_slug", None))
+
+    def _clear():
+        clear_embed_caches(*slugs)
+        schedule_cache_warm(embeds=True)
+
+    transaction.on_commit(_clear)
+
+
+@receiver([post_save, post_delete], sender=CurrentProjectSchedule)
+# noinspection PyUnusedLocal
+def invalidate_schedule_embed_cache(sender, instance, **kwargs):
+    """Clear app-route embed payloads, which expose the configured schedule id."""
+
+    def _clear():
+        if CMSEmbedWidget.objects.filter(widget_type="app_route").exists():
+            clear_embed_caches()
+            schedule_cache_warm(embeds=True)
 
     transaction.on_commit(_clear)
 
@@ -164,7 +221,7 @@ def schedule_route_redirect_edge_sync(sender, instance, **kwargs):
         from .services.amplify.amplify_redirects import schedule_amplify_redirect_sync
 
         try:
-            cache.delete(f"cms:page:{source_path}")
+            clear_cms_page_cache(source_path)
         except Exception:  # noqa: BLE001 - edge sync must still be scheduled.
             logger.exception("Unable to invalidate the CMS redirect cache")
         if not requires_edge_sync:
@@ -182,3 +239,31 @@ def schedule_route_redirect_edge_sync(sender, instance, **kwargs):
                 logger.exception("Unable to record the Amplify scheduling failure")
 
     transaction.on_commit(_schedule)
+
+
+@receiver(pre_save, sender=CMSAsset)
+# noinspection PyUnusedLocal
+def stash_old_asset_file(sender, instance, **kwargs):
+    """Remember the stored file name so only a new upload regenerates renditions."""
+    if instance._state.adding:
+        instance._old_file_name = None
+        return
+    instance._old_file_name = CMSAsset.objects.filter(pk=instance.pk).values_list("file", flat=True).first()
+
+
+@receiver(post_save, sender=CMSAsset)
+# noinspection PyUnusedLocal
+def queue_asset_derivatives(sender, instance, **kwargs):
+    """Generate resized renditions of a new or replaced image once the upload commits."""
+    file_name = instance.file.name if instance.file else ""
+    if not file_name or file_name == getattr(instance, "_old_file_name", None):
+        return
+    asset_id = instance.pk
+    transaction.on_commit(lambda: schedule_asset_derivatives(asset_id, file_name))
+
+
+@receiver(pre_delete, sender=CMSAsset)
+# noinspection PyUnusedLocal
+def delete_asset_derivatives(sender, instance, **kwargs):
+    """Remove an asset's stored renditions along with their cascaded rows."""
+    delete_derivative_files(instance.pk)
@@ -4,6 +4,12 @@
     var keepaliveTimer = null;
     var KEEPALIVE_MS = 4 * 60 * 1000; // re-post every 4 min to keep 10-min TTL alive
     var lastBlocks = null;
+    // Revision the server holds for this editor, and the state it was built from.
+    // Once known, edits are sent as patches of the fields and blocks that changed.
+    var syncedRev = null;
+    var syncedState = null;
+    var postInFlight = false;
+    var postQueued = null;
 
     function getLivePreviewKey() {
         var config = window.CMS_ROUTE_EDITOR || {};
@@ -60,26 +66,63 @@
         syncStatusTimer = setTimeout(function () { el.classList.remove('is-visible'); }, 1200);
     }
 
+    function buildPatch(data) {
+        var patch = { base_rev: syncedRev, fields: {}, blocks: {}, block_count: data.blocks.length };
+        Object.keys(data).forEach(function (name) {
+            if (name !== 'blocks' && data[name] !== syncedState.fields[name]) patch.fields[name] = data[name];
+        });
+        data.blocks.forEach(function (block, index) {
+            if (JSON.stringify(block) !== syncedState.blocks[index]) patch.blocks[index] = block;
+        });
+        return patch;
+    }
+
+    function rememberSynced(data, rev) {
+        var fields = {};
+        Object.keys(data).forEach(function (name) { if (name !== 'blocks') fields[name] = data[name]; });
+        syncedRev = rev;
+        syncedState = { fields: fields, blocks: data.blocks.map(function (block) { return JSON.stringify(block); }) };
+    }
+
     function post(blocks, callback) {
         var config = window.CMS_ROUTE_EDITOR || {};
         if (!config.pageId) return;
         lastBlocks = blocks;
         startKeepalive();
+        if (postInFlight) { postQueued = { blocks: blocks, callback: callback }; return; }
+        var data = gatherPageData(blocks);
+        var body = syncedRev === null ? data : buildPatch(data);
         var csrfEl = document.querySelector('[name=csrfmiddlewaretoken]');
         var wrapper = document.getElementById('cms-inline-preview');
         if (wrapper && wrapper.classList.contains('is-active')) showSyncStatus('Syncing\u2026');
+        postInFlight = true;
         fetch('/cms/live-preview/' + config.pageId + '/', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json', 'X-CSRFToken': csrfEl ? csrfEl.value : '' },
-            body: JSON.stringify(gatherPageData(blocks)),
+            body: JSON.stringify(body),
             credentials: 'same-origin',
         }).then(function (response) {
-            if (!response.ok) console.warn('[CMS Preview] POST failed with status ' + response.status);
-            else {
+            if (response.status === 409) {
+                // Another tab or an expired session moved the revision; resend everything.
+                syncedRev = null;
+                if (!postQueued) postQueued = { blocks: blocks, callback: callback };
+                return;
+            }
+            if (!response.ok) { console.warn('[CMS Preview] POST failed with status ' + response.status); return; }
+            return response.json().then(function (result) {
+                rememberSynced(data, result.rev);
                 showSyncStatus('Synced');
                 if (callback) callback();
-            }
-        }).catch(function (err) { console.warn('[CMS Preview] Network error:', err.message || err); });
+            });
+        }).catch(function (err) {
+            syncedRev = null;
+            console.warn('[CMS Preview] Network error:', err.message || err);
+        }).then(function () {
+            postInFlight = false;
+            var next = postQueued;
+            postQueued = null;
+            if (next) post(next.blocks, next.callback);
+        });
     }
 
     function startKeepalive() {
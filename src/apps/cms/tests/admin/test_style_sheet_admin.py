@@ -56,7 +56,7 @@ class StyleSheetAdminImportExportTests(TestCase):
         self.assertEqual(response["Content-Type"], "application/json")
         self.assertIn("attachment", response["Content-Disposition"])
 
-        bundle = json.loads(response.content)
+        bundle = json.loads(response.getvalue())
         self.assertEqual(bundle["version"], 1)
         self.assertEqual([row["name"] for row in bundle["stylesheets"]], ["a", "z"])
         self.assertEqual(
@@ -19,6 +19,7 @@ from apps.cms.admin.analytics.page_view.stats import (
     compute_dashboard_stats,
 )
 from apps.cms.models import PageView
+from apps.cms.services.analytics import refresh_page_view_rollups
 from apps.event.tests.helpers import make_superuser
 
 Member = get_user_model()
@@ -124,6 +125,7 @@ class PageViewAdminChangelistTests(TestCase):
 
     def test_changelist_computes_and_caches_dashboard_stats(self):
         PageView.objects.create(path="/home", ip_address="1.1.1.1")
+        refresh_page_view_rollups()
         self.assertIsNone(cache.get(DASHBOARD_CACHE_KEY))
 
         response = self.client.get(reverse("admin:cms_pageview_changelist"))
@@ -182,6 +184,7 @@ class ComputeDashboardStatsTests(TestCase):
         # One older view (2 days ago) to land inside the 7-day window.
         older = PageView.objects.create(path="/old", ip_address="3.3.3.3")
         PageView.objects.filter(pk=older.pk).update(timestamp=now - timedelta(days=2))
+        refresh_page_view_rollups()
 
         stats = compute_dashboard_stats()
 
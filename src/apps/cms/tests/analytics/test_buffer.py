@@ -1,31 +1,47 @@
+import tempfile
+from datetime import timedelta
 from unittest.mock import patch
 
 from django.db import DatabaseError
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
 
+from apps.authn.models import Member
 from apps.cms.models import PageView
 from apps.cms.services.analytics import buffer as buffer_module
+from apps.cms.services.analytics.backends import MemoryStreamBackend, SpoolFileBackend, set_ingest_backend
 from apps.cms.services.analytics.buffer import (
-    _BATCH_SIZE,
-    _do_bulk_insert,
-    _flush,
-    _schedule_flush_locked,
+    drain_page_views,
+    drain_page_views_job,
     enqueue,
     flush_sync,
+    ingestion_metrics,
+    repair_page_view_rollups_job,
 )
+from apps.core.models import BackgroundJob
+from apps.core.services.background_jobs import TransientJobError
 
 
-class PageViewBufferTest(TestCase):
-    def setUp(self):
-        flush_sync()
-        PageView.objects.all().delete()
+def _view(path, **extra):
+    return {"path": path, "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": "", **extra}
+
+
+class _BackendTestMixin:
+    def use_backend(self, backend):
+        set_ingest_backend(backend)
+        self.addCleanup(set_ingest_backend, None)
+        return backend
+
 
-    def tearDown(self):
+class PageViewBufferTest(_BackendTestMixin, TestCase):
+    def setUp(self):
+        self.backend = self.use_backend(MemoryStreamBackend())
         flush_sync()
+        self.addCleanup(flush_sync)
 
     def test_enqueue_and_flush(self):
-        enqueue({"path": "/test", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""})
-        enqueue({"path": "/test2", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""})
+        enqueue(_view("/test"))
+        enqueue(_view("/test2"))
 
         flush_sync()
         self.assertEqual(PageView.objects.count(), 2)
@@ -35,184 +51,301 @@ class PageViewBufferTest(TestCase):
         flush_sync()
         self.assertEqual(PageView.objects.count(), 0)
 
-    def test_auto_flush_triggered_at_batch_size(self):
-        enqueue({"path": "/init", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""})
+    def test_flush_sync_clears_buffer(self):
+        enqueue(_view("/x"))
+        flush_sync()
+        flush_sync()
+        self.assertEqual(PageView.objects.count(), 1)
+        self.assertEqual(self.backend.depth(), 0)
 
-        with patch("apps.cms.services.analytics.buffer.threading.Thread") as mock_thread_cls:
-            for i in range(_BATCH_SIZE):
-                enqueue(
-                    {"path": f"/page-{i}", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""}
-                )
-            mock_thread_cls.assert_called()
-            mock_thread_cls.return_value.start.assert_called()
+    def test_timestamp_is_enqueue_time(self):
+        viewed_at = timezone.now() - timedelta(minutes=10)
+        enqueue(_view("/late", timestamp=viewed_at))
 
         flush_sync()
-        self.assertEqual(PageView.objects.count(), _BATCH_SIZE + 1)
+        self.assertEqual(PageView.objects.get().timestamp, viewed_at)
 
-    def test_flush_sync_clears_buffer(self):
-        enqueue({"path": "/x", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""})
-        flush_sync()
-        self.assertEqual(PageView.objects.count(), 1)
+    def test_member_is_recorded_and_deleted_member_is_cleared(self):
+        member = Member.objects.create_user(password="x")
+        gone = Member.objects.create_user(password="x")
+        enqueue(_view("/mine", member_id=member.pk))
+        enqueue(_view("/gone", member_id=gone.pk))
+        gone.delete()
 
         flush_sync()
-        self.assertEqual(PageView.objects.count(), 1)
+        self.assertEqual(PageView.objects.get(path="/mine").member, member)
+        self.assertIsNone(PageView.objects.get(path="/gone").member)
+
+    def test_full_backend_drops_and_counts(self):
+        self.use_backend(MemoryStreamBackend(max_pending=3))
 
-    @patch("apps.cms.services.analytics.buffer._MAX_BUFFER_SIZE", 5)
-    def test_buffer_overflow_drops_oldest(self):
-        for i in range(8):
-            enqueue(
-                {"path": f"/page-{i}", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""}
-            )
+        accepted = [enqueue(_view(f"/page-{i}")) for i in range(5)]
 
+        self.assertEqual(accepted, [True, True, True, False, False])
         flush_sync()
-        self.assertEqual(PageView.objects.count(), 5)
-        paths = set(PageView.objects.values_list("path", flat=True))
-        self.assertEqual(paths, {"/page-3", "/page-4", "/page-5", "/page-6", "/page-7"})
+        self.assertEqual(set(PageView.objects.values_list("path", flat=True)), {"/page-0", "/page-1", "/page-2"})
+        self.assertEqual(ingestion_metrics()["pageview_dropped_total"], 2)
+
+    def test_enqueue_schedules_one_drain_per_interval(self):
+        with patch("apps.cms.services.analytics.buffer.threading.Timer") as mock_timer:
+            for i in range(250):
+                enqueue(_view(f"/page-{i}"))
+
+        mock_timer.assert_called_once()
+        mock_timer.return_value.start.assert_called_once()
+        buffer_module._timer = None
+
+    def test_append_failure_does_not_raise(self):
+        with (
+            patch.object(self.backend, "append", side_effect=OSError("disk full")),
+            patch("apps.cms.services.analytics.buffer.logger") as mock_logger,
+        ):
+            self.assertFalse(enqueue(_view("/x")))
+        mock_logger.exception.assert_called_once()
 
 
-class DoBulkInsertTests(TestCase):
+class DrainPageViewsTest(_BackendTestMixin, TestCase):
     def setUp(self):
-        flush_sync()
-        PageView.objects.all().delete()
+        self.backend = self.use_backend(MemoryStreamBackend())
 
-    def tearDown(self):
-        flush_sync()
+    def test_drains_in_batches(self):
+        for i in range(25):
+            self.backend.append(buffer_module._record_from(_view(f"/p{i}")))
 
-    def test_bulk_insert_writes_rows(self):
-        batch = [
-            {"path": "/a", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""},
-            {"path": "/b", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""},
-        ]
-        _do_bulk_insert(batch)
-        self.assertEqual(PageView.objects.count(), 2)
+        with patch.object(PageView.objects, "bulk_create", wraps=PageView.objects.bulk_create) as bulk_create:
+            result = drain_page_views(batch_size=10)
 
-    def test_bulk_insert_retries_then_succeeds(self):
-        batch = [{"path": "/retry", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""}]
-        real_bulk_create = PageView.objects.bulk_create
-        calls = {"n": 0}
+        self.assertEqual(result, {"inserted": 25, "discarded": 0, "backlog": False})
+        self.assertEqual(bulk_create.call_count, 3)
+        self.assertEqual(PageView.objects.count(), 25)
 
-        def flaky_bulk_create(objs, *args, **kwargs):
-            calls["n"] += 1
-            if calls["n"] == 1:
-                raise DatabaseError("transient")
-            return real_bulk_create(objs, *args, **kwargs)
+    def test_reports_backlog_when_batches_run_out(self):
+        for i in range(5):
+            self.backend.append(buffer_module._record_from(_view(f"/p{i}")))
+
+        result = drain_page_views(batch_size=2, max_batches=2)
+
+        self.assertTrue(result["backlog"])
+        self.assertEqual(self.backend.depth(), 1)
+
+    def test_failed_insert_keeps_records_queued(self):
+        self.backend.append(buffer_module._record_from(_view("/retry")))
 
         with (
-            patch.object(PageView.objects, "bulk_create", side_effect=flaky_bulk_create),
+            patch.object(PageView.objects, "bulk_create", side_effect=DatabaseError("down")),
+            patch("apps.cms.services.analytics.buffer.logger"),
+            self.assertRaises(DatabaseError),
+        ):
+            drain_page_views()
+
+        self.assertEqual(self.backend.depth(), 1)
+        drain_page_views()
+        self.assertEqual(PageView.objects.get().path, "/retry")
+
+    def test_concurrent_spool_drains_insert_each_record_once(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        backend = self.use_backend(SpoolFileBackend(directory.name))
+        for i in range(3):
+            backend.append(buffer_module._record_from(_view(f"/p{i}")))
+        bulk_create = PageView.objects.bulk_create
+        overlapping = []
+
+        def insert_while_another_drain_runs(rows, **kwargs):
+            # A second process's timer fires between this drain's read and ack.
+            if not overlapping:
+                overlapping.append(drain_page_views(batch_size=2))
+            return bulk_create(rows, **kwargs)
+
+        with patch.object(PageView.objects, "bulk_create", side_effect=insert_while_another_drain_runs):
+            drain_page_views(batch_size=2)
+
+        self.assertEqual(overlapping[0]["inserted"], 0)
+        self.assertEqual(sorted(PageView.objects.values_list("path", flat=True)), ["/p0", "/p1", "/p2"])
+        self.assertEqual(backend.depth(), 0)
+
+    def test_flush_sync_logs_on_database_error(self):
+        self.backend.append(buffer_module._record_from(_view("/err")))
+
+        with (
+            patch.object(PageView.objects, "bulk_create", side_effect=DatabaseError("nope")),
             patch("apps.cms.services.analytics.buffer.logger") as mock_logger,
         ):
-            _do_bulk_insert(batch)
-            mock_logger.warning.assert_called_once()
+            flush_sync()
+            mock_logger.exception.assert_called()
+
+        self.assertEqual(self.backend.depth(), 1)
+
+    def test_unacknowledged_records_are_redelivered(self):
+        backend = self.use_backend(MemoryStreamBackend(claim_idle_seconds=0))
+        backend.append(buffer_module._record_from(_view("/crash")))
+        backend.read_batch(10)  # a drainer that died before acknowledging
+
+        drain_page_views()
+        self.assertEqual(PageView.objects.get().path, "/crash")
 
-        self.assertEqual(calls["n"], 2)
+    def test_malformed_records_are_discarded_and_counted(self):
+        self.backend.append({"referrer": "no path"})
+        self.backend.append(buffer_module._record_from(_view("/ok")))
+
+        result = drain_page_views()
+
+        self.assertEqual(result["discarded"], 1)
+        self.assertEqual(self.backend.dropped_total(), 1)
         self.assertEqual(PageView.objects.count(), 1)
 
-    def test_bulk_insert_drops_batch_after_max_retries(self):
-        batch = [{"path": "/fail", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""}]
+    def test_records_flush_latency(self):
+        self.backend.append(buffer_module._record_from(_view("/old", timestamp=timezone.now() - timedelta(seconds=30))))
+
+        drain_page_views()
+
+        self.assertGreaterEqual(ingestion_metrics()["pageview_flush_latency_seconds"], 30)
+        self.assertEqual(ingestion_metrics()["pageview_buffer_depth"], 0)
+
+
+@override_settings(BACKGROUND_JOBS_ENABLED=True)
+class PageViewDrainJobTest(_BackendTestMixin, TestCase):
+    def setUp(self):
+        self.backend = self.use_backend(MemoryStreamBackend())
+
+    def test_job_handler_drains(self):
+        self.backend.append(buffer_module._record_from(_view("/job")))
+        job = BackgroundJob.objects.create(kind=buffer_module.DRAIN_JOB_KIND, dedupe_key="drain:1", payload={})
+
+        drain_page_views_job(job)
+
+        self.assertEqual(PageView.objects.get().path, "/job")
+
+    def test_job_handler_retries_on_database_error(self):
+        self.backend.append(buffer_module._record_from(_view("/job")))
+        job = BackgroundJob.objects.create(kind=buffer_module.DRAIN_JOB_KIND, dedupe_key="drain:1", payload={})
 
         with (
             patch.object(PageView.objects, "bulk_create", side_effect=DatabaseError("down")),
-            patch("apps.cms.services.analytics.buffer.logger") as mock_logger,
+            patch("apps.cms.services.analytics.buffer.logger"),
+            self.assertRaises(TransientJobError),
         ):
-            _do_bulk_insert(batch)
-            mock_logger.exception.assert_called_once()
+            drain_page_views_job(job)
+        self.assertEqual(self.backend.depth(), 1)
 
-        self.assertEqual(PageView.objects.count(), 0)
+    def test_shared_stream_schedules_a_durable_job(self):
+        self.backend.name = "redis"
+        self.addCleanup(flush_sync)
 
+        with patch("apps.cms.services.analytics.buffer.threading.Timer") as mock_timer:
+            enqueue(_view("/a"))
+            enqueue(_view("/b"))
 
-class FlushTests(TestCase):
-    def setUp(self):
-        flush_sync()
-        PageView.objects.all().delete()
+        mock_timer.assert_not_called()
+        self.assertEqual(BackgroundJob.objects.filter(kind=buffer_module.DRAIN_JOB_KIND).count(), 1)
 
-    def tearDown(self):
-        flush_sync()
 
-    def test_flush_inserts_and_reschedules(self):
-        buffer_module._buffer.append(
-            {"path": "/flush-me", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""}
-        )
-        buffer_module._flush_done.set()
+@override_settings(PAGEVIEW_ROLLUP_REPAIR_ENABLED=True)
+class RollupRepairScheduleTest(_BackendTestMixin, TestCase):
+    def setUp(self):
+        self.backend = self.use_backend(MemoryStreamBackend())
+        patcher = patch.object(buffer_module, "_next_repair_at", 0.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
-        with patch("apps.cms.services.analytics.buffer._schedule_flush_locked") as mock_schedule:
-            _flush()
-            mock_schedule.assert_called_once()
+    def _drain_one(self, path):
+        self.backend.append(buffer_module._record_from(_view(path)))
+        drain_page_views()
 
-        self.assertEqual(PageView.objects.count(), 1)
-        # done flag is restored after insert completes
-        self.assertTrue(buffer_module._flush_done.is_set())
+    @override_settings(BACKGROUND_JOBS_ENABLED=True)
+    def test_drains_queue_one_repair_job_per_interval(self):
+        self._drain_one("/a")
+        self._drain_one("/b")
 
-    def test_flush_skips_when_flush_in_progress(self):
-        buffer_module._buffer.append(
-            {"path": "/skip", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""}
-        )
-        buffer_module._flush_done.clear()  # simulate in-progress flush
+        self.assertEqual(BackgroundJob.objects.filter(kind=buffer_module.ROLLUP_JOB_KIND).count(), 1)
 
+    def test_repairs_in_process_without_the_worker(self):
         with (
-            patch("apps.cms.services.analytics.buffer._schedule_flush_locked") as mock_schedule,
-            patch("apps.cms.services.analytics.buffer._do_bulk_insert") as mock_insert,
+            patch.object(buffer_module.cache, "add", return_value=True),
+            patch("apps.core.services.helpers.in_process.start_in_process_task") as start_task,
         ):
-            _flush()
-            mock_schedule.assert_called_once()
-            mock_insert.assert_not_called()
+            self._drain_one("/a")
+            self._drain_one("/b")
+
+        start_task.assert_called_once()
+        self.assertIs(start_task.call_args.args[0], buffer_module.repair_page_view_rollups)
 
-        # buffer untouched because flush was skipped
-        self.assertEqual(len(buffer_module._buffer), 1)
-        buffer_module._buffer.clear()
-        buffer_module._flush_done.set()
+    @override_settings(PAGEVIEW_ROLLUP_REPAIR_ENABLED=False)
+    def test_disabled_repair_is_never_scheduled(self):
+        with patch("apps.core.services.helpers.in_process.start_in_process_task") as start_task:
+            self._drain_one("/a")
 
-    def test_flush_reschedules_when_buffer_empty(self):
-        buffer_module._buffer.clear()
-        buffer_module._flush_done.set()
+        start_task.assert_not_called()
+        self.assertFalse(BackgroundJob.objects.filter(kind=buffer_module.ROLLUP_JOB_KIND).exists())
+
+    def test_job_handler_retries_on_database_error(self):
+        job = BackgroundJob.objects.create(kind=buffer_module.ROLLUP_JOB_KIND, dedupe_key="repair:1", payload={})
 
         with (
-            patch("apps.cms.services.analytics.buffer._schedule_flush_locked") as mock_schedule,
-            patch("apps.cms.services.analytics.buffer._do_bulk_insert") as mock_insert,
+            patch.object(buffer_module, "repair_page_view_rollups", side_effect=DatabaseError("down")),
+            self.assertRaises(TransientJobError),
         ):
-            _flush()
-            mock_schedule.assert_called_once()
-            mock_insert.assert_not_called()
+            repair_page_view_rollups_job(job)
 
 
-class ScheduleFlushTests(TestCase):
-    def tearDown(self):
-        flush_sync()
+class SpoolFileBackendTest(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.backend = SpoolFileBackend(directory.name)
 
-    def test_schedule_cancels_existing_timer(self):
-        sentinel_timer = patch("apps.cms.services.analytics.buffer.threading.Timer").start()
-        self.addCleanup(patch.stopall)
+    def test_append_read_ack_round_trip(self):
+        for i in range(3):
+            self.assertTrue(self.backend.append({"path": f"/p{i}"}))
+        self.assertEqual(self.backend.depth(), 3)
 
-        # First schedule creates a timer.
-        _schedule_flush_locked()
-        first_timer = buffer_module._timer
-        self.assertIsNotNone(first_timer)
+        receipts, records = self.backend.read_batch(2)
+        self.assertEqual([record["path"] for record in records], ["/p0", "/p1"])
+        self.backend.ack(receipts)
 
-        # Second schedule must cancel the existing timer before replacing it.
-        _schedule_flush_locked()
-        first_timer.cancel.assert_called_once()
+        self.backend.append({"path": "/p3"})
+        receipts, records = self.backend.read_batch(10)
+        self.assertEqual([record["path"] for record in records], ["/p2"])
+        self.backend.ack(receipts)
+        receipts, records = self.backend.read_batch(10)
+        self.assertEqual([record["path"] for record in records], ["/p3"])
+        self.backend.ack(receipts)
 
+        self.assertEqual(self.backend.depth(), 0)
+        self.assertEqual(self.backend.read_batch(10), ([], []))
 
-class FlushSyncErrorTests(TestCase):
-    def setUp(self):
-        flush_sync()
-        PageView.objects.all().delete()
+    def test_released_batch_is_read_again(self):
+        self.backend.append({"path": "/p0"})
 
-    def tearDown(self):
-        flush_sync()
+        receipts, _records = self.backend.read_batch(10)
+        self.backend.release(receipts)
+        _receipts, records = self.backend.read_batch(10)
 
-    def test_flush_sync_logs_on_database_error(self):
-        buffer_module._buffer.append(
-            {"path": "/err", "referrer": "", "ip_address": "1.2.3.4", "user_agent": "", "session_key": ""}
-        )
-        buffer_module._flush_done.set()
+        self.assertEqual(records, [{"path": "/p0"}])
 
-        with (
-            patch.object(PageView.objects, "bulk_create", side_effect=DatabaseError("nope")),
-            patch("apps.cms.services.analytics.buffer.logger") as mock_logger,
-        ):
-            flush_sync()
-            mock_logger.exception.assert_called_once()
+    def test_unacknowledged_batch_is_claimed_until_ack(self):
+        self.backend.append({"path": "/p0"})
+        other_process = SpoolFileBackend(self.backend.directory)
 
-        # batch was consumed even though the insert failed
-        self.assertEqual(len(buffer_module._buffer), 0)
-        self.assertEqual(PageView.objects.count(), 0)
+        receipts, _records = self.backend.read_batch(10)
+        self.assertEqual(other_process.read_batch(10), ([], []))
+        self.backend.ack(receipts)
+
+        self.assertEqual(other_process.read_batch(10), ([], []))
+        self.assertEqual(other_process.depth(), 0)
+
+    def test_full_spool_drops(self):
+        backend = SpoolFileBackend(self.backend.directory, max_bytes=40)
+        with patch.object(backend, "record_drops") as record_drops:
+            self.assertTrue(backend.append({"path": "/first"}))
+            self.assertFalse(backend.append({"path": "/second-record-too-long"}))
+        record_drops.assert_called_once_with(1)
+
+    def test_torn_and_malformed_lines_decode_as_none(self):
+        self.backend.append({"path": "/ok"})
+        with open(self.backend.active_path, "ab") as handle:
+            handle.write(b'not json\n{"path": "/torn')
+
+        _receipts, records = self.backend.read_batch(10)
+
+        self.assertEqual(records, [{"path": "/ok"}, None, None])
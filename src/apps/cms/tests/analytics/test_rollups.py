@@ -0,0 +1,166 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.authn.models import Member
+from apps.cms.models import PageView, PageViewDailyRollup, PageViewHourlyRollup
+from apps.cms.models.content.analytics import ALL_PATHS
+from apps.cms.services.analytics import (
+    MemoryStreamBackend,
+    enqueue,
+    flush_sync,
+    prune_raw_page_views,
+    refresh_drained_rollups,
+    refresh_page_view_rollups,
+    repair_page_view_rollups,
+    rollup_queryset,
+    set_ingest_backend,
+)
+
+
+class PageViewRollupTest(TestCase):
+    def setUp(self):
+        self.now = timezone.localtime().replace(hour=12, minute=30, second=0, microsecond=0)
+        self.member = Member.objects.create_user(password="x")
+
+    def _view(self, path, *, at=None, **fields):
+        view = PageView.objects.create(path=path, **fields)
+        PageView.objects.filter(pk=view.pk).update(timestamp=at or self.now)
+        return view
+
+    def test_rollups_count_views_sessions_visitors_and_members(self):
+        self._view("/home", session_key="a", ip_address="1.1.1.1", member=self.member, referrer="https://g.example")
+        self._view("/home", session_key="a", ip_address="1.1.1.1", referrer="https://g.example")
+        self._view("/home", session_key="b", ip_address="2.2.2.2", referrer="https://b.example")
+        self._view("/about", ip_address="2.2.2.2")
+
+        refresh_page_view_rollups()
+
+        home = PageViewDailyRollup.objects.get(path="/home", day=self.now.date())
+        self.assertEqual(home.views, 3)
+        self.assertEqual(home.unique_sessions, 2)
+        self.assertEqual(home.unique_visitors, 2)
+        self.assertEqual((home.member_views, home.anonymous_views), (1, 2))
+        self.assertEqual(
+            home.top_referrers,
+            [{"referrer": "https://g.example", "count": 2}, {"referrer": "https://b.example", "count": 1}],
+        )
+        site = PageViewDailyRollup.objects.get(path=ALL_PATHS, day=self.now.date())
+        self.assertEqual((site.views, site.unique_visitors), (4, 2))
+        hour = PageViewHourlyRollup.objects.get(path=ALL_PATHS)
+        self.assertEqual(timezone.localtime(hour.hour).hour, 12)
+        self.assertEqual(hour.views, 4)
+
+    def test_refresh_is_idempotent_and_picks_up_new_rows(self):
+        self._view("/home")
+        refresh_page_view_rollups()
+        refresh_page_view_rollups()
+        self._view("/home")
+        refresh_page_view_rollups()
+
+        self.assertEqual(PageViewDailyRollup.objects.filter(path="/home").count(), 1)
+        self.assertEqual(PageViewDailyRollup.objects.get(path="/home").views, 2)
+
+    def test_prune_keeps_rollups_for_deleted_raw_rows(self):
+        self._view("/old", at=self.now - timedelta(days=40))
+        self._view("/new")
+
+        deleted = prune_raw_page_views(retention_days=30)
+
+        self.assertEqual(deleted, 1)
+        self.assertEqual(list(PageView.objects.values_list("path", flat=True)), ["/new"])
+        self.assertEqual(PageViewDailyRollup.objects.get(path="/old").views, 1)
+        # Refreshing again must not wipe the pruned day.
+        refresh_page_view_rollups()
+        self.assertEqual(PageViewDailyRollup.objects.get(path="/old").views, 1)
+
+    def test_prune_disabled_with_zero_retention(self):
+        self._view("/old", at=self.now - timedelta(days=400))
+        self.assertEqual(prune_raw_page_views(retention_days=0), 0)
+        self.assertEqual(PageView.objects.count(), 1)
+
+    def test_rollup_queryset_filters_by_path_and_day(self):
+        self._view("/blog/a", at=self.now - timedelta(days=3))
+        self._view("/blog/b")
+        self._view("/about")
+        refresh_page_view_rollups()
+
+        qs = rollup_queryset("day", path="blog", date_from=self.now.date().isoformat())
+
+        self.assertEqual(list(qs.values_list("path", flat=True)), ["/blog/b"])
+        self.assertFalse(rollup_queryset("day").filter(path=ALL_PATHS).exists())
+
+    def test_drain_refreshes_rollups(self):
+        set_ingest_backend(MemoryStreamBackend())
+        self.addCleanup(set_ingest_backend, None)
+        self.addCleanup(flush_sync)
+
+        enqueue({"path": "/drained", "session_key": "s", "member_id": self.member.pk})
+        flush_sync()
+
+        rollup = PageViewDailyRollup.objects.get(path="/drained")
+        self.assertEqual((rollup.views, rollup.member_views), (1, 1))
+
+    def test_drained_refresh_only_rescans_the_touched_hours(self):
+        earlier = self.now - timedelta(hours=2)
+        self._view("/home", at=earlier, ip_address="1.1.1.1")
+        refresh_page_view_rollups()
+        # Stored without a drain: its hour is not touched below, so it stays out of the rollups.
+        self._view("/home", at=earlier, ip_address="3.3.3.3")
+        self._view("/home", ip_address="2.2.2.2", member=self.member)
+
+        refresh_drained_rollups(self.now, self.now)
+
+        hour = PageViewHourlyRollup.objects.get(path="/home", hour=self.now.replace(minute=0))
+        self.assertEqual((hour.views, hour.unique_visitors), (1, 1))
+        day = PageViewDailyRollup.objects.get(path="/home", day=self.now.date())
+        # Additive counts are summed from the hourly rows; distinct counts wait for the scheduled job.
+        self.assertEqual((day.views, day.member_views, day.anonymous_views, day.unique_visitors), (2, 1, 1, 1))
+        self.assertEqual(PageViewDailyRollup.objects.get(path=ALL_PATHS, day=self.now.date()).views, 2)
+
+        refresh_page_view_rollups(earlier)
+        day.refresh_from_db()
+        self.assertEqual((day.views, day.unique_visitors), (3, 3))
+
+    @override_settings(PAGEVIEW_RAW_RETENTION_DAYS=30)
+    def test_repair_completes_distinct_counts_backfills_history_and_prunes(self):
+        self._view("/old", at=self.now - timedelta(days=40))
+        self._view("/history", at=self.now - timedelta(days=10), ip_address="1.1.1.1")
+        self._view("/home", ip_address="1.1.1.1")
+        self._view("/home", ip_address="2.2.2.2")
+        refresh_drained_rollups(self.now, self.now)
+
+        result = repair_page_view_rollups()
+
+        self.assertEqual(result["pruned"], 1)
+        self.assertEqual(PageViewDailyRollup.objects.get(path="/home", day=self.now.date()).unique_visitors, 2)
+        self.assertEqual(PageViewDailyRollup.objects.get(path="/history").views, 1)
+        self.assertEqual(PageViewDailyRollup.objects.get(path="/old").views, 1)
+        self.assertFalse(PageView.objects.filter(path="/old").exists())
+
+    def test_repair_skips_history_that_is_already_rolled_up(self):
+        self._view("/history", at=self.now - timedelta(days=10))
+        refresh_page_view_rollups()
+        PageViewDailyRollup.objects.filter(path="/history").update(views=7)
+        self._view("/home")
+
+        repair_page_view_rollups(prune=False)
+
+        self.assertEqual(PageViewDailyRollup.objects.get(path="/history").views, 7)
+        self.assertEqual(PageViewDailyRollup.objects.get(path="/home").views, 1)
+
+    @override_settings(PAGEVIEW_RAW_RETENTION_DAYS=30)
+    def test_command_refreshes_and_prunes(self):
+        set_ingest_backend(MemoryStreamBackend())
+        self.addCleanup(set_ingest_backend, None)
+        self._view("/old", at=self.now - timedelta(days=40))
+        self._view("/new")
+        out = StringIO()
+
+        call_command("rollup_page_views", "--all", stdout=out)
+
+        self.assertIn("Removed 1 raw page view(s) older than 30 day(s).", out.getvalue())
+        self.assertEqual(set(PageViewDailyRollup.objects.values_list("path", flat=True)), {"/old", "/new", ALL_PATHS})
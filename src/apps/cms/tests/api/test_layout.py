@@ -5,7 +5,7 @@ from django.test import TestCase
 from rest_framework.test import APIClient
 
 from apps.cms.models import FooterContent, Menu, SiteSettings, StyleSheet
-from apps.cms.views.layout import LAYOUT_CACHE_TIMEOUT, LAYOUT_STYLESHEET_CACHE_KEY
+from apps.cms.views.layout import LAYOUT_CACHE_TIMEOUT, LAYOUT_STYLESHEET_CACHE_KEY, stylesheet_version_key
 
 
 class LayoutMenuFilteringTests(TestCase):
@@ -34,9 +34,9 @@ class LayoutMenuFilteringTests(TestCase):
         resp = self.client.get("/layout/")
         self.assertEqual(resp.json()["menus"], [])
 
-    def test_response_contains_only_menus_and_footer(self):
+    def test_response_contains_menus_footer_and_stylesheet_url(self):
         resp = self.client.get("/layout/")
-        self.assertEqual(set(resp.json()), {"menus", "footer"})
+        self.assertEqual(set(resp.json()), {"menus", "footer", "stylesheet_url"})
 
     def test_etag_supports_weak_and_comma_separated_if_none_match(self):
         first = self.client.get("/layout/")
@@ -242,8 +242,8 @@ class LayoutStylesheetViewTests(TestCase):
         # the expected version here forces a conscious decision if someone
         # edits the assembly without bumping the key.
         self.assertTrue(
-            LAYOUT_STYLESHEET_CACHE_KEY.endswith(":v6"),
-            f"expected cache key to end with :v6, got {LAYOUT_STYLESHEET_CACHE_KEY}",
+            LAYOUT_STYLESHEET_CACHE_KEY.endswith(":v8"),
+            f"expected cache key to end with :v8, got {LAYOUT_STYLESHEET_CACHE_KEY}",
         )
 
     def test_stylesheets_emitted_in_sort_order(self):
@@ -283,6 +283,53 @@ class LayoutStylesheetViewTests(TestCase):
         self.assertIsNotNone(cache.get(LAYOUT_STYLESHEET_CACHE_KEY))
 
 
+class LayoutVersionedStylesheetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def _current_url(self):
+        return self.client.get("/layout/").json()["stylesheet_url"]
+
+    def test_layout_payload_links_immutable_hashed_stylesheet(self):
+        StyleSheet.objects.create(name="a", display_name="A", css="body { color: red; }")
+
+        url = self._current_url()
+        resp = self.client.get(url)
+
+        self.assertRegex(url, r"^/layout/stylesheet\.[0-9a-f]{16}\.css$")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("body { color: red; }", resp.content.decode())
+        self.assertIn("immutable", resp["Cache-Control"])
+        self.assertIn("max-age=31536000", resp["Cache-Control"])
+        self.assertEqual(resp["ETag"], f'"{url.split(".")[1]}"')
+
+    def test_superseded_hash_keeps_serving_its_css_during_grace_window(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            sheet = StyleSheet.objects.create(name="a", display_name="A", css="/* v1 */")
+        old_url = self._current_url()
+
+        sheet.css = "/* v2 */"
+        with self.captureOnCommitCallbacks(execute=True):
+            sheet.save()
+        new_url = self._current_url()
+
+        self.assertNotEqual(old_url, new_url)
+        self.assertIn("/* v1 */", self.client.get(old_url).content.decode())
+        self.assertIn("/* v2 */", self.client.get(new_url).content.decode())
+
+    def test_expired_hash_redirects_to_current_stylesheet(self):
+        current = self._current_url()
+        cache.delete(stylesheet_version_key(current.split(".")[1]))
+
+        self.assertEqual(self.client.get(current).status_code, 200)
+        resp = self.client.get("/layout/stylesheet.0123456789abcdef.css")
+
+        self.assertEqual(resp.status_code, 302)
+        self.assertEqual(resp["Location"], current.rsplit("/", 1)[1])
+        self.assertIn("no-cache", resp["Cache-Control"])
+
+
 class DesignTokensToCssTests(TestCase):
     """Direct unit tests for the _design_tokens_to_css helper edge cases."""
 
@@ -13,14 +13,14 @@ class LayoutAPIViewTests(TestCase):
     def setUp(self):
         cache.clear()
 
-    def test_layout_returns_only_menus_and_footer(self):
+    def test_layout_returns_menus_footer_and_stylesheet_url(self):
         Menu.objects.create(name="main-nav", display_name="Main Nav")
         FooterContent.objects.create(name="Footer V1", slug="footer-v1", is_active=True)
         response = self.client.get("/layout/")
         self.assertEqual(response.status_code, 200)
         self.assertIn("menus", response.json())
         self.assertIn("footer", response.json())
-        self.assertEqual(set(response.json()), {"menus", "footer"})
+        self.assertEqual(set(response.json()), {"menus", "footer", "stylesheet_url"})
 
     def test_layout_no_auth_required(self):
         response = self.client.get("/layout/")
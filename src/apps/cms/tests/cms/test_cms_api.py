@@ -1,3 +1,5 @@
+import json
+
 from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.test import APIClient
@@ -116,7 +118,7 @@ class CMSPageAPITest(TestCase):
         # Verify cache hit by checking the cache key exists
         cached = cache.get("cms:page:/cached")
         self.assertIsNotNone(cached)
-        self.assertEqual(cached["slug"], "cached")
+        self.assertEqual(json.loads(cached.body)["slug"], "cached")
 
     def test_published_page_etag_returns_304(self):
         CMSPage.objects.create(slug="etag", route="/etag", title="ETag", status="published")
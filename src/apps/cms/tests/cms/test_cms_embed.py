@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.db import IntegrityError
 from django.test import TestCase
 from rest_framework.test import APIClient
@@ -17,6 +18,7 @@ class EmbedBlockViewTest(TestCase):
 
     # noinspection PyPep8Naming
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.page = CMSPage.objects.create(
             slug="embed-host",
@@ -215,6 +217,7 @@ class EmbedAppRouteWidgetViewTest(TestCase):
 
     # noinspection PyPep8Naming
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.schedule = CurrentProjectSchedule.objects.create(name="Demo Day")
         self.widget = CMSEmbedWidget.objects.create(
@@ -315,3 +318,77 @@ class EmbedAppRouteWidgetViewTest(TestCase):
                 "schedule_id",
             },
         )
+
+
+class EmbedPayloadCacheTest(TestCase):
+    """Embed payloads are cached per slug and retired by CMS and schedule signals."""
+
+    # noinspection PyPep8Naming
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.page = CMSPage.objects.create(slug="host", route="/host", title="Host", status="published")
+        self.block = CMSBlock.objects.create(
+            page=self.page, block_type="rich_text", sort_order=0, data={"body_html": "<p>v1</p>"}
+        )
+        self.widget = CMSEmbedWidget.objects.create(page=self.page, slug="cached-widget", block_sort_orders=[0])
+
+    def _get(self, slug="cached-widget", **headers):
+        return self.client.get(f"/cms/embed/{slug}/", **headers)
+
+    def test_repeat_loads_are_served_from_cache_with_etag(self):
+        first = self._get()
+        with self.assertNumQueries(0):
+            second = self._get(HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["Access-Control-Allow-Origin"], "*")
+
+    def test_block_edit_clears_embed_payload(self):
+        self._get()
+        self.block.data = {"body_html": "<p>v2</p>"}
+        with self.captureOnCommitCallbacks(execute=True):
+            self.block.save()
+
+        self.assertIn("v2", self._get().json()["blocks"][0]["data"]["body_html"])
+
+    def test_unpublishing_the_source_page_clears_embed_payload(self):
+        self._get()
+        self.page.status = "draft"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.page.save()
+
+        self.assertEqual(self._get().status_code, 404)
+
+    def test_renamed_widget_clears_its_old_slug(self):
+        self._get()
+        self.widget.slug = "renamed-widget"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.widget.save()
+
+        self.assertEqual(self._get().status_code, 404)
+        self.assertEqual(self._get("renamed-widget").status_code, 200)
+
+    def test_deleting_a_schedule_clears_app_route_payloads(self):
+        schedule = CurrentProjectSchedule.objects.create(name="Demo Day")
+        CMSEmbedWidget.objects.create(
+            widget_type="app_route", app_route="/schedule", slug="schedule-embed", schedule=schedule
+        )
+        self.assertEqual(self._get("schedule-embed").json()["schedule_id"], str(schedule.pk))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            schedule.delete()
+
+        self.assertIsNone(self._get("schedule-embed").json()["schedule_id"])
+
+    def test_warming_preloads_every_widget(self):
+        from apps.cms.services.cache_warming import warm_cms_caches
+
+        CMSEmbedWidget.objects.create(widget_type="app_route", app_route="/schedule", slug="other-widget")
+
+        result = warm_cms_caches(embeds=True)
+
+        self.assertEqual(result["warmed"], 2)
+        with self.assertNumQueries(0):
+            self._get("other-widget")
+            self._get()
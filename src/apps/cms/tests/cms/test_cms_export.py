@@ -45,8 +45,9 @@ class CMSExportActionTest(TestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/json")
+        self.assertTrue(response.streaming)
 
-        bundle = json.loads(response.content)
+        bundle = json.loads(response.getvalue())
         self.assertEqual(bundle["version"], 1)
         self.assertEqual(len(bundle["pages"]), 1)
 
@@ -83,7 +84,7 @@ class CMSExportActionTest(TestCase):
             "/admin/cms/cmspage/",
             {"action": "export_pages", "_selected_action": [str(page.pk)]},
         )
-        bundle = json.loads(response.content)
+        bundle = json.loads(response.getvalue())
         self.assertEqual(len(bundle["pages"][0]["blocks"]), 1)
 
 
@@ -110,7 +111,7 @@ class CMSExportViewTest(TestCase):
         self.assertEqual(response["Content-Type"], "application/json")
         self.assertIn("attachment", response["Content-Disposition"])
 
-        bundle = json.loads(response.content)
+        bundle = json.loads(response.getvalue())
         self.assertEqual(len(bundle["pages"]), 2)
 
     def test_export_filter_by_status(self):
@@ -118,13 +119,13 @@ class CMSExportViewTest(TestCase):
         CMSPage.objects.create(slug="draft", route="/draft", title="Draft", status="draft")
 
         response = self.client.get("/admin/cms/cmspage/export/?status=published")
-        bundle = json.loads(response.content)
+        bundle = json.loads(response.getvalue())
         self.assertEqual(len(bundle["pages"]), 1)
         self.assertEqual(bundle["pages"][0]["slug"], "pub")
 
     def test_export_empty_returns_empty_list(self):
         response = self.client.get("/admin/cms/cmspage/export/")
-        bundle = json.loads(response.content)
+        bundle = json.loads(response.getvalue())
         self.assertEqual(bundle["pages"], [])
 
     def test_export_requires_staff(self):
@@ -1,6 +1,8 @@
 import json
+from unittest.mock import patch
 
 from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 from rest_framework.test import APIClient
 
@@ -198,3 +200,48 @@ class CMSImportTest(TestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertFalse(CMSPage.objects.filter(slug="dry-run").exists())
+
+    @patch("apps.cms.admin.cms.page_admin.import_export.IMPORT_BATCH_SIZE", 2)
+    def test_import_writes_pages_in_batches_with_bulk_blocks(self):
+        """Every batch lands, and each page's blocks are replaced in one insert."""
+        CMSPage.objects.create(slug="page-0", route="/page-0", title="Old", status="draft")
+        pages = [
+            {
+                "slug": f"page-{n}",
+                "route": f"/page-{n}",
+                "title": f"Page {n}",
+                "blocks": [
+                    {"block_type": "rich_text", "sort_order": order, "data": {"body_html": f"<p>{n}.{order}</p>"}}
+                    for order in range(3)
+                ],
+            }
+            for n in range(5)
+        ]
+        upload = SimpleUploadedFile("import.json", self._make_bundle(pages), content_type="application/json")
+
+        with patch.object(CMSBlock.objects, "bulk_create", wraps=CMSBlock.objects.bulk_create) as bulk_create:
+            response = self.client.post(
+                "/admin/cms/cmspage/import/", {"json_file": upload, "action": "execute"}, format="multipart"
+            )
+
+        self.assertContains(response, "Successfully imported 5 page(s).")
+        self.assertEqual(bulk_create.call_count, 5)
+        self.assertEqual(CMSPage.objects.get(slug="page-0").title, "Page 0")
+        self.assertEqual(
+            list(CMSPage.objects.get(slug="page-4").blocks.values_list("data__body_html", flat=True)),
+            ["<p>4.0</p>", "<p>4.1</p>", "<p>4.2</p>"],
+        )
+
+    @patch("apps.cms.admin.cms.page_admin.import_export.IMPORT_BATCH_SIZE", 1)
+    def test_import_rejects_json_error_found_mid_file_before_writing(self):
+        """A file that breaks after its first pages is rejected before any batch is written."""
+        page = {"slug": "first", "route": "/first", "title": "First", "blocks": []}
+        truncated = self._make_bundle([page])[:-2] + b', {"slug": '
+        upload = SimpleUploadedFile("import.json", truncated, content_type="application/json")
+
+        response = self.client.post(
+            "/admin/cms/cmspage/import/", {"json_file": upload, "action": "execute"}, format="multipart"
+        )
+
+        self.assertContains(response, "Invalid JSON file:")
+        self.assertFalse(CMSPage.objects.filter(slug="first").exists())
@@ -0,0 +1,118 @@
+import json
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.cms.models import CMSPage
+from apps.cms.views import live_preview
+from apps.event.tests.helpers import make_admin
+
+
+def _block(html, order=0):
+    return {"block_type": "rich_text", "sort_order": order, "data": {"body_html": html}}
+
+
+class CMSLivePreviewDeltaTest(TestCase):
+    """Revisioned patches from the editor and ``?since=`` deltas for preview tabs."""
+
+    # noinspection PyPep8Naming
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_login(make_admin(apps=["cms"], email="cms-delta@example.com"))
+        self.page = CMSPage.objects.create(slug="delta", route="/delta", title="Delta", status="published")
+        self.url = f"/cms/live-preview/{self.page.pk}/"
+
+    def _post(self, data):
+        return self.client.post(self.url, data=json.dumps(data), content_type="application/json")
+
+    def _seed(self):
+        response = self._post({"title": "Draft", "blocks": [_block("<p>one</p>"), _block("<p>two</p>", 1)]})
+        return response.json()["rev"]
+
+    def test_patch_updates_state_and_since_returns_only_changes(self):
+        rev = self._seed()
+
+        response = self._post({"base_rev": rev, "blocks": {"1": _block("<p>2</p>", 1)}})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["rev"], rev + 1)
+
+        delta = self.client.get(self.url, {"since": rev}).json()
+        self.assertTrue(delta["delta"])
+        self.assertEqual(delta["fields"], {})
+        self.assertEqual(delta["blocks"], {"1": _block("<p>2</p>", 1)})
+        self.assertEqual(delta["block_count"], 2)
+
+        full = self.client.get(self.url).json()
+        self.assertEqual([b["data"]["body_html"] for b in full["blocks"]], ["<p>one</p>", "<p>2</p>"])
+        self.assertNotIn("_revisions", full)
+
+    def test_full_resend_only_marks_changed_blocks(self):
+        rev = self._seed()
+
+        self._post({"title": "Renamed", "blocks": [_block("<p>one</p>"), _block("<p>two</p>", 1)]})
+
+        delta = self.client.get(self.url, {"since": rev}).json()
+        self.assertEqual(delta["fields"], {"title": "Renamed"})
+        self.assertEqual(delta["blocks"], {})
+
+    def test_stale_base_revision_is_rejected_with_current_revision(self):
+        rev = self._seed()
+
+        response = self._post({"base_rev": rev - 1, "fields": {"title": "Late"}})
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["rev"], rev)
+        self.assertEqual(cache.get(f"cms:live-preview:{self.page.pk}")["title"], "Draft")
+
+    def test_patch_without_stored_state_asks_for_full_state(self):
+        response = self._post({"base_rev": 1, "fields": {"title": "x"}})
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIsNone(response.json()["rev"])
+
+    def test_block_count_truncates_and_rejects_gaps(self):
+        rev = self._seed()
+
+        self.assertEqual(self._post({"base_rev": rev, "block_count": 3}).status_code, 400)
+        response = self._post({"base_rev": rev, "block_count": 1})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.client.get(self.url).json()["blocks"]), 1)
+
+    def test_patch_that_grows_past_the_limit_returns_413(self):
+        rev = self._seed()
+
+        response = self._post({"base_rev": rev, "blocks": {"0": _block("x" * 600_000)}})
+
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(cache.get(f"cms:live-preview:{self.page.pk}")["rev"], rev)
+
+    def test_cursor_from_another_session_gets_full_state(self):
+        rev = self._seed()
+
+        data = self.client.get(self.url, {"since": rev - 10}).json()
+
+        self.assertNotIn("delta", data)
+        self.assertEqual(data["title"], "Draft")
+
+    @patch.object(live_preview, "LIVE_PREVIEW_STREAM_SECONDS", 0.01)
+    @patch.object(live_preview, "LIVE_PREVIEW_STREAM_POLL_SECONDS", 0)
+    def test_event_stream_sends_delta_after_cursor(self):
+        rev = self._seed()
+        self._post({"base_rev": rev, "fields": {"title": "Streamed"}})
+
+        async def collect():
+            return [chunk async for chunk in live_preview._preview_event_stream(self.page.pk, rev)]
+
+        chunks = async_to_sync(collect)()
+
+        self.assertTrue(chunks[0].startswith("retry: "))
+        event = chunks[1].split("\n")
+        self.assertEqual(event[:2], [f"id: {rev + 1}", "event: preview"])
+        payload = json.loads(event[2].removeprefix("data: "))
+        self.assertEqual((payload["since"], payload["fields"]), (rev, {"title": "Streamed"}))
+        self.assertEqual(len(chunks), 2)
@@ -223,7 +223,7 @@ class CMSLivePreviewSyncPostingTest(TestCase):
 
         from rest_framework.test import APIRequestFactory, force_authenticate
 
-        from apps.cms.views.cms import CMSLivePreviewView
+        from apps.cms.views.live_preview import CMSLivePreviewView
 
         factory = APIRequestFactory()
         request = factory.post(self.live_preview_url, {"title": "x"}, format="json")
@@ -1,12 +1,14 @@
 import io
+import tracemalloc
 import zipfile
+from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
-from apps.cms.models import CMSAsset
-from apps.cms.models.media import MAX_ASSET_UPLOAD_BYTES
+from apps.cms.models import CMSAsset, media
+from apps.cms.models.media import MAX_ASSET_UPLOAD_BYTES, validate_asset_file_type
 
 
 def uploaded_file(name, content, content_type="application/octet-stream"):
@@ -126,3 +128,66 @@ class CMSAssetValidationTests(TestCase):
         )
         self.assertTrue(asset.public_url)
         self.assertEqual(asset.public_url, asset.file.url)
+
+
+class CMSAssetStreamingValidationTests(SimpleTestCase):
+    """Content checks read uploads chunk by chunk and keep the same decisions."""
+
+    def assert_peak_below(self, name, content, limit):
+        upload = uploaded_file(name, content)
+        tracemalloc.start()
+        try:
+            validate_asset_file_type(upload)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, limit, f"{name} validation peaked at {peak} bytes")
+        self.assertEqual(upload.tell(), 0)
+
+    def test_large_uploads_validate_in_bounded_memory(self):
+        size = 8 * 1024 * 1024
+        svg = b"<svg xmlns='http://www.w3.org/2000/svg'>" + b"<rect data-on='x'/>\n" * (size // 20) + b"</svg>"
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+            archive.writestr("[Content_Types].xml", "<Types></Types>")
+            archive.writestr("word/media/image.bin", b"\x01" * size)
+
+        for name, content in (
+            ("big.svg", svg),
+            ("big.txt", b"caf\xc3\xa9," * (size // 6)),
+            ("big.docx", buffer.getvalue()),
+        ):
+            with self.subTest(name=name):
+                self.assert_peak_below(name, content, 1024 * 1024)
+
+    @patch.object(media, "_SCAN_CHUNK_BYTES", 4)
+    def test_svg_markers_split_across_chunks_are_still_found(self):
+        head = b"<svg xmlns='http://www.w3.org/2000/svg'"
+        for tail in (
+            b" onload='a'>",
+            b" ONLOAD  \n = 'a'>",
+            b" on" + b"x" * 50 + b"   ='a'>",
+            b"><sCrIpt>",
+            b" href='JavaScript:a'>",
+        ):
+            with self.subTest(tail=tail):
+                with self.assertRaisesMessage(ValidationError, "rejected as unsafe"):
+                    validate_asset_file_type(uploaded_file("split.svg", head + tail))
+
+        for tail in (b" data-onload='a'>", b" x" + b"o" * 9 + b"nload='a'>", b" on load='a'>"):
+            with self.subTest(tail=tail):
+                validate_asset_file_type(uploaded_file("split.svg", head + tail))
+
+    @patch.object(media, "_SCAN_CHUNK_BYTES", 2)
+    def test_svg_root_check_skips_whitespace_and_bom_across_chunks(self):
+        validate_asset_file_type(uploaded_file("bom.svg", b" \n\xef\xbb\xbf \t<svg></svg>"))
+        with self.assertRaisesMessage(ValidationError, "SVG file content is invalid."):
+            validate_asset_file_type(uploaded_file("late.svg", b"<x>" + b" " * 600 + b"<svg></svg>"))
+
+    @patch.object(media, "_SCAN_CHUNK_BYTES", 3)
+    def test_text_checks_keep_binary_data_ahead_of_encoding_errors(self):
+        with self.assertRaisesMessage(ValidationError, "binary data"):
+            validate_asset_file_type(uploaded_file("mixed.txt", b"\xff\xfe bad" + b"a" * 10 + b"\x00"))
+        with self.assertRaisesMessage(ValidationError, "UTF-8"):
+            validate_asset_file_type(uploaded_file("cut.txt", b"caf\xc3"))
+        validate_asset_file_type(uploaded_file("split.txt", b"\xef\xbb\xbfcaf\xc3\xa9"))
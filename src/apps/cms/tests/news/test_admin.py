@@ -1,5 +1,5 @@
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth import get_user_model
@@ -76,7 +76,7 @@ class NewsFeedSourceAdminTest(TestCase):
         mock_sync.return_value = {"created": 5, "updated": 2, "errors": []}
         resp = self.client.get(reverse("admin:cms_newsfeedsource_sync_all_feeds"))
         self.assertEqual(resp.status_code, 302)
-        mock_sync.assert_called_once_with(feed_url=self.source.feed_url, source_key="ucmerced")
+        mock_sync.assert_called_once_with(feed_url=self.source.feed_url, source_key="ucmerced", scheduler=ANY)
 
     @patch("apps.cms.services.news.orchestrator.sync_news")
     def test_sync_all_feeds_with_errors(self, mock_sync):
@@ -93,7 +93,7 @@ class NewsFeedSourceAdminTest(TestCase):
         mock_sync.return_value = {"created": 3, "updated": 1, "errors": []}
         resp = self.client.get(reverse("admin:cms_newsfeedsource_sync_this_feed", args=[self.source.pk]))
         self.assertEqual(resp.status_code, 302)
-        mock_sync.assert_called_once_with(feed_url=self.source.feed_url, source_key="ucmerced")
+        mock_sync.assert_called_once_with(feed_url=self.source.feed_url, source_key="ucmerced", scheduler=ANY)
 
     def test_sync_all_feeds_no_active(self):
         self.source.is_active = False
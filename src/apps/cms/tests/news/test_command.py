@@ -1,7 +1,7 @@
 """Tests for the sync_news management command."""
 
 from io import StringIO
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from django.core.management import call_command
 from django.core.management.base import CommandError
@@ -27,7 +27,9 @@ class SyncNewsCommandTests(TestCase):
 
         call_command("sync_news", stdout=out, stderr=err)
 
-        mock_sync.assert_called_once_with(feed_url=self.source.feed_url, source_key=self.source.source_key)
+        mock_sync.assert_called_once_with(
+            feed_url=self.source.feed_url, source_key=self.source.source_key, scheduler=ANY
+        )
         output = out.getvalue()
         self.assertIn("Syncing 1 active news feed(s)...", output)
         self.assertIn("UC Merced: 4 created, 2 updated", output)
@@ -97,8 +99,8 @@ class SyncNewsCommandTests(TestCase):
         call_command("sync_news", stdout=StringIO(), stderr=StringIO())
 
         self.assertEqual(mock_sync.call_count, 2)
-        mock_sync.assert_any_call(feed_url=self.source.feed_url, source_key=self.source.source_key)
-        mock_sync.assert_any_call(feed_url=second_source.feed_url, source_key=second_source.source_key)
+        mock_sync.assert_any_call(feed_url=self.source.feed_url, source_key=self.source.source_key, scheduler=ANY)
+        mock_sync.assert_any_call(feed_url=second_source.feed_url, source_key=second_source.source_key, scheduler=ANY)
         self.assertEqual(NewsSyncLog.objects.count(), 2)
 
     def test_command_fails_when_no_active_sources(self):
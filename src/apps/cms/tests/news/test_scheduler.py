@@ -0,0 +1,137 @@
+"""Tests for the shared news-scraping scheduler and concurrent source sync."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+from apps.cms.models import NewsFeedSource, NewsSyncLog
+from apps.cms.services.news import sync_feed_sources
+from apps.cms.services.news.scheduler import ScrapeScheduler
+
+
+class _ConcurrencyProbe:
+    """Record the peak number of simultaneously held slots, overall and per host."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.total = 0
+        self.peak_total = 0
+
+    def run(self, scheduler, url, host, hold=0.05):
+        with scheduler.slot(url):
+            with self._lock:
+                self.active[host] = self.active.get(host, 0) + 1
+                self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+                self.total += 1
+                self.peak_total = max(self.peak_total, self.total)
+            time.sleep(hold)
+            with self._lock:
+                self.active[host] -= 1
+                self.total -= 1
+
+
+class ScrapeSchedulerTest(SimpleTestCase):
+    def test_limits_in_flight_requests_per_host(self):
+        probe = _ConcurrencyProbe()
+        with ScrapeScheduler(max_concurrency=10, per_host_concurrency=2, per_host_delay=0) as scheduler:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for index in range(8):
+                    pool.submit(probe.run, scheduler, f"https://a.example/{index}", "a")
+
+        self.assertEqual(probe.peak["a"], 2)
+
+    def test_global_cap_applies_across_hosts(self):
+        probe = _ConcurrencyProbe()
+        with ScrapeScheduler(max_concurrency=3, per_host_concurrency=2, per_host_delay=0) as scheduler:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for index in range(8):
+                    host = f"h{index % 4}"
+                    pool.submit(probe.run, scheduler, f"https://{host}.example/{index}", host)
+
+        self.assertEqual(probe.peak_total, 3)
+
+    def test_spaces_request_starts_to_the_same_host(self):
+        starts: list[float] = []
+        with ScrapeScheduler(per_host_concurrency=3, per_host_delay=0.05) as scheduler:
+
+            def run():
+                with scheduler.slot("https://a.example/page"):
+                    starts.append(time.monotonic())
+
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                for _ in range(3):
+                    pool.submit(run)
+
+        starts.sort()
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:], strict=False)]
+        self.assertTrue(all(gap >= 0.045 for gap in gaps), gaps)
+
+    def test_different_hosts_do_not_wait_for_each_other(self):
+        with ScrapeScheduler(per_host_delay=1.0) as scheduler:
+            started = time.monotonic()
+            for host in ("a", "b", "c"):
+                with scheduler.slot(f"https://{host}.example/"):
+                    pass
+
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_worker_count_reflects_hosts_and_caps(self):
+        scheduler = ScrapeScheduler(max_concurrency=5, per_host_concurrency=2)
+        self.assertEqual(scheduler.worker_count(["https://a.example/1"] * 10), 2)
+        self.assertEqual(scheduler.worker_count([f"https://h{i}.example/" for i in range(10)]), 5)
+        self.assertEqual(scheduler.worker_count([]), 1)
+
+
+class ConcurrentSourceSyncTest(TestCase):
+    def setUp(self):
+        self.sources = [
+            NewsFeedSource.objects.create(
+                name=f"Feed {index}",
+                feed_url=f"https://feed{index}.example/rss",
+                source_key=f"feed-{index}",
+                is_active=True,
+            )
+            for index in range(3)
+        ]
+
+    @patch("apps.cms.services.news.orchestrator.sync_news")
+    def test_wall_time_tracks_slowest_source(self, mock_sync):
+        schedulers = set()
+
+        def slow_sync(*, feed_url, source_key, scheduler):
+            schedulers.add(id(scheduler))
+            time.sleep(0.3)
+            return {"created": 1, "updated": 0, "errors": [], "warnings": []}
+
+        mock_sync.side_effect = slow_sync
+
+        started = time.monotonic()
+        result = sync_feed_sources(self.sources)
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.75)
+        self.assertEqual(result["created"], 3)
+        self.assertEqual(len(schedulers), 1)
+        self.assertEqual(NewsSyncLog.objects.count(), 3)
+
+    @patch("apps.cms.services.news.orchestrator.sync_news")
+    def test_results_keep_source_order_and_isolate_failures(self, mock_sync):
+        def sync(*, feed_url, source_key, scheduler):
+            if source_key == "feed-1":
+                raise RuntimeError("boom")
+            return {"created": 0, "updated": 1, "errors": [], "warnings": []}
+
+        mock_sync.side_effect = sync
+
+        result = sync_feed_sources(self.sources)
+
+        self.assertEqual([feed["source"] for feed in result["feeds"]], self.sources)
+        self.assertEqual(result["updated"], 2)
+        self.assertEqual(result["errors"], ["Feed 1: boom"])
+        self.sources[1].refresh_from_db()
+        self.assertEqual(self.sources[1].last_sync_errors, "Error: boom")
@@ -515,8 +515,8 @@ class SyncNewsBranchTest(TestCase):
     def test_sync_records_item_level_exception(self, mock_fetch, mock_scrape):
         mock_fetch.return_value = RSS_ONE
         with patch(
-            "apps.cms.services.news.sync.NewsArticle.objects.get_or_create",
-            side_effect=ValueError("db boom"),
+            "apps.cms.services.news.sync.parse_pub_date",
+            side_effect=ValueError("bad date"),
         ):
             result = sync_news()
         self.assertTrue(any("none were processable" in error for error in result["errors"]))
@@ -528,7 +528,7 @@ class SyncNewsBranchTest(TestCase):
     def test_sync_records_database_error_as_fatal(self, mock_fetch, mock_scrape):
         mock_fetch.return_value = RSS_ONE
         with patch(
-            "apps.cms.services.news.sync.NewsArticle.objects.get_or_create",
+            "apps.cms.services.news.sync.NewsArticle.objects.bulk_create",
             side_effect=DatabaseError("database unavailable"),
         ):
             result = sync_news()
@@ -591,7 +591,7 @@ class SyncNewsBranchTest(TestCase):
             "body_html": "<p>Body</p>",
         }
         with patch(
-            "apps.cms.services.news.sync.NewsArticle.objects.get",
+            "apps.cms.services.news.sync._surviving_article_ids",
             side_effect=DatabaseError("read failed"),
         ):
             result = sync_news()
@@ -623,11 +623,8 @@ class SyncNewsBranchTest(TestCase):
             "body_html": "<p>Body</p>",
         }
 
-        # The phase-2 lookup misses because the row vanished between phases.
-        with patch(
-            "apps.cms.services.news.sync.NewsArticle.objects.get",
-            side_effect=NewsArticle.DoesNotExist,
-        ):
+        # The batched existence check misses because the row vanished between phases.
+        with patch("apps.cms.services.news.sync._surviving_article_ids", return_value=set()):
             result = sync_news()
 
         self.assertEqual(result["created"], 1)
@@ -636,3 +633,34 @@ class SyncNewsBranchTest(TestCase):
         self.assertEqual(article.hero_image_url, "")
         self.assertEqual(result["scrape_failed"], 1)
         self.assertTrue(any("disappeared" in warning for warning in result["warnings"]))
+
+    @patch("apps.cms.services.news.sync.scrape_article")
+    @patch("apps.cms.services.news.sync.fetch_feed")
+    def test_sync_uses_constant_queries_regardless_of_item_count(self, mock_fetch, mock_scrape):
+        mock_fetch.return_value = SAMPLE_RSS
+        mock_scrape.return_value = {"hero_image_url": "", "hero_caption": "", "body_html": "<p>Body</p>"}
+        sync_news()
+        mock_fetch.return_value = SAMPLE_RSS.replace(b"Test Article", b"Renamed Article")
+        mock_scrape.return_value = {"hero_image_url": "", "hero_caption": "", "body_html": "<p>New body</p>"}
+
+        # One prefetch, one bulk update of changed feed fields, one existence
+        # check and one bulk update of scraped content; no per-article queries.
+        with self.assertNumQueries(4):
+            result = sync_news()
+
+        self.assertEqual(result["updated"], 2)
+        self.assertEqual(
+            set(NewsArticle.objects.values_list("title", "content")),
+            {("Renamed Article One", "<p>New body</p>"), ("Renamed Article Two", "<p>New body</p>")},
+        )
+
+    @patch("apps.cms.services.news.sync.scrape_article", side_effect=Exception("scrape error"))
+    @patch("apps.cms.services.news.sync.fetch_feed")
+    def test_sync_creates_new_articles_in_one_batch(self, mock_fetch, mock_scrape):
+        mock_fetch.return_value = SAMPLE_RSS
+
+        with self.assertNumQueries(2):
+            result = sync_news()
+
+        self.assertEqual(result["created"], 2)
+        self.assertEqual(NewsArticle.objects.count(), 2)
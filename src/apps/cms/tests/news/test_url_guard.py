@@ -7,15 +7,19 @@ malicious remote feed) reach internal services or read local files.
 
 import ipaddress
 import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
 
 from django.test import TestCase
 
 from apps.cms.services.news import url_guard
 from apps.cms.services.news.url_guard import (
+    ConnectionPool,
     UnsafeUrlError,
     _guarded_create_connection,
     has_allowed_scheme,
+    pooled_connections,
     safe_urlopen,
     validate_public_http_url,
 )
@@ -175,3 +179,69 @@ class GuardedCreateConnectionTest(TestCase):
         with patch("apps.cms.services.news.url_guard.socket.getaddrinfo", return_value=_addrinfo("127.0.0.1", port=80)):
             with self.assertRaises(UnsafeUrlError):
                 _guarded_create_connection("rebind.evil", 80, 10, None)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports: list[int] = []
+
+    def do_GET(self):
+        self.client_ports.append(self.client_address[1])
+        body = b"ok:" + self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class PooledConnectionsTest(TestCase):
+    def setUp(self):
+        _KeepAliveHandler.client_ports = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        self.addCleanup(self.server.server_close)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.shutdown)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        # The test server lives on loopback, which the guard rightly blocks.
+        for patcher in (
+            patch.object(url_guard, "_ip_is_blocked", return_value=False),
+            patch.object(url_guard, "validate_public_http_url", side_effect=lambda url: url),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_reuses_one_connection_for_sequential_requests(self):
+        pool = ConnectionPool()
+        with pooled_connections(pool):
+            bodies = []
+            for path in ("/a", "/b", "/c"):
+                with safe_urlopen(f"{self.base_url}{path}", timeout=5) as resp:
+                    bodies.append(resp.read())
+        pool.close()
+
+        self.assertEqual(bodies, [b"ok:/a", b"ok:/b", b"ok:/c"])
+        self.assertEqual(len(set(_KeepAliveHandler.client_ports)), 1)
+        self.assertEqual((pool.opened, pool.reused), (1, 2))
+
+    def test_partially_read_response_is_not_reused(self):
+        pool = ConnectionPool()
+        with pooled_connections(pool):
+            with safe_urlopen(f"{self.base_url}/first", timeout=5) as resp:
+                resp.read(1)
+            with safe_urlopen(f"{self.base_url}/second", timeout=5) as resp:
+                self.assertEqual(resp.read(), b"ok:/second")
+        pool.close()
+
+        self.assertEqual(pool.opened, 2)
+        self.assertEqual(len(set(_KeepAliveHandler.client_ports)), 2)
+
+    def test_without_pool_each_request_opens_a_connection(self):
+        for path in ("/a", "/b"):
+            with safe_urlopen(f"{self.base_url}{path}", timeout=5) as resp:
+                resp.read()
+
+        self.assertEqual(len(set(_KeepAliveHandler.client_ports)), 2)
@@ -0,0 +1,159 @@
+"""Responsive WebP/JPEG renditions of CMS image assets and their ``srcset`` maps."""
+
+import io
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from apps.cms.models import CMSAsset, CMSBlock, CMSPage
+from apps.cms.services.media import derivatives, generate_asset_derivatives, srcset
+from apps.cms.views.cms import published_page_data
+from apps.core.models import BackgroundJob
+from apps.core.services.background_jobs.registry import get_handler
+
+
+def image_upload(name, size, mode="RGB", image_format="JPEG"):
+    buffer = io.BytesIO()
+    Image.new(mode, size, (200, 40, 40, 128) if mode == "RGBA" else (200, 40, 40)).save(buffer, image_format)
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+@override_settings(CMS_IMAGE_DERIVATIVES_ENABLED=True)
+class ImageDerivativeTests(TestCase):
+    # noinspection PyPep8Naming,PyAttributeOutsideInit
+    def setUp(self):
+        cache.clear()
+        self.temp_media_root = tempfile.mkdtemp()
+        self.media_override = override_settings(MEDIA_ROOT=self.temp_media_root)
+        self.media_override.enable()
+
+    def tearDown(self):
+        self.media_override.disable()
+        shutil.rmtree(self.temp_media_root, ignore_errors=True)
+
+    def _asset(self, upload):
+        with patch.object(derivatives, "start_in_process_task"):
+            return CMSAsset.objects.create(name=upload.name, file=upload)
+
+    def test_jpeg_gets_webp_and_jpeg_renditions_next_to_the_original(self):
+        asset = self._asset(image_upload("photo.jpg", (2400, 1200)))
+
+        rows = generate_asset_derivatives(asset.pk)
+
+        sizes = sorted((row.format, row.width, row.height) for row in rows)
+        self.assertEqual(
+            sizes,
+            sorted(
+                (image_format, width, width // 2)
+                for image_format in ("jpeg", "webp")
+                for width in (480, 768, 1200, 1920)
+            ),
+        )
+        folder = os.path.dirname(asset.file.name)
+        for row in rows:
+            self.assertEqual(os.path.dirname(row.file.name), folder)
+            self.assertIn(row.content_hash[:12], os.path.basename(row.file.name))
+            with Image.open(row.file.path) as rendition:
+                self.assertEqual((rendition.format.lower(), rendition.width), (row.format, row.width))
+
+    def test_transparent_png_gets_webp_only_up_to_its_own_width(self):
+        asset = self._asset(image_upload("logo.png", (600, 300), mode="RGBA", image_format="PNG"))
+
+        rows = generate_asset_derivatives(asset.pk)
+
+        self.assertEqual(sorted((row.format, row.width) for row in rows), [("webp", 480), ("webp", 600)])
+
+    def test_svg_and_undecodable_files_are_skipped(self):
+        svg = self._asset(SimpleUploadedFile("icon.svg", b"<svg xmlns='http://www.w3.org/2000/svg'></svg>"))
+        broken = CMSAsset.objects.create(name="broken", file=SimpleUploadedFile("broken.png", b"\x89PNG\r\n\x1a\n"))
+
+        self.assertEqual(generate_asset_derivatives(svg.pk), [])
+        self.assertEqual(generate_asset_derivatives(broken.pk), [])
+
+    def test_upload_queues_one_durable_job_after_commit(self):
+        with self.settings(BACKGROUND_JOBS_ENABLED=True), self.captureOnCommitCallbacks(execute=True):
+            asset = CMSAsset.objects.create(name="Photo", file=image_upload("photo.jpg", (800, 400)))
+            asset.name = "Renamed"
+            asset.save()
+
+        job = BackgroundJob.objects.get(kind=derivatives.DERIVATIVE_JOB_KIND)
+        self.assertEqual(job.payload, {"asset_id": str(asset.pk)})
+        get_handler(job.kind)(job)
+        self.assertEqual(asset.derivatives.count(), 6)  # 480, 768 and 800 wide, WebP and JPEG.
+
+    def test_failed_or_unstarted_generation_can_be_scheduled_again(self):
+        asset = self._asset(image_upload("photo.jpg", (800, 400)))
+        self.addCleanup(derivatives._scheduled.clear)
+
+        with patch.object(derivatives, "start_in_process_task") as start:
+            derivatives.schedule_asset_derivatives(asset.pk, asset.file.name)
+            derivatives.schedule_asset_derivatives(asset.pk, asset.file.name)
+        start.assert_called_once()
+        run, *args = start.call_args.args
+        with (
+            patch.object(derivatives, "generate_asset_derivatives", side_effect=OSError("disk")),
+            self.assertRaises(OSError),
+        ):
+            run(*args)
+
+        with patch.object(derivatives, "start_in_process_task", return_value=None) as start:
+            derivatives.schedule_asset_derivatives(asset.pk, asset.file.name)
+            derivatives.schedule_asset_derivatives(asset.pk, asset.file.name)
+        self.assertEqual(start.call_count, 2)
+
+    def test_scheduled_entries_expire(self):
+        asset = self._asset(image_upload("photo.jpg", (800, 400)))
+        self.addCleanup(derivatives._scheduled.clear)
+
+        with patch.object(derivatives, "start_in_process_task") as start:
+            derivatives.schedule_asset_derivatives(asset.pk, asset.file.name)
+            with patch.object(derivatives.time, "monotonic", return_value=derivatives.time.monotonic() + 601):
+                derivatives.schedule_asset_derivatives(asset.pk, asset.file.name)
+
+        self.assertEqual(start.call_count, 2)
+
+    def test_replacing_the_file_swaps_renditions_and_deletes_stale_files(self):
+        asset = self._asset(image_upload("photo.jpg", (800, 400)))
+        old_paths = [row.file.path for row in generate_asset_derivatives(asset.pk)]
+
+        asset.file = image_upload("photo.jpg", (500, 250))
+        with patch.object(derivatives, "start_in_process_task"), self.captureOnCommitCallbacks(execute=True):
+            asset.save()
+            rows = generate_asset_derivatives(asset.pk)
+
+        self.assertEqual(sorted(row.width for row in asset.derivatives.all()), [480, 480, 500, 500])
+        self.assertTrue(all(row.source_name == asset.file.name for row in rows))
+        # Byte-identical renditions keep their file; the rest are removed.
+        stale_paths = set(old_paths) - {row.file.path for row in rows}
+        self.assertGreaterEqual(len(stale_paths), 4)
+        self.assertFalse(any(os.path.exists(path) for path in stale_paths))
+
+    def test_page_payload_exposes_srcset_and_is_rebuilt_after_generation(self):
+        asset = self._asset(image_upload("hero.jpg", (1000, 500)))
+        page = CMSPage.objects.create(slug="about", route="/about", title="About", status="published")
+        CMSBlock.objects.create(
+            page=page,
+            block_type="image_text",
+            sort_order=0,
+            data={"image_url": asset.public_url, "body_html": "<p>Hi</p>"},
+        )
+
+        with patch.object(srcset, "schedule_asset_derivatives") as schedule:
+            self.assertNotIn(b"image_srcset", published_page_data("/about"))
+        schedule.assert_called_once_with(asset.pk, asset.file.name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            generate_asset_derivatives(asset.pk)
+        self.assertIsNone(cache.get("cms:page:/about"))
+
+        block = self.client.get("/cms/pages/about/").json()["blocks"][0]
+        webp = block["data"]["image_srcset"]["webp"].split(", ")
+        self.assertEqual([candidate.rsplit(" ", 1)[1] for candidate in webp], ["480w", "768w", "1000w"])
+        self.assertIn("jpeg", block["data"]["image_srcset"])
+        self.assertEqual(block["data"]["image_url"], asset.public_url)
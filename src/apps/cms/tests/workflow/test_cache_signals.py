@@ -3,9 +3,11 @@
 from unittest.mock import patch
 
 from django.core.cache import cache
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
 
 from apps.cms.models import CMSBlock, CMSPage, NewsArticle
+from apps.core.services.cache import tiered_cache
 
 
 class CMSBlockCacheInvalidationTests(TestCase):
@@ -67,6 +69,24 @@ class CMSPageRouteChangeCacheTests(TestCase):
         self.assertIsNone(cache.get("layout:data"))
 
 
+@override_settings(TIERED_CACHE_L1_TTL=30)
+class CMSPageLocalCacheInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(tiered_cache.local.clear)
+
+    def test_page_save_retires_process_local_copy(self):
+        page = CMSPage.objects.create(slug="l1", route="/l1", title="Before", status="published")
+        client = APIClient()
+        self.assertEqual(client.get("/cms/pages/l1/").json()["title"], "Before")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            page.title = "After"
+            page.save()
+
+        self.assertEqual(client.get("/cms/pages/l1/").json()["title"], "After")
+
+
 class NewsArticleCacheInvalidationTests(TestCase):
     def setUp(self):
         cache.clear()
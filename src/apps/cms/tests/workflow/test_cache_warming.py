@@ -0,0 +1,66 @@
+"""Commit-time warming of the public CMS caches after a publish."""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.cms.models import CMSPage
+from apps.cms.services.cache_warming import last_warm_metrics, warm_cms_caches, warming
+from apps.core.models import BackgroundJob
+from apps.core.services.background_jobs.registry import get_handler
+
+
+def _run_inline(target, *args, **kwargs):
+    target(*args)
+    return object()
+
+
+@override_settings(CMS_CACHE_WARMING_ENABLED=True)
+@patch("apps.cms.services.cache_warming.warming.WARM_COALESCE_SECONDS", 0)
+class CMSCacheWarmingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.page = CMSPage.objects.create(slug="about", route="/about", title="About", status="published")
+
+    def test_warm_primes_pages_homepage_and_layout(self):
+        result = warm_cms_caches(["/about", "/missing"], homepage=True, layout=True)
+
+        self.assertEqual((result["entries"], result["warmed"]), (5, 3))
+        self.assertIsNotNone(cache.get("cms:page:/about"))
+        self.assertIsNone(cache.get("cms:page:/missing"))
+        self.assertIsNotNone(cache.get("layout:data"))
+        self.assertIsNotNone(cache.get("layout:stylesheet:v8"))
+        self.assertIsNone(cache.get("cms:homepage"))  # No homepage is published.
+        self.assertEqual(last_warm_metrics()["cms_cache_warm_entries"], 3)
+
+    def test_route_change_warms_new_and_old_routes_after_commit(self):
+        with (
+            patch.object(warming, "start_in_process_task", side_effect=_run_inline),
+            patch.object(warming, "warm_cms_caches") as warm,
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.page.route = "/about-us"
+                self.page.save()
+
+        warm.assert_called_once_with(["/about", "/about-us"], homepage=True, layout=True, embeds=False)
+
+    def test_requests_are_coalesced_into_one_durable_job(self):
+        with patch.object(warming, "start_in_process_task") as start, self.settings(BACKGROUND_JOBS_ENABLED=True):
+            warming.schedule_cache_warm(["/a"])
+            warming.schedule_cache_warm(["/b", None], layout=True)
+            start.assert_called_once()
+            warming._flush_pending()
+
+        job = BackgroundJob.objects.get(kind=warming.WARM_JOB_KIND)
+        self.assertEqual(job.payload, {"routes": ["/a", "/b"], "homepage": False, "layout": True, "embeds": False})
+
+        get_handler(job.kind)(job)
+        self.assertIsNotNone(cache.get("layout:data"))
+
+    @override_settings(CMS_CACHE_WARMING_ENABLED=False)
+    def test_disabled_warming_schedules_nothing(self):
+        with patch.object(warming, "start_in_process_task") as start:
+            warming.schedule_cache_warm(["/about"], homepage=True)
+
+        start.assert_not_called()
@@ -1,11 +1,13 @@
 from django.urls import path
 
-from apps.cms.views.cms import CMSEmbedHostsView, CMSHomepageView, CMSLivePreviewView, CMSPageView, CMSPreviewFetchView
-from apps.cms.views.layout import EmbedBlockView
+from apps.cms.views.cms import CMSEmbedHostsView, CMSHomepageView, CMSPageView, CMSPreviewFetchView
+from apps.cms.views.embed import EmbedBlockView
+from apps.cms.views.live_preview import CMSLivePreviewView, live_preview_events
 
 urlpatterns = [
     path("embed-hosts/", CMSEmbedHostsView.as_view(), name="cms-embed-hosts"),
     path("live-preview/<uuid:page_id>/", CMSLivePreviewView.as_view(), name="cms-live-preview"),
+    path("live-preview/<uuid:page_id>/events/", live_preview_events, name="cms-live-preview-events"),
     path("preview/<str:token>/", CMSPreviewFetchView.as_view(), name="cms-preview-fetch"),
     path("homepage/", CMSHomepageView.as_view(), name="cms-homepage"),
     path("pages/", CMSPageView.as_view(), {"route_path": ""}, name="cms-page-root"),
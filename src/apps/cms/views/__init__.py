@@ -1,11 +1,13 @@
 from .analytics import PageViewCreateView
 from .cms import CMSEmbedHostsView, CMSPageView, CMSPreviewFetchView
-from .layout import EmbedBlockView, LayoutAPIView, LayoutStylesheetView
+from .embed import EmbedBlockView
+from .layout import LayoutAPIView, LayoutStylesheetView, LayoutVersionedStylesheetView
 from .news import NewsDetailAPIView, NewsListAPIView
 
 __all__ = [
     "LayoutAPIView",
     "LayoutStylesheetView",
+    "LayoutVersionedStylesheetView",
     "EmbedBlockView",
     "CMSEmbedHostsView",
     "CMSPageView",
@@ -52,7 +52,7 @@ class PageViewCreateView(APIView):
                 "referrer": serializer.validated_data.get("referrer", ""),
                 "ip_address": self._get_client_ip(request),
                 "user_agent": request.META.get("HTTP_USER_AGENT", ""),
-                "member": member,
+                "member_id": member.pk if member else None,
                 "session_key": getattr(request.session, "session_key", None) or "",
             }
         )
@@ -1,11 +1,8 @@
 import logging
-from datetime import timedelta
 
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.http import HttpResponseNotModified
-from django.utils import timezone
-from rest_framework.authentication import SessionAuthentication
 from rest_framework.permissions import AllowAny, BasePermission
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -18,14 +15,27 @@ from apps.cms.services.routing.route_redirects import (
 )
 from apps.cms.services.sanitization.embed_hosts import CACHE_TTL as EMBED_HOST_CACHE_TTL
 from apps.cms.services.sanitization.embed_hosts import get_allowed_hosts_snapshot
+from apps.core.services.cache import tiered_cache
 from apps.core.utils.access import user_can_access_app
-from apps.core.utils.http_cache import public_json_response
+from apps.core.utils.http_cache import encode_public_json, public_json_response
 
 logger = logging.getLogger(__name__)
 
-_LIVE_PREVIEW_TTL = 600  # 10 minutes
 HOMEPAGE_CACHE_KEY = "cms:homepage"
 CMS_PAGE_CACHE_TIMEOUT = 300
+CMS_PAGE_CACHE_TAG = "cms-pages"
+
+
+def cms_page_cache_key(route):
+    return f"cms:page:{route}"
+
+
+def clear_cms_page_cache(*routes, homepage=False):
+    """Retire cached page (or redirect) payloads for ``routes`` in every process."""
+    keys = [cms_page_cache_key(route) for route in routes if route]
+    if homepage:
+        keys.append(HOMEPAGE_CACHE_KEY)
+    tiered_cache.invalidate(CMS_PAGE_CACHE_TAG, keys=keys)
 
 
 class CMSEmbedHostsView(APIView):
@@ -76,60 +86,6 @@ class CMSPreviewFetchView(APIView):
         return Response(data)
 
 
-class CMSLivePreviewView(APIView):
-    """Store and retrieve live-preview page data keyed by page UUID.
-
-    POST (cms-app only): admin JS pushes the current editor state here on every edit.
-    GET  (public cache): preview tab polls this endpoint to render the latest state.
-                       cms-app members may fall back to the current DB state.
-    """
-
-    # Session auth needed for admin JS; JWT default handles API clients.
-    authentication_classes = [SessionAuthentication]
-
-    def get_permissions(self):
-        if self.request.method == "POST":
-            return [HasCMSAppAccess()]
-        return [AllowAny()]
-
-    # noinspection PyMethodMayBeStatic,PyUnusedLocal
-    def get(self, request, page_id):
-        cached = cache.get(f"cms:live-preview:{page_id}")
-        if cached is not None:
-            return Response(cached)
-
-        if not user_can_access_app(request.user, "cms"):
-            return Response({"detail": "Preview not found or expired."}, status=404)
-
-        page = CMSPage.objects.prefetch_related("blocks").filter(pk=page_id).first()
-        if page is None:
-            return Response({"detail": "Page not found."}, status=404)
-        return Response(CMSPageSerializer(page).data)
-
-    # noinspection PyMethodMayBeStatic
-    def post(self, request, page_id):
-        import json
-
-        data = request.data
-        if not isinstance(data, dict):
-            return Response({"detail": "Invalid JSON."}, status=400)
-
-        # Reject oversize payloads before they hit the cache / GET reflection.
-        # 512 KB is ~10x a typical page payload and small enough that the GET
-        # reflection cannot be used to blow up downstream consumers.
-        try:
-            serialized_size = len(json.dumps(data, default=str))
-        except (TypeError, ValueError):
-            return Response({"detail": "Payload is not serializable."}, status=400)
-        if serialized_size > 512_000:
-            return Response({"detail": "Preview payload too large."}, status=413)
-
-        data.pop("expires_at", None)
-        data["expires_at"] = (timezone.now() + timedelta(seconds=_LIVE_PREVIEW_TTL)).isoformat()
-        cache.set(f"cms:live-preview:{page_id}", data, timeout=_LIVE_PREVIEW_TTL)
-        return Response({"ok": True})
-
-
 class CMSPageView(APIView):
     """Serve a published CMS page by its route path."""
 
@@ -149,7 +105,7 @@ class CMSPageView(APIView):
                 legacy_route = None
 
             if legacy_route is not None:
-                cached = cache.get(f"cms:page:{legacy_route}")
+                cached = tiered_cache.get(cms_page_cache_key(legacy_route), tags=(CMS_PAGE_CACHE_TAG,))
                 if cached is not None:
                     return public_json_response(request, cached)
 
@@ -159,8 +115,13 @@ class CMSPageView(APIView):
                     .first()
                 )
                 if redirect is not None:
-                    data = {"redirect_to": redirect.destination_path, "permanent": True}
-                    cache.set(f"cms:page:{legacy_route}", data, timeout=CMS_PAGE_CACHE_TIMEOUT)
+                    data = encode_public_json({"redirect_to": redirect.destination_path, "permanent": True})
+                    tiered_cache.set(
+                        cms_page_cache_key(legacy_route),
+                        data,
+                        tags=(CMS_PAGE_CACHE_TAG,),
+                        timeout=CMS_PAGE_CACHE_TIMEOUT,
+                    )
                     return public_json_response(request, data)
 
         try:
@@ -168,23 +129,36 @@ class CMSPageView(APIView):
         except ValidationError:
             return Response({"detail": "Page not found."}, status=404)
 
-        qs = CMSPage.objects.prefetch_related("blocks")
-        if is_preview and user_can_access_app(request.user, "cms"):
-            qs = qs.filter(route=route).exclude(status="archived")
-        else:
-            qs = qs.filter(route=route, status="published")
+        if not is_preview:
+            data = published_page_data(route)
+            if data is None:
+                return Response({"detail": "Page not found."}, status=404)
+            return public_json_response(request, data)
 
+        qs = CMSPage.objects.prefetch_related("blocks").filter(route=route)
+        if user_can_access_app(request.user, "cms"):
+            qs = qs.exclude(status="archived")
+        else:
+            qs = qs.filter(status="published")
         page = qs.first()
         if page is None:
             return Response({"detail": "Page not found."}, status=404)
+        return Response(CMSPageSerializer(page).data)
 
-        data = CMSPageSerializer(page).data
 
-        if not is_preview:
-            cache.set(f"cms:page:{route}", data, timeout=CMS_PAGE_CACHE_TIMEOUT)
-            return public_json_response(request, data)
+def published_page_data(route):
+    """Return the encoded published page at ``route`` (or ``None``), built at most once."""
+    return tiered_cache.get_or_build(
+        cms_page_cache_key(route),
+        lambda: _build_published_page_data(route),
+        CMS_PAGE_CACHE_TIMEOUT,
+        tags=(CMS_PAGE_CACHE_TAG,),
+    )
 
-        return Response(data)
+
+def _build_published_page_data(route):
+    page = CMSPage.objects.prefetch_related("blocks").filter(route=route, status="published").first()
+    return encode_public_json(CMSPageSerializer(page).data) if page is not None else None
 
 
 class CMSHomepageView(APIView):
@@ -194,20 +168,25 @@ class CMSHomepageView(APIView):
 
     # noinspection PyMethodMayBeStatic
     def get(self, request):
-        cached = cache.get(HOMEPAGE_CACHE_KEY)
-        if cached is not None:
-            return public_json_response(request, cached)
-
-        settings = SiteSettings.load()
-        pages = CMSPage.objects.prefetch_related("blocks").filter(status="published")
-        page = None
-        if settings.homepage_page_id:
-            page = pages.filter(pk=settings.homepage_page_id).first()
-        if page is None:
-            page = pages.filter(route="/").first()
-        if page is None:
+        data = homepage_data()
+        if data is None:
             return Response({"detail": "Page not found."}, status=404)
-
-        data = CMSPageSerializer(page).data
-        cache.set(HOMEPAGE_CACHE_KEY, data, timeout=CMS_PAGE_CACHE_TIMEOUT)
         return public_json_response(request, data)
+
+
+def homepage_data():
+    """Return the encoded homepage (or ``None``), built at most once."""
+    return tiered_cache.get_or_build(
+        HOMEPAGE_CACHE_KEY, _build_homepage_data, CMS_PAGE_CACHE_TIMEOUT, tags=(CMS_PAGE_CACHE_TAG,)
+    )
+
+
+def _build_homepage_data():
+    settings = SiteSettings.load()
+    pages = CMSPage.objects.prefetch_related("blocks").filter(status="published")
+    page = None
+    if settings.homepage_page_id:
+        page = pages.filter(pk=settings.homepage_page_id).first()
+    if page is None:
+        page = pages.filter(route="/").first()
+    return encode_public_json(CMSPageSerializer(page).data) if page is not None else None
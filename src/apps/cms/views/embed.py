@@ -0,0 +1,100 @@
+from django.utils.decorators import method_decorator
+from django.views.decorators.clickjacking import xframe_options_exempt
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.core.services.cache import tiered_cache
+from apps.core.utils.http_cache import encode_public_json, public_json_response
+
+from ..models import CMSBlock, CMSEmbedWidget
+from ..serializers import serialize_blocks
+
+EMBED_CACHE_TIMEOUT = 300
+EMBED_CACHE_TAG = "cms-embeds"
+
+
+def embed_cache_key(slug):
+    return f"cms:embed:{slug}"
+
+
+def clear_embed_caches(*slugs):
+    """Retire every cached widget payload, plus any ``slugs`` no longer in the table."""
+    current = CMSEmbedWidget.objects.values_list("slug", flat=True)
+    keys = {embed_cache_key(slug) for slug in (*current, *slugs) if slug}
+    tiered_cache.invalidate(EMBED_CACHE_TAG, keys=sorted(keys))
+
+
+def embed_widget_data(slug):
+    """Return the encoded payload for the visible widget ``slug`` (or ``None``), built at most once."""
+    return tiered_cache.get_or_build(
+        embed_cache_key(slug),
+        lambda: _build_embed_data(slug),
+        EMBED_CACHE_TIMEOUT,
+        tags=(EMBED_CACHE_TAG,),
+    )
+
+
+def _build_embed_data(slug):
+    widget = CMSEmbedWidget.objects.select_related("page", "schedule").filter(slug=slug).first()
+    if widget is None or not widget.is_visible():
+        return None
+
+    hidden_sections = widget.get_effective_hidden_sections()
+    if widget.widget_type == "app_route":
+        data = {
+            "widget_type": "app_route",
+            "app_route": widget.app_route,
+            "blocks": [],
+            "page_css_class": "",
+            "page_css": "",
+            "hidden_sections": hidden_sections,
+            "hide_section_titles": "section_titles" in hidden_sections,
+            "schedule_id": str(widget.schedule_id) if widget.app_route == "/schedule" and widget.schedule_id else None,
+        }
+    else:
+        sort_orders = [o for o in (widget.block_sort_orders or []) if isinstance(o, int)]
+        blocks_qs = CMSBlock.objects.filter(page_id=widget.page_id, sort_order__in=sort_orders)
+        blocks_by_order = {b.sort_order: b for b in blocks_qs}
+        ordered_blocks = [blocks_by_order[o] for o in sort_orders if o in blocks_by_order]
+        data = {
+            "widget_type": "blocks",
+            "app_route": "",
+            "blocks": serialize_blocks(ordered_blocks),
+            "page_css_class": widget.page.page_css_class or "",
+            "page_css": widget.page.page_css or "",
+            "hidden_sections": hidden_sections,
+            "hide_section_titles": "section_titles" in hidden_sections,
+        }
+    return encode_public_json(data)
+
+
+@method_decorator(xframe_options_exempt, name="dispatch")
+class EmbedBlockView(APIView):
+    """Public endpoint returning an embed widget's payload.
+
+    Two widget types:
+      - ``blocks`` — returns a subset of the source page's blocks plus page_css.
+      - ``app_route`` — returns an interactive app-route identifier (e.g. "/schedule")
+        the frontend mounts inside the embed iframe.
+
+    Payloads are cached per slug and revalidated by ETag; the CMS signals
+    retire them when a widget, its page or blocks, or a schedule changes.
+
+    Sets permissive CORS + removes X-Frame-Options so third parties can iframe-render.
+    NOTE: the wildcard `Access-Control-Allow-Origin` is intentional — widgets are
+    designed for arbitrary third-party embedding. To tighten this, add an
+    `allowed_origins` field to CMSEmbedWidget and echo only matching origins.
+    """
+
+    permission_classes = [AllowAny]
+
+    # noinspection PyMethodMayBeStatic
+    def get(self, request, embed_slug, *args, **kwargs):
+        data = embed_widget_data(embed_slug)
+        if data is None:
+            response = Response({"detail": "Not found."}, status=404)
+        else:
+            response = public_json_response(request, data)
+        response["Access-Control-Allow-Origin"] = "*"
+        return response
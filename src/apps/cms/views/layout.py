@@ -1,28 +1,29 @@
 from django.core.cache import cache
-from django.http import HttpResponse
+from django.http import HttpResponseRedirect
+from django.urls import reverse
 from django.utils.cache import patch_cache_control
-from django.utils.decorators import method_decorator
 from django.views import View
-from django.views.decorators.clickjacking import xframe_options_exempt
 from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.core.utils.http_cache import public_json_response
+from apps.core.services.cache import tiered_cache
+from apps.core.utils.http_cache import asset_response, encode_asset, encode_public_json, public_json_response
 
-from ..models import CMSBlock, CMSEmbedWidget, FooterContent, Menu, SiteSettings, StyleSheet
-from ..serializers import (
-    CMSBlockSerializer,
-    FooterContentSerializer,
-    MenuSerializer,
-)
+from ..models import FooterContent, Menu, SiteSettings, StyleSheet
+from ..serializers import FooterContentSerializer, MenuSerializer
 
 LAYOUT_CACHE_KEY = "layout:data"
 # Bump suffix (:v2, :v3, ...) whenever the assembled stylesheet gains or loses a
-# non-token section. This retires existing cached blobs instantly on deploy
-# instead of waiting the TTL out.
-LAYOUT_STYLESHEET_CACHE_KEY = "layout:stylesheet:v6"
+# non-token section, or the cached value changes shape. This retires existing
+# cached blobs instantly on deploy instead of waiting the TTL out.
+LAYOUT_STYLESHEET_CACHE_KEY = "layout:stylesheet:v8"
 LAYOUT_CACHE_TIMEOUT = 600
+# Content-hashed stylesheet URLs never change meaning, so browsers keep them a year.
+LAYOUT_STYLESHEET_IMMUTABLE_MAX_AGE = 31536000
+# How long a superseded stylesheet hash keeps serving its own CSS, for pages
+# and cached layout payloads that still link it.
+LAYOUT_STYLESHEET_GRACE_SECONDS = 7 * 24 * 60 * 60
+LAYOUT_CACHE_TAG = "layout"
 
 # Mirrors GROUP_PREFIX in pages/src/features/layout/components/LayoutProvider/LayoutProvider.tsx —
 # both must agree so the CSS variables emitted server-side match the names JS sets.
@@ -53,6 +54,57 @@ def _design_tokens_to_css(tokens):
     return ":root {\n" + "\n".join(lines) + "\n}\n"
 
 
+def clear_layout_caches():
+    """Retire the cached layout payload and stylesheet in every process."""
+    tiered_cache.invalidate(LAYOUT_CACHE_TAG, keys=(LAYOUT_CACHE_KEY, LAYOUT_STYLESHEET_CACHE_KEY))
+
+
+def layout_data():
+    """Return the encoded menus and footer payload, built at most once."""
+    return tiered_cache.get_or_build(
+        LAYOUT_CACHE_KEY, _build_layout_data, LAYOUT_CACHE_TIMEOUT, tags=(LAYOUT_CACHE_TAG,)
+    )
+
+
+def layout_stylesheet():
+    """Return the combined design-token and stylesheet CSS as an encoded asset, built at most once."""
+    return tiered_cache.get_or_build(
+        LAYOUT_STYLESHEET_CACHE_KEY, _build_stylesheet, LAYOUT_CACHE_TIMEOUT, tags=(LAYOUT_CACHE_TAG,)
+    )
+
+
+def stylesheet_version_key(digest):
+    return f"{LAYOUT_STYLESHEET_CACHE_KEY}:{digest}"
+
+
+def stylesheet_url(digest):
+    return reverse("layout-stylesheet-versioned", kwargs={"digest": digest})
+
+
+def _build_layout_data():
+    menus = Menu.objects.filter(is_active=True).order_by("display_name")
+    footer = FooterContent.get_active()
+    return encode_public_json(
+        {
+            "menus": MenuSerializer(menus, many=True).data,
+            "footer": FooterContentSerializer(footer).data if footer else None,
+            "stylesheet_url": stylesheet_url(layout_stylesheet().digest),
+        }
+    )
+
+
+def _build_stylesheet():
+    settings = SiteSettings.load()
+    tokens_css = _design_tokens_to_css(settings.design_tokens)
+    sheets = StyleSheet.objects.filter(is_active=True).values_list("css", flat=True)
+    sheets_css = "\n".join(c for c in sheets if c)
+    asset = encode_asset(((tokens_css + "\n" + sheets_css).strip() + "\n").encode())
+    # Versioned copies are never invalidated, only expired, so superseded
+    # hashes keep resolving for the grace window.
+    cache.set(stylesheet_version_key(asset.digest), asset, timeout=LAYOUT_STYLESHEET_GRACE_SECONDS)
+    return asset
+
+
 class LayoutAPIView(APIView):
     """Unified endpoint for menu and footer data with caching."""
 
@@ -60,27 +112,7 @@ class LayoutAPIView(APIView):
 
     # noinspection PyMethodMayBeStatic
     def get(self, request, *args, **kwargs):
-        cached_data = cache.get(LAYOUT_CACHE_KEY)
-        if cached_data is not None:
-            return public_json_response(request, cached_data)
-
-        menus = Menu.objects.filter(is_active=True).order_by("display_name")
-        menu_serializer = MenuSerializer(menus, many=True)
-
-        footer = FooterContent.get_active()
-        footer_data = None
-        if footer:
-            footer_serializer = FooterContentSerializer(footer)
-            footer_data = footer_serializer.data
-
-        data = {
-            "menus": menu_serializer.data,
-            "footer": footer_data,
-        }
-
-        cache.set(LAYOUT_CACHE_KEY, data, timeout=LAYOUT_CACHE_TIMEOUT)
-
-        return public_json_response(request, data)
+        return public_json_response(request, layout_data())
 
 
 class LayoutStylesheetView(View):
@@ -93,74 +125,34 @@ class LayoutStylesheetView(View):
 
     # noinspection PyMethodMayBeStatic
     def get(self, request, *args, **kwargs):
-        css = cache.get(LAYOUT_STYLESHEET_CACHE_KEY)
-        if css is None:
-            settings = SiteSettings.load()
-            tokens_css = _design_tokens_to_css(settings.design_tokens)
-            sheets = StyleSheet.objects.filter(is_active=True).values_list("css", flat=True)
-            sheets_css = "\n".join(c for c in sheets if c)
-            css = (tokens_css + "\n" + sheets_css).strip() + "\n"
-            cache.set(LAYOUT_STYLESHEET_CACHE_KEY, css, timeout=LAYOUT_CACHE_TIMEOUT)
-
-        response = HttpResponse(css, content_type="text/css; charset=utf-8")
-        patch_cache_control(response, public=True, max_age=LAYOUT_CACHE_TIMEOUT)
-        return response
-
-
-@method_decorator(xframe_options_exempt, name="dispatch")
-class EmbedBlockView(APIView):
-    """Public endpoint returning an embed widget's payload.
-
-    Two widget types:
-      - ``blocks`` — returns a subset of the source page's blocks plus page_css.
-      - ``app_route`` — returns an interactive app-route identifier (e.g. "/schedule")
-        the frontend mounts inside the embed iframe.
-
-    Sets permissive CORS + removes X-Frame-Options so third parties can iframe-render.
-    NOTE: the wildcard `Access-Control-Allow-Origin` is intentional — widgets are
-    designed for arbitrary third-party embedding. To tighten this, add an
-    `allowed_origins` field to CMSEmbedWidget and echo only matching origins.
-    """
+        return asset_response(
+            request,
+            layout_stylesheet(),
+            content_type="text/css; charset=utf-8",
+            cache_control=f"public, max-age={LAYOUT_CACHE_TIMEOUT}",
+        )
 
-    permission_classes = [AllowAny]
+
+class LayoutVersionedStylesheetView(View):
+    """The same stylesheet under a content-hashed URL, cacheable for a year.
+
+    The layout payload advertises the current URL. A hash that is neither
+    current nor inside the grace window redirects to the current one.
+    """
 
     # noinspection PyMethodMayBeStatic
-    def get(self, request, embed_slug, *args, **kwargs):
-        widget = CMSEmbedWidget.objects.select_related("page", "schedule").filter(slug=embed_slug).first()
-        if widget is None or not widget.is_visible():
-            response = Response({"detail": "Not found."}, status=404)
-            response["Access-Control-Allow-Origin"] = "*"
-            return response
-
-        if widget.widget_type == "app_route":
-            hidden_sections = widget.get_effective_hidden_sections()
-            data = {
-                "widget_type": "app_route",
-                "app_route": widget.app_route,
-                "blocks": [],
-                "page_css_class": "",
-                "page_css": "",
-                "hidden_sections": hidden_sections,
-                "hide_section_titles": "section_titles" in hidden_sections,
-                "schedule_id": str(widget.schedule_id)
-                if widget.app_route == "/schedule" and widget.schedule_id
-                else None,
-            }
-        else:
-            hidden_sections = widget.get_effective_hidden_sections()
-            sort_orders = [o for o in (widget.block_sort_orders or []) if isinstance(o, int)]
-            blocks_qs = CMSBlock.objects.filter(page_id=widget.page_id, sort_order__in=sort_orders)
-            blocks_by_order = {b.sort_order: b for b in blocks_qs}
-            ordered_blocks = [blocks_by_order[o] for o in sort_orders if o in blocks_by_order]
-            data = {
-                "widget_type": "blocks",
-                "app_route": "",
-                "blocks": CMSBlockSerializer(ordered_blocks, many=True).data,
-                "page_css_class": widget.page.page_css_class or "",
-                "page_css": widget.page.page_css or "",
-                "hidden_sections": hidden_sections,
-                "hide_section_titles": "section_titles" in hidden_sections,
-            }
-        response = Response(data)
-        response["Access-Control-Allow-Origin"] = "*"
-        return response
+    def get(self, request, digest, *args, **kwargs):
+        asset = cache.get(stylesheet_version_key(digest))
+        if asset is None:
+            asset = layout_stylesheet()
+            if asset.digest != digest:
+                # Relative, so it resolves under whatever prefix proxies the API.
+                response = HttpResponseRedirect(f"stylesheet.{asset.digest}.css")
+                patch_cache_control(response, no_cache=True)
+                return response
+        return asset_response(
+            request,
+            asset,
+            content_type="text/css; charset=utf-8",
+            cache_control=f"public, max-age={LAYOUT_STYLESHEET_IMMUTABLE_MAX_AGE}, immutable",
+        )
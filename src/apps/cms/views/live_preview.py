@@ -0,0 +1,130 @@
+import asyncio
+import json
+import time
+
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.cms.models import CMSPage
+from apps.cms.serializers.cms import CMSPageSerializer
+from apps.cms.services.live_preview import (
+    LivePreviewConflict,
+    LivePreviewError,
+    apply_patch,
+    live_preview_key,
+    public_state,
+    replace_state,
+    state_since,
+)
+from apps.core.utils.access import user_can_access_app
+
+from .cms import HasCMSAppAccess
+
+LIVE_PREVIEW_STREAM_SECONDS = 55
+LIVE_PREVIEW_STREAM_POLL_SECONDS = 0.5
+LIVE_PREVIEW_STREAM_HEARTBEAT_SECONDS = 15
+LIVE_PREVIEW_STREAM_RETRY_MS = 1000
+
+
+def _parse_since(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _preview_payload(state, since):
+    """Return the changes after ``since`` when it belongs to ``state``'s session, else the full state."""
+    if since is not None:
+        delta = state_since(state, since)
+        if delta is not None:
+            return delta
+    return public_state(state)
+
+
+class CMSLivePreviewView(APIView):
+    """Store and retrieve live-preview page data keyed by page UUID.
+
+    POST (cms-app only): admin JS pushes either its complete editor state or, once
+                         it holds a revision, a patch of the changed fields and
+                         blocks against that ``base_rev`` (409 when stale).
+    GET  (public cache): preview tab fetches the latest state; with ``?since=rev``
+                       only what changed after that revision is returned.
+                       cms-app members may fall back to the current DB state.
+    """
+
+    # Session auth needed for admin JS; JWT default handles API clients.
+    authentication_classes = [SessionAuthentication]
+
+    def get_permissions(self):
+        if self.request.method == "POST":
+            return [HasCMSAppAccess()]
+        return [AllowAny()]
+
+    # noinspection PyMethodMayBeStatic,PyUnusedLocal
+    def get(self, request, page_id):
+        cached = cache.get(live_preview_key(page_id))
+        if cached is not None:
+            return Response(_preview_payload(cached, _parse_since(request.query_params.get("since"))))
+
+        if not user_can_access_app(request.user, "cms"):
+            return Response({"detail": "Preview not found or expired."}, status=404)
+
+        page = CMSPage.objects.prefetch_related("blocks").filter(pk=page_id).first()
+        if page is None:
+            return Response({"detail": "Page not found."}, status=404)
+        return Response(CMSPageSerializer(page).data)
+
+    # noinspection PyMethodMayBeStatic
+    def post(self, request, page_id):
+        data = request.data
+        if not isinstance(data, dict):
+            return Response({"detail": "Invalid JSON."}, status=400)
+
+        # Full states over 512 KB are rejected before they hit the cache / GET
+        # reflection; patches are measured by the blocks they replace.
+        try:
+            state = apply_patch(page_id, data) if "base_rev" in data else replace_state(page_id, data)
+        except LivePreviewConflict as exc:
+            return Response({"detail": str(exc), "rev": exc.current_rev}, status=exc.status)
+        except LivePreviewError as exc:
+            return Response({"detail": str(exc)}, status=exc.status)
+        return Response({"ok": True, "rev": state["rev"], "expires_at": state["expires_at"]})
+
+
+@require_GET
+async def live_preview_events(request, page_id):
+    """Server-sent events carrying each new preview revision as a delta.
+
+    The stream closes after ``LIVE_PREVIEW_STREAM_SECONDS``; EventSource then
+    reconnects with ``Last-Event-ID`` so the next stream resumes from there.
+    """
+    since = _parse_since(request.headers.get("Last-Event-ID") or request.GET.get("since"))
+    response = StreamingHttpResponse(_preview_event_stream(page_id, since), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    response["Content-Encoding"] = "identity"
+    return response
+
+
+async def _preview_event_stream(page_id, since):
+    key = live_preview_key(page_id)
+    deadline = time.monotonic() + LIVE_PREVIEW_STREAM_SECONDS
+    last_sent = time.monotonic()
+    yield f"retry: {LIVE_PREVIEW_STREAM_RETRY_MS}\n\n"
+    while time.monotonic() < deadline:
+        state = await cache.aget(key)
+        rev = state.get("rev") if state else None
+        if rev is not None and rev != since:
+            payload = json.dumps(_preview_payload(state, since), default=str)
+            yield f"id: {rev}\nevent: preview\ndata: {payload}\n\n"
+            since, last_sent = rev, time.monotonic()
+        elif time.monotonic() - last_sent >= LIVE_PREVIEW_STREAM_HEARTBEAT_SECONDS:
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
+        await asyncio.sleep(LIVE_PREVIEW_STREAM_POLL_SECONDS)
@@ -0,0 +1,59 @@
+"""Microbenchmark for the per-request cost of ContentSecurityPolicyMiddleware.
+
+Times the middleware around a stub view, with the view's own cost excluded,
+for a JSON API response and an HTML admin page. Each case runs with memoized
+policy templates (the normal path) and with the memo cleared before every
+request (what every request paid before policies were memoized).
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from apps.core.middleware import ContentSecurityPolicyMiddleware
+
+_ADMIN_HTML = (
+    '<html><head><style id="unfold-theme-colors">:root{--primary:#123}</style>'
+    "<style>\n  #changelist table thead th:first-child {width: inherit}\n</style></head>"
+    "<body>" + "<div class='row'>cell</div>" * 400 + "</body></html>"
+)
+
+
+class Command(BaseCommand):
+    help = "Measure ContentSecurityPolicyMiddleware overhead per request."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=2000,
+            help="Requests timed per case (default: 2000).",
+        )
+
+    def handle(self, *args, **options):
+        iterations = max(1, options["iterations"])
+        factory = RequestFactory()
+        cases = (
+            ("json api", factory.get("/cms/pages/home/"), lambda: HttpResponse("{}", content_type="application/json")),
+            ("html admin", factory.get("/admin/cms/cmspage/"), lambda: HttpResponse(_ADMIN_HTML)),
+        )
+        for label, request, make_response in cases:
+            for memoized in (True, False):
+                per_request = self._time(request, make_response, iterations, memoized=memoized)
+                mode = "memoized" if memoized else "rebuilt "
+                self.stdout.write(f"{label:<10}  {mode}  {per_request * 1e6:8.1f} µs/request")
+
+    @staticmethod
+    def _time(request, make_response, iterations: int, *, memoized: bool) -> float:
+        responses = [make_response() for _ in range(iterations + 1)]
+        middleware = ContentSecurityPolicyMiddleware(lambda _request: responses.pop())
+        middleware(request)  # Warm the embed-host cache and the policy template.
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            if not memoized:
+                middleware._policy_templates.clear()
+            middleware(request)
+        return (time.perf_counter() - started) / iterations
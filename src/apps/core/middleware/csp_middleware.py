@@ -7,9 +7,34 @@ from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Stands in for the per-request nonce in memoized policy templates. NUL can
+# never come from settings or the host allowlist, so it cannot collide.
+_NONCE_MARKER = "\0nonce\0"
+
 
 class ContentSecurityPolicyMiddleware:
-    """Add the configured CSP using the CMS iframe policy as its source of truth."""
+    """Add the configured CSP using the CMS iframe policy as its source of truth.
+
+    The policy text depends only on settings and the embed-host allowlist, so
+    it is built once per combination and kept in process memory with a marker
+    where the nonce goes. Each response only substitutes its own nonce.
+    """
+
+    # Every setting the policy reads; a change to any of them yields a new template.
+    _POLICY_SETTINGS = (
+        "STATIC_URL",
+        "MEDIA_URL",
+        "FRONTEND_URL",
+        "CSP_SCRIPT_SOURCES",
+        "CSP_STYLE_SOURCES",
+        "CSP_FONT_SOURCES",
+        "CSP_IMAGE_SOURCES",
+        "CSP_CONNECT_SOURCES",
+    )
+    _MAX_POLICY_TEMPLATES = 32
+    # Admin pages and the admin invitation flow render Unfold templates; no
+    # other response carries the vendor styles rewritten below.
+    _ADMIN_PATH_PREFIXES = ("/admin/", "/authn/invite/")
 
     _HOST_PATTERN = re.compile(
         r"^(?:\*\.)?[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?"
@@ -27,6 +52,7 @@ class ContentSecurityPolicyMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self._policy_templates: dict[tuple, str] = {}
 
     def __call__(self, request):
         # Make the nonce available before template rendering. Source-owned
@@ -43,7 +69,8 @@ class ContentSecurityPolicyMiddleware:
             request.csp_nonce,
             allow_framing=bool(getattr(response, "xframe_options_exempt", False)),
         )
-        self._nonce_vendor_styles(response, request.csp_nonce)
+        if request.path_info.startswith(self._ADMIN_PATH_PREFIXES):
+            self._nonce_vendor_styles(response, request.csp_nonce)
         return response
 
     @staticmethod
@@ -80,6 +107,40 @@ class ContentSecurityPolicyMiddleware:
         *,
         allow_framing: bool = False,
     ) -> str:
+        return self._policy_template(allow_framing).replace(_NONCE_MARKER, nonce)
+
+    def _policy_template(self, allow_framing: bool) -> str:
+        fingerprint = repr(tuple(getattr(settings, name, None) for name in self._POLICY_SETTINGS))
+        embed_hosts = self._embed_hosts()
+        key = (fingerprint, embed_hosts, allow_framing)
+        template = self._policy_templates.get(key)
+        if template is not None:
+            return template
+        template = self._compile_policy(embed_hosts or (), allow_framing=allow_framing)
+        # The fail-closed policy is rebuilt per request so it recovers as
+        # soon as the allowlist can be read again.
+        if embed_hosts is not None:
+            if len(self._policy_templates) >= self._MAX_POLICY_TEMPLATES:
+                self._policy_templates.clear()
+            self._policy_templates[key] = template
+        return template
+
+    @staticmethod
+    def _embed_hosts() -> tuple[str, ...] | None:
+        """Return the allowlist (its content is the revision), or ``None`` if unavailable."""
+
+        try:
+            from apps.cms.services.sanitization.embed_hosts import get_allowed_hosts
+
+            return tuple(get_allowed_hosts())
+        except Exception:
+            # A policy lookup must never take the application down. Failing
+            # closed leaves only same-origin frames until the cache/database
+            # becomes healthy again.
+            logger.exception("Unable to load CMS embed hosts for CSP; using same-origin only")
+            return None
+
+    def _compile_policy(self, embed_hosts: tuple[str, ...], *, allow_framing: bool) -> str:
         storage_origins = self._storage_origins()
         script_sources = self._configured_sources(
             "CSP_SCRIPT_SOURCES",
@@ -106,20 +167,12 @@ class ContentSecurityPolicyMiddleware:
         if frontend_origin:
             frame_sources.append(frontend_origin)
             connect_sources.append(frontend_origin)
-        try:
-            from apps.cms.services.sanitization.embed_hosts import get_allowed_hosts
-
-            for host in get_allowed_hosts():
-                normalized = host.strip().lower()
-                if self._HOST_PATTERN.fullmatch(normalized):
-                    frame_sources.append(f"https://{normalized}")
-        except Exception:
-            # A policy lookup must never take the application down. Failing
-            # closed leaves only same-origin frames until the cache/database
-            # becomes healthy again.
-            logger.exception("Unable to load CMS embed hosts for CSP; using same-origin only")
+        for host in embed_hosts:
+            normalized = host.strip().lower()
+            if self._HOST_PATTERN.fullmatch(normalized):
+                frame_sources.append(f"https://{normalized}")
 
-        nonce_source = f"'nonce-{nonce}'"
+        nonce_source = f"'nonce-{_NONCE_MARKER}'"
         media_sources = list(dict.fromkeys(["'self'", "blob:", *storage_origins]))
         directives = [
             "default-src 'self'",
@@ -152,8 +205,8 @@ class ContentSecurityPolicyMiddleware:
         Unfold ships dynamic inline theme styles but does not expose a nonce
         hook. Rewriting style elements keeps those fragments compatible with
         enforcing CSP. Inline scripts are deliberately excluded and must opt
-        in from a trusted template. Non-HTML, streaming, and encoded responses
-        are left untouched.
+        in from a trusted template. Only admin paths get here; non-HTML,
+        streaming, and encoded responses are left untouched.
         """
 
         if getattr(response, "streaming", False):
@@ -13,8 +13,10 @@ Subsystem               What it is                                          Impo
 ``aws/``                Shared AWS credential resolution + SNS SMS send      ``authn``, ``event``, ``mail``
 ``background_jobs/``    Durable outbox: queue, worker, retry, rate limit     ``authn``, ``cms``, ``event``, ``mail``
 ``bedrock/``            Amazon Bedrock LLM client (converse + streaming)     ``mail``, ``projects``, ``system_intelligence``
+``cache/``              Two-tier (process-local + shared) payload cache     ``cms``, ``event``, ``projects``
 ``db_tools/``           Read-only ORM sandbox exposed as AI assistant tools  ``cli_admin``, ``system_intelligence``
-``helpers/``            In-process task runner + sheet formula safety       ``authn``, ``event``, ``mail``, ``system_intelligence``
+``google_sheets/``      Pooled gspread clients + batched, retried calls      ``authn``, ``event``, ``projects``
+``helpers/``            In-process task runner + sheet formula safety       ``authn``, ``cms``, ``event``, ``mail``, ``system_intelligence``
 ======================  ==================================================  ==================================================
 
 Extracting ``background_jobs``, ``bedrock`` and ``db_tools`` into their own apps
@@ -25,9 +25,46 @@ def worker_metrics() -> dict[str, float | int]:
         "oldest_job_age_seconds": max(0, (now - oldest).total_seconds()) if oldest else 0,
         "failed_jobs": counts.get(BackgroundJob.Status.FAILED, 0),
         "uncertain_jobs": counts.get(BackgroundJob.Status.UNCERTAIN, 0),
+        **_pageview_ingestion_metrics(),
+        **_tiered_cache_metrics(),
+        **_cms_cache_warm_metrics(),
     }
 
 
+def _pageview_ingestion_metrics() -> dict[str, float | int]:
+    try:
+        from apps.cms.services.analytics import ingestion_metrics
+
+        return ingestion_metrics()
+    except Exception:  # noqa: BLE001 - an unreachable ingestion backend must not stop the heartbeat.
+        logger.exception("Could not read page-view ingestion metrics")
+        return {}
+
+
+def _tiered_cache_metrics() -> dict[str, float | int]:
+    try:
+        from apps.core.services.cache import shared_cache_stats
+
+        stats = shared_cache_stats()
+    except Exception:  # noqa: BLE001 - an unreachable cache must not stop the heartbeat.
+        logger.exception("Could not read tiered cache statistics")
+        return {}
+    return {
+        "cache_l1_hit_ratio": stats["l1_hit_ratio"],
+        "cache_l2_hit_ratio": stats["l2_hit_ratio"],
+    }
+
+
+def _cms_cache_warm_metrics() -> dict[str, float | int]:
+    try:
+        from apps.cms.services.cache_warming import last_warm_metrics
+
+        return last_warm_metrics()
+    except Exception:  # noqa: BLE001 - an unreachable cache must not stop the heartbeat.
+        logger.exception("Could not read CMS cache warming metrics")
+        return {}
+
+
 def publish_worker_metrics(metrics: dict[str, float | int]) -> None:
     """Publish operational metrics when a CloudWatch namespace is configured."""
     namespace = getattr(settings, "BACKGROUND_JOB_METRICS_NAMESPACE", "")
@@ -39,6 +76,13 @@ def publish_worker_metrics(metrics: dict[str, float | int]) -> None:
         "oldest_job_age_seconds": ("OldestJobAge", "Seconds"),
         "failed_jobs": ("FailedJobs", "Count"),
         "uncertain_jobs": ("UncertainJobs", "Count"),
+        "pageview_buffer_depth": ("PageViewBufferDepth", "Count"),
+        "pageview_dropped_total": ("PageViewsDropped", "Count"),
+        "pageview_flush_latency_seconds": ("PageViewFlushLatency", "Seconds"),
+        "cache_l1_hit_ratio": ("CacheL1HitRatio", "None"),
+        "cache_l2_hit_ratio": ("CacheL2HitRatio", "None"),
+        "cms_cache_warm_seconds": ("CMSCacheWarmDuration", "Seconds"),
+        "cms_cache_warm_entries": ("CMSCacheWarmEntries", "Count"),
     }
     try:
         import boto3
@@ -56,6 +100,7 @@ def publish_worker_metrics(metrics: dict[str, float | int]) -> None:
                     "Unit": unit,
                 }
                 for key, (metric_name, unit) in metric_names.items()
+                if key in metrics
             ],
         )
     except Exception:  # noqa: BLE001 - metrics failure must not stop delivery.
@@ -16,14 +16,50 @@ def _cms_handlers():
     return amplify_redirects
 
 
+def _cms_cache_warming_handlers():
+    from apps.cms.services.cache_warming import warming
+
+    return warming
+
+
+def _cms_media_handlers():
+    from apps.cms.services.media import derivatives
+
+    return derivatives
+
+
+def _cms_analytics_handlers():
+    from apps.cms.services.analytics import buffer
+
+    return buffer
+
+
+def _projects_csv_import_handlers():
+    from apps.projects.services.csv_import import runs
+
+    return runs
+
+
+def _projects_similarity_handlers():
+    from apps.projects.services import similarity
+
+    return similarity
+
+
 _HANDLER_LOADERS = {
     "authn.member_sheet_sync": lambda: _core_handlers().sync_member_sheet_job,
     "authn.notification_email": lambda: _core_handlers().send_notification_email_job,
     "cms.amplify_redirects": lambda: _cms_handlers().sync_amplify_redirects_job,
+    "cms.asset_derivatives": lambda: _cms_media_handlers().generate_asset_derivatives_job,
+    "cms.cache_warm": lambda: _cms_cache_warming_handlers().warm_cms_caches_job,
+    "cms.pageview_drain": lambda: _cms_analytics_handlers().drain_page_views_job,
+    "cms.pageview_rollup": lambda: _cms_analytics_handlers().repair_page_view_rollups_job,
     "event.registration_sheet_sync": lambda: _core_handlers().sync_registration_sheet_job,
     "event.ticket_email": lambda: _core_handlers().send_ticket_email_job,
     "mail.email_recipient": lambda: _mail_handlers().send_email_recipient_job,
     "mail.sms_recipient": lambda: _mail_handlers().send_sms_recipient_job,
+    "projects.csv_import": lambda: _projects_csv_import_handlers().import_projects_csv_job,
+    "projects.similarity_index": lambda: _projects_similarity_handlers().rebuild_similarity_index_job,
 }
 
 _STATE_HANDLER_LOADERS = {
@@ -0,0 +1,12 @@
+from .revisions import bump_revisions, read_revisions
+from .stats import shared_cache_stats
+from .tiered import TieredCache, cache_stats, tiered_cache
+
+__all__ = [
+    "TieredCache",
+    "bump_revisions",
+    "cache_stats",
+    "read_revisions",
+    "shared_cache_stats",
+    "tiered_cache",
+]
@@ -0,0 +1,59 @@
+"""Bounded, process-local (L1) entry store."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+
+class LocalEntry(NamedTuple):
+    value: Any
+    revisions: tuple[int, ...]
+    expires_at: float
+
+
+class LocalStore:
+    """Thread-safe LRU with per-entry expiry.
+
+    Values are shared by every caller in the process, so callers must treat
+    them as read-only.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, LocalEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> LocalEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: Any, revisions: tuple[int, ...], ttl: float) -> None:
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = LocalEntry(value, revisions, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
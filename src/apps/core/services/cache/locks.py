@@ -0,0 +1,74 @@
+"""Cross-process build locks for single-flight cache regeneration.
+
+``CACHE_BUILD_LOCK_BACKEND`` selects the primitive: ``"cache"`` uses an atomic
+``cache.add`` (``SET NX`` on Redis); ``"database"`` takes a PostgreSQL
+session advisory lock, for deployments whose shared cache cannot add
+atomically (the file-based fallback). Other databases fall back to the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY_SUFFIX = ":build-lock"
+
+
+def lock_backend() -> str:
+    backend = getattr(settings, "CACHE_BUILD_LOCK_BACKEND", "cache")
+    if backend == "database" and connection.vendor == "postgresql":
+        return "database"
+    return "cache"
+
+
+@contextmanager
+def build_lock(key: str, timeout: int):
+    """Try once to take the build lock for ``key``; yield whether it was taken.
+
+    ``timeout`` bounds how long a crashed holder can block other builders
+    (the advisory lock is released with its connection instead).
+    """
+    if lock_backend() == "database":
+        with _advisory_lock(key) as acquired:
+            yield acquired
+        return
+
+    lock_key = f"{key}{LOCK_KEY_SUFFIX}"
+    token = uuid.uuid4().hex
+    try:
+        acquired = cache.add(lock_key, token, timeout=timeout)
+    except Exception:  # noqa: BLE001 - without a lock every caller simply builds.
+        logger.warning("Could not take the build lock for %s", key, exc_info=True)
+        acquired = True
+        token = None
+    try:
+        yield acquired
+    finally:
+        if acquired and token is not None:
+            try:
+                if cache.get(lock_key) == token:
+                    cache.delete(lock_key)
+            except Exception:  # noqa: BLE001 - the lock expires on its own.
+                logger.warning("Could not release the build lock for %s", key, exc_info=True)
+
+
+@contextmanager
+def _advisory_lock(key: str):
+    lock_id = int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big", signed=True)
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_id])
+        acquired = bool(cursor.fetchone()[0])
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
@@ -0,0 +1,46 @@
+"""Shared revision counters that tag cached entries.
+
+A tag's counter lives in the shared Django cache with no expiry. Bumping it
+makes every process's L1 copy of an entry with that tag stale at once.
+Counters start from the wall clock in nanoseconds, so a counter that was
+evicted or cleared never comes back with a value an old entry recorded.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+
+from django.core.cache import cache
+
+REVISION_KEY_PREFIX = "tiered-cache:rev:"
+
+
+def _revision_key(tag: str) -> str:
+    return f"{REVISION_KEY_PREFIX}{tag}"
+
+
+def read_revisions(tags: Iterable[str]) -> tuple[int, ...]:
+    """Return the current counter for each tag, in order, in one round trip."""
+    tags = tuple(tags)
+    if not tags:
+        return ()
+    keys = [_revision_key(tag) for tag in tags]
+    found = cache.get_many(keys)
+    revisions = []
+    for key in keys:
+        value = found.get(key)
+        if value is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            value = cache.get(key, 0)
+        revisions.append(int(value))
+    return tuple(revisions)
+
+
+def bump_revisions(tags: Iterable[str]) -> None:
+    for tag in tags:
+        key = _revision_key(tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
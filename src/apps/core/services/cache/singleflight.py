@@ -0,0 +1,88 @@
+"""Single-flight regeneration with stale-while-revalidate for the tiered cache.
+
+When a hot entry expires or is invalidated, only the request holding the
+build lock (:mod:`.locks`) runs the builder. Concurrent misses are answered
+from a stale copy kept under a separate key, so a publish does not turn into
+one rebuild per in-flight request.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .locks import build_lock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STALE_TTL = 300
+STALE_KEY_SUFFIX = ":stale"
+BUILD_LOCK_TIMEOUT = 30
+BUILD_WAIT_SECONDS = 2.0
+BUILD_POLL_SECONDS = 0.05
+
+
+class SingleFlightMixin:
+    """Adds :meth:`get_or_build` to :class:`~.tiered.TieredCache`."""
+
+    def get_or_build(
+        self,
+        key: str,
+        builder: Callable[[], Any],
+        ttl: int,
+        *,
+        tags: Iterable[str] = (),
+        stale_ttl: int | None = None,
+    ) -> Any:
+        """Like :meth:`get_or_set`, but only one request at a time rebuilds ``key``.
+
+        Every build also writes a stale copy that outlives ``ttl`` by
+        ``stale_ttl`` seconds and survives :meth:`invalidate`. Requests that
+        miss while another holds the build lock get that copy; with none
+        available they wait briefly for the build, then build themselves.
+        """
+        tags = tuple(tags)
+        value, revisions = self._lookup(key, tags)
+        if value is not None:
+            return value
+        if stale_ttl is None:
+            stale_ttl = int(getattr(settings, "TIERED_CACHE_STALE_TTL", DEFAULT_STALE_TTL))
+
+        with build_lock(key, BUILD_LOCK_TIMEOUT) as acquired:
+            if acquired:
+                return self._build(key, builder, ttl, tags, revisions, stale_ttl)
+
+        stale = self._read_l2(f"{key}{STALE_KEY_SUFFIX}")
+        if stale is not None:
+            self.stats.record("stale_hits")
+            return stale
+        deadline = time.monotonic() + BUILD_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(BUILD_POLL_SECONDS)
+            value = self._read_l2(key)
+            if value is not None:
+                return value
+        return self._build(key, builder, ttl, tags, revisions, stale_ttl)
+
+    def _build(self, key, builder, ttl, tags, revisions, stale_ttl) -> Any:
+        # The previous lock holder may have stored a value since our lookup.
+        value = self._read_l2(key)
+        if value is not None:
+            return value
+        value = builder()
+        if value is not None:
+            self._store(key, value, tags, revisions, ttl)
+        try:
+            if value is None:
+                # Gone (unpublished, deleted): stop serving the old copy too.
+                cache.delete(f"{key}{STALE_KEY_SUFFIX}")
+            else:
+                cache.set(f"{key}{STALE_KEY_SUFFIX}", value, timeout=ttl + stale_ttl)
+        except Exception:  # noqa: BLE001 - the stale copy is best effort.
+            logger.warning("Could not update the stale copy of %s", key, exc_info=True)
+        return value
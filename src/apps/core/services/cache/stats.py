@@ -0,0 +1,82 @@
+"""L1/L2 hit counters for the tiered cache.
+
+Each process counts its own lookups and periodically folds the deltas into
+shared counters, so the worker heartbeat can report fleet-wide hit ratios.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+SHARED_STATS_KEY_PREFIX = "tiered-cache:stats:"
+FLUSH_INTERVAL_SECONDS = 30
+COUNTERS = ("l1_hits", "l2_hits", "misses", "stale_hits")
+_LOOKUP_COUNTERS = ("l1_hits", "l2_hits", "misses")
+
+
+def hit_ratios(counts: dict[str, int]) -> dict[str, float | int]:
+    """Add ``l1_hit_ratio`` (of all lookups) and ``l2_hit_ratio`` (of L1 misses).
+
+    ``stale_hits`` counts misses answered with a stale copy while another
+    request rebuilt the entry; they are already counted as misses.
+    """
+    lookups = sum(counts.get(name, 0) for name in _LOOKUP_COUNTERS)
+    l1_misses = lookups - counts.get("l1_hits", 0)
+    return {
+        **counts,
+        "lookups": lookups,
+        "l1_hit_ratio": round(counts.get("l1_hits", 0) / lookups, 4) if lookups else 0.0,
+        "l2_hit_ratio": round(counts.get("l2_hits", 0) / l1_misses, 4) if l1_misses else 0.0,
+    }
+
+
+class CacheStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = dict.fromkeys(COUNTERS, 0)
+        self._unflushed = dict.fromkeys(COUNTERS, 0)
+        self._last_flush = time.monotonic()
+
+    def record(self, counter: str) -> None:
+        with self._lock:
+            self._totals[counter] += 1
+            self._unflushed[counter] += 1
+            due = time.monotonic() - self._last_flush >= FLUSH_INTERVAL_SECONDS
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._unflushed = self._unflushed, dict.fromkeys(COUNTERS, 0)
+            self._last_flush = time.monotonic()
+        try:
+            for counter, delta in pending.items():
+                if not delta:
+                    continue
+                key = f"{SHARED_STATS_KEY_PREFIX}{counter}"
+                if not cache.add(key, delta, timeout=None):
+                    cache.incr(key, delta)
+        except Exception:  # noqa: BLE001 - statistics must never fail a cached read.
+            logger.warning("Could not publish tiered cache statistics", exc_info=True)
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            return hit_ratios(dict(self._totals))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals = dict.fromkeys(COUNTERS, 0)
+            self._unflushed = dict.fromkeys(COUNTERS, 0)
+
+
+def shared_cache_stats() -> dict[str, float | int]:
+    """Return hit counts and ratios summed across every process."""
+    keys = [f"{SHARED_STATS_KEY_PREFIX}{counter}" for counter in COUNTERS]
+    found = cache.get_many(keys)
+    return hit_ratios({counter: int(found.get(key) or 0) for counter, key in zip(COUNTERS, keys, strict=True)})
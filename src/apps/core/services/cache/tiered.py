@@ -0,0 +1,143 @@
+"""Two-tier cache for hot public payloads.
+
+L1 is a small per-process LRU with a short TTL; L2 is the shared Django cache.
+Every entry carries tags. An L1 entry records the tag revisions that were
+current when it was filled and is only served while they are unchanged, so
+:meth:`TieredCache.invalidate` (which deletes the L2 keys and bumps the tags)
+retires the copies held by every process, not just the one that ran it.
+
+Each lookup reads the (small) revision counters from L2; an L1 hit saves
+fetching and unpickling the payload itself. Keys keep their existing L2
+names, so ``cache.get``/``cache.delete`` on the raw key still see and clear
+the shared copy. :meth:`TieredCache.get_or_build` adds single-flight
+regeneration (see :mod:`.singleflight`).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .local import LocalStore
+from .revisions import bump_revisions, read_revisions
+from .singleflight import SingleFlightMixin
+from .stats import CacheStats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_L1_MAX_ENTRIES = 256
+
+
+class TieredCache(SingleFlightMixin):
+    """Process-local L1 in front of the shared cache, invalidated by tag revisions.
+
+    ``l1_ttl`` of ``None`` reads ``TIERED_CACHE_L1_TTL`` on every call, so tests
+    can switch L1 off with ``override_settings``; ``0`` disables it.
+    """
+
+    def __init__(self, *, l1_ttl: float | None = None, max_entries: int | None = None):
+        self._l1_ttl = l1_ttl
+        if max_entries is None:
+            max_entries = int(getattr(settings, "TIERED_CACHE_L1_MAX_ENTRIES", DEFAULT_L1_MAX_ENTRIES))
+        self.local = LocalStore(max_entries)
+        self.stats = CacheStats()
+
+    @property
+    def l1_ttl(self) -> float:
+        if self._l1_ttl is not None:
+            return self._l1_ttl
+        return float(getattr(settings, "TIERED_CACHE_L1_TTL", 0) or 0)
+
+    def get(self, key: str, *, tags: Iterable[str] = ()) -> Any:
+        """Return the cached value for ``key`` or ``None``."""
+        return self._lookup(key, tuple(tags))[0]
+
+    def set(self, key: str, value: Any, *, tags: Iterable[str] = (), timeout: int | None = None) -> None:
+        tags = tuple(tags)
+        self._store(key, value, tags, self._revisions(tags), timeout)
+
+    def get_or_set(
+        self,
+        key: str,
+        builder: Callable[[], Any],
+        *,
+        tags: Iterable[str] = (),
+        timeout: int | None = None,
+    ) -> Any:
+        """Return the cached value, building and storing it on a miss.
+
+        ``None`` results are returned but not cached.
+        """
+        tags = tuple(tags)
+        value, revisions = self._lookup(key, tags)
+        if value is not None:
+            return value
+        value = builder()
+        if value is not None:
+            # Store under the revisions read before building: if an
+            # invalidation lands meanwhile, the L1 copy is already stale.
+            self._store(key, value, tags, revisions, timeout)
+        return value
+
+    def invalidate(self, *tags: str, keys: Iterable[str] = ()) -> None:
+        """Delete ``keys`` from both tiers and retire every entry tagged ``tags``."""
+        keys = tuple(keys)
+        if keys:
+            cache.delete_many(keys)
+            self.local.discard(*keys)
+        if tags:
+            bump_revisions(tags)
+
+    def _revisions(self, tags: tuple[str, ...]) -> tuple[int, ...]:
+        if self.l1_ttl <= 0:
+            return ()
+        try:
+            return read_revisions(tags)
+        except Exception:  # noqa: BLE001 - an unreachable L2 degrades to uncached reads.
+            logger.warning("Could not read tiered cache revisions for %s", tags, exc_info=True)
+            return ()
+
+    def _lookup(self, key: str, tags: tuple[str, ...]) -> tuple[Any, tuple[int, ...]]:
+        revisions = self._revisions(tags)
+        entry = self.local.get(key) if self.l1_ttl > 0 else None
+        if entry is not None and entry.revisions == revisions and (revisions or not tags):
+            self.stats.record("l1_hits")
+            return entry.value, revisions
+        value = self._read_l2(key)
+        if value is None:
+            self.stats.record("misses")
+            return None, revisions
+        self.stats.record("l2_hits")
+        self._fill_local(key, value, tags, revisions)
+        return value, revisions
+
+    def _read_l2(self, key: str) -> Any:
+        try:
+            return cache.get(key)
+        except Exception:  # noqa: BLE001 - fall through to the builder.
+            logger.warning("Could not read %s from the shared cache", key, exc_info=True)
+            return None
+
+    def _store(self, key, value, tags, revisions, timeout) -> None:
+        try:
+            cache.set(key, value, timeout=timeout)
+        except Exception:  # noqa: BLE001 - serving the fresh value matters more than caching it.
+            logger.warning("Could not write %s to the shared cache", key, exc_info=True)
+        self._fill_local(key, value, tags, revisions)
+
+    def _fill_local(self, key, value, tags, revisions) -> None:
+        if self.l1_ttl <= 0 or (tags and not revisions):
+            return
+        self.local.set(key, value, revisions, self.l1_ttl)
+
+
+tiered_cache = TieredCache()
+
+
+def cache_stats() -> dict[str, float | int]:
+    """Return this process's L1/L2 hit counts and ratios."""
+    return tiered_cache.stats.snapshot()
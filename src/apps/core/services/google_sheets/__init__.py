@@ -0,0 +1,42 @@
+"""
+Shared Google Sheets gateway for the sheet syncs.
+
+Authorizing a service account and opening a spreadsheet cost a token exchange
+and a metadata request each. :mod:`.pool` keeps one client per credential
+fingerprint until its access token is about to expire, and reuses spreadsheet
+and worksheet handles for a few minutes. :mod:`.calls` reads or writes several
+ranges in one ``values:batchGet`` / ``values:batchUpdate`` request and retries
+calls that Sheets rejects with 429.
+"""
+
+from .calls import (
+    batch_get,
+    batch_update,
+    call_with_backoff,
+    records_from_values,
+    worksheet_range,
+)
+from .pool import (
+    clear_pool,
+    credential_fingerprint,
+    get_client,
+    invalidate_spreadsheet,
+    open_spreadsheet,
+    open_worksheet,
+    worksheet_by_gid,
+)
+
+__all__ = [
+    "batch_get",
+    "batch_update",
+    "call_with_backoff",
+    "clear_pool",
+    "credential_fingerprint",
+    "get_client",
+    "invalidate_spreadsheet",
+    "open_spreadsheet",
+    "open_worksheet",
+    "records_from_values",
+    "worksheet_by_gid",
+    "worksheet_range",
+]
@@ -0,0 +1,93 @@
+"""Batched value reads and writes with backoff on Sheets rate limits."""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any
+
+RATE_LIMIT_STATUS = 429
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 32.0
+
+_sleep = time.sleep
+
+
+def _status(exc: Exception) -> int | None:
+    code = getattr(exc, "code", None)
+    if isinstance(code, int):
+        return code
+    return getattr(getattr(exc, "response", None), "status_code", None)
+
+
+def _retry_after(exc: Exception) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+def call_with_backoff(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call ``func``, retrying with exponential backoff while Sheets answers 429.
+
+    Only rate-limit rejections are retried: the request was refused, so
+    repeating a non-idempotent write such as ``append_rows`` cannot duplicate
+    it. ``Retry-After`` is honoured when present.
+    """
+    from gspread.exceptions import APIError
+
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            return func(*args, **kwargs)
+        except APIError as exc:
+            if _status(exc) != RATE_LIMIT_STATUS or attempt == MAX_ATTEMPTS:
+                raise
+            delay = _retry_after(exc)
+            if delay is None:
+                delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+                delay += random.uniform(0, delay / 2)
+            _sleep(delay)
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def worksheet_range(worksheet, cells: str | None = None) -> str:
+    """A1 range of ``cells`` (the whole tab when omitted) on ``worksheet``."""
+    from gspread.utils import absolute_range_name
+
+    return absolute_range_name(worksheet.title, cells)
+
+
+def batch_get(spreadsheet, ranges: Sequence[str]) -> list[list[list[Any]]]:
+    """Values of every A1 range in ``ranges``, in order, from one request."""
+    response = call_with_backoff(spreadsheet.values_batch_get, list(ranges))
+    value_ranges = (response or {}).get("valueRanges", [])
+    return [value_range.get("values", []) for value_range in value_ranges]
+
+
+def batch_update(
+    spreadsheet,
+    data: Mapping[str, Sequence[Sequence[Any]]] | Iterable[tuple[str, Sequence[Sequence[Any]]]],
+    *,
+    value_input_option: str = "USER_ENTERED",
+) -> Any:
+    """Write several ``{a1_range: rows}`` blocks in one request."""
+    items = data.items() if isinstance(data, Mapping) else data
+    body = {
+        "valueInputOption": value_input_option,
+        "data": [{"range": cells, "values": [list(row) for row in rows]} for cells, rows in items],
+    }
+    return call_with_backoff(spreadsheet.values_batch_update, body)
+
+
+def records_from_values(values: list[list[Any]]) -> list[dict[str, Any]]:
+    """Header-keyed rows, the same as ``Worksheet.get_all_records()`` returns for ``values``."""
+    from gspread.utils import numericise_all, to_records
+
+    if not values or values == [[]]:
+        return []
+    width = max(len(row) for row in values)
+    rows = [list(row) + [""] * (width - len(row)) for row in values]
+    return to_records(rows[0], [numericise_all(row) for row in rows[1:]])
@@ -0,0 +1,140 @@
+"""Process-wide pool of authorized gspread clients and spreadsheet handles."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from django.conf import settings
+
+# Refresh a client this long before its access token expires.
+TOKEN_EXPIRY_MARGIN = timedelta(minutes=1)
+# Clients whose token expiry is not known yet (no request made) are kept this long.
+CLIENT_MAX_AGE = 3300
+# Spreadsheet and worksheet handles are reopened this often, so renamed tabs are
+# picked up; a GID that is not cached yet always reads the current tab list.
+HANDLE_TTL = 300
+
+_lock = threading.Lock()
+_clients: dict[str, tuple[Any, float]] = {}
+_spreadsheets: dict[tuple[str, str], tuple[Any, float]] = {}
+_worksheets: dict[tuple[str, str, str], tuple[Any, float]] = {}
+
+
+def pool_enabled() -> bool:
+    return bool(getattr(settings, "GOOGLE_SHEETS_CLIENT_POOL_ENABLED", True))
+
+
+def credential_fingerprint(credentials_info: dict) -> str:
+    """Stable digest of a service-account key; a rotated key gets a new client."""
+    payload = json.dumps(credentials_info, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _token_expired(client) -> bool:
+    expiry = getattr(getattr(getattr(client, "http_client", None), "auth", None), "expiry", None)
+    if not isinstance(expiry, datetime):
+        return False
+    # google-auth stores the expiry as naive UTC.
+    now = datetime.now(UTC).replace(tzinfo=None) if expiry.tzinfo is None else datetime.now(UTC)
+    return expiry - TOKEN_EXPIRY_MARGIN <= now
+
+
+def get_client(credentials_info: dict):
+    """An authorized gspread client for ``credentials_info``, reused until its token expires."""
+    import gspread
+
+    if not pool_enabled():
+        return gspread.service_account_from_dict(credentials_info)
+    fingerprint = credential_fingerprint(credentials_info)
+    with _lock:
+        entry = _clients.get(fingerprint)
+        if entry is not None:
+            client, created = entry
+            if not _token_expired(client) and time.monotonic() - created < CLIENT_MAX_AGE:
+                return client
+            _forget(fingerprint)
+        client = gspread.service_account_from_dict(credentials_info)
+        _clients[fingerprint] = (client, time.monotonic())
+        return client
+
+
+def open_spreadsheet(credentials_info: dict, sheet_id: str):
+    """The spreadsheet ``sheet_id``, opened once per :data:`HANDLE_TTL`."""
+    client = get_client(credentials_info)
+    if not pool_enabled():
+        return client.open_by_key(sheet_id)
+    key = (credential_fingerprint(credentials_info), sheet_id)
+    with _lock:
+        entry = _spreadsheets.get(key)
+        if entry is not None and time.monotonic() - entry[1] < HANDLE_TTL:
+            return entry[0]
+    spreadsheet = client.open_by_key(sheet_id)
+    with _lock:
+        _spreadsheets[key] = (spreadsheet, time.monotonic())
+    return spreadsheet
+
+
+def worksheet_by_gid(spreadsheet, worksheet_gid: int):
+    """The worksheet of ``spreadsheet`` whose GID is ``worksheet_gid``, or ``None``."""
+    return next(
+        (worksheet for worksheet in spreadsheet.worksheets() if worksheet.id == worksheet_gid),
+        None,
+    )
+
+
+def open_worksheet(credentials_info: dict, sheet_id: str, *, gid: int | None = None, title: str | None = None):
+    """A worksheet by ``gid``, else by ``title``, else the first one; ``None`` when no tab matches a GID."""
+    spreadsheet = open_spreadsheet(credentials_info, sheet_id)
+    if gid is not None:
+        lookup = f"gid:{int(gid)}"
+    elif title is not None:
+        lookup = f"title:{title}"
+    else:
+        lookup = "first"
+    key = (credential_fingerprint(credentials_info), sheet_id, lookup)
+    if pool_enabled():
+        with _lock:
+            entry = _worksheets.get(key)
+            if entry is not None and time.monotonic() - entry[1] < HANDLE_TTL:
+                return entry[0]
+
+    if gid is not None:
+        worksheet = worksheet_by_gid(spreadsheet, int(gid))
+    elif title is not None:
+        worksheet = spreadsheet.worksheet(title)
+    else:
+        worksheet = spreadsheet.sheet1
+    if worksheet is not None and pool_enabled():
+        with _lock:
+            _worksheets[key] = (worksheet, time.monotonic())
+    return worksheet
+
+
+def invalidate_spreadsheet(sheet_id: str) -> None:
+    """Drop cached handles of ``sheet_id``, e.g. after a tab was renamed."""
+    with _lock:
+        for key in [key for key in _spreadsheets if key[1] == sheet_id]:
+            del _spreadsheets[key]
+        for key in [key for key in _worksheets if key[1] == sheet_id]:
+            del _worksheets[key]
+
+
+def clear_pool() -> None:
+    with _lock:
+        _clients.clear()
+        _spreadsheets.clear()
+        _worksheets.clear()
+
+
+def _forget(fingerprint: str) -> None:
+    # Caller holds ``_lock``.
+    _clients.pop(fingerprint, None)
+    for key in [key for key in _spreadsheets if key[0] == fingerprint]:
+        del _spreadsheets[key]
+    for key in [key for key in _worksheets if key[0] == fingerprint]:
+        del _worksheets[key]
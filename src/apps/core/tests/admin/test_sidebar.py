@@ -92,12 +92,13 @@ class AdminSidebarNavigationTest(SimpleTestCase):
         projects_tab = next(tab for tab in tabs if "projects.project" in tab.get("models", []))
         project_resources_tab = next(tab for tab in tabs if "projects.pastprojectssheetconfig" in tab.get("models", []))
 
-        self.assertEqual(projects_tab["models"], ["projects.project", "projects.semester"])
+        self.assertEqual(projects_tab["models"], ["projects.project", "projects.semester", "projects.projectimportrun"])
         self.assertEqual(
             projects_tab["items"],
             [
                 {"title": "Projects", "link": "/admin/projects/project/"},
                 {"title": "Semesters", "link": "/admin/projects/semester/"},
+                {"title": "CSV Imports", "link": "/admin/projects/projectimportrun/"},
             ],
         )
         self.assertEqual(
@@ -0,0 +1,17 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+
+class BenchmarkCSPMiddlewareCommandTest(TestCase):
+    def test_reports_memoized_and_rebuilt_overhead_per_case(self):
+        out = StringIO()
+
+        call_command("benchmark_csp_middleware", "--iterations", "5", stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(all(line.endswith("µs/request") for line in lines))
+        self.assertTrue(lines[0].startswith("json api") and "memoized" in lines[0])
+        self.assertTrue(lines[3].startswith("html admin") and "rebuilt" in lines[3])
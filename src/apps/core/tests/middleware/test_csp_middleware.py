@@ -160,11 +160,52 @@ class CSPHeaderTests(TestCase):
             response["Content-Length"] = str(len(response.content))
             return response
 
-        response = ContentSecurityPolicyMiddleware(_html_view)(self.factory.get("/"))
+        response = ContentSecurityPolicyMiddleware(_html_view)(self.factory.get("/admin/"))
 
         self.assertIn("nonce=", response.content.decode())
         self.assertEqual(int(response["Content-Length"]), len(response.content))
 
+    def test_vendor_style_rewrite_is_limited_to_admin_paths(self):
+        def _html_view(_request):
+            return HttpResponse('<style id="unfold-theme-colors">.ok{display:block}</style>')
+
+        middleware = ContentSecurityPolicyMiddleware(_html_view)
+
+        self.assertNotIn("nonce=", middleware(self.factory.get("/cms/pages/home/")).content.decode())
+        self.assertIn("nonce=", middleware(self.factory.get("/authn/invite/token/")).content.decode())
+
+    def test_policy_template_is_memoized_and_only_the_nonce_changes(self):
+        with patch(
+            "apps.cms.services.sanitization.embed_hosts.get_allowed_hosts", return_value=["docs.google.com"]
+        ) as hosts:
+            with patch.object(self.middleware, "_compile_policy", wraps=self.middleware._compile_policy) as compile_:
+                _, first = self._header()
+                _, second = self._header()
+
+                self.assertEqual(compile_.call_count, 1)
+                self.assertNotEqual(first, second)
+                nonce = re.compile(r"'nonce-[^']+'")
+                self.assertEqual(nonce.sub("", first), nonce.sub("", second))
+
+                hosts.return_value = ["docs.google.com", "calendly.com"]
+                _, third = self._header()
+                with override_settings(FRONTEND_URL="https://frontend.example.test"):
+                    _, fourth = self._header()
+
+        self.assertEqual(compile_.call_count, 3)
+        self.assertIn("https://calendly.com", third)
+        self.assertIn("https://frontend.example.test", fourth)
+
+    def test_unavailable_allowlist_is_not_memoized(self):
+        target = "apps.cms.services.sanitization.embed_hosts.get_allowed_hosts"
+        with patch(target, side_effect=RuntimeError("cache down")), self.assertLogs(level="ERROR"):
+            _, degraded = self._header()
+        with patch(target, return_value=["docs.google.com"]):
+            _, recovered = self._header()
+
+        self.assertNotIn("https://docs.google.com", degraded)
+        self.assertIn("https://docs.google.com", recovered)
+
     def test_nonces_unfold_changelist_compatibility_style(self):
         def _html_view(_request):
             return HttpResponse("<style>\n  #changelist table thead th:first-child {width: inherit}\n</style>")
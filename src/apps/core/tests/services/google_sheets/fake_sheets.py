@@ -0,0 +1,145 @@
+"""In-memory stand-in for the slice of gspread the sheet syncs use.
+
+Every method that would be an HTTP request to Sheets is recorded in
+``FakeSheetsService.requests``, so tests can assert how many round trips a
+sync makes. ``rate_limit(n)`` makes the next ``n`` requests fail with a 429
+``APIError``, like Sheets does when a quota is exhausted.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import requests
+from gspread.exceptions import APIError, WorksheetNotFound
+from gspread.utils import a1_range_to_grid_range
+
+
+def api_error(code: int, *, retry_after: str | None = None) -> APIError:
+    response = requests.Response()
+    response.status_code = code
+    response._content = json.dumps({"error": {"code": code, "message": "fake", "status": "FAKE"}}).encode()
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return APIError(response)
+
+
+class FakeSheetsService:
+    def __init__(self):
+        self.spreadsheets: dict[str, FakeSpreadsheet] = {}
+        self.requests: list[str] = []
+        self.clients_created = 0
+        self._rate_limited = 0
+
+    def add_spreadsheet(self, key: str, tabs: dict[str, list[list]]) -> FakeSpreadsheet:
+        spreadsheet = FakeSpreadsheet(self, key)
+        for gid, (title, values) in enumerate(tabs.items(), start=1):
+            spreadsheet.tabs.append(FakeWorksheet(spreadsheet, gid, title, values))
+        self.spreadsheets[key] = spreadsheet
+        return spreadsheet
+
+    def rate_limit(self, count: int = 1) -> None:
+        self._rate_limited = count
+
+    def request(self, name: str) -> None:
+        self.requests.append(name)
+        if self._rate_limited:
+            self._rate_limited -= 1
+            raise api_error(429)
+
+    def service_account_from_dict(self, info, *args, **kwargs) -> FakeClient:
+        self.clients_created += 1
+        return FakeClient(self)
+
+
+class FakeAuth:
+    def __init__(self):
+        # google-auth keeps the expiry as naive UTC.
+        self.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+
+
+class FakeHTTPClient:
+    def __init__(self):
+        self.auth = FakeAuth()
+
+
+class FakeClient:
+    def __init__(self, service: FakeSheetsService):
+        self.service = service
+        self.http_client = FakeHTTPClient()
+
+    def open_by_key(self, key: str) -> FakeSpreadsheet:
+        self.service.request("open_by_key")
+        return self.service.spreadsheets[key]
+
+
+class FakeSpreadsheet:
+    def __init__(self, service: FakeSheetsService, key: str):
+        self.service = service
+        self.id = key
+        self.tabs: list[FakeWorksheet] = []
+
+    @property
+    def sheet1(self) -> FakeWorksheet:
+        return self.tabs[0]
+
+    def worksheets(self) -> list[FakeWorksheet]:
+        self.service.request("worksheets")
+        return list(self.tabs)
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self.service.request("worksheet")
+        for tab in self.tabs:
+            if tab.title == title:
+                return tab
+        raise WorksheetNotFound(title)
+
+    def _tab(self, range_name: str) -> FakeWorksheet:
+        title = range_name.split("!", 1)[0].strip("'")
+        return next(tab for tab in self.tabs if tab.title == title)
+
+    def values_batch_get(self, ranges: list[str]) -> dict:
+        self.service.request("values_batch_get")
+        return {"valueRanges": [{"range": name, "values": self._tab(name).values} for name in ranges]}
+
+    def values_batch_update(self, body: dict) -> dict:
+        self.service.request("values_batch_update")
+        for block in body["data"]:
+            tab = self._tab(block["range"])
+            cells = block["range"].split("!", 1)[1] if "!" in block["range"] else "A1"
+            grid = a1_range_to_grid_range(cells)
+            tab.write(grid.get("startRowIndex", 0), grid.get("startColumnIndex", 0), block["values"])
+        return {"totalUpdatedRanges": len(body["data"])}
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet: FakeSpreadsheet, gid: int, title: str, values: list[list]):
+        self.spreadsheet = spreadsheet
+        self.id = gid
+        self.title = title
+        self.values = [list(row) for row in values]
+
+    def write(self, row: int, column: int, rows: list[list]) -> None:
+        for offset, values in enumerate(rows):
+            while len(self.values) <= row + offset:
+                self.values.append([])
+            target = self.values[row + offset]
+            target.extend([""] * (column + len(values) - len(target)))
+            target[column : column + len(values)] = values
+
+    def get_all_values(self) -> list[list]:
+        self.spreadsheet.service.request("get_all_values")
+        return [list(row) for row in self.values]
+
+    def clear(self) -> None:
+        self.spreadsheet.service.request("clear")
+        self.values = []
+
+    def update(self, values: list[list], **kwargs) -> None:
+        self.spreadsheet.service.request("update")
+        self.write(0, 0, values)
+
+    def append_rows(self, values: list[list], **kwargs) -> None:
+        self.spreadsheet.service.request("append_rows")
+        self.values.extend(list(row) for row in values)
@@ -0,0 +1,168 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from gspread.exceptions import APIError
+
+from apps.core.services.google_sheets import (
+    batch_get,
+    batch_update,
+    call_with_backoff,
+    clear_pool,
+    get_client,
+    invalidate_spreadsheet,
+    open_worksheet,
+    records_from_values,
+    worksheet_range,
+)
+from apps.core.services.google_sheets import calls as sheet_calls
+
+from .fake_sheets import FakeSheetsService, api_error
+
+KEY = {"client_email": "sync@example.iam.gserviceaccount.com", "private_key_id": "one"}
+
+
+class GatewayTestMixin:
+    def setUp(self):
+        super().setUp()
+        clear_pool()
+        self.addCleanup(clear_pool)
+        self.sheets = FakeSheetsService()
+        self.sheets.add_spreadsheet(
+            "SHEET",
+            {
+                "Tracks": [["Track", "Room"], ["1", "COB 102"], ["2"]],
+                "Projects": [["Team#", "Title"], ["CAP-1", "Solar Pump"]],
+            },
+        )
+        patcher = patch("gspread.service_account_from_dict", side_effect=self.sheets.service_account_from_dict)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sleep = patch.object(sheet_calls, "_sleep")
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+
+
+@override_settings(GOOGLE_SHEETS_CLIENT_POOL_ENABLED=True)
+class PoolTests(GatewayTestMixin, SimpleTestCase):
+    def test_client_is_reused_per_credential_fingerprint(self):
+        first = get_client(KEY)
+
+        self.assertIs(get_client(dict(KEY)), first)
+        self.assertIsNot(get_client({**KEY, "private_key_id": "rotated"}), first)
+        self.assertEqual(self.sheets.clients_created, 2)
+
+    def test_client_is_replaced_when_its_token_is_about_to_expire(self):
+        first = get_client(KEY)
+        first.http_client.auth.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(seconds=30)
+
+        self.assertIsNot(get_client(KEY), first)
+
+    def test_worksheet_handles_are_reused(self):
+        tracks = open_worksheet(KEY, "SHEET", gid=1)
+
+        self.assertIs(open_worksheet(KEY, "SHEET", gid=1), tracks)
+        self.assertEqual(open_worksheet(KEY, "SHEET", title="Projects").id, 2)
+        self.assertEqual(self.sheets.requests, ["open_by_key", "worksheets", "worksheet"])
+
+    def test_unknown_gid_is_not_cached(self):
+        self.assertIsNone(open_worksheet(KEY, "SHEET", gid=9))
+
+        self.sheets.spreadsheets["SHEET"].tabs[1].id = 9
+        self.assertEqual(open_worksheet(KEY, "SHEET", gid=9).title, "Projects")
+
+    def test_invalidate_reopens_the_spreadsheet(self):
+        open_worksheet(KEY, "SHEET")
+        invalidate_spreadsheet("SHEET")
+        open_worksheet(KEY, "SHEET")
+
+        self.assertEqual(self.sheets.requests.count("open_by_key"), 2)
+
+    @override_settings(GOOGLE_SHEETS_CLIENT_POOL_ENABLED=False)
+    def test_disabled_pool_authorizes_every_call(self):
+        open_worksheet(KEY, "SHEET", gid=1)
+        open_worksheet(KEY, "SHEET", gid=1)
+
+        self.assertEqual(self.sheets.clients_created, 2)
+
+
+class CallTests(GatewayTestMixin, SimpleTestCase):
+    def test_batch_get_reads_every_range_in_one_request(self):
+        spreadsheet = self.sheets.spreadsheets["SHEET"]
+        tracks, projects = spreadsheet.tabs
+
+        values = batch_get(spreadsheet, [worksheet_range(tracks), worksheet_range(projects)])
+
+        self.assertEqual(self.sheets.requests, ["values_batch_get"])
+        self.assertEqual(records_from_values(values[0]), [{"Track": 1, "Room": "COB 102"}, {"Track": 2, "Room": ""}])
+        self.assertEqual(records_from_values(values[1]), [{"Team#": "CAP-1", "Title": "Solar Pump"}])
+        self.assertEqual(records_from_values([]), [])
+
+    def test_batch_update_writes_every_range_in_one_request(self):
+        spreadsheet = self.sheets.spreadsheets["SHEET"]
+        tracks, projects = spreadsheet.tabs
+
+        batch_update(
+            spreadsheet,
+            {worksheet_range(tracks, "B3"): [["SE 100"]], worksheet_range(projects, "A3:B3"): [["CAP-2", "Drone"]]},
+        )
+
+        self.assertEqual(self.sheets.requests, ["values_batch_update"])
+        self.assertEqual(tracks.values[2], ["2", "SE 100"])
+        self.assertEqual(projects.values[2], ["CAP-2", "Drone"])
+
+    def test_rate_limited_calls_are_retried_with_backoff(self):
+        self.sheets.rate_limit(2)
+
+        values = batch_get(self.sheets.spreadsheets["SHEET"], ["'Projects'"])
+
+        self.assertEqual(values[0][1], ["CAP-1", "Solar Pump"])
+        self.assertEqual(self.sheets.requests, ["values_batch_get"] * 3)
+        first, second = (call.args[0] for call in self.sleep.call_args_list)
+        self.assertGreaterEqual(second, 2 * sheet_calls.BACKOFF_BASE_SECONDS)
+        self.assertLess(first, second)
+
+    def test_retry_after_header_is_honoured(self):
+        func = MagicMock(side_effect=[api_error(429, retry_after="7"), "ok"])
+
+        self.assertEqual(call_with_backoff(func, 1, key="v"), "ok")
+        self.sleep.assert_called_once_with(7.0)
+        func.assert_called_with(1, key="v")
+
+    def test_server_errors_are_not_retried(self):
+        # A 5xx may follow a write that did land; retrying an append could duplicate rows.
+        func = MagicMock(side_effect=api_error(500))
+
+        with self.assertRaises(APIError):
+            call_with_backoff(func)
+        func.assert_called_once()
+
+    def test_exhausted_retries_raise_the_rate_limit_error(self):
+        tracks = self.sheets.spreadsheets["SHEET"].tabs[0]
+        self.sheets.rate_limit(sheet_calls.MAX_ATTEMPTS)
+
+        with self.assertRaises(APIError) as ctx:
+            call_with_backoff(tracks.append_rows, [["3"]])
+
+        self.assertEqual(ctx.exception.code, 429)
+        self.assertEqual(self.sheets.requests, ["append_rows"] * sheet_calls.MAX_ATTEMPTS)
+        self.assertEqual(tracks.values[-1], ["2"])
+
+
+@override_settings(GOOGLE_SHEETS_CLIENT_POOL_ENABLED=True)
+class SheetSyncGatewayTests(GatewayTestMixin, TestCase):
+    def test_repeated_schedule_reads_reuse_the_client_and_tabs(self):
+        from apps.event.models import CurrentProjectSchedule
+        from apps.event.services.schedule_sync.sheets import fetch_schedule_sheet_records
+
+        CurrentProjectSchedule.objects.create(name="Demo Day", sheet_id="SHEET", tracks_gid=1, projects_gid=2)
+        credentials = MagicMock(is_configured=True, get_credentials_info=MagicMock(return_value=KEY))
+
+        with patch("apps.event.services.schedule_sync.sheets.GoogleCredentialConfig.load", return_value=credentials):
+            fetch_schedule_sheet_records()
+            tracks, projects = fetch_schedule_sheet_records()
+
+        self.assertEqual(tracks[0], {"Track": 1, "Room": "COB 102"})
+        self.assertEqual(projects, [{"Team#": "CAP-1", "Title": "Solar Pump"}])
+        self.assertEqual(self.sheets.clients_created, 1)
+        self.assertEqual(self.sheets.requests, ["open_by_key", "worksheets", "worksheets"] + ["values_batch_get"] * 2)
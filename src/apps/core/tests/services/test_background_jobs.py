@@ -371,6 +371,8 @@ class BackgroundJobQueueTests(TestCase):
         self.assertEqual(metrics["queue_depth"], 1)
         self.assertEqual(metrics["failed_jobs"], 1)
         self.assertEqual(metrics["uncertain_jobs"], 1)
+        self.assertIn("pageview_buffer_depth", metrics)
+        self.assertIn("cache_l1_hit_ratio", metrics)
 
     def test_delivery_rate_slots_enforce_configured_global_throughput(self):
         now = timezone.now()
@@ -108,8 +108,11 @@ class DefinitionsTest(TestCase):
 class AnalyticsTest(TestCase):
     def _make_view(self, path="/home/"):
         from apps.cms.models import PageView
+        from apps.cms.services.analytics import refresh_page_view_rollups
 
-        return PageView.objects.create(path=path, timestamp=timezone.now())
+        view = PageView.objects.create(path=path, timestamp=timezone.now())
+        refresh_page_view_rollups()
+        return view
 
     def test_count_only(self):
         self._make_view()
@@ -0,0 +1,141 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from apps.core.services.cache import TieredCache, shared_cache_stats
+from apps.core.services.cache.local import LocalStore
+from apps.core.services.cache.locks import build_lock
+
+
+class TieredCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.tiered = TieredCache(l1_ttl=30)
+
+    def test_l1_serves_repeat_reads_without_the_builder_or_l2(self):
+        builder = Mock(return_value={"v": 1})
+
+        first = self.tiered.get_or_set("hot", builder, tags=("t",), timeout=60)
+        cache.delete("hot")  # An L1 hit must not need the shared copy.
+        second = self.tiered.get_or_set("hot", builder, tags=("t",), timeout=60)
+
+        self.assertEqual(first, {"v": 1})
+        self.assertIs(second, first)
+        builder.assert_called_once()
+        self.assertEqual(self.tiered.stats.snapshot()["l1_hits"], 1)
+
+    def test_invalidation_in_another_process_retires_local_copies(self):
+        other_process = TieredCache(l1_ttl=30)
+        self.tiered.set("page", "old", tags=("pages",), timeout=60)
+        self.assertEqual(self.tiered.get("page", tags=("pages",)), "old")
+
+        other_process.invalidate("pages", keys=("page",))
+
+        self.assertIsNone(self.tiered.get("page", tags=("pages",)))
+        self.assertEqual(self.tiered.get_or_set("page", lambda: "new", tags=("pages",)), "new")
+
+    def test_bump_only_retires_entries_with_that_tag(self):
+        self.tiered.set("a", "a", tags=("one",), timeout=60)
+        self.tiered.set("b", "b", tags=("two",), timeout=60)
+        cache.delete_many(["a", "b"])
+
+        self.tiered.invalidate("one")
+
+        self.assertIsNone(self.tiered.get("a", tags=("one",)))
+        self.assertEqual(self.tiered.get("b", tags=("two",)), "b")
+
+    def test_cleared_revisions_never_revalidate_old_copies(self):
+        self.tiered.set("k", "old", tags=("t",), timeout=60)
+        cache.clear()
+
+        self.assertIsNone(self.tiered.get("k", tags=("t",)))
+
+    def test_l2_hit_fills_l1_and_none_is_not_cached(self):
+        cache.set("shared", "from-l2")
+
+        self.assertEqual(self.tiered.get("shared", tags=("t",)), "from-l2")
+        self.assertIsNone(self.tiered.get_or_set("missing", lambda: None, tags=("t",)))
+        self.assertIsNone(cache.get("missing"))
+        stats = self.tiered.stats.snapshot()
+        self.assertEqual((stats["l2_hits"], stats["misses"]), (1, 1))
+        self.assertEqual(self.tiered.local.get("shared").value, "from-l2")
+
+    def test_disabled_l1_reads_through_to_l2(self):
+        tiered = TieredCache(l1_ttl=0)
+        tiered.set("k", "v", tags=("t",), timeout=60)
+        cache.set("k", "changed")
+
+        self.assertEqual(tiered.get("k", tags=("t",)), "changed")
+        self.assertEqual(len(tiered.local), 0)
+
+    def test_stats_ratios_and_shared_totals(self):
+        self.tiered.get_or_set("k", lambda: "v", tags=("t",))
+        self.tiered.get("k", tags=("t",))
+        self.tiered.get("k", tags=("t",))
+        self.tiered.stats.flush()
+
+        local = self.tiered.stats.snapshot()
+        shared = shared_cache_stats()
+
+        self.assertEqual((local["l1_hits"], local["misses"], local["lookups"]), (2, 1, 3))
+        self.assertEqual(local["l1_hit_ratio"], round(2 / 3, 4))
+        self.assertEqual(local["l2_hit_ratio"], 0.0)
+        self.assertEqual(shared["l1_hits"], 2)
+
+
+class SingleFlightTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.tiered = TieredCache(l1_ttl=0)
+
+    def test_concurrent_miss_gets_stale_copy_while_another_request_rebuilds(self):
+        self.tiered.get_or_build("page", lambda: "v1", 60, tags=("pages",))
+        self.tiered.invalidate("pages", keys=("page",))
+        builder = Mock(return_value="v2")
+
+        with build_lock("page", 30) as acquired:
+            self.assertTrue(acquired)
+            during = self.tiered.get_or_build("page", builder, 60, tags=("pages",))
+
+        self.assertEqual(during, "v1")
+        builder.assert_not_called()
+        self.assertEqual(self.tiered.get_or_build("page", builder, 60, tags=("pages",)), "v2")
+        self.assertEqual(self.tiered.stats.snapshot()["stale_hits"], 1)
+
+    @patch("apps.core.services.cache.singleflight.BUILD_WAIT_SECONDS", 0.1)
+    def test_waiter_without_stale_copy_builds_after_the_wait(self):
+        with build_lock("cold", 30):
+            value = self.tiered.get_or_build("cold", lambda: "built", 60)
+
+        self.assertEqual(value, "built")
+        self.assertEqual(cache.get("cold"), "built")
+
+    def test_lock_holder_reuses_a_value_stored_since_its_lookup(self):
+        def builder():
+            raise AssertionError("should not rebuild")
+
+        with patch.object(self.tiered, "_lookup", return_value=(None, ())):
+            cache.set("k", "fresh")
+            self.assertEqual(self.tiered.get_or_build("k", builder, 60), "fresh")
+
+    def test_missing_result_drops_the_stale_copy(self):
+        self.tiered.get_or_build("gone", lambda: "old", 60)
+        cache.delete("gone")
+
+        self.assertIsNone(self.tiered.get_or_build("gone", lambda: None, 60))
+        with build_lock("gone", 30), patch("apps.core.services.cache.singleflight.BUILD_WAIT_SECONDS", 0):
+            self.assertIsNone(self.tiered.get_or_build("gone", lambda: None, 60))
+
+
+class LocalStoreTests(SimpleTestCase):
+    def test_evicts_least_recently_used_entry(self):
+        store = LocalStore(max_entries=2)
+        store.set("a", 1, (), ttl=30)
+        store.set("b", 2, (), ttl=30)
+        store.get("a")
+        store.set("c", 3, (), ttl=30)
+
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.get("a").value, 1)
+        self.assertEqual(len(store), 2)
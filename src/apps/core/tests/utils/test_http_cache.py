@@ -1,6 +1,10 @@
+import gzip
+from unittest.mock import patch
+
 from django.test import RequestFactory, SimpleTestCase
+from rest_framework.renderers import JSONRenderer
 
-from apps.core.utils.http_cache import public_json_response
+from apps.core.utils.http_cache import asset_response, encode_asset, encode_public_json, public_json_response
 
 
 class PublicJsonResponseTests(SimpleTestCase):
@@ -36,3 +40,67 @@ class PublicJsonResponseTests(SimpleTestCase):
         response = public_json_response(self.factory.get("/public/", HTTP_IF_NONE_MATCH='"different"'), self.data)
 
         self.assertEqual(response.status_code, 200)
+
+
+class EncodedJSONTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.data = {"items": [{"title": f"Project {i}", "note": "é"} for i in range(100)]}
+
+    def test_body_matches_drf_rendering_and_etag_is_precomputed(self):
+        encoded = encode_public_json(self.data)
+
+        self.assertEqual(encoded.body, JSONRenderer().render(self.data))
+        with patch("apps.core.utils.http_cache.JSONRenderer") as renderer:
+            response = public_json_response(self.factory.get("/public/"), encoded)
+
+        renderer.assert_not_called()
+        self.assertEqual(response.content, encoded.body)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response["ETag"], encoded.etag)
+
+    def test_gzip_variant_is_served_to_clients_that_accept_it(self):
+        encoded = encode_public_json(self.data)
+        request = self.factory.get("/public/", HTTP_ACCEPT_ENCODING="br, gzip")
+
+        response = public_json_response(request, encoded)
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), encoded.body)
+        self.assertEqual(response["ETag"], f"W/{encoded.etag}")
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+        revalidated = public_json_response(
+            self.factory.get("/public/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]),
+            encoded,
+        )
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_small_bodies_have_no_gzip_variant(self):
+        encoded = encode_public_json({"message": "public"})
+        response = public_json_response(self.factory.get("/public/", HTTP_ACCEPT_ENCODING="gzip"), encoded)
+
+        self.assertIsNone(encoded.gzip_body)
+        self.assertNotIn("Content-Encoding", response)
+
+
+class EncodedAssetTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.body = b"".join(f".rule-{i} {{ color: red; }}\n".encode() for i in range(100))
+
+    def _serve(self, asset, **headers):
+        return asset_response(
+            self.factory.get("/styles.css", **headers), asset, content_type="text/css", cache_control="public"
+        )
+
+    def test_digest_is_stable_and_gzip_variant_is_stored(self):
+        asset = encode_asset(self.body)
+
+        self.assertEqual(asset.digest, encode_asset(self.body).digest)
+        self.assertEqual(len(asset.digest), 16)
+        self.assertEqual(gzip.decompress(asset.gzip_body), self.body)
+        response = self._serve(asset, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["ETag"], f'W/"{asset.digest}"')
+        self.assertEqual(self._serve(asset, HTTP_IF_NONE_MATCH=f'"{asset.digest}"').status_code, 304)
@@ -0,0 +1,54 @@
+"""Tests for core.utils.json_stream — incremental JSON bundle reading and writing."""
+
+import json
+
+from django.test import SimpleTestCase
+
+from apps.core.utils.json_stream import JSONBundleError, JSONBundleFormatError, iter_json_bundle, stream_json_bundle
+
+
+def _chunks(text, size=3):
+    data = text.encode("utf-8")
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class IterJsonBundleTests(SimpleTestCase):
+    def test_items_survive_any_chunk_boundary(self):
+        bundle = {"version": 1, "pages": [{"title": "Café", "blocks": [1, 2.5, None]}, 12345, "tail"]}
+        text = json.dumps(bundle, ensure_ascii=False)
+
+        for size in (1, 2, 5, len(text)):
+            header, items = iter_json_bundle(_chunks(text, size), "pages")
+            self.assertEqual(header, {"version": 1})
+            self.assertEqual(list(items), bundle["pages"])
+
+    def test_wrong_shape_is_a_format_error(self):
+        for text in ("[1]", '{"version": 1, "not_pages": []}', '{"pages": 3}'):
+            with self.assertRaises(JSONBundleFormatError):
+                iter_json_bundle(_chunks(text), "pages")
+
+    def test_malformed_header_fails_before_any_item(self):
+        with self.assertRaises(JSONBundleError):
+            iter_json_bundle(_chunks("{ not json"), "pages")
+
+    def test_errors_after_the_header_surface_while_iterating(self):
+        for text in ('{"pages": [1, 2', '{"pages": [1]} trailing', '{"pages": ["\\ud800", }'):
+            _header, items = iter_json_bundle(_chunks(text), "pages")
+            with self.assertRaises(JSONBundleError):
+                list(items)
+
+    def test_invalid_utf8_is_a_json_error(self):
+        with self.assertRaises(JSONBundleError):
+            _header, items = iter_json_bundle([b'{"pages": ["', b'\xff"]}'], "pages")
+            list(items)
+
+
+class StreamJsonBundleTests(SimpleTestCase):
+    def test_round_trips_through_the_reader(self):
+        chunks = list(stream_json_bundle({"version": 1}, "pages", iter([{"a": 1}, {"b": [2]}]), indent=2))
+
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(json.loads("".join(chunks)), {"version": 1, "pages": [{"a": 1}, {"b": [2]}]})
+
+    def test_empty_list_and_header(self):
+        self.assertEqual(json.loads("".join(stream_json_bundle({}, "pages", []))), {"pages": []})
@@ -1,11 +1,31 @@
+import gzip
 import hashlib
 import json
+import re
+from typing import NamedTuple
 
-from django.http import HttpResponseNotModified
-from rest_framework.response import Response
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from rest_framework.renderers import JSONRenderer
 
 PUBLIC_JSON_MAX_AGE = 60
 PUBLIC_JSON_STALE_WHILE_REVALIDATE = 300
+# Bodies smaller than this are not worth a stored gzip variant.
+PUBLIC_JSON_GZIP_MIN_BYTES = 1024
+
+_accepts_gzip = re.compile(r"\bgzip\b")
+
+
+class EncodedJSON(NamedTuple):
+    """A public JSON representation rendered once, at cache-fill time.
+
+    Cache this instead of the raw data: serving it needs no re-rendering and
+    no re-hashing, and a conditional GET only compares ``etag``.
+    """
+
+    body: bytes
+    etag: str
+    gzip_body: bytes | None = None
 
 
 def _canonical_json_etag(data):
@@ -13,9 +33,23 @@ def _canonical_json_etag(data):
     return f'"{hashlib.sha256(payload).hexdigest()}"'
 
 
+def encode_public_json(data, *, etag_data=None):
+    """Render ``data`` exactly as DRF would and precompute its ETag and gzip body.
+
+    The ETag hashes the rendered bytes unless ``etag_data`` names a different
+    representation to validate against.
+    """
+    body = JSONRenderer().render(data)
+    etag = f'"{hashlib.sha256(body).hexdigest()}"' if etag_data is None else _canonical_json_etag(etag_data)
+    gzip_body = gzip.compress(body, mtime=0) if len(body) >= PUBLIC_JSON_GZIP_MIN_BYTES else None
+    return EncodedJSON(body, etag, gzip_body)
+
+
 def _etag_matches(if_none_match, etag):
     if not if_none_match:
         return False
+    if etag.startswith("W/"):
+        etag = etag[2:]
     for candidate in if_none_match.split(","):
         candidate = candidate.strip()
         if candidate == "*":
@@ -35,12 +69,59 @@ def public_json_response(
     max_age=PUBLIC_JSON_MAX_AGE,
     stale_while_revalidate=PUBLIC_JSON_STALE_WHILE_REVALIDATE,
 ):
-    """Return stable conditional-GET headers for a public JSON representation."""
-    etag = _canonical_json_etag(data if etag_data is None else etag_data)
+    """Return stable conditional-GET headers for a public JSON representation.
+
+    ``data`` may be an :class:`EncodedJSON` from the cache, whose bytes are
+    sent as-is; anything else is encoded first.
+    """
+    encoded = data if isinstance(data, EncodedJSON) else encode_public_json(data, etag_data=etag_data)
+    send_gzip = encoded.gzip_body is not None and _accepts_gzip.search(request.headers.get("Accept-Encoding", ""))
+    # Like GZipMiddleware, mark the compressed variant's validator weak.
+    etag = f"W/{encoded.etag}" if send_gzip else encoded.etag
     if _etag_matches(request.headers.get("If-None-Match"), etag):
         response = HttpResponseNotModified()
     else:
-        response = Response(data)
+        response = HttpResponse(encoded.gzip_body if send_gzip else encoded.body, content_type="application/json")
+        if send_gzip:
+            response["Content-Encoding"] = "gzip"
+    if encoded.gzip_body is not None:
+        patch_vary_headers(response, ("Accept-Encoding",))
     response["ETag"] = etag
     response["Cache-Control"] = f"public, max-age={max_age}, stale-while-revalidate={stale_while_revalidate}"
     return response
+
+
+class EncodedAsset(NamedTuple):
+    """A static text asset with its content digest and pre-compressed variants."""
+
+    body: bytes
+    digest: str
+    gzip_body: bytes | None = None
+
+
+def encode_asset(body: bytes, *, digest_length: int = 16) -> EncodedAsset:
+    """Hash ``body`` and store its gzip variant."""
+    digest = hashlib.sha256(body).hexdigest()[:digest_length]
+    if len(body) < PUBLIC_JSON_GZIP_MIN_BYTES:
+        return EncodedAsset(body, digest)
+    return EncodedAsset(body, digest, gzip.compress(body, mtime=0))
+
+
+def asset_response(request, asset: EncodedAsset, *, content_type: str, cache_control: str):
+    """Serve the best stored encoding of ``asset`` with a digest ETag."""
+    accept_encoding = request.headers.get("Accept-Encoding", "")
+    encoding, body = None, asset.body
+    if asset.gzip_body is not None and _accepts_gzip.search(accept_encoding):
+        encoding, body = "gzip", asset.gzip_body
+    etag = f'W/"{asset.digest}"' if encoding else f'"{asset.digest}"'
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type=content_type)
+        if encoding:
+            response["Content-Encoding"] = encoding
+    if asset.gzip_body is not None:
+        patch_vary_headers(response, ("Accept-Encoding",))
+    response["ETag"] = etag
+    response["Cache-Control"] = cache_control
+    return response
@@ -0,0 +1,141 @@
+"""Incremental reading and writing of JSON bundles shaped ``{..., "<key>": [items]}``.
+
+Admin import/export moves whole-site bundles (CMS pages, stylesheets). Writing
+them item by item and reading the item list one element at a time keeps memory
+bounded by the largest single item instead of the whole file.
+"""
+
+import codecs
+import json
+from collections.abc import Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+
+
+class JSONBundleError(ValueError):
+    """The upload is not valid JSON."""
+
+
+class JSONBundleFormatError(JSONBundleError):
+    """The upload is valid JSON so far but is not an object holding the expected list."""
+
+
+class _Reader:
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next decoded text to the buffer; return False at end of input."""
+        if self._eof:
+            return False
+        try:
+            for chunk in self._chunks:
+                text = self._decoder.decode(chunk)
+                if text:
+                    self._buffer = self._buffer[self._pos :] + text
+                    self._pos = 0
+                    return True
+            tail = self._decoder.decode(b"", final=True)
+        except UnicodeDecodeError as exc:
+            raise JSONBundleError(str(exc)) from exc
+        self._eof = True
+        self._buffer = self._buffer[self._pos :] + tail
+        self._pos = 0
+        return bool(tail)
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at end of input)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def consume(self, expected: str) -> None:
+        found = self.peek()
+        if found != expected:
+            raise JSONBundleError(f"Expecting '{expected}', found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input until it is whole."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise JSONBundleError(str(exc)) from exc
+            # A number at the very end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_bundle(chunks: Iterable[bytes], key: str) -> tuple[dict, Iterator]:
+    """Parse a bundle's header up to ``key`` and return ``(header, items)``.
+
+    Malformed input before the list raises immediately; errors inside or after
+    the list are raised by the ``items`` iterator when it reaches them. Header
+    keys that follow the list are not returned.
+    """
+    reader = _Reader(chunks)
+    first = reader.peek()
+    if first and first != "{" and first in '["-0123456789tfn':
+        raise JSONBundleFormatError(f"expected a JSON object with a '{key}' list.")
+    reader.consume("{")
+    header = {}
+    while reader.peek() != "}":
+        if header:
+            reader.consume(",")
+        name = reader.value()
+        if not isinstance(name, str):
+            raise JSONBundleError("Expecting property name enclosed in double quotes")
+        reader.consume(":")
+        if name == key:
+            if reader.peek() != "[":
+                raise JSONBundleFormatError(f"expected a JSON object with a '{key}' list.")
+            reader.consume("[")
+            return header, _iter_items(reader)
+        header[name] = reader.value()
+    raise JSONBundleFormatError(f"expected a JSON object with a '{key}' list.")
+
+
+def _iter_items(reader: _Reader) -> Iterator:
+    if reader.peek() != "]":
+        while True:
+            yield reader.value()
+            if reader.peek() != ",":
+                break
+            reader.consume(",")
+    reader.consume("]")
+    while reader.peek() == ",":
+        reader.consume(",")
+        if not isinstance(reader.value(), str):
+            raise JSONBundleError("Expecting property name enclosed in double quotes")
+        reader.consume(":")
+        reader.value()
+    reader.consume("}")
+    if reader.peek():
+        raise JSONBundleError("Extra data after the JSON object")
+
+
+def stream_json_bundle(header: dict, key: str, items: Iterable, **dumps_kwargs) -> Iterator[str]:
+    """Yield ``{**header, key: items}`` as JSON text, one item per chunk."""
+    opening = json.dumps(header, **dumps_kwargs)[:-1].rstrip()
+    separator = ", " if header else ""
+    yield f"{opening}{separator}{json.dumps(key)}: ["
+    first = True
+    for item in items:
+        yield ("\n" if first else ",\n") + json.dumps(item, **dumps_kwargs)
+        first = False
+    yield "\n]}\n" if not first else "]}\n"
@@ -6,3 +6,7 @@ class EventConfig(AppConfig):
     name = "apps.event"
     label = "event"
     verbose_name = "Event"
+
+    # noinspection PyMethodMayBeStatic
+    def ready(self):
+        from . import signals  # noqa: F401
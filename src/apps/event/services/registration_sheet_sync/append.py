@@ -4,6 +4,7 @@ import threading
 from django.db import close_old_connections, transaction
 from django.utils import timezone
 
+from apps.core.services.google_sheets import call_with_backoff
 from apps.event.models import Event, EventRegistration, RegistrationSheetSyncLog
 
 from .logs import record_sync_failure
@@ -125,12 +126,13 @@ def _flush_pending_sync(event_id: str, *, raise_errors: bool = False) -> None:
             ]
 
             if not sheet_values:
-                worksheet.append_rows(
+                call_with_backoff(
+                    worksheet.append_rows,
                     [header] + rows,
                     value_input_option="USER_ENTERED",
                 )
             elif rows:
-                worksheet.append_rows(rows, value_input_option="USER_ENTERED")
+                call_with_backoff(worksheet.append_rows, rows, value_input_option="USER_ENTERED")
             ensure_registration_id_protected(
                 worksheet,
                 header,
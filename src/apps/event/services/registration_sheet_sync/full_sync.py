@@ -3,6 +3,7 @@ import logging
 from django.db import transaction
 from django.utils import timezone
 
+from apps.core.services.google_sheets import call_with_backoff
 from apps.event.models import Event, EventRegistration, RegistrationSheetSyncLog
 
 from .logs import record_sync_failure
@@ -60,8 +61,8 @@ def sync_registrations_to_sheet(event: Event) -> int:
                 existing_values,
                 expected_header=header,
             )
-            worksheet.clear()
-            worksheet.update([header] + rows, value_input_option="USER_ENTERED")
+            call_with_backoff(worksheet.clear)
+            call_with_backoff(worksheet.update, [header] + rows, value_input_option="USER_ENTERED")
             ensure_registration_id_protected(
                 worksheet,
                 header,
@@ -1,6 +1,7 @@
 from datetime import UTC, datetime
 
 from apps.core.models import GoogleCredentialConfig
+from apps.core.services.google_sheets import call_with_backoff, open_worksheet, worksheet_by_gid
 from apps.event.models import Event
 
 from .rows import REGISTRATION_ID_COLUMN
@@ -14,7 +15,7 @@ class RegistrationSyncError(RuntimeError):
 
 def read_sheet_values(worksheet) -> list[list[str]]:
     """Return worksheet values while keeping test doubles and empty sheets safe."""
-    values = worksheet.get_all_values()
+    values = call_with_backoff(worksheet.get_all_values)
     if not isinstance(values, list):
         return []
     return [row for row in values if isinstance(row, list)]
@@ -135,11 +136,7 @@ def service_account_email(credentials) -> str:
     return str(info.get("client_email") or "")
 
 
-def _get_worksheet_by_gid(spreadsheet, worksheet_gid: int):
-    return next(
-        (worksheet for worksheet in spreadsheet.worksheets() if worksheet.id == worksheet_gid),
-        None,
-    )
+_get_worksheet_by_gid = worksheet_by_gid
 
 
 def _get_worksheet(event: Event):
@@ -147,16 +144,12 @@ def _get_worksheet(event: Event):
     if not credentials.is_configured:
         raise RegistrationSyncError("No active Google service account is configured.")
 
-    import gspread
-
-    client = gspread.service_account_from_dict(credentials.get_credentials_info())
-    spreadsheet = client.open_by_key(event.registration_sheet_id)
-
-    if event.registration_sheet_gid is not None:
-        worksheet = _get_worksheet_by_gid(spreadsheet, int(event.registration_sheet_gid))
-        if worksheet is None:
-            raise RegistrationSyncError("Registration worksheet GID not found in the spreadsheet.")
-    else:
-        worksheet = spreadsheet.sheet1
-
+    gid = event.registration_sheet_gid
+    worksheet = open_worksheet(
+        credentials.get_credentials_info(),
+        event.registration_sheet_id,
+        gid=int(gid) if gid is not None else None,
+    )
+    if worksheet is None:
+        raise RegistrationSyncError("Registration worksheet GID not found in the spreadsheet.")
     return worksheet
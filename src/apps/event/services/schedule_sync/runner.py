@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Any
 
-from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 
@@ -76,7 +75,9 @@ def _sync_schedule(
         sync_error="",
         grand_winners=grand_winners,
     )
-    cache.delete("event:current-projects")
+    from apps.event.views.schedule.cache import clear_schedule_caches
+
+    clear_schedule_caches()
     _record_sync_success(config, stats, sync_type)
     return stats
 
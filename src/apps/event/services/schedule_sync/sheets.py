@@ -3,16 +3,19 @@ from __future__ import annotations
 from typing import Any
 
 from apps.core.models import GoogleCredentialConfig
+from apps.core.services.google_sheets import (
+    batch_get,
+    open_spreadsheet,
+    open_worksheet,
+    records_from_values,
+    worksheet_by_gid,
+    worksheet_range,
+)
 from apps.event.models import CurrentProjectSchedule
 
 from .shared import ScheduleSyncError
 
-
-def get_worksheet_by_gid(spreadsheet, worksheet_gid: int):
-    return next(
-        (worksheet for worksheet in spreadsheet.worksheets() if worksheet.id == worksheet_gid),
-        None,
-    )
+get_worksheet_by_gid = worksheet_by_gid
 
 
 def fetch_schedule_sheet_records() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
@@ -24,13 +27,11 @@ def fetch_schedule_sheet_records() -> tuple[list[dict[str, Any]], list[dict[str,
     if not credentials.is_configured:
         raise ScheduleSyncError("No active Google service account is configured.")
 
+    credentials_info = credentials.get_credentials_info()
     try:
-        import gspread
-
-        client = gspread.service_account_from_dict(credentials.get_credentials_info())
-        spreadsheet = client.open_by_key(source.sheet_id)
-        tracks_worksheet = get_worksheet_by_gid(spreadsheet, int(source.tracks_gid))
-        projects_worksheet = get_worksheet_by_gid(spreadsheet, int(source.projects_gid))
+        spreadsheet = open_spreadsheet(credentials_info, source.sheet_id)
+        tracks_worksheet = open_worksheet(credentials_info, source.sheet_id, gid=int(source.tracks_gid))
+        projects_worksheet = open_worksheet(credentials_info, source.sheet_id, gid=int(source.projects_gid))
     except Exception as exc:
         raise ScheduleSyncError(f"Unable to open the configured Google Sheet: {exc}") from exc
 
@@ -40,6 +41,10 @@ def fetch_schedule_sheet_records() -> tuple[list[dict[str, Any]], list[dict[str,
         raise ScheduleSyncError("Schedule projects worksheet not found.")
 
     try:
-        return tracks_worksheet.get_all_records(), projects_worksheet.get_all_records()
+        # Both tabs in one values:batchGet request.
+        tracks_values, projects_values = batch_get(
+            spreadsheet, [worksheet_range(tracks_worksheet), worksheet_range(projects_worksheet)]
+        )
+        return records_from_values(tracks_values), records_from_values(projects_values)
     except Exception as exc:
         raise ScheduleSyncError(f"Unable to read schedule worksheet records: {exc}") from exc
@@ -0,0 +1,30 @@
+"""Invalidate the public schedule caches when schedule content changes.
+
+Clearing is deferred via ``transaction.on_commit`` so a concurrent request
+cannot re-cache data that has not been committed yet.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import (
+    CurrentProject,
+    CurrentProjectSchedule,
+    EventAgendaItem,
+    EventScheduleSection,
+    EventScheduleSlot,
+    EventScheduleTrack,
+)
+from .views.schedule.cache import clear_schedule_caches
+
+
+@receiver([post_save, post_delete], sender=CurrentProjectSchedule)
+@receiver([post_save, post_delete], sender=CurrentProject)
+@receiver([post_save, post_delete], sender=EventScheduleSection)
+@receiver([post_save, post_delete], sender=EventScheduleTrack)
+@receiver([post_save, post_delete], sender=EventScheduleSlot)
+@receiver([post_save, post_delete], sender=EventAgendaItem)
+# noinspection PyUnusedLocal
+def invalidate_schedule_cache(sender, instance, **kwargs):
+    transaction.on_commit(clear_schedule_caches)
@@ -197,17 +197,24 @@ class FetchScheduleSheetRecordsTest(TestCase):
             is_configured=True,
             get_credentials_info=MagicMock(return_value={"client_email": "x@example.com"}),
         )
-        tracks_ws = MagicMock(id=1)
-        tracks_ws.get_all_records.return_value = [{"Track": 1}]
-        projects_ws = MagicMock(id=2)
-        projects_ws.get_all_records.return_value = [{"Team#": "CAP-1"}]
+        tracks_ws = MagicMock(id=1, title="Tracks")
+        projects_ws = MagicMock(id=2, title="Projects")
         spreadsheet = MagicMock(worksheets=MagicMock(return_value=[tracks_ws, projects_ws]))
+        spreadsheet.values_batch_get.return_value = {
+            "valueRanges": [
+                {"values": [["Track", "Room"], ["1"]]},
+                {"values": [["Team#"], ["CAP-1"]]},
+            ]
+        }
         client = MagicMock()
         client.open_by_key.return_value = spreadsheet
         with patch("gspread.service_account_from_dict", return_value=client):
             tracks, projects = fetch_schedule_sheet_records()
-        self.assertEqual(tracks, [{"Track": 1}])
+        self.assertEqual(tracks, [{"Track": 1, "Room": ""}])
         self.assertEqual(projects, [{"Team#": "CAP-1"}])
+        # Both tabs are read in a single request.
+        spreadsheet.values_batch_get.assert_called_once_with(["'Tracks'", "'Projects'"])
+        tracks_ws.get_all_records.assert_not_called()
 
     @patch("apps.event.services.schedule_sync.sheets.GoogleCredentialConfig.load")
     def test_open_failure_raises_schedule_sync_error(self, mock_load):
@@ -233,10 +240,10 @@ class FetchScheduleSheetRecordsTest(TestCase):
             is_configured=True,
             get_credentials_info=MagicMock(return_value={"client_email": "x@example.com"}),
         )
-        tracks_ws = MagicMock(id=1)
-        tracks_ws.get_all_records.side_effect = RuntimeError("read failed")
-        projects_ws = MagicMock(id=2)
+        tracks_ws = MagicMock(id=1, title="Tracks")
+        projects_ws = MagicMock(id=2, title="Projects")
         spreadsheet = MagicMock(worksheets=MagicMock(return_value=[tracks_ws, projects_ws]))
+        spreadsheet.values_batch_get.side_effect = RuntimeError("read failed")
         client = MagicMock()
         client.open_by_key.return_value = spreadsheet
         with patch("gspread.service_account_from_dict", return_value=client):
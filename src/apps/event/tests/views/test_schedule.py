@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.test import APIClient
 
@@ -8,18 +9,19 @@ from apps.event.tests.helpers import sample_projects_records, sample_tracks_reco
 
 class CurrentEventScheduleViewTest(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
 
     def test_no_config_returns_404(self):
         response = self.client.get("/event/schedule/")
         self.assertEqual(response.status_code, 404)
-        self.assertEqual(response.data["detail"], "No schedule configured.")
+        self.assertEqual(response.json()["detail"], "No schedule configured.")
 
     def test_config_without_schedule_returns_404(self):
         CurrentProjectSchedule.objects.create(name="Demo Day")
         response = self.client.get("/event/schedule/")
         self.assertEqual(response.status_code, 404)
-        self.assertEqual(response.data["detail"], "No schedule available.")
+        self.assertEqual(response.json()["detail"], "No schedule available.")
 
     def test_returns_payload_for_schedule(self):
         config = CurrentProjectSchedule.objects.create(name="Demo Day")
@@ -28,14 +30,14 @@ class CurrentEventScheduleViewTest(TestCase):
         response = self.client.get("/event/schedule/")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.data["event"]["name"], "Demo Day")
-        self.assertEqual(response.data["expo"]["title"], "EXPO: POSTERS AND DEMOS")
-        self.assertEqual(response.data["awards"]["title"], "AWARDS & RECEPTION")
-        self.assertEqual(len(response.data["sections"]), 3)
-        self.assertEqual(response.data["sections"][0]["code"], "CAP")
-        self.assertEqual(response.data["sections"][0]["tracks"][0]["track_number"], 1)
-        self.assertEqual(response.data["sections"][0]["tracks"][0]["slots"][0]["team_number"], "CAP-101")
-        self.assertEqual(response.data["projects"][0]["team_number"], "CAP-101")
+        self.assertEqual(response.json()["event"]["name"], "Demo Day")
+        self.assertEqual(response.json()["expo"]["title"], "EXPO: POSTERS AND DEMOS")
+        self.assertEqual(response.json()["awards"]["title"], "AWARDS & RECEPTION")
+        self.assertEqual(len(response.json()["sections"]), 3)
+        self.assertEqual(response.json()["sections"][0]["code"], "CAP")
+        self.assertEqual(response.json()["sections"][0]["tracks"][0]["track_number"], 1)
+        self.assertEqual(response.json()["sections"][0]["tracks"][0]["slots"][0]["team_number"], "CAP-101")
+        self.assertEqual(response.json()["projects"][0]["team_number"], "CAP-101")
         self.assertEqual(response["Cache-Control"], "public, max-age=60, stale-while-revalidate=300")
 
         unchanged = self.client.get("/event/schedule/", HTTP_IF_NONE_MATCH="*")
@@ -43,6 +45,20 @@ class CurrentEventScheduleViewTest(TestCase):
         self.assertEqual(unchanged.content, b"")
         self.assertEqual(unchanged["ETag"], response["ETag"])
 
+    def test_payload_is_cached_until_schedule_content_changes(self):
+        config = CurrentProjectSchedule.objects.create(name="Demo Day")
+        sync_schedule(config, tracks_records=sample_tracks_records(), projects_records=sample_projects_records())
+        self.client.get("/event/schedule/")
+
+        CurrentProjectSchedule.objects.filter(pk=config.pk).update(name="Renamed Quietly")
+        self.assertEqual(self.client.get("/event/schedule/").json()["event"]["name"], "Demo Day")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config.refresh_from_db()
+            config.name = "Renamed"
+            config.save()
+        self.assertEqual(self.client.get("/event/schedule/").json()["event"]["name"], "Renamed")
+
     def test_schedule_id_query_selects_non_active_schedule(self):
         active = CurrentProjectSchedule.objects.create(name="Active Demo Day")
         sync_schedule(active, tracks_records=sample_tracks_records(), projects_records=sample_projects_records())
@@ -53,9 +69,9 @@ class CurrentEventScheduleViewTest(TestCase):
         selected_response = self.client.get("/event/schedule/", {"schedule_id": str(archived.pk)})
 
         self.assertEqual(default_response.status_code, 200)
-        self.assertEqual(default_response.data["event"]["name"], "Active Demo Day")
+        self.assertEqual(default_response.json()["event"]["name"], "Active Demo Day")
         self.assertEqual(selected_response.status_code, 200)
-        self.assertEqual(selected_response.data["event"]["name"], "Archived Demo Day")
+        self.assertEqual(selected_response.json()["event"]["name"], "Archived Demo Day")
 
     def test_projects_include_non_presenting_teams(self):
         config = CurrentProjectSchedule.objects.create(name="Demo Day")
@@ -69,9 +85,9 @@ class CurrentEventScheduleViewTest(TestCase):
         response = self.client.get("/event/schedule/")
 
         self.assertEqual(response.status_code, 200)
-        team_numbers = {row["team_number"] for row in response.data["projects"]}
+        team_numbers = {row["team_number"] for row in response.json()["projects"]}
         self.assertIn("CAP-101", team_numbers)
         self.assertIn("CAP-FALL", team_numbers)
 
-        fall_row = next(row for row in response.data["projects"] if row["team_number"] == "CAP-FALL")
+        fall_row = next(row for row in response.json()["projects"] if row["team_number"] == "CAP-FALL")
         self.assertFalse(fall_row["is_presenting"])
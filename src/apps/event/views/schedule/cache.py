@@ -0,0 +1,18 @@
+"""Cache keys for the public schedule payloads and their invalidation."""
+
+from apps.core.services.cache import tiered_cache
+from apps.event.models import CurrentProjectSchedule
+
+SCHEDULE_CACHE_TAG = "event-schedule"
+SCHEDULE_CACHE_TIMEOUT = 300
+CURRENT_PROJECTS_CACHE_KEY = "event:current-projects"
+
+
+def schedule_cache_key(schedule_id):
+    return f"event:schedule:{schedule_id}"
+
+
+def clear_schedule_caches():
+    """Retire every cached schedule payload and the current-projects list in every process."""
+    keys = [schedule_cache_key(pk) for pk in CurrentProjectSchedule.objects.values_list("pk", flat=True)]
+    tiered_cache.invalidate(SCHEDULE_CACHE_TAG, keys=[CURRENT_PROJECTS_CACHE_KEY, *keys])
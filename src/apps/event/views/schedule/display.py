@@ -5,10 +5,34 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.core.utils.http_cache import public_json_response
+from apps.core.services.cache import tiered_cache
+from apps.core.utils.http_cache import encode_public_json, public_json_response
 from apps.event.models import CurrentProjectSchedule, EventScheduleSection, EventScheduleTrack
 from apps.event.serializers import build_schedule_payload
 
+from .cache import SCHEDULE_CACHE_TAG, SCHEDULE_CACHE_TIMEOUT, schedule_cache_key
+
+
+def _build_schedule(schedule_id):
+    config = (
+        CurrentProjectSchedule.objects.filter(pk=schedule_id)
+        .prefetch_related(
+            "agenda_items",
+            Prefetch(
+                "schedule_sections",
+                queryset=EventScheduleSection.objects.prefetch_related(
+                    Prefetch("tracks", queryset=EventScheduleTrack.objects.prefetch_related("slots"))
+                ),
+            ),
+        )
+        .first()
+    )
+    if config is None:
+        raise CurrentProjectSchedule.DoesNotExist
+    if not config.schedule_sections.exists():
+        return None
+    return encode_public_json(build_schedule_payload(config))
+
 
 class CurrentEventScheduleView(APIView):
     permission_classes = [AllowAny]
@@ -19,26 +43,18 @@ class CurrentEventScheduleView(APIView):
         if not config:
             return Response({"detail": "No schedule configured."}, status=status.HTTP_404_NOT_FOUND)
 
-        config = (
-            CurrentProjectSchedule.objects.filter(pk=config.pk)
-            .prefetch_related(
-                "agenda_items",
-                Prefetch(
-                    "schedule_sections",
-                    queryset=EventScheduleSection.objects.prefetch_related(
-                        Prefetch("tracks", queryset=EventScheduleTrack.objects.prefetch_related("slots"))
-                    ),
-                ),
+        try:
+            data = tiered_cache.get_or_build(
+                schedule_cache_key(config.pk),
+                lambda: _build_schedule(config.pk),
+                SCHEDULE_CACHE_TIMEOUT,
+                tags=(SCHEDULE_CACHE_TAG,),
             )
-            .first()
-        )
-        if config is None:
+        except CurrentProjectSchedule.DoesNotExist:
             return Response({"detail": "No schedule configured."}, status=status.HTTP_404_NOT_FOUND)
-
-        if not config.schedule_sections.exists():
+        if data is None:
             return Response({"detail": "No schedule available."}, status=status.HTTP_404_NOT_FOUND)
-
-        return public_json_response(request, build_schedule_payload(config))
+        return public_json_response(request, data)
 
     def _get_config(self, schedule_id):
         if not schedule_id:
@@ -1,30 +1,36 @@
-from django.core.cache import cache
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.services.cache import tiered_cache
 from apps.event.models import CurrentProjectSchedule
 from apps.event.serializers import CurrentProjectSerializer
 
+from .cache import CURRENT_PROJECTS_CACHE_KEY, SCHEDULE_CACHE_TAG, SCHEDULE_CACHE_TIMEOUT
+
+
+def _build_current_projects():
+    config = CurrentProjectSchedule.load()
+    if not config:
+        return None
+    projects = config.projects.order_by("class_code", "team_number")
+    return {
+        "schedule": {"id": str(config.pk), "name": config.name},
+        "projects": CurrentProjectSerializer(projects, many=True).data,
+    }
+
 
 class CurrentProjectsAPIView(APIView):
     permission_classes = [AllowAny]
 
     # noinspection PyUnusedLocal,PyMethodMayBeStatic
     def get(self, request):
-        cache_key = "event:current-projects"
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return Response(cached)
-
-        config = CurrentProjectSchedule.load()
-        if not config:
+        data = tiered_cache.get_or_build(
+            CURRENT_PROJECTS_CACHE_KEY,
+            _build_current_projects,
+            SCHEDULE_CACHE_TIMEOUT,
+            tags=(SCHEDULE_CACHE_TAG,),
+        )
+        if data is None:
             return Response({"detail": "No published projects found."}, status=404)
-
-        projects = config.projects.order_by("class_code", "team_number")
-        data = {
-            "schedule": {"id": str(config.pk), "name": config.name},
-            "projects": CurrentProjectSerializer(projects, many=True).data,
-        }
-        cache.set(cache_key, data, timeout=300)
         return Response(data)
@@ -2,6 +2,7 @@ from .past_project_share import PastProjectShareAdmin
 from .past_project_sync_log import PastProjectSyncLogAdmin
 from .past_projects_sheet_config import PastProjectsSheetConfigAdmin
 from .project import ProjectAdmin
+from .project_import_run import ProjectImportRunAdmin
 from .semester import SemesterAdmin
 
 __all__ = [
@@ -9,5 +10,6 @@ __all__ = [
     "PastProjectSyncLogAdmin",
     "PastProjectsSheetConfigAdmin",
     "ProjectAdmin",
+    "ProjectImportRunAdmin",
     "SemesterAdmin",
 ]
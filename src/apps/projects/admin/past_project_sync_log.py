@@ -17,7 +17,9 @@ class PastProjectSyncLogAdmin(ReadOnlyModelAdmin):
         "projects_deleted",
         "semesters_touched",
         "rows_skipped",
+        "rows_unchanged",
         "rows_read",
+        "duration_ms",
     )
     list_filter = ("status", "sync_type", "config")
     search_fields = ("error_message",)
@@ -31,6 +33,10 @@ class PastProjectSyncLogAdmin(ReadOnlyModelAdmin):
         "projects_deleted",
         "semesters_touched",
         "rows_skipped",
+        "rows_unchanged",
+        "fields_updated",
+        "sheet_unchanged",
+        "duration_ms",
         "error_message",
         "created_at",
         "updated_at",
@@ -0,0 +1,39 @@
+from django.contrib import admin
+
+from apps.core.admin import ReadOnlyModelAdmin
+
+from ..models import ProjectImportRun
+
+
+@admin.register(ProjectImportRun)
+class ProjectImportRunAdmin(ReadOnlyModelAdmin):
+    list_display = (
+        "created_at",
+        "filename",
+        "status",
+        "dry_run",
+        "rows_read",
+        "projects_created",
+        "rows_skipped",
+        "error_count",
+        "finished_at",
+    )
+    list_filter = ("status", "dry_run", "publish")
+    search_fields = ("filename", "error_message")
+    readonly_fields = (
+        "filename",
+        "status",
+        "dry_run",
+        "publish",
+        "rows_read",
+        "projects_created",
+        "rows_skipped",
+        "semesters_created",
+        "error_count",
+        "errors",
+        "error_message",
+        "created_at",
+        "updated_at",
+        "finished_at",
+    )
+    exclude = ("csv_file",)
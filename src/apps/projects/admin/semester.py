@@ -5,12 +5,14 @@ from django.db import transaction
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
 from django.urls import path, reverse
+from django.utils import timezone
 from unfold.admin import TabularInline
 
 from apps.core.admin import BaseModelAdmin
 
-from ..models import Project, Semester
+from ..models import Project, ProjectImportRun, Semester
 from ..services.csv_import import import_projects_from_csv
+from ..services.csv_import.runs import background_import_threshold, schedule_import_run
 from ..signals import _clear_project_caches
 
 
@@ -32,13 +34,13 @@ class SemesterAdmin(BaseModelAdmin):
 
     @admin.action(description="Publish selected semesters")
     def publish_selected(self, request, queryset):
-        updated = queryset.filter(is_published=False).update(is_published=True)
+        updated = queryset.filter(is_published=False).update(is_published=True, updated_at=timezone.now())
         transaction.on_commit(_clear_project_caches)
         self.message_user(request, f"{updated} semester(s) published.", messages.SUCCESS)
 
     @admin.action(description="Unpublish selected semesters")
     def unpublish_selected(self, request, queryset):
-        updated = queryset.filter(is_published=True).update(is_published=False)
+        updated = queryset.filter(is_published=True).update(is_published=False, updated_at=timezone.now())
         transaction.on_commit(_clear_project_caches)
         self.message_user(request, f"{updated} semester(s) unpublished.", messages.SUCCESS)
 
@@ -81,7 +83,7 @@ class SemesterAdmin(BaseModelAdmin):
                 if confirmation_text.lower() != "publish all":
                     messages.error(request, 'Confirmation text does not match. Type "publish all" to confirm.')
                     return redirect(reverse("admin:projects_semester_changelist"))
-            updated = Semester.objects.filter(is_published=False).update(is_published=True)
+            updated = Semester.objects.filter(is_published=False).update(is_published=True, updated_at=timezone.now())
             transaction.on_commit(_clear_project_caches)
             self.message_user(request, f"{updated} semester(s) published.", messages.SUCCESS)
         return redirect(reverse("admin:projects_semester_changelist"))
@@ -107,6 +109,20 @@ class SemesterAdmin(BaseModelAdmin):
                     messages.error(request, 'Confirmation text does not match. Type "import" to confirm.')
                     return redirect(reverse("admin:projects_import_csv"))
 
+            if csv_file.size >= background_import_threshold():
+                with transaction.atomic():
+                    run = ProjectImportRun.objects.create(
+                        csv_file=csv_file, filename=csv_file.name[:255], dry_run=dry_run, publish=publish
+                    )
+                    transaction.on_commit(lambda: schedule_import_run(run))
+                self.message_user(
+                    request,
+                    f"{'[DRY RUN] ' if dry_run else ''}Large file queued for a background import; "
+                    "follow its progress under Project CSV Imports.",
+                    messages.INFO,
+                )
+                return redirect(reverse("admin:projects_projectimportrun_change", args=[run.pk]))
+
             result = import_projects_from_csv(csv_file, dry_run=dry_run, publish=publish)
 
             prefix = "[DRY RUN] " if dry_run else ""
@@ -117,8 +133,6 @@ class SemesterAdmin(BaseModelAdmin):
             )
             for error in result.errors[:20]:
                 self.message_user(request, error, messages.WARNING)
-            if not dry_run and result.created:
-                transaction.on_commit(_clear_project_caches)
 
             return redirect(reverse("admin:projects_semester_changelist"))
 
@@ -0,0 +1,87 @@
+"""Microbenchmark for the lexical ranking stage of past-project AI search.
+
+Builds a BM25 index over a synthetic, deterministic catalog (5,000 projects by
+default) and times index construction and query ranking, reporting median and
+95th-percentile latency per query. No database access is needed.
+"""
+
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.projects.services.ai_search.ranking import LexicalIndex
+from apps.projects.services.search import search_words
+
+_TOPICS = (
+    "solar irrigation sensor battery drone robotics wildfire water soil almond dairy crop yield forecasting "
+    "machine learning vision dashboard inventory logistics supply chain energy grid microgrid hydrogen "
+    "recycling plastic packaging medical device telehealth wearable prosthetic biomedical imaging campus "
+    "student housing transit traffic parking mobile app web portal analytics blockchain security network "
+    "satellite weather climate drought groundwater pump valve conveyor manufacturing automation welding"
+).split()
+_ORGANIZATIONS = ("Acme Farms", "Valley Water District", "Mercy Medical", "Central Energy", "City Transit", "UC Lab")
+_INDUSTRIES = ("Agriculture", "Energy", "Healthcare", "Transportation", "Manufacturing", "Software")
+_QUERIES = (
+    "solar irrigation",
+    "machine learning crop yield",
+    "medical wearable",
+    "drone wildfire monitoring",
+    "supply chain inventory dashboard",
+    "groundwater pump automation",
+    "hydro",
+    "battery energy storage microgrid",
+)
+
+
+def synthetic_catalog(size: int, *, seed: int = 0):
+    rng = random.Random(seed)
+    for number in range(size):
+        title = " ".join(rng.sample(_TOPICS, 4)).title()
+        abstract = " ".join(rng.choices(_TOPICS, k=60))
+        yield (
+            f"project-{number}",
+            {
+                "project_title": title,
+                "organization": rng.choice(_ORGANIZATIONS),
+                "industry": rng.choice(_INDUSTRIES),
+                "team_name": f"Team {rng.choice(_TOPICS).title()}",
+                "class_code": rng.choice(("CAP", "ENGR", "CSE")),
+                "team_number": str(number % 200),
+                "abstract": abstract,
+                "student_names": "Alex Student, Sam Student",
+            },
+        )
+
+
+class Command(BaseCommand):
+    help = "Measure BM25 index build time and query ranking latency for AI search candidates."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--projects", type=int, default=5000, help="Synthetic catalog size (default: 5000).")
+        parser.add_argument("--rounds", type=int, default=50, help="Times each sample query is ranked (default: 50).")
+        parser.add_argument("--limit", type=int, default=25, help="Candidates returned per query (default: 25).")
+
+    def handle(self, *args, **options):
+        size = max(1, options["projects"])
+        rounds = max(1, options["rounds"])
+        limit = max(1, options["limit"])
+
+        started = time.perf_counter()
+        index = LexicalIndex(synthetic_catalog(size))
+        build_seconds = time.perf_counter() - started
+        self.stdout.write(f"index build   {len(index):>6} projects  {build_seconds * 1e3:8.1f} ms")
+
+        timings = []
+        for _ in range(rounds):
+            for query in _QUERIES:
+                started = time.perf_counter()
+                index.rank(search_words(query), limit)
+                timings.append(time.perf_counter() - started)
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f"rank top {limit:<4} {len(timings):>6} queries   {statistics.median(timings) * 1e3:8.2f} ms p50"
+        )
+        self.stdout.write(f"rank top {limit:<4} {len(timings):>6} queries   {p95 * 1e3:8.2f} ms p95")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.projects.services.similarity import rebuild_similarity_index
+
+
+class Command(BaseCommand):
+    help = "Recompute the similar-projects table for every published project."
+
+    def handle(self, *args, **options):
+        links = rebuild_similarity_index()
+        self.stdout.write(self.style.SUCCESS(f"Stored {links} similar-project link(s)."))
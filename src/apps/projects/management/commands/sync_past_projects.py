@@ -9,6 +9,9 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument("--force", action="store_true", help="Sync even if the interval has not elapsed.")
+        parser.add_argument(
+            "--full", action="store_true", help="Compare every row even if the sheet is unchanged since the last sync."
+        )
 
     def handle(self, *args, **options):
         config = PastProjectsSheetConfig.load()
@@ -22,7 +25,7 @@ class Command(BaseCommand):
 
         self.stdout.write(f"Syncing '{config.name}' from Google Sheets...")
         try:
-            stats = sync_past_projects(config, sync_type="auto")
+            stats = sync_past_projects(config, sync_type="auto", force=options["full"])
         except SheetSyncError as exc:
             # Raise CommandError so cron/CI supervisors that watch exit codes see the
             # failure rather than a silent exit 0 with stale data.
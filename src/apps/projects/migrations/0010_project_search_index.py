@@ -0,0 +1,91 @@
+from django.db import migrations
+
+# PostgreSQL: a weighted tsvector kept current by the database as a generated
+# column, a GIN index over it, and trigram indexes for fuzzy title and
+# organization matches.
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    ALTER TABLE projects_project ADD COLUMN search_document tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(project_title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(organization, '') || ' ' || coalesce(industry, '')), 'B')
+        || setweight(
+            to_tsvector(
+                'english', coalesce(team_name, '') || ' ' || coalesce(class_code, '') || ' ' || coalesce(team_number, '')
+            ),
+            'C'
+        )
+        || setweight(to_tsvector('english', coalesce(abstract, '') || ' ' || coalesce(student_names, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX projects_project_search_gin ON projects_project USING gin (search_document)",
+    "CREATE INDEX projects_project_title_trgm ON projects_project USING gin (project_title gin_trgm_ops)",
+    "CREATE INDEX projects_project_org_trgm ON projects_project USING gin (organization gin_trgm_ops)",
+]
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS projects_project_org_trgm",
+    "DROP INDEX IF EXISTS projects_project_title_trgm",
+    "DROP INDEX IF EXISTS projects_project_search_gin",
+    "ALTER TABLE projects_project DROP COLUMN IF EXISTS search_document",
+]
+
+# SQLite (development and tests): an FTS5 shadow table maintained by triggers.
+_FTS_COLUMNS = "project_title, organization, industry, team_name, class_code, team_number, abstract, student_names"
+_FTS_VALUES = ", ".join(f"NEW.{column.strip()}" for column in _FTS_COLUMNS.split(","))
+SQLITE_FORWARD = [
+    f"""
+    CREATE VIRTUAL TABLE projects_project_fts USING fts5(
+        project_id UNINDEXED, {_FTS_COLUMNS}, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+    )
+    """,
+    f"INSERT INTO projects_project_fts (project_id, {_FTS_COLUMNS}) SELECT id, {_FTS_COLUMNS} FROM projects_project",
+    f"""
+    CREATE TRIGGER projects_project_fts_insert AFTER INSERT ON projects_project BEGIN
+        INSERT INTO projects_project_fts (project_id, {_FTS_COLUMNS}) VALUES (NEW.id, {_FTS_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER projects_project_fts_update AFTER UPDATE ON projects_project BEGIN
+        DELETE FROM projects_project_fts WHERE project_id = OLD.id;
+        INSERT INTO projects_project_fts (project_id, {_FTS_COLUMNS}) VALUES (NEW.id, {_FTS_VALUES});
+    END
+    """,
+    """
+    CREATE TRIGGER projects_project_fts_delete AFTER DELETE ON projects_project BEGIN
+        DELETE FROM projects_project_fts WHERE project_id = OLD.id;
+    END
+    """,
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS projects_project_fts_delete",
+    "DROP TRIGGER IF EXISTS projects_project_fts_update",
+    "DROP TRIGGER IF EXISTS projects_project_fts_insert",
+    "DROP TABLE IF EXISTS projects_project_fts",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        connection = schema_editor.connection
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+                if not cursor.fetchone()[0]:
+                    return  # Search falls back to substring matching without FTS5.
+        for statement in statements_by_vendor.get(connection.vendor, ()):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0009_active_sheet_config_invariant"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            _run({"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,39 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0010_project_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectSimilarity",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("rank", models.PositiveSmallIntegerField(help_text="1 for the closest neighbour.")),
+                ("score", models.FloatField(help_text="Cosine similarity of the two projects' TF-IDF vectors (0–1).")),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="similar_links", to="projects.project"
+                    ),
+                ),
+                (
+                    "similar",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="projects.project"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Project Similarity",
+                "verbose_name_plural": "Project Similarities",
+                "ordering": ["project", "rank"],
+                "constraints": [
+                    models.UniqueConstraint(fields=("project", "rank"), name="projects_similarity_unique_rank")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0011_project_similarity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectTombstone",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("project_id", models.UUIDField(db_index=True)),
+                ("deleted_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                "verbose_name": "Project Tombstone",
+                "verbose_name_plural": "Project Tombstones",
+                "ordering": ["deleted_at"],
+            },
+        ),
+    ]
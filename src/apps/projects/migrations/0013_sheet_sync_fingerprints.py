@@ -0,0 +1,73 @@
+from importlib import import_module
+
+from django.db import migrations, models
+
+search_index = import_module("apps.projects.migrations.0010_project_search_index")
+
+
+def restore_sqlite_search_triggers(apps, schema_editor):
+    # SQLite adds a NOT NULL column by rebuilding projects_project, which drops
+    # the FTS triggers from 0010; put them back. The FTS table itself is kept.
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        if "projects_project_fts" not in connection.introspection.table_names(cursor):
+            return
+    triggers = [statement for statement in search_index.SQLITE_FORWARD if "CREATE TRIGGER" in statement]
+    for statement in search_index.SQLITE_REVERSE[:3] + triggers:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0012_project_tombstone"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pastprojectssheetconfig",
+            name="sheet_digest",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Digest of the sheet contents last synced; a sync of an identical sheet is skipped.",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="pastprojectsynclog",
+            name="duration_ms",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="pastprojectsynclog",
+            name="fields_updated",
+            field=models.PositiveIntegerField(default=0, help_text="Columns changed across updated projects."),
+        ),
+        migrations.AddField(
+            model_name="pastprojectsynclog",
+            name="rows_unchanged",
+            field=models.PositiveIntegerField(default=0, help_text="Rows whose fingerprint matched the project."),
+        ),
+        migrations.AddField(
+            model_name="pastprojectsynclog",
+            name="sheet_unchanged",
+            field=models.BooleanField(
+                default=False, help_text="The sheet matched the last sync, so no rows were compared or written."
+            ),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="sync_fingerprint",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Digest of the sheet row last synced into this project; cleared when the project is edited.",
+                max_length=64,
+            ),
+        ),
+        migrations.RunPython(restore_sqlite_search_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+import apps.projects.models.project_import_run
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0013_sheet_sync_fingerprints"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectImportRun",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True, db_index=True)),
+                (
+                    "csv_file",
+                    models.FileField(blank=True, upload_to=apps.projects.models.project_import_run._import_upload_to),
+                ),
+                ("filename", models.CharField(max_length=255)),
+                ("dry_run", models.BooleanField(default=False)),
+                ("publish", models.BooleanField(default=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "Queued"),
+                            ("running", "Running"),
+                            ("success", "Success"),
+                            ("failed", "Failed"),
+                        ],
+                        db_index=True,
+                        default="queued",
+                        max_length=10,
+                    ),
+                ),
+                ("rows_read", models.PositiveIntegerField(default=0)),
+                ("projects_created", models.PositiveIntegerField(default=0)),
+                ("rows_skipped", models.PositiveIntegerField(default=0)),
+                ("semesters_created", models.PositiveIntegerField(default=0)),
+                ("errors", models.JSONField(blank=True, default=list, help_text="The first row errors of the import.")),
+                ("error_count", models.PositiveIntegerField(default=0)),
+                ("error_message", models.TextField(blank=True, default="")),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Project CSV Import",
+                "verbose_name_plural": "Project CSV Imports",
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
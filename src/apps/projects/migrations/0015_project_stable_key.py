@@ -0,0 +1,49 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.projects.services.share_keys import project_stable_key
+
+
+def backfill_stable_keys(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectStableKey = apps.get_model("projects", "ProjectStableKey")
+    projects = Project.objects.select_related("semester").only(
+        "pk", "class_code", "team_number", "semester__year", "semester__season"
+    )
+    ProjectStableKey.objects.bulk_create(
+        (
+            ProjectStableKey(project_id=project.pk, stable_key=project_stable_key(project))
+            for project in projects.iterator(chunk_size=2000)
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0014_project_import_run"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectStableKey",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stable_key",
+                        serialize=False,
+                        to="projects.project",
+                    ),
+                ),
+                ("stable_key", models.CharField(db_index=True, max_length=120)),
+            ],
+            options={
+                "verbose_name": "Project Stable Key",
+                "verbose_name_plural": "Project Stable Keys",
+            },
+        ),
+        migrations.RunPython(backfill_stable_keys, migrations.RunPython.noop),
+    ]
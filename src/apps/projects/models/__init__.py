@@ -2,6 +2,10 @@ from .past_project_share import PastProjectShare
 from .past_project_sync_log import PastProjectSyncLog
 from .past_projects_sheet_config import PastProjectsSheetConfig
 from .project import Project
+from .project_import_run import ProjectImportRun
+from .project_similarity import ProjectSimilarity
+from .project_stable_key import ProjectStableKey
+from .project_tombstone import ProjectTombstone
 from .semester import Semester
 
 __all__ = [
@@ -9,5 +13,9 @@ __all__ = [
     "PastProjectSyncLog",
     "PastProjectsSheetConfig",
     "Project",
+    "ProjectImportRun",
+    "ProjectSimilarity",
+    "ProjectStableKey",
+    "ProjectTombstone",
     "Semester",
 ]
@@ -25,6 +25,12 @@ class PastProjectSyncLog(ProjectControlModel):
     projects_deleted = models.PositiveIntegerField(default=0)
     semesters_touched = models.PositiveIntegerField(default=0)
     rows_skipped = models.PositiveIntegerField(default=0)
+    rows_unchanged = models.PositiveIntegerField(default=0, help_text="Rows whose fingerprint matched the project.")
+    fields_updated = models.PositiveIntegerField(default=0, help_text="Columns changed across updated projects.")
+    sheet_unchanged = models.BooleanField(
+        default=False, help_text="The sheet matched the last sync, so no rows were compared or written."
+    )
+    duration_ms = models.PositiveIntegerField(default=0)
     error_message = models.TextField(blank=True, default="")
 
     class Meta:
@@ -41,6 +41,13 @@ class PastProjectsSheetConfig(ActiveModel, ProjectControlModel):
     last_synced_at = models.DateTimeField(null=True, blank=True, editable=False)
     sync_error = models.TextField(blank=True, default="")
     sync_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="Projects Synced (last run)")
+    sheet_digest = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Digest of the sheet contents last synced; a sync of an identical sheet is skipped.",
+    )
 
     class Meta:
         verbose_name = "Project Resource"
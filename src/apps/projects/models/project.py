@@ -29,6 +29,13 @@ class Project(ProjectControlModel):
             "manual/CSV rows are never touched by the sync."
         ),
     )
+    sync_fingerprint = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Digest of the sheet row last synced into this project; cleared when the project is edited.",
+    )
 
     class Meta:
         ordering = ["semester", "class_code", "team_number"]
@@ -0,0 +1,43 @@
+from django.db import models
+
+from apps.core.models import ProjectControlModel
+
+
+def _import_upload_to(instance, filename):
+    return f"project_imports/{instance.id}/{filename}"
+
+
+class ProjectImportRun(ProjectControlModel):
+    """A CSV project import too large for the admin request, run in the background.
+
+    The uploaded file is stored until the run finishes; the counters are
+    updated after every chunk so the admin list shows progress.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        SUCCESS = "success", "Success"
+        FAILED = "failed", "Failed"
+
+    csv_file = models.FileField(upload_to=_import_upload_to, blank=True)
+    filename = models.CharField(max_length=255)
+    dry_run = models.BooleanField(default=False)
+    publish = models.BooleanField(default=False)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.QUEUED, db_index=True)
+    rows_read = models.PositiveIntegerField(default=0)
+    projects_created = models.PositiveIntegerField(default=0)
+    rows_skipped = models.PositiveIntegerField(default=0)
+    semesters_created = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True, help_text="The first row errors of the import.")
+    error_count = models.PositiveIntegerField(default=0)
+    error_message = models.TextField(blank=True, default="")
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Project CSV Import"
+        verbose_name_plural = "Project CSV Imports"
+
+    def __str__(self):
+        return f"{self.filename} — {self.get_status_display()}"
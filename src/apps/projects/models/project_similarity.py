@@ -0,0 +1,25 @@
+from django.db import models
+
+
+class ProjectSimilarity(models.Model):
+    """One precomputed "similar project" neighbour, rebuilt wholesale by the similarity index.
+
+    Rows are derived data: ``apps.projects.services.similarity`` replaces the
+    whole table after the sheet sync and the CSV import change the catalog.
+    """
+
+    project = models.ForeignKey("projects.Project", on_delete=models.CASCADE, related_name="similar_links")
+    similar = models.ForeignKey("projects.Project", on_delete=models.CASCADE, related_name="+")
+    rank = models.PositiveSmallIntegerField(help_text="1 for the closest neighbour.")
+    score = models.FloatField(help_text="Cosine similarity of the two projects' TF-IDF vectors (0–1).")
+
+    class Meta:
+        ordering = ["project", "rank"]
+        verbose_name = "Project Similarity"
+        verbose_name_plural = "Project Similarities"
+        constraints = [
+            models.UniqueConstraint(fields=["project", "rank"], name="projects_similarity_unique_rank"),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} → {self.similar_id} ({self.score:.3f})"
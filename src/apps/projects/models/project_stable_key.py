@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class ProjectStableKey(models.Model):
+    """A project's normalized Year-Semester + Class + Team# key, for resolving saved share rows.
+
+    Rows are derived data maintained by ``apps.projects.services.share_keys``:
+    project and semester saves refresh them through the signals, and the sheet
+    sync and the CSV import refresh the projects they bulk-create.
+    """
+
+    project = models.OneToOneField(
+        "projects.Project", on_delete=models.CASCADE, primary_key=True, related_name="stable_key"
+    )
+    stable_key = models.CharField(max_length=120, db_index=True)
+
+    class Meta:
+        verbose_name = "Project Stable Key"
+        verbose_name_plural = "Project Stable Keys"
+
+    def __str__(self):
+        return self.stable_key
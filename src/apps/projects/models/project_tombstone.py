@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class ProjectTombstone(models.Model):
+    """Records a deleted project so ``/projects/past-all/?since=`` can report it.
+
+    Written by the ``post_delete`` signal; tombstones older than
+    ``apps.projects.services.catalog.TOMBSTONE_RETENTION`` are pruned when the
+    full catalog payload is rebuilt.
+    """
+
+    project_id = models.UUIDField(db_index=True)
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ["deleted_at"]
+        verbose_name = "Project Tombstone"
+        verbose_name_plural = "Project Tombstones"
+
+    def __str__(self):
+        return f"{self.project_id} (deleted {self.deleted_at:%Y-%m-%d %H:%M})"
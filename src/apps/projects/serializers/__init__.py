@@ -7,10 +7,13 @@ from .past_project_share import (
 )
 from .project import (
     CompactPastProjectSerializer,
+    PastProjectDeltaQuerySerializer,
     PastProjectQuerySerializer,
     ProjectDetailSerializer,
+    ProjectFacetQuerySerializer,
     ProjectListSerializer,
     ProjectTableSerializer,
+    SimilarProjectSerializer,
 )
 from .semester import SemesterWithFullProjectsSerializer, SemesterWithProjectsSerializer
 
@@ -21,10 +24,13 @@ __all__ = [
     "PastProjectShareSerializer",
     "StalePastProjectShareSnapshot",
     "CompactPastProjectSerializer",
+    "PastProjectDeltaQuerySerializer",
     "PastProjectQuerySerializer",
     "ProjectDetailSerializer",
+    "ProjectFacetQuerySerializer",
     "ProjectListSerializer",
     "ProjectTableSerializer",
+    "SimilarProjectSerializer",
     "SemesterWithFullProjectsSerializer",
     "SemesterWithProjectsSerializer",
 ]
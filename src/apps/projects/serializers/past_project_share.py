@@ -8,7 +8,8 @@ from django.db.models import F
 from django.utils import timezone
 from rest_framework import serializers
 
-from ..models import PastProjectShare, Project
+from ..models import PastProjectShare
+from ..services.share_keys import resolve_stable_keys, share_row_stable_key
 
 # When the user does not name a curation, derive one from its content (the email request: "is the
 # name necessary? … or just a default e.g. the first N characters of the curation").
@@ -68,74 +69,16 @@ def _default_share_name(note: str, rows) -> str:
     return candidate
 
 
-def _normalized_text_key(value):
-    return re.sub(r"\s+", " ", str(value or "").strip()).casefold()
-
-
-def _semester_label_key(value):
-    label = (value or "").strip()
-    if not label:
-        return None
-
-    match = re.fullmatch(r"(\d{4})(?:-\d+)?\s+(.+)", label)
-    if not match:
-        return None
-
-    year, season_name = match.groups()
-    normalized_season = _normalized_text_key(season_name)
-    if not normalized_season:
-        return None
-    return year, normalized_season
-
-
-def _share_row_stable_key(row):
-    semester_label = (row.get("semester_label") or "").strip()
-    class_code = (row.get("class_code") or "").strip()
-    team_number = (row.get("team_number") or "").strip()
-    if not semester_label or not class_code or not team_number:
-        return None
-
-    semester_key = _semester_label_key(semester_label)
-    if semester_key is None:
-        return None
-    year, season_name = semester_key
-    return year, season_name, class_code, team_number
-
-
-def _project_stable_key(project):
-    return (
-        str(project.semester.year),
-        _normalized_text_key(project.semester.get_season_display()),
-        project.class_code.strip(),
-        project.team_number.strip(),
-    )
-
-
 def _rows_with_backfilled_project_ids(rows):
     """Add Project UUIDs to legacy share rows when their stable sheet key still resolves.
 
     Older saved-share JSON snapshots did not include ``id``. The frontend intentionally omits
     Individual Links for rows without an id, so enrich API output from the canonical
     Year-Semester + Class + Team# key when possible without mutating the stored snapshot.
+    All missing keys are resolved in one query against the stable-key index.
     """
-    missing_keys = {key for row in rows if not row.get("id") for key in [_share_row_stable_key(row)] if key is not None}
-    if not missing_keys:
-        return rows
-
-    years = {int(key[0]) for key in missing_keys}
-    class_codes = {key[2] for key in missing_keys}
-    team_numbers = {key[3] for key in missing_keys}
-    project_ids_by_key = {}
-    projects = (
-        Project.objects.select_related("semester")
-        .filter(semester__year__in=years, class_code__in=class_codes, team_number__in=team_numbers)
-        .order_by("-source", "pk")
-    )
-    for project in projects:
-        key = _project_stable_key(project)
-        if key in missing_keys and key not in project_ids_by_key:
-            project_ids_by_key[key] = str(project.pk)
-
+    missing_keys = {key for row in rows if not row.get("id") for key in [share_row_stable_key(row)] if key is not None}
+    project_ids_by_key = resolve_stable_keys(missing_keys)
     if not project_ids_by_key:
         return rows
 
@@ -143,8 +86,7 @@ def _rows_with_backfilled_project_ids(rows):
     for row in rows:
         next_row = dict(row)
         if not next_row.get("id"):
-            key = _share_row_stable_key(next_row)
-            project_id = project_ids_by_key.get(key)
+            project_id = project_ids_by_key.get(share_row_stable_key(next_row))
             if project_id:
                 next_row["id"] = project_id
         enriched_rows.append(next_row)
@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from ..models import Project
+from ..models import Project, ProjectSimilarity
 
 
 class ProjectListSerializer(serializers.ModelSerializer):
@@ -44,6 +44,14 @@ class PastProjectQuerySerializer(serializers.Serializer):
         return attrs
 
 
+class ProjectFacetQuerySerializer(serializers.Serializer):
+    search = serializers.CharField(required=False, allow_blank=True, max_length=200, trim_whitespace=True)
+
+
+class PastProjectDeltaQuerySerializer(serializers.Serializer):
+    since = serializers.IntegerField(min_value=0)
+
+
 class ProjectTableSerializer(serializers.ModelSerializer):
     """Serializer with all fields needed for project data tables."""
 
@@ -86,3 +94,30 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
             "presentation_order",
             "semester_label",
         ]
+
+
+class SimilarProjectSerializer(serializers.ModelSerializer):
+    """A neighbour from the similar-projects table, flattened with its similarity score."""
+
+    id = serializers.UUIDField(source="similar.id", read_only=True)
+    semester_label = serializers.CharField(source="similar.semester.label", read_only=True)
+    class_code = serializers.CharField(source="similar.class_code", read_only=True)
+    team_number = serializers.CharField(source="similar.team_number", read_only=True)
+    team_name = serializers.CharField(source="similar.team_name", read_only=True)
+    project_title = serializers.CharField(source="similar.project_title", read_only=True)
+    organization = serializers.CharField(source="similar.organization", read_only=True)
+    industry = serializers.CharField(source="similar.industry", read_only=True)
+
+    class Meta:
+        model = ProjectSimilarity
+        fields = [
+            "id",
+            "semester_label",
+            "class_code",
+            "team_number",
+            "team_name",
+            "project_title",
+            "organization",
+            "industry",
+            "score",
+        ]
@@ -1,9 +1,9 @@
 import json
 import logging
 import re
-from collections.abc import Iterable
+from uuid import UUID
 
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 
 from apps.core.models import AWSCredentialConfig
 from apps.core.services.bedrock import BedrockError, normalize_bedrock_model_id
@@ -11,11 +11,14 @@ from apps.projects.models import Project
 from apps.system_intelligence.models import SystemIntelligenceConfig
 from apps.system_intelligence.services.agents import run_tool_free_agent
 
+from . import result_cache
+from .ranking import rank_past_projects
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_AI_SEARCH_LIMIT = 10
 MAX_AI_SEARCH_LIMIT = 10
-_CANDIDATE_LIMIT = 80
+_CANDIDATE_LIMIT = 25
 _TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.&/-]*", re.IGNORECASE)
 _STOP_WORDS = {
     "a",
@@ -59,28 +62,27 @@ def _tokens(query: str) -> list[str]:
     return tokens
 
 
-def _candidate_filter(tokens: Iterable[str]) -> Q:
-    query = Q()
-    for token in tokens:
-        query |= Q(project_title__icontains=token)
-        query |= Q(organization__icontains=token)
-        query |= Q(industry__icontains=token)
-        query |= Q(class_code__icontains=token)
-        query |= Q(team_number__icontains=token)
-        query |= Q(team_name__icontains=token)
-        query |= Q(abstract__icontains=token)
-        query |= Q(student_names__icontains=token)
-    return query
+def ai_search_cache_key(query: str, *, limit: int, model_id: str) -> str:
+    """Result-cache key shared by every query with the same tokens, limit, catalog revision and model."""
+    limit = min(max(1, limit), MAX_AI_SEARCH_LIMIT)
+    return result_cache.cache_key(_tokens(query), limit=limit, model_id=model_id)
 
 
 def find_ai_search_candidates(query: str, *, candidate_limit: int = _CANDIDATE_LIMIT) -> list[Project]:
+    """The best BM25 matches for ``query``, best first, each with its ``search_score``."""
     tokens = _tokens(query)
     if not tokens:
         return []
-    project_filter = _candidate_filter(tokens)
-    if not project_filter:
-        return []
-    return list(past_project_ai_queryset().filter(project_filter).distinct()[:candidate_limit])
+    queryset = past_project_ai_queryset()
+    ranked = rank_past_projects(queryset, " ".join(tokens), limit=candidate_limit)
+    projects = queryset.in_bulk([project_id for project_id, _score in ranked])
+    candidates = []
+    for project_id, score in ranked:
+        # A project removed since the index was built is simply skipped.
+        if project := projects.get(UUID(project_id)):
+            project.search_score = score
+            candidates.append(project)
+    return candidates
 
 
 def _candidate_line(project: Project) -> str:
@@ -89,6 +91,7 @@ def _candidate_line(project: Project) -> str:
         abstract = abstract[:420].rstrip() + "..."
     parts = [
         f"id={project.id}",
+        f"score={project.search_score:.2f}",
         f"title={project.project_title}",
         f"semester={project.semester.label}",
         f"class={project.class_code}",
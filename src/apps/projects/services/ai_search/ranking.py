@@ -0,0 +1,153 @@
+"""In-process BM25 ranking of published past projects for AI search.
+
+AI search sends the model a short list of candidates to choose from, so that
+list should hold the best lexical matches in the whole archive rather than the
+first database matches in catalog order. :class:`LexicalIndex` is a compact
+inverted index: one posting list per term, stored as parallel ``array``
+buffers of document positions and precomputed BM25 term weights, so ranking a
+query is a sum over a few posting lists with no per-query normalisation work.
+
+Fields are weighted BM25F-style by repeating their term frequencies: a word in
+the title counts more than one in the organization or team name, which counts
+more than one in the abstract. Query words also match as prefixes
+(``forecast`` matches "forecasting"), scored a little below exact matches.
+
+:func:`rank_past_projects` keeps one index per process and rebuilds it when the
+project archive changes: the catalog revision bumped after every project or
+semester write, the sheet sync and the CSV import, together with the row count
+and latest ``updated_at`` of the published catalog.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Sequence
+
+from django.db.models import Count, Max
+
+from apps.projects.services.catalog import catalog_revision
+from apps.projects.services.search import search_words, text_terms
+
+# Term-frequency multipliers per field.
+FIELD_WEIGHTS = {
+    "project_title": 3.0,
+    "organization": 2.0,
+    "industry": 2.0,
+    "team_name": 2.0,
+    "class_code": 1.0,
+    "team_number": 1.0,
+    "abstract": 1.0,
+    "student_names": 1.0,
+}
+BM25_K1 = 1.2
+BM25_B = 0.75
+PREFIX_MATCH_WEIGHT = 0.8
+_MIN_PREFIX_LENGTH = 3
+
+_lock = threading.Lock()
+_current: dict = {"key": None, "index": None}
+
+
+class LexicalIndex:
+    """BM25 scores over a fixed set of documents given as ``(doc_id, {field: text})``."""
+
+    def __init__(self, documents: Iterable[tuple[str, dict[str, str]]]):
+        self.doc_ids: list[str] = []
+        frequencies: list[Counter] = []
+        for doc_id, fields in documents:
+            counts: Counter = Counter()
+            for field, weight in FIELD_WEIGHTS.items():
+                for term in text_terms(fields.get(field) or ""):
+                    counts[term] += weight
+            self.doc_ids.append(doc_id)
+            frequencies.append(counts)
+
+        lengths = [sum(counts.values()) for counts in frequencies]
+        average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        postings: dict[str, tuple[array, array]] = {}
+        for position, (counts, length) in enumerate(zip(frequencies, lengths, strict=True)):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length) if average_length else BM25_K1
+            for term, frequency in counts.items():
+                positions, weights = postings.setdefault(term, (array("I"), array("d")))
+                positions.append(position)
+                weights.append(frequency * (BM25_K1 + 1) / (frequency + norm))
+
+        total = len(self.doc_ids)
+        self._postings = postings
+        self._idf = {
+            term: math.log(1 + (total - len(positions) + 0.5) / (len(positions) + 0.5))
+            for term, (positions, _weights) in postings.items()
+        }
+        self._vocabulary = sorted(postings)
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def _expansions(self, word: str) -> list[tuple[str, float]]:
+        expansions = [(word, 1.0)] if word in self._postings else []
+        if len(word) >= _MIN_PREFIX_LENGTH:
+            start = bisect_left(self._vocabulary, word)
+            for term in self._vocabulary[start:]:
+                if not term.startswith(word):
+                    break
+                if term != word:
+                    expansions.append((term, PREFIX_MATCH_WEIGHT))
+        return expansions
+
+    def rank(self, words: Sequence[str], limit: int) -> list[tuple[str, float]]:
+        """The ``limit`` best ``(doc_id, score)`` pairs for ``words``, any of which may match."""
+        scores: dict[int, float] = {}
+        for word in words:
+            # A document scores once per query word, through its best-matching term.
+            best: dict[int, float] = {}
+            for term, factor in self._expansions(word):
+                positions, weights = self._postings[term]
+                idf = self._idf[term] * factor
+                for position, weight in zip(positions, weights, strict=True):
+                    score = idf * weight
+                    if score > best.get(position, 0.0):
+                        best[position] = score
+            for position, score in best.items():
+                scores[position] = scores.get(position, 0.0) + score
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.doc_ids[position], score) for position, score in ranked]
+
+
+def _catalog_key(queryset) -> tuple:
+    stats = queryset.aggregate(
+        count=Count("pk"), updated=Max("updated_at"), semester_updated=Max("semester__updated_at")
+    )
+    return catalog_revision(), stats["count"], stats["updated"], stats["semester_updated"]
+
+
+def past_project_index(queryset) -> LexicalIndex:
+    """The process-wide index of ``queryset`` (published past projects), rebuilt when it changes."""
+    key = _catalog_key(queryset)
+    index = _current["index"]
+    if _current["key"] == key and index is not None:
+        return index
+    with _lock:
+        if _current["key"] != key or _current["index"] is None:
+            fields = tuple(FIELD_WEIGHTS)
+            rows = queryset.order_by().values_list("pk", *fields)
+            _current["index"] = LexicalIndex((str(row[0]), dict(zip(fields, row[1:], strict=True))) for row in rows)
+            _current["key"] = key
+        return _current["index"]
+
+
+def rank_past_projects(queryset, query: str, *, limit: int) -> list[tuple[str, float]]:
+    """The ``limit`` best ``(project_id, score)`` matches for ``query`` among ``queryset``."""
+    words = search_words(query)
+    if not words:
+        return []
+    return past_project_index(queryset).rank(words, limit)
+
+
+def clear_past_project_index() -> None:
+    with _lock:
+        _current.update(key=None, index=None)
@@ -0,0 +1,53 @@
+"""Shared cache of AI search answers for repeated queries.
+
+Popular searches ("machine learning", "agriculture") repeat often, and every
+model call costs latency, Bedrock tokens and the visitor's token budget. An
+answer is reusable while the same question is asked of the same catalog by
+the same model, so entries are keyed by the query's normalized token set
+(case, word order, punctuation and stop words do not matter), the result
+limit, the catalog revision and the model ID. A catalog change therefore
+retires every cached answer without any explicit invalidation.
+
+Answers are kept for ``PROJECT_AI_SEARCH_CACHE_TTL`` seconds; empty answers
+are cached too, for the shorter ``PROJECT_AI_SEARCH_NEGATIVE_CACHE_TTL``, so a
+burst of a query with no matches does not reach the model either. Errors are
+never cached. Each entry remembers the tokens its model call spent, which a
+hit reports as saved.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.projects.services.catalog import catalog_revision
+
+_KEY_PREFIX = "projects:ai-search:"
+
+
+def cache_key(tokens: list[str], *, limit: int, model_id: str) -> str:
+    """Cache key of an answer to the query with these normalized ``tokens``."""
+    identity = json.dumps([sorted(set(tokens)), limit, catalog_revision(), model_id], separators=(",", ":"))
+    return _KEY_PREFIX + hashlib.sha256(identity.encode()).hexdigest()
+
+
+def cached_answer(key: str) -> dict | None:
+    """The cached ``{"project_ids": [...], "total_tokens": n}`` answer, if any."""
+    if settings.PROJECT_AI_SEARCH_CACHE_TTL <= 0:
+        return None
+    return cache.get(key)
+
+
+def store_answer(key: str, *, project_ids: list[str], usage: dict) -> None:
+    """Cache a successful answer; empty answers expire sooner."""
+    timeout = settings.PROJECT_AI_SEARCH_CACHE_TTL if project_ids else settings.PROJECT_AI_SEARCH_NEGATIVE_CACHE_TTL
+    if settings.PROJECT_AI_SEARCH_CACHE_TTL <= 0 or timeout <= 0:
+        return
+    cache.set(
+        key,
+        {"project_ids": list(project_ids), "total_tokens": int((usage or {}).get("totalTokens") or 0)},
+        timeout=timeout,
+    )
@@ -0,0 +1,118 @@
+"""Revision counter of the past-project catalog.
+
+Every change to projects or semesters (admin edits, the sheet sync, the CSV
+import) bumps one shared counter after commit, through
+``apps.projects.signals._clear_project_caches``. Anything derived from the
+catalog (the AI search ranking index, cached AI search answers) keys on the
+current revision instead of tracking writes itself.
+
+The counter lives in the cache and only says *that* the catalog changed. For
+clients that keep their own copy, :func:`catalog_watermark` is a durable
+revision read from the database: the newest ``updated_at`` of any project or
+semester, or ``deleted_at`` of any :class:`~apps.projects.models.ProjectTombstone`,
+in microseconds since the epoch. :func:`catalog_changes` answers "what changed
+after watermark N" from the same columns.
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
+
+from django.core.cache import cache
+from django.db.models import Max, Q, QuerySet
+from django.utils import timezone
+
+CATALOG_REVISION_KEY = "projects:archive-version"
+# A row's timestamp is taken before its transaction commits. Writes are assumed
+# to commit within this long, so the watermark never claims a moment more recent
+# than this: a write stamped earlier but committed later is still reported by
+# the next delta. Re-sending a row the client already has is harmless.
+DELTA_OVERLAP = timedelta(seconds=5)
+TOMBSTONE_RETENTION = timedelta(days=30)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _seed() -> int:
+    # Seeded from the clock so a counter lost to eviction or a cache flush
+    # never restarts at a revision that older cache entries were keyed on.
+    return time.time_ns() // 1000
+
+
+def catalog_revision() -> int:
+    """The current catalog revision."""
+    revision = cache.get(CATALOG_REVISION_KEY)
+    if revision is None:
+        cache.add(CATALOG_REVISION_KEY, _seed(), timeout=None)
+        revision = cache.get(CATALOG_REVISION_KEY)
+    return revision
+
+
+def bump_catalog_revision() -> int:
+    """Advance the catalog revision and return the new value."""
+    try:
+        return cache.incr(CATALOG_REVISION_KEY)
+    except ValueError:
+        # No counter yet: start one, unless a concurrent bump just did.
+        if cache.add(CATALOG_REVISION_KEY, _seed(), timeout=None):
+            return cache.get(CATALOG_REVISION_KEY)
+        return cache.incr(CATALOG_REVISION_KEY)
+
+
+def revision_from_datetime(moment: datetime | None) -> int:
+    """``moment`` as a watermark: microseconds since the epoch (0 for ``None``)."""
+    if moment is None:
+        return 0
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+
+def datetime_from_revision(revision: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=revision)
+
+
+def catalog_watermark() -> int:
+    """Revision of the catalog as stored: its latest project, semester or deletion timestamp.
+
+    Capped at :data:`DELTA_OVERLAP` ago, so every change stamped at or before
+    the returned revision is already visible.
+    """
+    from apps.projects.models import Project, ProjectTombstone, Semester
+
+    moments = [
+        Project.objects.aggregate(latest=Max("updated_at"))["latest"],
+        Semester.objects.aggregate(latest=Max("updated_at"))["latest"],
+        ProjectTombstone.objects.aggregate(latest=Max("deleted_at"))["latest"],
+    ]
+    latest = max(revision_from_datetime(moment) for moment in moments)
+    return min(latest, revision_from_datetime(timezone.now() - DELTA_OVERLAP))
+
+
+class CatalogChanges(NamedTuple):
+    """Published projects written after a watermark, and IDs of projects no longer public."""
+
+    changed: QuerySet
+    deleted: list[str]
+
+
+def catalog_changes(since: int) -> CatalogChanges | None:
+    """Projects changed and removed after watermark ``since``; ``None`` when it predates the tombstones."""
+    from apps.projects.models import Project, ProjectTombstone
+
+    if datetime_from_revision(since) < timezone.now() - TOMBSTONE_RETENTION:
+        return None
+    cutoff = datetime_from_revision(since)
+    touched = Q(updated_at__gt=cutoff) | Q(semester__updated_at__gt=cutoff)
+    changed = Project.objects.filter(touched, semester__is_published=True)
+    # Projects in an unpublished semester are gone as far as public clients are concerned.
+    hidden = Project.objects.filter(touched, semester__is_published=False).values_list("pk", flat=True)
+    removed = ProjectTombstone.objects.filter(deleted_at__gt=cutoff).values_list("project_id", flat=True)
+    deleted = sorted({str(pk) for pk in hidden} | {str(pk) for pk in removed})
+    return CatalogChanges(changed=changed, deleted=deleted)
+
+
+def prune_tombstones() -> int:
+    """Delete tombstones no delta can still ask for; returns how many were removed."""
+    from apps.projects.models import ProjectTombstone
+
+    deleted, _ = ProjectTombstone.objects.filter(deleted_at__lt=timezone.now() - TOMBSTONE_RETENTION).delete()
+    return deleted
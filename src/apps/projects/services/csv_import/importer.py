@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.projects.models import Project, Semester
+from apps.projects.services.share_keys import index_new_projects
+from apps.projects.services.similarity import schedule_similarity_refresh
+
+from .reader import CSVRow, importable_semester_keys, iter_csv_rows, open_csv_text
+
+IMPORT_CHUNK_SIZE = 500
+
+ProjectKey = tuple[int, int, str, str]
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    skipped: int = 0
+    errors: list[str] = field(default_factory=list)
+    rows_read: int = 0
+    semesters_created: int = 0
+
+
+def _existing_semesters(keys: set[tuple[int, int]]) -> dict[tuple[int, int], Semester]:
+    if not keys:
+        return {}
+    candidates = Semester.objects.filter(
+        year__in={year for year, _season in keys}, season__in={season for _year, season in keys}
+    )
+    return {
+        (semester.year, semester.season): semester
+        for semester in candidates
+        if (semester.year, semester.season) in keys
+    }
+
+
+def _existing_project_keys(semesters: dict[tuple[int, int], Semester]) -> set[ProjectKey]:
+    if not semesters:
+        return set()
+    key_by_pk = {semester.pk: key for key, semester in semesters.items()}
+    rows = Project.objects.filter(semester_id__in=key_by_pk).values_list("semester_id", "class_code", "team_number")
+    return {(*key_by_pk[semester_id], class_code, team_number) for semester_id, class_code, team_number in rows}
+
+
+def _create_semesters(semesters: dict[tuple[int, int], Semester], keys: set[tuple[int, int]]) -> int:
+    """Insert the semesters of ``keys`` missing from ``semesters`` and add them to it."""
+    missing = sorted(keys - semesters.keys())
+    if not missing:
+        return 0
+    new = [Semester(year=year, season=season) for year, season in missing]
+    for semester in new:
+        # bulk_create skips Semester.save(), which derives the label.
+        semester.label = f"{semester.year}-{semester.season} {semester.get_season_display()}"
+    Semester.objects.bulk_create(new, ignore_conflicts=True)
+    # A concurrent import may have created some of them; read back the stored rows.
+    semesters.update(_existing_semesters(set(missing)))
+    return len(missing)
+
+
+def _chunks(rows: Iterable[CSVRow | None], size: int) -> Iterator[tuple[list[CSVRow | None], bool]]:
+    """Yield ``(chunk, is_last)`` pairs of at most ``size`` rows."""
+    rows = iter(rows)
+    chunk = list(islice(rows, size))
+    while chunk:
+        following = list(islice(rows, size))
+        yield chunk, not following
+        chunk = following
+
+
+def import_projects_from_csv(
+    csv_file,
+    *,
+    dry_run: bool = False,
+    publish: bool = False,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    on_progress: Callable[[ImportResult], None] | None = None,
+) -> ImportResult:
+    """
+    Import projects from a CSV file (path string or file-like object).
+
+    The file is streamed in chunks of ``chunk_size`` rows. Semesters and the
+    existing (semester, class code, team number) keys are read once up front;
+    each chunk is then inserted with one ``bulk_create`` in its own
+    transaction, and ``on_progress`` is called with the running totals. The
+    first chunk also creates the missing semesters and the last one publishes
+    them, so a file that fits in one chunk is imported atomically. A failure in
+    a later chunk keeps the chunks before it; re-importing the file skips them
+    as duplicates.
+
+    Returns an ImportResult with created/skipped counts and error details.
+    """
+    result = ImportResult()
+    with open_csv_text(csv_file) as stream:
+        start = stream.tell()
+        semester_keys = importable_semester_keys(stream)
+        stream.seek(start)
+
+        semesters = _existing_semesters(semester_keys)
+        # Duplicate check: same semester + class_code + team_number, against
+        # both already-persisted rows and rows staged earlier in this import.
+        seen_keys = _existing_project_keys(semesters)
+        semesters_to_publish: set[tuple[int, int]] = set()
+
+        rows = iter_csv_rows(stream, result.errors)
+        for chunk, is_last in _chunks(rows, chunk_size):
+            staged: list[CSVRow] = []
+            for row in chunk:
+                result.rows_read += 1
+                if row is None:
+                    continue
+                year, season = row.semester_key
+                dup_key = (year, season, row.fields["class_code"], row.fields["team_number"])
+                if dup_key in seen_keys:
+                    result.skipped += 1
+                    continue
+                seen_keys.add(dup_key)
+                staged.append(row)
+                if publish:
+                    semesters_to_publish.add(row.semester_key)
+
+            if not dry_run:
+                _write_chunk(result, semesters, semester_keys, staged, semesters_to_publish if is_last else set())
+            result.created += len(staged)
+            if on_progress is not None:
+                on_progress(result)
+
+    if not dry_run and result.created:
+        transaction.on_commit(schedule_similarity_refresh)
+    return result
+
+
+def _write_chunk(
+    result: ImportResult,
+    semesters: dict[tuple[int, int], Semester],
+    semester_keys: set[tuple[int, int]],
+    staged: list[CSVRow],
+    semesters_to_publish: set[tuple[int, int]],
+) -> None:
+    from apps.projects.signals import _clear_project_caches
+
+    with transaction.atomic():
+        if semester_keys - semesters.keys():
+            result.semesters_created += _create_semesters(semesters, semester_keys)
+        created = Project.objects.bulk_create(
+            [Project(semester=semesters[row.semester_key], **row.fields) for row in staged]
+        )
+        index_new_projects(created)
+        if semesters_to_publish:
+            Semester.objects.filter(
+                pk__in=[semesters[key].pk for key in semesters_to_publish], is_published=False
+            ).update(is_published=True, updated_at=timezone.now())
+        if staged or semesters_to_publish:
+            # bulk_create and update() send no signals.
+            transaction.on_commit(_clear_project_caches)
@@ -0,0 +1,134 @@
+"""Streaming reader for the legacy "Project Resources" CSV export."""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+import re
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO, NamedTuple
+
+YEAR_SEMESTER_RE = re.compile(r"^(\d{4})-(\d)\s")
+
+# Map CSV column indices to Project field names.
+# Headers 8/9 are non-breaking spaces in the legacy export, so we use indices.
+FIELD_INDICES = {
+    1: "class_code",
+    2: "team_number",
+    3: "team_name",
+    4: "project_title",
+    5: "organization",
+    6: "industry",
+    8: "abstract",
+    9: "student_names",
+}
+
+# Uploads without a seekable binary stream are copied here first; larger files spill to disk.
+_SPOOL_MAX_BYTES = 1024 * 1024
+
+
+class CSVRow(NamedTuple):
+    line_no: int
+    semester_key: tuple[int, int]
+    fields: dict[str, str]
+
+
+def _parse_semester(value: str) -> tuple[int, int] | None:
+    """Parse a semester label without reading from or mutating the database."""
+    match = YEAR_SEMESTER_RE.match(value.strip())
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def _binary_stream(csv_file) -> IO[bytes] | None:
+    # Django's UploadedFile and FieldFile proxy the real stream through ``.file``.
+    stream = csv_file
+    while not isinstance(stream, io.IOBase) and hasattr(stream, "file"):
+        stream = stream.file
+    if isinstance(stream, io.IOBase) and stream.seekable() and not isinstance(stream, io.TextIOBase):
+        return stream
+    return None
+
+
+@contextmanager
+def open_csv_text(csv_file) -> Iterator[IO[str]]:
+    """A seekable text stream over a path, an upload, or a text/binary file-like object."""
+    if isinstance(csv_file, str | bytes | os.PathLike):
+        with open(csv_file, newline="", encoding="utf-8-sig") as fh:
+            yield fh
+        return
+    if isinstance(csv_file.read(0), str):
+        yield csv_file
+        return
+
+    stream = _binary_stream(csv_file)
+    spool = None
+    if stream is None:
+        spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
+        shutil.copyfileobj(csv_file, spool)
+        spool.seek(0)
+        stream = spool
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        yield text
+    finally:
+        # Leave the caller's file open; only a spool of our own is closed.
+        text.detach()
+        if spool is not None:
+            spool.close()
+
+
+def _records(stream: IO[str]) -> Iterator[tuple[int, list[str]]]:
+    reader = csv.reader(stream)
+    next(reader, None)  # skip header
+    yield from enumerate(reader, start=2)
+
+
+def importable_semester_keys(stream: IO[str]) -> set[tuple[int, int]]:
+    """Semesters of every row :func:`iter_csv_rows` would yield, without keeping the rows."""
+    keys = set()
+    for _line_no, row in _records(stream):
+        if len(row) < 5 or not row[4].strip():
+            continue
+        semester_key = _parse_semester(row[0])
+        if semester_key is not None:
+            keys.add(semester_key)
+    return keys
+
+
+def iter_csv_rows(stream: IO[str], errors: list[str]) -> Iterator[CSVRow | None]:
+    """Yield each data row of ``stream``: a :class:`CSVRow`, or ``None`` when it cannot be imported.
+
+    Unusable rows are reported in ``errors`` (blank and short rows silently).
+    """
+    for line_no, row in _records(stream):
+        if len(row) < 5:
+            yield None
+            continue
+
+        year_sem = row[0].strip()
+        if not year_sem:
+            yield None
+            continue
+
+        semester_key = _parse_semester(year_sem)
+        if semester_key is None:
+            errors.append(f"Row {line_no}: unparseable Year-Semester '{year_sem}'")
+            yield None
+            continue
+
+        fields = {}
+        for idx, field_name in FIELD_INDICES.items():
+            fields[field_name] = row[idx].strip() if idx < len(row) else ""
+
+        if not fields.get("project_title"):
+            errors.append(f"Row {line_no}: missing project_title, skipped")
+            yield None
+            continue
+
+        yield CSVRow(line_no, semester_key, fields)
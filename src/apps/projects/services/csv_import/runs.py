@@ -0,0 +1,122 @@
+"""Background CSV imports for files too large to import inside the admin request.
+
+The admin stores the upload on a :class:`~apps.projects.models.ProjectImportRun`
+and :func:`schedule_import_run` runs it as a durable ``projects.csv_import``
+job when the outbox is enabled and on a background thread otherwise. Counters
+on the run are updated after every chunk; the stored file is deleted once the
+run finishes.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+
+from apps.core.services.helpers.in_process import start_in_process_task
+
+from .importer import ImportResult, import_projects_from_csv
+
+logger = logging.getLogger(__name__)
+
+IMPORT_JOB_KIND = "projects.csv_import"
+# Row errors kept on the run; the rest are only counted.
+MAX_STORED_ERRORS = 100
+
+
+def background_import_threshold() -> int:
+    """Uploads of at least this many bytes are imported in the background."""
+    return int(getattr(settings, "PROJECT_CSV_BACKGROUND_IMPORT_BYTES", 1024 * 1024))
+
+
+def _progress_fields(result: ImportResult) -> dict:
+    return {
+        "rows_read": result.rows_read,
+        "projects_created": result.created,
+        "rows_skipped": result.skipped,
+        "semesters_created": result.semesters_created,
+        "errors": result.errors[:MAX_STORED_ERRORS],
+        "error_count": len(result.errors),
+        "updated_at": timezone.now(),
+    }
+
+
+def schedule_import_run(run) -> None:
+    """Start the import of a saved run; call after the run commits."""
+    from apps.core.services.background_jobs import enqueue_job, jobs_enabled
+
+    if jobs_enabled():
+        try:
+            enqueue_job(kind=IMPORT_JOB_KIND, dedupe_key=str(run.pk), payload={"run_id": str(run.pk)}, max_attempts=3)
+            return
+        except DatabaseError:
+            logger.exception("Could not queue project CSV import %s; importing in-process", run.pk)
+    start_in_process_task(execute_import_run, run.pk, name="project-csv-import", best_effort_start=True)
+
+
+def execute_import_run(run_id, *, retryable: bool = False) -> None:
+    """Import the file of one run, recording progress and the outcome on it.
+
+    With ``retryable`` a database error leaves the run queued and is raised for
+    the job to retry; otherwise every error fails the run.
+    """
+    from apps.projects.models import ProjectImportRun
+
+    run = ProjectImportRun.objects.filter(pk=run_id).first()
+    if run is None or run.status in (ProjectImportRun.Status.SUCCESS, ProjectImportRun.Status.FAILED):
+        return
+    runs = ProjectImportRun.objects.filter(pk=run.pk)
+    runs.update(status=ProjectImportRun.Status.RUNNING, error_message="", updated_at=timezone.now())
+
+    try:
+        with run.csv_file.open("rb") as csv_file:
+            result = import_projects_from_csv(
+                csv_file,
+                dry_run=run.dry_run,
+                publish=run.publish,
+                on_progress=lambda progress: runs.update(**_progress_fields(progress)),
+            )
+    except Exception as exc:
+        if retryable and isinstance(exc, DatabaseError):
+            # Chunks committed before the failure are skipped as duplicates on retry.
+            runs.update(status=ProjectImportRun.Status.QUEUED, updated_at=timezone.now())
+            raise
+        logger.exception("Project CSV import %s failed", run.pk)
+        runs.update(
+            status=ProjectImportRun.Status.FAILED,
+            error_message=str(exc)[:2000],
+            finished_at=timezone.now(),
+            updated_at=timezone.now(),
+        )
+        _delete_file(run)
+        return
+
+    runs.update(status=ProjectImportRun.Status.SUCCESS, finished_at=timezone.now(), **_progress_fields(result))
+    _delete_file(run)
+    logger.info(
+        "Project CSV import %s: %d created, %d skipped, %d errors",
+        run.pk,
+        result.created,
+        result.skipped,
+        len(result.errors),
+    )
+
+
+def _delete_file(run) -> None:
+    try:
+        run.csv_file.delete(save=False)
+    except OSError:
+        logger.warning("Could not delete the stored file of project CSV import %s", run.pk)
+    type(run).objects.filter(pk=run.pk).update(csv_file="")
+
+
+def import_projects_csv_job(job) -> None:
+    """Durable job handler for ``projects.csv_import``."""
+    from apps.core.services.background_jobs import TransientJobError
+
+    try:
+        execute_import_run((job.payload or {}).get("run_id"), retryable=True)
+    except DatabaseError as exc:
+        raise TransientJobError("The project CSV import could not be written.") from exc
@@ -0,0 +1,145 @@
+"""Facet counts for the past-project archive filters.
+
+The archive filters by year, season, semester and industry. Every facet is
+counted in a single grouped query over published projects joined to their
+semester, optionally narrowed to the matches of the active search:
+
+* PostgreSQL: one ``GROUP BY GROUPING SETS`` scan; ``GROUPING()`` tells which
+  facet each row counts.
+* Other databases: the four ``GROUP BY`` queries combined with ``UNION ALL``
+  into one statement.
+
+Results are cached per catalog revision and normalized search, so a catalog
+change retires them without explicit invalidation. With a search, every value
+of the unfiltered archive is listed, with a zero count when nothing matches,
+so the UI can grey out filters that would empty the list.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import CharField, Count, F, Value
+from django.db.models.functions import Cast
+
+from apps.projects.services.catalog import catalog_revision
+from apps.projects.services.search import search_projects, search_words
+
+FACETS = ("year", "season", "semester", "industry")
+FACETS_CACHE_TIMEOUT = 600
+_KEY_PREFIX = "projects:facets:"
+# GROUPING(year, season, label, industry) bitmasks: a set bit marks a column not grouped in that set.
+_GROUPING_SETS = {0b0111: "year", 0b1011: "season", 0b0001: "semester", 0b1110: "industry"}
+
+
+def normalize_search(search: str) -> str:
+    """The part of ``search`` that decides its matches: indexed words in any order, else the trimmed text."""
+    words = search_words(search)
+    return " ".join(sorted(words)) if words else " ".join((search or "").lower().split())
+
+
+def project_facets(search: str = "") -> dict:
+    """Facet counts for published projects, optionally limited to the matches of ``search``."""
+    normalized = normalize_search(search)
+    key = f"{_KEY_PREFIX}{catalog_revision()}:{hashlib.sha256(normalized.encode()).hexdigest()}"
+    facets = cache.get(key)
+    if facets is None:
+        facets = _build_facets(search, normalized)
+        cache.set(key, facets, timeout=FACETS_CACHE_TIMEOUT)
+    return facets
+
+
+def _build_facets(search: str, normalized: str) -> dict:
+    from apps.projects.models import Project, Semester
+
+    queryset = Project.objects.filter(semester__is_published=True)
+    if normalized:
+        queryset = search_projects(queryset, search)
+    counts = _grouped_counts(queryset)
+
+    if normalized:
+        # List every value the unfiltered archive offers, with zero where nothing matches.
+        for facet, values in project_facets()["facets"].items():
+            for entry in values:
+                counts[facet].setdefault(entry["value"], 0)
+
+    seasons = dict(Semester.Season.choices)
+    year_order = sorted(counts["year"], reverse=True)
+    semester_order = sorted(counts["semester"], key=_semester_sort_key, reverse=True)
+    return {
+        "search": normalized,
+        "total": sum(counts["year"].values()),
+        "facets": {
+            "year": [{"value": year, "count": counts["year"][year]} for year in year_order],
+            "season": [
+                {"value": season, "label": seasons.get(season, str(season)), "count": counts["season"][season]}
+                for season in sorted(counts["season"])
+            ],
+            "semester": [{"value": label, "count": counts["semester"][label]} for label in semester_order],
+            "industry": [
+                {"value": industry, "count": counts["industry"][industry]}
+                for industry in sorted(counts["industry"], key=str.casefold)
+            ],
+        },
+    }
+
+
+def _semester_sort_key(label: str) -> tuple:
+    # Labels are "<year>-<season> <name>", so year and season sort numerically.
+    year, _, rest = label.partition("-")
+    season = rest.split(" ", 1)[0]
+    return (int(year), int(season)) if year.isdigit() and season.isdigit() else (0, 0)
+
+
+def _grouped_counts(queryset) -> dict[str, dict]:
+    counts: dict[str, dict] = {facet: {} for facet in FACETS}
+    if connections[queryset.db].vendor == "postgresql":
+        rows = _grouping_sets_rows(queryset)
+    else:
+        rows = _union_rows(queryset)
+    for facet, value, count in rows:
+        if facet == "industry" and not value:
+            continue  # Projects without an industry are not a filter option.
+        if facet in ("year", "season"):
+            value = int(value)
+        counts[facet][value] = count
+    return counts
+
+
+def _grouping_sets_rows(queryset):
+    from apps.projects.models import Project, Semester
+
+    project_table = Project._meta.db_table
+    semester_table = Semester._meta.db_table
+    subquery, params = queryset.order_by().values("pk").query.sql_with_params()
+    sql = (
+        f"SELECT s.year, s.season, s.label, p.industry, GROUPING(s.year, s.season, s.label, p.industry), COUNT(*)"
+        f" FROM {project_table} p INNER JOIN {semester_table} s ON s.id = p.semester_id"
+        f" WHERE p.id IN ({subquery})"
+        f" GROUP BY GROUPING SETS ((s.year), (s.season), (s.year, s.season, s.label), (p.industry))"
+    )
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        for year, season, label, industry, grouping, count in cursor.fetchall():
+            facet = _GROUPING_SETS[grouping]
+            value = {"year": year, "season": season, "semester": label, "industry": industry}[facet]
+            yield facet, value, count
+
+
+def _union_rows(queryset):
+    base = queryset.order_by()
+    columns = {
+        "year": "semester__year",
+        "season": "semester__season",
+        "semester": "semester__label",
+        "industry": "industry",
+    }
+    grouped = [
+        base.values(facet=Value(facet, output_field=CharField()), value=Cast(F(column), CharField()))
+        .annotate(count=Count("pk"))
+        .values_list("facet", "value", "count")
+        for facet, column in columns.items()
+    ]
+    return grouped[0].union(*grouped[1:], all=True)
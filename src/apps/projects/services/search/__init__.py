@@ -0,0 +1,134 @@
+"""Full-text search over past projects, independent of the database backend.
+
+Every project has a search document the database keeps current on each write,
+including the bulk writes of the sheet sync and CSV import:
+
+* PostgreSQL: ``projects_project.search_document``, a weighted ``tsvector``
+  generated column (title, then organization and industry, then team and
+  class, then abstract and student names) with a GIN index, plus trigram
+  indexes on titles and organization names for near-miss spellings.
+* SQLite (development and tests): the ``projects_project_fts`` FTS5 shadow
+  table, filled by triggers.
+
+:func:`search_projects` narrows a project queryset to the matches of a search
+box query, every word matched as a prefix, and orders it by relevance. Queries
+without indexable words (single letters, punctuation, only stop words) and
+other database backends fall back to case-insensitive substring matching.
+"""
+
+from __future__ import annotations
+
+import re
+
+from django.db import connections
+from django.db.models import BooleanField, F, FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+
+SEARCH_RANK = "search_rank"
+SEARCH_FIELDS = (
+    "project_title",
+    "organization",
+    "industry",
+    "team_name",
+    "team_number",
+    "class_code",
+    "abstract",
+    "student_names",
+)
+FTS_TABLE = "projects_project_fts"
+_MAX_WORDS = 12
+_WORD_RE = re.compile(r"[^\W_]+")
+_STOP_WORDS = frozenset(
+    {"a", "an", "and", "are", "as", "at", "by", "for", "from", "in", "of", "on", "or", "the", "to", "with"}
+)
+# bm25() weights in FTS table column order: project_id (unindexed), title, organization, industry,
+# team name, class code, team number, abstract, student names.
+_FTS_WEIGHTS = "0, 10.0, 5.0, 5.0, 2.0, 2.0, 2.0, 1.0, 1.0"
+_fts_available: dict[str, bool] = {}
+
+
+def text_terms(text: str) -> list[str]:
+    """Lower-cased words of ``text`` in order, without stop words and single letters."""
+    return [
+        word
+        for word in _WORD_RE.findall((text or "").lower())
+        if word not in _STOP_WORDS and (len(word) > 1 or word.isdigit())
+    ]
+
+
+def search_words(text: str) -> list[str]:
+    """Lower-cased distinct words of ``text`` worth looking up in the index."""
+    return list(dict.fromkeys(text_terms(text)))[:_MAX_WORDS]
+
+
+def search_projects(queryset: QuerySet, text: str, *, match_all: bool = True) -> QuerySet:
+    """Filter ``queryset`` to projects matching ``text`` and order them by relevance.
+
+    With ``match_all`` every word must match (the archive search box);
+    otherwise any word does (candidate retrieval for AI search). The result is
+    annotated with ``search_rank`` (higher is better); ties keep the
+    queryset's own ordering.
+    """
+    words = search_words(text)
+    vendor = connections[queryset.db].vendor
+    if words and vendor == "postgresql":
+        ranked = _postgres_search(queryset, words, match_all)
+    elif words and vendor == "sqlite" and _has_fts_table(queryset.db):
+        ranked = _sqlite_search(queryset, words, match_all)
+    else:
+        terms = [text.strip()] if match_all or not words else words
+        ranked = queryset.filter(_substring_filter(terms)).annotate(**{SEARCH_RANK: Value(0.0)})
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return ranked.order_by(F(SEARCH_RANK).desc(), *ordering)
+
+
+def _substring_filter(terms) -> Q:
+    query = Q()
+    for term in terms:
+        for field in SEARCH_FIELDS:
+            query |= Q(**{f"{field}__icontains": term})
+    return query
+
+
+def _postgres_search(queryset: QuerySet, words: list[str], match_all: bool) -> QuerySet:
+    table = queryset.model._meta.db_table
+    tsquery = (" & " if match_all else " | ").join(f"{word}:*" for word in words)
+    phrase = " ".join(words)
+    match = RawSQL(
+        f"({table}.search_document @@ to_tsquery('english', %s)"
+        f" OR {table}.project_title %% %s OR {table}.organization %% %s)",
+        (tsquery, phrase, phrase),
+        output_field=BooleanField(),
+    )
+    rank = RawSQL(
+        f"(ts_rank_cd({table}.search_document, to_tsquery('english', %s))"
+        f" + GREATEST(similarity({table}.project_title, %s), similarity({table}.organization, %s)))",
+        (tsquery, phrase, phrase),
+        output_field=FloatField(),
+    )
+    return queryset.annotate(**{SEARCH_RANK: rank}).filter(match)
+
+
+def _sqlite_search(queryset: QuerySet, words: list[str], match_all: bool) -> QuerySet:
+    table = queryset.model._meta.db_table
+    fts_query = (" AND " if match_all else " OR ").join(f'"{word}"*' for word in words)
+    match = RawSQL(
+        f"{table}.id IN (SELECT project_id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)",
+        (fts_query,),
+        output_field=BooleanField(),
+    )
+    rank = RawSQL(
+        f"(SELECT -bm25({FTS_TABLE}, {_FTS_WEIGHTS}) FROM {FTS_TABLE}"
+        f" WHERE {FTS_TABLE} MATCH %s AND project_id = {table}.id)",
+        (fts_query,),
+        output_field=FloatField(),
+    )
+    return queryset.annotate(**{SEARCH_RANK: rank}).filter(match)
+
+
+def _has_fts_table(alias: str) -> bool:
+    """Whether the FTS5 shadow table exists (the SQLite build may lack FTS5)."""
+    if alias not in _fts_available:
+        with connections[alias].cursor() as cursor:
+            _fts_available[alias] = FTS_TABLE in connections[alias].introspection.table_names(cursor)
+    return _fts_available[alias]
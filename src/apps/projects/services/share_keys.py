@@ -0,0 +1,114 @@
+"""Stable-key index that resolves saved share rows to projects.
+
+Share rows saved before they carried a project ``id`` are matched to projects by
+their Year-Semester + Class + Team# key. :class:`~apps.projects.models.ProjectStableKey`
+stores that key, normalized, for every project, so all the rows of a share are
+resolved with one ``IN`` query. Project and semester saves refresh the index
+through ``apps.projects.signals``; the sheet sync and the CSV import, which
+write in bulk, call :func:`index_new_projects` for the projects they create.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Collection, Iterable
+
+# Keeps each ``IN (...)`` below SQLite's bound-parameter limit.
+REFRESH_BATCH_SIZE = 500
+
+
+def _normalized_text_key(value):
+    return re.sub(r"\s+", " ", str(value or "").strip()).casefold()
+
+
+def _semester_label_key(value):
+    label = (value or "").strip()
+    if not label:
+        return None
+
+    match = re.fullmatch(r"(\d{4})(?:-\d+)?\s+(.+)", label)
+    if not match:
+        return None
+
+    year, season_name = match.groups()
+    normalized_season = _normalized_text_key(season_name)
+    if not normalized_season:
+        return None
+    return year, normalized_season
+
+
+def _encode(year, season_name, class_code, team_number) -> str:
+    return json.dumps([str(year), season_name, class_code, team_number], ensure_ascii=False)
+
+
+def share_row_stable_key(row) -> str | None:
+    """The index key of a saved share row, or ``None`` when the row lacks part of it."""
+    semester_label = (row.get("semester_label") or "").strip()
+    class_code = (row.get("class_code") or "").strip()
+    team_number = (row.get("team_number") or "").strip()
+    if not semester_label or not class_code or not team_number:
+        return None
+
+    semester_key = _semester_label_key(semester_label)
+    if semester_key is None:
+        return None
+    year, season_name = semester_key
+    return _encode(year, season_name, class_code, team_number)
+
+
+def project_stable_key(project) -> str:
+    """The index key of a project (its semester must be loaded)."""
+    return _encode(
+        project.semester.year,
+        _normalized_text_key(project.semester.get_season_display()),
+        project.class_code.strip(),
+        project.team_number.strip(),
+    )
+
+
+def refresh_stable_keys(project_ids: Iterable) -> None:
+    """Rewrite the index rows of ``project_ids``; IDs of deleted projects are dropped."""
+    from apps.projects.models import Project, ProjectStableKey
+
+    project_ids = list(project_ids)
+    for start in range(0, len(project_ids), REFRESH_BATCH_SIZE):
+        batch = project_ids[start : start + REFRESH_BATCH_SIZE]
+        projects = (
+            Project.objects.filter(pk__in=batch)
+            .select_related("semester")
+            .only("pk", "class_code", "team_number", "semester__year", "semester__season")
+        )
+        keys = [ProjectStableKey(project_id=project.pk, stable_key=project_stable_key(project)) for project in projects]
+        ProjectStableKey.objects.filter(project_id__in=batch).delete()
+        ProjectStableKey.objects.bulk_create(keys)
+
+
+def index_new_projects(projects: Iterable) -> None:
+    """Add the index rows of projects just bulk-created, from their loaded semesters."""
+    from apps.projects.models import ProjectStableKey
+
+    ProjectStableKey.objects.bulk_create(
+        [ProjectStableKey(project_id=project.pk, stable_key=project_stable_key(project)) for project in projects],
+        batch_size=REFRESH_BATCH_SIZE,
+    )
+
+
+def resolve_stable_keys(keys: Collection[str]) -> dict[str, str]:
+    """Project ID (as a string) for each of ``keys`` that matches a project, in one query.
+
+    When several projects share a key the sheet-synced one wins, then the lowest ID.
+    """
+    from apps.projects.models import ProjectStableKey
+
+    if not keys:
+        return {}
+    project_ids: dict[str, str] = {}
+    matches = (
+        ProjectStableKey.objects.filter(stable_key__in=keys)
+        .order_by("-project__source", "project_id")
+        .values_list("stable_key", "project_id")
+    )
+    for key, project_id in matches:
+        project_ids.setdefault(key, str(project_id))
+    return project_ids
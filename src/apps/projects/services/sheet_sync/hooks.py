@@ -35,7 +35,7 @@ def resolve_project_row(raw_row: dict, sheet_link) -> dict | None:
     semester, _ = Semester.objects.get_or_create(year=year, season=season)
     if not semester.is_published:
         semester.is_published = True
-        semester.save(update_fields=["is_published"])
+        semester.save(update_fields=["is_published", "updated_at"])
 
     # Inject the resolved FK instance directly (sync engine will use it as-is)
     raw_row["semester"] = semester
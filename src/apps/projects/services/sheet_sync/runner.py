@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import time
 from typing import Any
 
 from django.db import transaction
 from django.utils import timezone
 
 from apps.projects.models import PastProjectsSheetConfig, PastProjectSyncLog, Project
+from apps.projects.services.share_keys import index_new_projects
 from apps.projects.services.sheet_sync.hooks import resolve_project_row
+from apps.projects.services.similarity import schedule_similarity_refresh
 from apps.projects.signals import _clear_project_caches
 
 from .shared import PastProjectSyncStats, SheetSyncError
@@ -47,11 +52,26 @@ def _project_sync_key(fields_or_project) -> tuple:
     return (semester_id, class_code, team_number)
 
 
+def _sheet_digest(config: PastProjectsSheetConfig, records: list[dict[str, Any]]) -> str:
+    """Digest of the worksheet contents, tied to the sheet they were read from."""
+    payload = json.dumps(
+        [config.sheet_id, config.worksheet_name, records], sort_keys=True, default=str, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _row_fingerprint(fields: dict[str, Any]) -> str:
+    """Digest of a parsed row's mutable fields; equal fingerprints mean nothing to update."""
+    payload = json.dumps([fields.get(field, "") for field in _MUTABLE_PROJECT_FIELDS], separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
 def sync_past_projects(
     config: PastProjectsSheetConfig,
     *,
     records: list[dict[str, Any]] | None = None,
     sync_type: str = "",
+    force: bool = False,
 ) -> PastProjectSyncStats:
     """Upsert the Google-Sheet-sourced past projects from the configured sheet.
 
@@ -59,9 +79,13 @@ def sync_past_projects(
     their UUIDs stay stable across syncs. Manual/CSV rows are never touched.
     ``records`` injects the row list to bypass the network (used by tests).
     Failures are logged and re-raised as SheetSyncError.
+
+    The run is incremental: a sheet identical to the last synced one is not
+    compared at all unless ``force`` is set, rows whose fingerprint matches
+    their project are skipped, and updates write only the changed columns.
     """
     try:
-        return _sync_past_projects(config, records=records, sync_type=sync_type)
+        return _sync_past_projects(config, records=records, sync_type=sync_type, force=force)
     except Exception as exc:
         _record_sync_failure(config, exc, sync_type)
         if isinstance(exc, SheetSyncError):
@@ -74,11 +98,22 @@ def _sync_past_projects(
     *,
     records: list[dict[str, Any]] | None,
     sync_type: str,
+    force: bool,
 ) -> PastProjectSyncStats:
+    started = time.monotonic()
     if records is None:
         records = fetch_past_project_records()
 
     stats = PastProjectSyncStats(rows_read=len(records))
+    digest = _sheet_digest(config, records)
+    # Read the stored digest fresh: ``config`` may have been loaded before an earlier sync.
+    last_digest = PastProjectsSheetConfig.objects.filter(pk=config.pk).values_list("sheet_digest", flat=True).first()
+    if records and not force and digest == last_digest:
+        stats.sheet_unchanged = True
+        PastProjectsSheetConfig.objects.filter(pk=config.pk).update(last_synced_at=timezone.now(), sync_error="")
+        stats.duration_ms = int((time.monotonic() - started) * 1000)
+        _record_sync_success(config, stats, sync_type)
+        return stats
 
     # Parse + upsert inside one transaction so the semester auto-publish done by
     # resolve_project_row rolls back if the project write phase fails.
@@ -118,9 +153,16 @@ def _sync_past_projects(
         if not parsed:
             raise SheetSyncError("The configured sheet contained no importable past-project rows.")
 
+        # Keys and fingerprints are enough to classify every row; the field values
+        # are loaded below only for the rows whose fingerprint no longer matches.
         existing_by_key: dict[tuple, Project] = {}
         duplicate_existing_ids = []
-        for project in Project.objects.filter(source=Project.Source.SHEET).select_related("semester").order_by("pk"):
+        existing_rows = (
+            Project.objects.filter(source=Project.Source.SHEET)
+            .only("semester", "class_code", "team_number", "sync_fingerprint")
+            .order_by("pk")
+        )
+        for project in existing_rows:
             key = _project_sync_key(project)
             if key in existing_by_key:
                 duplicate_existing_ids.append(project.pk)
@@ -128,48 +170,70 @@ def _sync_past_projects(
             existing_by_key[key] = project
 
         to_create = []
-        to_update = []
-        now = timezone.now()
+        changed_rows: dict[Any, tuple[dict[str, Any], str]] = {}
         for fields in parsed:
-            key = _project_sync_key(fields)
-            existing = existing_by_key.get(key)
+            fingerprint = _row_fingerprint(fields)
+            existing = existing_by_key.get(_project_sync_key(fields))
             if existing is None:
-                to_create.append(Project(source=Project.Source.SHEET, **fields))
-                continue
-
-            changed = False
-            for field in _MUTABLE_PROJECT_FIELDS:
-                new_value = fields.get(field, "")
-                if getattr(existing, field) != new_value:
-                    setattr(existing, field, new_value)
-                    changed = True
-            if changed:
-                existing.updated_at = now
-                to_update.append(existing)
+                to_create.append(Project(source=Project.Source.SHEET, sync_fingerprint=fingerprint, **fields))
+            elif existing.sync_fingerprint == fingerprint:
+                stats.rows_unchanged += 1
+            else:
+                changed_rows[existing.pk] = (fields, fingerprint)
+
+        # Group updates by the set of columns that changed, so each bulk_update
+        # writes only those columns.
+        updates_by_columns: dict[tuple[str, ...], list[Project]] = {}
+        now = timezone.now()
+        current = Project.objects.only(*_MUTABLE_PROJECT_FIELDS).in_bulk(list(changed_rows))
+        for pk, (fields, fingerprint) in changed_rows.items():
+            project = current[pk]
+            columns = tuple(
+                field for field in _MUTABLE_PROJECT_FIELDS if getattr(project, field) != fields.get(field, "")
+            )
+            for field in columns:
+                setattr(project, field, fields.get(field, ""))
+            project.sync_fingerprint = fingerprint
+            if columns:
+                project.updated_at = now
+                stats.fields_updated += len(columns)
+                columns += ("updated_at",)
+            else:
+                # Same values under a missing or outdated fingerprint: just record the fingerprint.
+                stats.rows_unchanged += 1
+            updates_by_columns.setdefault(columns, []).append(project)
 
         stale_ids = duplicate_existing_ids + [project.pk for key, project in existing_by_key.items() if key not in seen]
         if stale_ids:
-            deleted_count, _ = Project.objects.filter(pk__in=stale_ids, source=Project.Source.SHEET).delete()
-            stats.projects_deleted = deleted_count
+            _, deleted_by_model = Project.objects.filter(pk__in=stale_ids, source=Project.Source.SHEET).delete()
+            # The total also counts rows removed by cascade (stable keys, similarity links).
+            stats.projects_deleted = deleted_by_model.get(Project._meta.label, 0)
         if to_create:
             Project.objects.bulk_create(to_create)
-        if to_update:
-            Project.objects.bulk_update(to_update, [*_MUTABLE_PROJECT_FIELDS, "updated_at"])
+            # Updates keep the key fields, so only new rows need index entries.
+            index_new_projects(to_create)
+        for columns, projects in updates_by_columns.items():
+            Project.objects.bulk_update(projects, [*columns, "sync_fingerprint"])
 
         stats.projects_created = len(to_create)
-        stats.projects_updated = len(to_update)
+        stats.projects_updated = sum(len(projects) for columns, projects in updates_by_columns.items() if columns)
         stats.semesters_touched = len(touched_semester_pks)
 
     # Mark synced without triggering ActiveModel save() side effects.
+    # Sync-side deletes reset the digest through the project signals, so store it last.
     PastProjectsSheetConfig.objects.filter(pk=config.pk).update(
         last_synced_at=timezone.now(),
         sync_error="",
         sync_count=len(parsed),
+        sheet_digest=digest,
     )
 
     # Bulk writes do not fire post_save, so clear the cache explicitly (post-commit).
     _clear_project_caches()
+    if stats.projects_created or stats.projects_updated or stats.projects_deleted:
+        transaction.on_commit(schedule_similarity_refresh)
 
+    stats.duration_ms = int((time.monotonic() - started) * 1000)
     _record_sync_success(config, stats, sync_type)
     return stats
 
@@ -189,6 +253,10 @@ def _record_sync_success(
         projects_deleted=stats.projects_deleted,
         semesters_touched=stats.semesters_touched,
         rows_skipped=stats.rows_skipped,
+        rows_unchanged=stats.rows_unchanged,
+        fields_updated=stats.fields_updated,
+        sheet_unchanged=stats.sheet_unchanged,
+        duration_ms=stats.duration_ms,
     )
 
 
@@ -13,6 +13,10 @@ class PastProjectSyncStats:
     projects_deleted: int = 0
     semesters_touched: int = 0
     rows_skipped: int = 0
+    rows_unchanged: int = 0
+    fields_updated: int = 0
+    sheet_unchanged: bool = False
+    duration_ms: int = 0
 
 
 def format_sync_stats(stats: "PastProjectSyncStats") -> str:
@@ -20,8 +24,10 @@ def format_sync_stats(stats: "PastProjectSyncStats") -> str:
     "Pull now" action so their wording cannot drift. After the full-replace -> upsert change,
     reporting only ``projects_created`` would show "0" on any steady-state re-sync, so include the
     update and delete counts too."""
+    if stats.sheet_unchanged:
+        return f"sheet unchanged since the last sync; {stats.rows_read} rows read, nothing written."
     return (
         f"{stats.projects_created} created, {stats.projects_updated} updated, "
         f"{stats.projects_deleted} deleted across {stats.semesters_touched} semester(s); "
-        f"{stats.rows_skipped} rows skipped of {stats.rows_read} read."
+        f"{stats.rows_unchanged} unchanged, {stats.rows_skipped} rows skipped of {stats.rows_read} read."
     )
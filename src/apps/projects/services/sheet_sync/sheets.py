@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from apps.core.models import GoogleCredentialConfig
+from apps.core.services.google_sheets import call_with_backoff, open_worksheet
 from apps.projects.models import PastProjectsSheetConfig
 
 from .shared import SheetSyncError
@@ -19,15 +20,11 @@ def fetch_past_project_records() -> list[dict[str, Any]]:
         raise SheetSyncError("No active Google service account is configured.")
 
     try:
-        import gspread
-
-        client = gspread.service_account_from_dict(credentials.get_credentials_info())
-        spreadsheet = client.open_by_key(source.sheet_id)
-        worksheet = spreadsheet.worksheet(source.worksheet_name)
+        worksheet = open_worksheet(credentials.get_credentials_info(), source.sheet_id, title=source.worksheet_name)
     except Exception as exc:
         raise SheetSyncError(f"Unable to open the configured Google Sheet: {exc}") from exc
 
     try:
-        return worksheet.get_all_records()
+        return call_with_backoff(worksheet.get_all_records)
     except Exception as exc:
         raise SheetSyncError(f"Unable to read past-project worksheet records: {exc}") from exc
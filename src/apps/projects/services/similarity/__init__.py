@@ -0,0 +1,192 @@
+"""Precomputed "similar projects" for project detail pages.
+
+Each published project gets a TF-IDF vector over its title (counted twice),
+abstract, industry and organization. Terms that appear in only one project
+cannot link two projects, and terms in more than half of the catalog link
+everything, so both are dropped; the rest are weighted by sublinear term
+frequency times smoothed IDF and L2-normalised, which makes the dot product of
+two vectors their cosine similarity.
+
+Neighbours are found through an inverted index: each project's strongest terms
+are looked up in the posting lists of the other projects, so the work grows
+with how many projects share a term rather than with every pair in the
+catalog. The top :data:`SIMILAR_PROJECTS_LIMIT` neighbours per project are
+stored as :class:`~apps.projects.models.ProjectSimilarity` rows, replacing the
+whole table in one transaction, and ``/projects/<id>/similar/`` reads them
+with one indexed query.
+
+The index is rebuilt offline: :func:`schedule_similarity_refresh` runs after
+the sheet sync and the CSV import change the catalog, as a durable
+``projects.similarity_index`` job when the outbox is enabled (changes made
+while a rebuild is still waiting share it) and on a background thread
+otherwise; ``manage.py rebuild_similar_projects`` rebuilds it on demand.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import threading
+import uuid
+from collections import Counter
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+
+from apps.core.services.helpers.in_process import start_in_process_task
+from apps.projects.services.search import text_terms
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_JOB_KIND = "projects.similarity_index"
+SIMILAR_PROJECTS_LIMIT = 8
+MIN_SIMILARITY = 0.05
+# Term-frequency multipliers per field.
+FIELD_WEIGHTS = {"project_title": 2, "abstract": 1, "industry": 1, "organization": 1}
+_MAX_DOCUMENT_FREQUENCY = 0.5
+_QUERY_TERMS = 32
+
+_refresh_lock = threading.Lock()
+_refresh_pending = False
+
+
+def similarity_refresh_enabled() -> bool:
+    return bool(getattr(settings, "PROJECT_SIMILARITY_REFRESH_ENABLED", True))
+
+
+def _tfidf_vectors(documents: list[dict[str, str]]) -> list[dict[str, float]]:
+    counts = []
+    for fields in documents:
+        terms: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in text_terms(fields.get(field) or ""):
+                terms[term] += weight
+        counts.append(terms)
+
+    total = len(counts)
+    document_frequency = Counter(term for terms in counts for term in terms)
+    max_frequency = max(2, int(total * _MAX_DOCUMENT_FREQUENCY))
+    idf = {
+        term: math.log((1 + total) / (1 + frequency)) + 1
+        for term, frequency in document_frequency.items()
+        if 1 < frequency <= max_frequency
+    }
+
+    vectors = []
+    for terms in counts:
+        vector = {term: (1 + math.log(count)) * idf[term] for term, count in terms.items() if term in idf}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        vectors.append({term: weight / norm for term, weight in vector.items()} if norm else {})
+    return vectors
+
+
+def nearest_neighbours(
+    documents: Iterable[tuple[str, dict[str, str]]], *, limit: int = SIMILAR_PROJECTS_LIMIT
+) -> dict[str, list[tuple[str, float]]]:
+    """Map each document id to its ``limit`` most similar ``(doc_id, cosine)`` pairs, closest first."""
+    ids, fields = [], []
+    for doc_id, document in documents:
+        ids.append(doc_id)
+        fields.append(document)
+    vectors = _tfidf_vectors(fields)
+
+    postings: dict[str, list[tuple[int, float]]] = {}
+    for position, vector in enumerate(vectors):
+        for term, weight in vector.items():
+            postings.setdefault(term, []).append((position, weight))
+
+    neighbours = {}
+    for position, vector in enumerate(vectors):
+        scores: dict[int, float] = {}
+        strongest = heapq.nlargest(_QUERY_TERMS, vector.items(), key=lambda item: item[1])
+        for term, weight in strongest:
+            for other, other_weight in postings[term]:
+                if other != position:
+                    scores[other] = scores.get(other, 0.0) + weight * other_weight
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        neighbours[ids[position]] = [(ids[other], score) for other, score in best if score >= MIN_SIMILARITY]
+    return neighbours
+
+
+def rebuild_similarity_index() -> int:
+    """Recompute every published project's neighbours and replace the stored rows; returns the row count."""
+    from apps.projects.models import Project, ProjectSimilarity
+
+    fields = tuple(FIELD_WEIGHTS)
+    rows = Project.objects.filter(semester__is_published=True).order_by("pk").values_list("pk", *fields)
+    neighbours = nearest_neighbours((row[0], dict(zip(fields, row[1:], strict=True))) for row in rows)
+    links = [
+        ProjectSimilarity(project_id=project_id, similar_id=similar_id, rank=rank, score=round(score, 6))
+        for project_id, similar in neighbours.items()
+        for rank, (similar_id, score) in enumerate(similar, start=1)
+    ]
+    with transaction.atomic():
+        ProjectSimilarity.objects.all().delete()
+        # A project deleted while the vectors were computed would break the
+        # foreign keys; link only projects that still exist.
+        existing = set(Project.objects.filter(pk__in=neighbours).values_list("pk", flat=True))
+        links = [link for link in links if link.project_id in existing and link.similar_id in existing]
+        ProjectSimilarity.objects.bulk_create(links, batch_size=1000)
+    logger.info("Rebuilt similar-project index: %d projects, %d links", len(neighbours), len(links))
+    return len(links)
+
+
+def schedule_similarity_refresh() -> None:
+    """Rebuild the index in the background; call after the catalog change commits."""
+    global _refresh_pending
+    from apps.core.services.background_jobs import jobs_enabled
+
+    if not similarity_refresh_enabled():
+        return
+    if jobs_enabled():
+        try:
+            _enqueue_rebuild_job()
+            return
+        except DatabaseError:
+            logger.exception("Could not queue the similar-project index rebuild; rebuilding in-process")
+    with _refresh_lock:
+        if _refresh_pending:
+            return
+        _refresh_pending = True
+    if start_in_process_task(_refresh_in_process, name="project-similarity", best_effort_start=True) is None:
+        with _refresh_lock:
+            _refresh_pending = False
+
+
+def _enqueue_rebuild_job():
+    """Queue a rebuild unless one is already waiting; a waiting job reads the catalog when it runs."""
+    from apps.core.models import BackgroundJob
+    from apps.core.services.background_jobs import enqueue_job
+
+    with transaction.atomic():
+        queued = (
+            BackgroundJob.objects.select_for_update()
+            .filter(kind=SIMILARITY_JOB_KIND, status__in=[BackgroundJob.Status.PENDING, BackgroundJob.Status.RETRY])
+            .order_by("created_at")
+            .first()
+        )
+        if queued is not None:
+            return queued
+        # A rebuild already processing may have read the catalog before this change, so it does not count.
+        job, _created = enqueue_job(kind=SIMILARITY_JOB_KIND, dedupe_key=str(uuid.uuid4()), payload={}, max_attempts=3)
+        return job
+
+
+def _refresh_in_process() -> None:
+    global _refresh_pending
+
+    with _refresh_lock:
+        _refresh_pending = False
+    rebuild_similarity_index()
+
+
+def rebuild_similarity_index_job(job) -> None:
+    """Durable job handler for ``projects.similarity_index``."""
+    from apps.core.services.background_jobs import TransientJobError
+
+    try:
+        rebuild_similarity_index()
+    except DatabaseError as exc:
+        raise TransientJobError("The similar-project index could not be rebuilt.") from exc
@@ -1,18 +1,22 @@
 from django.core.cache import cache
 from django.db import transaction
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .models import Project, Semester
+from apps.core.services.cache import tiered_cache
 
-PROJECT_ARCHIVE_VERSION_KEY = "projects:archive-version"
+from .models import PastProjectsSheetConfig, Project, ProjectTombstone, Semester
+from .services.catalog import CATALOG_REVISION_KEY, bump_catalog_revision
+from .services.share_keys import refresh_stable_keys
+from .views.all_past_projects import PAST_PROJECTS_CACHE_KEY, PAST_PROJECTS_CACHE_TAG
+
+PROJECT_ARCHIVE_VERSION_KEY = CATALOG_REVISION_KEY
 
 
 def _clear_project_caches():
     cache.delete("event:current-projects")
-    cache.delete("projects:past-all")
-    current_version = cache.get(PROJECT_ARCHIVE_VERSION_KEY, 1)
-    cache.set(PROJECT_ARCHIVE_VERSION_KEY, current_version + 1, timeout=None)
+    tiered_cache.invalidate(PAST_PROJECTS_CACHE_TAG, keys=(PAST_PROJECTS_CACHE_KEY,))
+    bump_catalog_revision()
 
 
 @receiver([post_save, post_delete], sender=Project)
@@ -20,3 +24,43 @@ def _clear_project_caches():
 # noinspection PyUnusedLocal
 def invalidate_project_cache(sender, instance, **kwargs):
     transaction.on_commit(_clear_project_caches)
+
+
+@receiver(post_delete, sender=Project)
+# noinspection PyUnusedLocal
+def record_project_tombstone(sender, instance, **kwargs):
+    # Written in the deleting transaction, so a rolled-back delete leaves no tombstone.
+    ProjectTombstone.objects.create(project_id=instance.pk)
+
+
+@receiver(pre_save, sender=Project)
+# noinspection PyUnusedLocal
+def reset_sheet_row_fingerprint(sender, instance, **kwargs):
+    # The sheet sync writes through bulk_create/bulk_update, which send no
+    # signals; any other save is an edit the next sync must compare in full.
+    if instance.source == Project.Source.SHEET:
+        instance.sync_fingerprint = ""
+
+
+@receiver([post_save, post_delete], sender=Project)
+# noinspection PyUnusedLocal
+def reset_sheet_digest(sender, instance, **kwargs):
+    # A sheet row changed or removed outside the sync: the next sync must run
+    # even if the sheet itself has not changed.
+    if instance.source == Project.Source.SHEET:
+        PastProjectsSheetConfig.objects.exclude(sheet_digest="").update(sheet_digest="")
+
+
+@receiver(post_save, sender=Project)
+# noinspection PyUnusedLocal
+def refresh_project_stable_key(sender, instance, **kwargs):
+    # Written in the saving transaction; deleted projects lose their key by cascade.
+    refresh_stable_keys([instance.pk])
+
+
+@receiver(post_save, sender=Semester)
+# noinspection PyUnusedLocal
+def refresh_semester_stable_keys(sender, instance, created, update_fields=None, **kwargs):
+    # The key includes the year and season, so a re-labelled semester re-keys its projects.
+    if not created and (update_fields is None or {"year", "season"} & set(update_fields)):
+        refresh_stable_keys(instance.projects.values_list("pk", flat=True))
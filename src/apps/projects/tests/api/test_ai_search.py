@@ -33,7 +33,7 @@ def create_project(semester, **overrides):
     return Project.objects.create(semester=semester, **defaults)
 
 
-class PastProjectAISearchAPIViewTests(TestCase):
+class AISearchTestCase(TestCase):
     # noinspection PyPep8Naming,PyAttributeOutsideInit
     def setUp(self):
         cache.clear()
@@ -79,6 +79,8 @@ class PastProjectAISearchAPIViewTests(TestCase):
     def authenticate(self):
         self.client.force_authenticate(user=self.member)
 
+
+class PastProjectAISearchAPIViewTests(AISearchTestCase):
     def test_authentication_required(self):
         response = self.client.post("/projects/past-ai-search/", {"query": "solar"}, format="json")
 
@@ -260,3 +262,77 @@ class PastProjectAISearchAPIViewTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTrue(response.data["available"])
         self.assertEqual(AssistantMessageLog.objects.count(), 0)
+
+
+class PastProjectAISearchResultCacheTests(AISearchTestCase):
+    # noinspection PyPep8Naming
+    def setUp(self):
+        super().setUp()
+        self.authenticate()
+
+    def search(self, query, project_ids, limit=10):
+        outcome = {"project_ids": project_ids, "usage": {"inputTokens": 40, "outputTokens": 5, "totalTokens": 45}}
+        with patch("apps.projects.views.ai_search.run_past_project_ai_search", return_value=outcome) as mocked:
+            response = self.client.post("/projects/past-ai-search/", {"query": query, "limit": limit}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response, mocked
+
+    def test_equivalent_query_is_served_from_cache_and_logged_as_saved_tokens(self):
+        first, first_call = self.search("Machine learning", [str(self.past_project_a.id)])
+        repeat, repeat_call = self.search("learning, MACHINE!", [str(self.past_project_b.id)])
+
+        first_call.assert_called_once()
+        repeat_call.assert_not_called()
+        self.assertFalse(first.data["cached"])
+        self.assertTrue(repeat.data["cached"])
+        self.assertEqual(repeat.data["usage"]["totalTokens"], 0)
+        self.assertEqual(repeat.data["results"], first.data["results"])
+        hit = AssistantMessageLog.objects.get(cache_hit=True)
+        self.assertEqual((hit.saved_tokens, hit.token_usage), (45, {}))
+        self.assertEqual((hit.conversation.cache_hits, hit.conversation.saved_tokens), (1, 45))
+        self.assertEqual(AssistantMessageLog.objects.filter(cache_hit=False, token_usage__totalTokens=45).count(), 1)
+
+    def test_limit_model_and_catalog_changes_miss_the_cache(self):
+        self.search("solar", [str(self.past_project_a.id)])
+
+        _response, other_limit = self.search("solar", [str(self.past_project_a.id)], limit=3)
+        other_limit.assert_called_once()
+
+        self.config.default_model_id = "us.anthropic.claude-3-5-haiku-20241022-v1:0"
+        self.config.save()
+        _response, other_model = self.search("solar", [str(self.past_project_a.id)])
+        other_model.assert_called_once()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            create_project(self.past_fall, project_title="Solar Drying Rack")
+        _response, new_catalog = self.search("solar", [str(self.past_project_a.id)])
+        new_catalog.assert_called_once()
+
+    def test_empty_answers_use_the_negative_ttl_and_errors_are_not_cached(self):
+        with patch("apps.projects.services.ai_search.result_cache.cache.set") as cache_set:
+            self.search("quantum", [])
+        self.assertEqual(cache_set.call_args.kwargs["timeout"], 300)
+
+        with patch("apps.projects.views.ai_search.run_past_project_ai_search", side_effect=RuntimeError("boom")):
+            self.client.post("/projects/past-ai-search/", {"query": "fusion"}, format="json")
+        _response, retried = self.search("fusion", [])
+        retried.assert_called_once()
+
+    def test_cache_hits_are_served_past_the_token_budget(self):
+        self.search("solar", [str(self.past_project_a.id)])
+        self.config.public_assistant_ip_token_limit = 1
+        self.config.save()
+        record_usage(hash_ip("127.0.0.1"), 1, 3600)
+
+        response, mocked = self.search("solar", [str(self.past_project_b.id)])
+
+        mocked.assert_not_called()
+        self.assertEqual(
+            [row["project_title"] for row in response.data["results"]], ["Solar Sensor Irrigation Network"]
+        )
+
+    def test_zero_ttl_disables_the_cache(self):
+        with self.settings(PROJECT_AI_SEARCH_CACHE_TTL=0):
+            self.search("solar", [str(self.past_project_a.id)])
+            _response, mocked = self.search("solar", [str(self.past_project_a.id)])
+        mocked.assert_called_once()
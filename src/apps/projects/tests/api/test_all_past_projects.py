@@ -1,8 +1,12 @@
+from datetime import timedelta
+
 from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
 from rest_framework.test import APIClient
 
-from apps.projects.models import Project, Semester
+from apps.projects.models import Project, ProjectTombstone, Semester
+from apps.projects.services.catalog import TOMBSTONE_RETENTION, catalog_watermark, revision_from_datetime
 
 
 class AllPastProjectsAPIViewTests(TestCase):
@@ -52,33 +56,33 @@ class AllPastProjectsAPIViewTests(TestCase):
     def test_returns_flat_list(self):
         response = self.client.get("/projects/past-all/")
         self.assertEqual(response.status_code, 200)
-        self.assertIsInstance(response.data, list)
+        self.assertIsInstance(response.json(), list)
 
     def test_includes_newest_semester(self):
         # The newest published semester is a real past semester and must not be hidden.
         response = self.client.get("/projects/past-all/")
-        titles = [p["project_title"] for p in response.data]
+        titles = [p["project_title"] for p in response.json()]
         self.assertIn("Current Project", titles)
 
     def test_excludes_unpublished(self):
         response = self.client.get("/projects/past-all/")
-        titles = [p["project_title"] for p in response.data]
+        titles = [p["project_title"] for p in response.json()]
         self.assertNotIn("Unpub Project", titles)
 
     def test_includes_past_projects(self):
         response = self.client.get("/projects/past-all/")
-        titles = [p["project_title"] for p in response.data]
+        titles = [p["project_title"] for p in response.json()]
         self.assertIn("Past Project 1", titles)
         self.assertIn("Past Project 2", titles)
 
     def test_response_includes_semester_label(self):
         response = self.client.get("/projects/past-all/")
-        self.assertTrue(len(response.data) > 0)
-        self.assertIn("semester_label", response.data[0])
+        self.assertTrue(len(response.json()) > 0)
+        self.assertIn("semester_label", response.json()[0])
 
     def test_response_includes_all_table_fields(self):
         response = self.client.get("/projects/past-all/")
-        project = next(p for p in response.data if p["project_title"] == "Past Project 1")
+        project = next(p for p in response.json() if p["project_title"] == "Past Project 1")
         self.assertEqual(project["abstract"], "An abstract")
         self.assertEqual(project["student_names"], "Alice")
         self.assertEqual(project["team_name"], "Beta")
@@ -89,7 +93,7 @@ class AllPastProjectsAPIViewTests(TestCase):
 
     def test_ordering(self):
         response = self.client.get("/projects/past-all/")
-        titles = [p["project_title"] for p in response.data]
+        titles = [p["project_title"] for p in response.json()]
         # Newest semester first: 2025-2 (Current), then 2025-1 (Past 1), then 2024-2 (Past 2).
         self.assertEqual(titles.index("Current Project"), 0)
         self.assertEqual(titles.index("Past Project 1"), 1)
@@ -101,8 +105,100 @@ class AllPastProjectsAPIViewTests(TestCase):
 
         cached = cache.get("projects:past-all")
         self.assertIsNotNone(cached)
-        self.assertEqual(len(cached), 3)
+        self.assertEqual(cached.body, response1.content)
 
         response2 = self.client.get("/projects/past-all/")
         self.assertEqual(response2.status_code, 200)
-        self.assertEqual(len(response2.data), 3)
+        self.assertEqual(len(response2.json()), 3)
+
+
+class AllPastProjectsRevisionTests(TestCase):
+    # noinspection PyPep8Naming,PyAttributeOutsideInit
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.semester = Semester.objects.create(year=2025, season=1, is_published=True)
+        self.kept = Project.objects.create(semester=self.semester, project_title="Kept", team_number="T01")
+        self.edited = Project.objects.create(semester=self.semester, project_title="Edited", team_number="T02")
+        # Age the catalog so writes made by a test fall outside the delta overlap window.
+        an_hour_ago = timezone.now() - timedelta(hours=1)
+        Semester.objects.update(updated_at=an_hour_ago)
+        Project.objects.update(updated_at=an_hour_ago)
+        self.revision = catalog_watermark()
+
+    def delta(self, since):
+        return self.client.get("/projects/past-all/", {"since": since})
+
+    def test_full_list_etag_is_the_catalog_revision(self):
+        response = self.client.get("/projects/past-all/")
+
+        self.assertEqual(response["ETag"], f'"{self.revision}"')
+        self.assertEqual(response["X-Catalog-Revision"], str(self.revision))
+        revalidated = self.client.get("/projects/past-all/", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_full_list_revision_advances_after_an_edit(self):
+        self.client.get("/projects/past-all/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.edited.project_title = "Edited again"
+            self.edited.save()
+        response = self.client.get("/projects/past-all/", HTTP_IF_NONE_MATCH=f'"{self.revision}"')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(int(response["X-Catalog-Revision"]), self.revision)
+        self.assertIn("Edited again", [project["project_title"] for project in response.json()])
+
+    def test_delta_is_empty_when_nothing_changed(self):
+        response = self.delta(self.revision)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"revision": self.revision, "changed": [], "deleted": []})
+
+    def test_delta_returns_changed_projects(self):
+        self.edited.project_title = "Edited again"
+        self.edited.save()
+
+        body = self.delta(self.revision).json()
+
+        self.assertEqual([project["project_title"] for project in body["changed"]], ["Edited again"])
+        self.assertEqual(body["deleted"], [])
+        self.assertGreater(body["revision"], self.revision)
+
+    def test_delta_reports_deleted_projects(self):
+        deleted_id = str(self.edited.pk)
+        self.edited.delete()
+
+        body = self.delta(self.revision).json()
+
+        self.assertEqual(body["changed"], [])
+        self.assertEqual(body["deleted"], [deleted_id])
+        self.assertTrue(ProjectTombstone.objects.filter(project_id=deleted_id).exists())
+
+    def test_delta_reports_unpublished_semesters_as_deleted(self):
+        self.semester.is_published = False
+        self.semester.save()
+
+        body = self.delta(self.revision).json()
+
+        self.assertEqual(body["changed"], [])
+        self.assertEqual(body["deleted"], sorted([str(self.kept.pk), str(self.edited.pk)]))
+
+    def test_delta_before_tombstone_retention_is_gone(self):
+        too_old = revision_from_datetime(timezone.now() - TOMBSTONE_RETENTION - timedelta(minutes=1))
+
+        response = self.delta(too_old)
+
+        self.assertEqual(response.status_code, 410)
+        self.assertEqual(response.json()["code"], "revision_expired")
+
+    def test_invalid_since_is_rejected(self):
+        self.assertEqual(self.delta("yesterday").status_code, 400)
+
+    def test_rebuild_prunes_expired_tombstones(self):
+        ProjectTombstone.objects.create(project_id=self.kept.pk)
+        ProjectTombstone.objects.update(deleted_at=timezone.now() - TOMBSTONE_RETENTION - timedelta(days=1))
+
+        self.client.get("/projects/past-all/")
+
+        self.assertFalse(ProjectTombstone.objects.exists())
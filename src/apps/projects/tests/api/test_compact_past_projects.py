@@ -42,10 +42,10 @@ class CompactPastProjectsAPIViewTests(TestCase):
         response = self.client.get("/projects/archive/", {"page": 1, "page_size": 2})
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.data["count"], 4)
-        self.assertEqual([row["id"] for row in response.data["results"]], [str(self.beta.id), str(self.alpha.id)])
+        self.assertEqual(response.json()["count"], 4)
+        self.assertEqual([row["id"] for row in response.json()["results"]], [str(self.beta.id), str(self.alpha.id)])
         self.assertEqual(
-            set(response.data["results"][0]),
+            set(response.json()["results"][0]),
             {
                 "id",
                 "semester_label",
@@ -59,24 +59,24 @@ class CompactPastProjectsAPIViewTests(TestCase):
                 "presentation_order",
             },
         )
-        self.assertNotIn("abstract", response.data["results"][0])
+        self.assertNotIn("abstract", response.json()["results"][0])
         second = self.client.get("/projects/archive/", {"page": 2, "page_size": 2})
         self.assertEqual(
-            [row["id"] for row in second.data["results"]], [str(self.spring_project.id), str(self.old_project.id)]
+            [row["id"] for row in second.json()["results"]], [str(self.spring_project.id), str(self.old_project.id)]
         )
 
     def test_searches_text_fields_case_insensitively(self):
         for search in ("solar", "ACME", "renewable", "searchable student"):
             with self.subTest(search=search):
                 response = self.client.get("/projects/archive/", {"search": search})
-                self.assertEqual(response.data["count"], 1)
+                self.assertEqual(response.json()["count"], 1)
 
     def test_filters_by_year_season_and_semester_label(self):
         response = self.client.get("/projects/archive/", {"year": 2025, "season": 1})
-        self.assertEqual([row["project_title"] for row in response.data["results"]], ["Spring Robotics"])
+        self.assertEqual([row["project_title"] for row in response.json()["results"]], ["Spring Robotics"])
 
         response = self.client.get("/projects/archive/", {"semester": "2024-2 fall"})
-        self.assertEqual([row["project_title"] for row in response.data["results"]], ["Old Project"])
+        self.assertEqual([row["project_title"] for row in response.json()["results"]], ["Old Project"])
 
     def test_rejects_invalid_pagination_and_filters(self):
         for params in (
@@ -95,7 +95,7 @@ class CompactPastProjectsAPIViewTests(TestCase):
     def test_excludes_unpublished_and_uses_select_related(self):
         with CaptureQueriesContext(connection) as queries:
             response = self.client.get("/projects/archive/", {"page_size": 100})
-        self.assertNotIn("Unpublished Project", [row["project_title"] for row in response.data["results"]])
+        self.assertNotIn("Unpublished Project", [row["project_title"] for row in response.json()["results"]])
         self.assertLessEqual(len(queries), 2)
 
     def test_returns_query_specific_public_etag_and_supports_conditional_get(self):
@@ -123,7 +123,7 @@ class CompactPastProjectsAPIViewTests(TestCase):
     def test_legacy_past_all_contract_remains_a_full_flat_detail_list(self):
         response = self.client.get("/projects/past-all/", {"page": 1, "page_size": 1, "search": "nothing"})
         self.assertEqual(response.status_code, 200)
-        self.assertIsInstance(response.data, list)
-        self.assertEqual(len(response.data), 4)
-        self.assertIn("abstract", response.data[0])
-        self.assertIn("student_names", response.data[0])
+        self.assertIsInstance(response.json(), list)
+        self.assertEqual(len(response.json()), 4)
+        self.assertIn("abstract", response.json()[0])
+        self.assertIn("student_names", response.json()[0])
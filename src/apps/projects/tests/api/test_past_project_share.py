@@ -478,6 +478,45 @@ class PastProjectShareAPIViewTests(TestCase):
         share.refresh_from_db()
         self.assertNotIn("id", share.rows[0])
 
+    def test_get_large_share_costs_constant_queries(self):
+        semester = Semester.objects.create(year=2025, season=Semester.Season.SPRING)
+        projects = [
+            Project.objects.create(
+                semester=semester, class_code="ENGR 120", team_number=f"T{index:03}", project_title="Project"
+            )
+            for index in range(200)
+        ]
+        share = PastProjectShare.objects.create(
+            rows=[sample_row(team_number=project.team_number) for project in projects], created_by=self.member
+        )
+
+        with self.assertNumQueries(3):  # share stub, full share, one stable-key lookup
+            response = self.client.get(f"/projects/past-shares/{share.pk}/")
+        with self.assertNumQueries(1):  # share stub; the payload is cached
+            cached = self.client.get(f"/projects/past-shares/{share.pk}/")
+
+        self.assertEqual([row["id"] for row in response.data["rows"]], [str(project.pk) for project in projects])
+        self.assertEqual(cached.data, response.data)
+        self.assertTrue(cached.data["can_edit"])
+        self.assertFalse(APIClient().get(f"/projects/past-shares/{share.pk}/").data["can_edit"])
+
+    def test_cached_share_follows_catalog_and_share_changes(self):
+        share = PastProjectShare.objects.create(rows=[sample_row()], created_by=self.member)
+        self.assertNotIn("id", self.client.get(f"/projects/past-shares/{share.pk}/").data["rows"][0])
+
+        semester = Semester.objects.create(year=2025, season=Semester.Season.SPRING)
+        with self.captureOnCommitCallbacks(execute=True):
+            project = Project.objects.create(
+                semester=semester, class_code="ENGR 120", team_number="T01", project_title="New Project"
+            )
+        self.assertEqual(self.client.get(f"/projects/past-shares/{share.pk}/").data["rows"][0]["id"], str(project.pk))
+
+        response = self.client.patch(
+            f"/projects/past-shares/{share.pk}/", {"note": "Updated", "version": 1}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(f"/projects/past-shares/{share.pk}/").data["note"], "Updated")
+
     def test_get_share_marks_owner_can_edit(self):
         share = PastProjectShare.objects.create(rows=[sample_row()], created_by=self.member)
 
@@ -0,0 +1,94 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.projects.models import Project, Semester
+
+
+class ProjectFacetsAPIViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        fall = Semester.objects.create(year=2024, season=2, is_published=True)
+        spring = Semester.objects.create(year=2025, season=1, is_published=True)
+        hidden = Semester.objects.create(year=2025, season=2, is_published=False)
+        Project.objects.create(semester=spring, project_title="Solar Pump", industry="Energy")
+        Project.objects.create(semester=fall, project_title="Crop Drone", industry="Agriculture")
+        Project.objects.create(semester=fall, project_title="Solar Dryer", industry="agriculture tech")
+        Project.objects.create(semester=fall, project_title="Untagged Solar Kiosk")
+        Project.objects.create(semester=hidden, project_title="Solar Secret", industry="Space")
+
+    def facets(self, **params):
+        response = self.client.get("/projects/facets/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_counts_every_facet_of_published_projects(self):
+        with CaptureQueriesContext(connection) as queries:
+            body = self.facets()
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(body["total"], 4)
+        self.assertEqual(body["search"], "")
+        self.assertEqual(body["facets"]["year"], [{"value": 2025, "count": 1}, {"value": 2024, "count": 3}])
+        self.assertEqual(
+            body["facets"]["season"],
+            [{"value": 1, "label": "Spring", "count": 1}, {"value": 2, "label": "Fall", "count": 3}],
+        )
+        self.assertEqual(
+            body["facets"]["semester"], [{"value": "2025-1 Spring", "count": 1}, {"value": "2024-2 Fall", "count": 3}]
+        )
+        self.assertEqual(
+            body["facets"]["industry"],
+            [
+                {"value": "Agriculture", "count": 1},
+                {"value": "agriculture tech", "count": 1},
+                {"value": "Energy", "count": 1},
+            ],
+        )
+
+    def test_search_narrows_counts_and_keeps_empty_values(self):
+        body = self.facets(search="solar")
+
+        self.assertEqual(body["total"], 3)
+        self.assertEqual(
+            body["facets"]["industry"],
+            [
+                {"value": "Agriculture", "count": 0},
+                {"value": "agriculture tech", "count": 1},
+                {"value": "Energy", "count": 1},
+            ],
+        )
+        self.assertEqual(body["facets"]["year"], [{"value": 2025, "count": 1}, {"value": 2024, "count": 2}])
+
+    def test_equivalent_searches_share_a_cache_entry(self):
+        self.facets(search="Solar dryer")
+
+        with CaptureQueriesContext(connection) as queries:
+            body = self.facets(search="  the DRYER, solar ")
+
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(body["search"], "dryer solar")
+        self.assertEqual(body["total"], 1)
+
+    def test_catalog_change_refreshes_counts(self):
+        self.facets()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.create(
+                semester=Semester.objects.get(year=2025, season=1), project_title="Wind", industry="Energy"
+            )
+
+        body = self.facets()
+        self.assertEqual(body["total"], 5)
+        self.assertIn({"value": "Energy", "count": 2}, body["facets"]["industry"])
+
+    def test_responses_are_conditional(self):
+        first = self.client.get("/projects/facets/")
+
+        self.assertEqual(self.client.get("/projects/facets/", HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+
+    def test_overlong_search_is_rejected(self):
+        self.assertEqual(self.client.get("/projects/facets/", {"search": "x" * 201}).status_code, 400)
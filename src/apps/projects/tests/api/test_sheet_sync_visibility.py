@@ -41,7 +41,7 @@ class SheetSyncVisibilityTest(TestCase):
         sync_past_projects(self.config, records=records)
 
         response = self.api.get("/projects/past-all/")
-        titles = [p["project_title"] for p in response.data]
+        titles = [p["project_title"] for p in response.json()]
         # The newest semester is no longer hidden; synced history is shown alongside it.
         self.assertIn("Newest Project", titles)
         self.assertIn("Historical Project", titles)
@@ -0,0 +1,43 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.projects.models import Project, ProjectSimilarity, Semester
+
+
+class SimilarProjectsAPIViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        published = Semester.objects.create(year=2025, season=1, is_published=True)
+        hidden = Semester.objects.create(year=2025, season=2, is_published=False)
+        self.project = Project.objects.create(semester=published, project_title="Solar Pump")
+        self.close = Project.objects.create(semester=published, project_title="Solar Drip", organization="Acme")
+        self.far = Project.objects.create(semester=published, project_title="Soil Sensors")
+        self.unpublished = Project.objects.create(semester=hidden, project_title="Solar Secret")
+        for rank, (similar, score) in enumerate([(self.close, 0.8), (self.unpublished, 0.6), (self.far, 0.3)], 1):
+            ProjectSimilarity.objects.create(project=self.project, similar=similar, rank=rank, score=score)
+
+    def test_returns_published_neighbours_in_rank_order_with_scores(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"/projects/{self.project.id}/similar/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 2)
+        results = response.json()["results"]
+        self.assertEqual([row["project_title"] for row in results], ["Solar Drip", "Soil Sensors"])
+        self.assertEqual(results[0]["id"], str(self.close.id))
+        self.assertEqual(results[0]["organization"], "Acme")
+        self.assertEqual(results[0]["score"], 0.8)
+        self.assertIn("ETag", response)
+
+    def test_unpublished_or_unknown_project_is_404(self):
+        self.assertEqual(self.client.get(f"/projects/{self.unpublished.id}/similar/").status_code, 404)
+        self.assertEqual(self.client.get("/projects/00000000-0000-0000-0000-000000000000/similar/").status_code, 404)
+
+    def test_project_without_index_rows_has_no_results(self):
+        response = self.client.get(f"/projects/{self.far.id}/similar/")
+
+        self.assertEqual(response.json(), {"project_id": str(self.far.id), "results": []})
@@ -38,7 +38,7 @@ class SyncPastProjectsCommandTest(TestCase):
             ),
         ) as mock_sync:
             call_command("sync_past_projects", "--force", stdout=out)
-        mock_sync.assert_called_once_with(config, sync_type="auto")
+        mock_sync.assert_called_once_with(config, sync_type="auto", force=False)
         self.assertIn("Synced: 2 created, 1 updated, 1 deleted", out.getvalue())
         self.assertIn("1 rows skipped of 5 read", out.getvalue())
 
@@ -52,7 +52,16 @@ class SyncPastProjectsCommandTest(TestCase):
             return_value=PastProjectSyncStats(),
         ) as mock_sync:
             call_command("sync_past_projects", stdout=out)
-        mock_sync.assert_called_once_with(config, sync_type="auto")
+        mock_sync.assert_called_once_with(config, sync_type="auto", force=False)
+
+    def test_full_compares_an_unchanged_sheet(self):
+        config = PastProjectsSheetConfig.objects.create(name="Prod", is_active=True, auto_sync_enabled=False)
+        with patch(
+            "apps.projects.management.commands.sync_past_projects.sync_past_projects",
+            return_value=PastProjectSyncStats(),
+        ) as mock_sync:
+            call_command("sync_past_projects", "--force", "--full", stdout=StringIO())
+        mock_sync.assert_called_once_with(config, sync_type="auto", force=True)
 
     def test_sync_failure_raises_command_error(self):
         PastProjectsSheetConfig.objects.create(name="Prod", is_active=True, auto_sync_enabled=True)
@@ -0,0 +1,167 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from apps.projects.models import Project, Semester
+from apps.projects.services.ai_search import _build_prompt, find_ai_search_candidates
+from apps.projects.services.ai_search.ranking import LexicalIndex, clear_past_project_index
+from apps.projects.services.search import search_words
+
+# Offline relevance set: a small catalog shaped like real archive rows and the
+# projects a reviewer judged relevant for each query, most relevant first.
+RELEVANCE_CATALOG = {
+    "irrigation": {
+        "project_title": "Smart Irrigation Scheduler",
+        "organization": "Valley Water District",
+        "industry": "Agriculture",
+        "abstract": "Soil moisture sensors and weather forecasts decide when to irrigate almond orchards.",
+    },
+    "solar-pump": {
+        "project_title": "Solar Powered Well Pump",
+        "organization": "Acme Farms",
+        "industry": "Energy",
+        "abstract": "An off-grid pump for groundwater irrigation driven by photovoltaic panels.",
+    },
+    "battery": {
+        "project_title": "Battery Health Monitor",
+        "organization": "Central Energy",
+        "industry": "Energy",
+        "abstract": "Predictive maintenance for solar battery storage systems.",
+    },
+    "microgrid": {
+        "project_title": "Campus Microgrid Dashboard",
+        "organization": "UC Facilities",
+        "industry": "Energy",
+        "abstract": "Visualizes solar generation, storage and demand across campus buildings.",
+    },
+    "wildfire": {
+        "project_title": "Wildfire Smoke Drone",
+        "organization": "County Fire",
+        "industry": "Public Safety",
+        "abstract": "A drone that maps smoke plumes and hot spots for fire crews.",
+    },
+    "crop-yield": {
+        "project_title": "Crop Yield Forecasting",
+        "organization": "Acme Farms",
+        "industry": "Agriculture",
+        "abstract": "Machine learning models predict tomato yield from satellite imagery.",
+    },
+    "telehealth": {
+        "project_title": "Rural Telehealth Kiosk",
+        "organization": "Mercy Medical",
+        "industry": "Healthcare",
+        "abstract": "Video visits and vitals capture for patients far from clinics.",
+    },
+    "wearable": {
+        "project_title": "Fall Detection Wearable",
+        "organization": "Mercy Medical",
+        "industry": "Healthcare",
+        "abstract": "A wrist sensor that alerts caregivers when an elderly patient falls.",
+    },
+    "inventory": {
+        "project_title": "Warehouse Inventory Robot",
+        "organization": "Central Logistics",
+        "industry": "Supply Chain",
+        "abstract": "Computer vision counts pallets and flags misplaced stock.",
+    },
+    "transit": {
+        "project_title": "Bus Arrival Predictions",
+        "organization": "City Transit",
+        "industry": "Transportation",
+        "abstract": "Machine learning on GPS traces to forecast bus arrival times for riders.",
+    },
+    "dairy": {
+        "project_title": "Dairy Herd Analytics",
+        "organization": "Valley Dairy",
+        "industry": "Agriculture",
+        "abstract": "Milk yield and feed tracking dashboard for dairy farmers.",
+    },
+}
+RELEVANCE_JUDGMENTS = {
+    "solar": ["solar-pump", "battery", "microgrid"],
+    "irrigation water": ["irrigation", "solar-pump"],
+    "machine learning forecast": ["crop-yield", "transit"],
+    "healthcare patients": ["telehealth", "wearable"],
+    "drone fire": ["wildfire"],
+    "energy storage": ["battery", "microgrid"],
+    "dairy": ["dairy"],
+    "robot warehouse": ["inventory"],
+    "forecast": ["crop-yield", "transit", "irrigation"],
+    "medic": ["telehealth", "wearable"],
+}
+
+
+class LexicalRelevanceTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.index = LexicalIndex(RELEVANCE_CATALOG.items())
+
+    def ranked_ids(self, query, limit=5):
+        return [doc_id for doc_id, _score in self.index.rank(search_words(query), limit)]
+
+    def test_top_result_is_the_most_relevant_project(self):
+        for query, relevant in RELEVANCE_JUDGMENTS.items():
+            with self.subTest(query=query):
+                self.assertEqual(self.ranked_ids(query)[0], relevant[0])
+
+    def test_every_relevant_project_is_in_the_top_five(self):
+        for query, relevant in RELEVANCE_JUDGMENTS.items():
+            with self.subTest(query=query):
+                self.assertLessEqual(set(relevant), set(self.ranked_ids(query)))
+
+    def test_title_match_outranks_abstract_match(self):
+        self.assertLess(self.ranked_ids("solar").index("solar-pump"), self.ranked_ids("solar").index("microgrid"))
+
+    def test_scores_descend_and_unmatched_queries_rank_nothing(self):
+        scores = [score for _doc_id, score in self.index.rank(search_words("solar energy"), 10)]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertTrue(all(score > 0 for score in scores))
+        self.assertEqual(self.index.rank(search_words("quantum"), 10), [])
+
+
+class AISearchCandidateRankingTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_past_project_index()
+        self.semester = Semester.objects.create(year=2025, season=1, is_published=True)
+        for number in range(30):
+            Project.objects.create(semester=self.semester, project_title=f"Solar Project {number}", team_number="1")
+        self.best = Project.objects.create(
+            semester=self.semester, project_title="Solar Irrigation Pump", abstract="Solar pumping for irrigation."
+        )
+
+    def test_candidates_are_the_best_matches_with_scores(self):
+        candidates = find_ai_search_candidates("solar irrigation")
+
+        self.assertEqual(len(candidates), 25)
+        self.assertEqual(candidates[0], self.best)
+        self.assertEqual(
+            [project.search_score for project in candidates],
+            sorted((project.search_score for project in candidates), reverse=True),
+        )
+        prompt = _build_prompt(query="solar irrigation", candidates=candidates, limit=5)
+        self.assertIn(f"id={self.best.id} | score={candidates[0].search_score:.2f}", prompt)
+
+    def test_index_is_rebuilt_when_the_catalog_changes(self):
+        self.assertEqual(find_ai_search_candidates("turbine"), [])
+
+        turbine = Project.objects.create(semester=self.semester, project_title="Wind Turbine Blade Inspection")
+        self.assertEqual(find_ai_search_candidates("turbine"), [turbine])
+
+        Project.objects.filter(pk=turbine.pk).delete()
+        self.assertEqual(find_ai_search_candidates("turbine"), [])
+
+
+class BenchmarkAISearchRankingCommandTest(SimpleTestCase):
+    def test_reports_build_time_and_query_latency(self):
+        out = StringIO()
+
+        call_command("benchmark_ai_search_ranking", "--projects", "50", "--rounds", "2", stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("index build") and "50 projects" in lines[0])
+        self.assertTrue(lines[1].endswith("ms p50") and lines[2].endswith("ms p95"))
@@ -189,3 +189,94 @@ class ImportResultTest(TestCase):
         self.assertEqual(result.created, 0)
         self.assertEqual(result.skipped, 0)
         self.assertEqual(result.errors, [])
+
+
+class StreamingImportTest(TestCase):
+    header = "Year-Semester,ClassCode,Team#,TeamName,ProjectTitle,Organization,Industry,Col7,Abstract,StudentNames"
+
+    def _make_csv(self, count, *, semesters=("2024-2 Fall", "2025-1 Spring")):
+        rows = [
+            f"{semesters[index % len(semesters)]},CSE,{index},Team {index},Project {index},Org,Ind,,Abs,Names"
+            for index in range(count)
+        ]
+        return io.StringIO("\n".join([self.header, *rows]))
+
+    def test_queries_do_not_grow_with_rows(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        Semester.objects.create(year=2024, season=2)
+        with CaptureQueriesContext(connection) as queries:
+            result = import_projects_from_csv(self._make_csv(1200), chunk_size=500)
+
+        self.assertEqual(result.created, 1200)
+        self.assertEqual(result.rows_read, 1200)
+        self.assertEqual(result.semesters_created, 1)
+        self.assertEqual(Project.objects.count(), 1200)
+        self.assertEqual(Semester.objects.get(year=2025, season=1).label, "2025-1 Spring")
+        # Semesters and existing keys are read once up front, plus the read-back
+        # of the created semester; projects are only ever bulk-inserted.
+        selects = [query for query in queries if query["sql"].startswith("SELECT")]
+        self.assertEqual(len(selects), 3)
+        self.assertLess(len(queries), 60)
+
+    def test_progress_is_reported_per_chunk(self):
+        progress = []
+
+        import_projects_from_csv(
+            self._make_csv(5),
+            chunk_size=2,
+            on_progress=lambda result: progress.append((result.rows_read, result.created)),
+        )
+
+        self.assertEqual(progress, [(2, 2), (4, 4), (5, 5)])
+
+    def test_existing_projects_are_skipped_across_chunks(self):
+        semester = Semester.objects.create(year=2024, season=2)
+        Project.objects.create(semester=semester, class_code="CSE", team_number="4", project_title="Existing")
+
+        result = import_projects_from_csv(self._make_csv(6), chunk_size=2)
+
+        self.assertEqual((result.created, result.skipped), (5, 1))
+
+    def test_dry_run_streams_without_writing(self):
+        result = import_projects_from_csv(self._make_csv(5), dry_run=True, chunk_size=2)
+
+        self.assertEqual((result.created, result.rows_read, result.semesters_created), (5, 5, 0))
+        self.assertEqual(Semester.objects.count(), 0)
+
+    def test_publish_happens_with_the_last_chunk(self):
+        from unittest.mock import patch
+
+        from django.db import DatabaseError
+
+        original = Project.objects.bulk_create
+        calls = []
+
+        def fail_second_chunk(objs, *args, **kwargs):
+            calls.append(len(objs))
+            if len(calls) == 2:
+                raise DatabaseError("boom")
+            return original(objs, *args, **kwargs)
+
+        with patch.object(Project.objects, "bulk_create", side_effect=fail_second_chunk):
+            with self.assertRaises(DatabaseError):
+                import_projects_from_csv(self._make_csv(4), chunk_size=2, publish=True)
+
+        # The first chunk stays committed; nothing is published until the import completes.
+        self.assertEqual(Project.objects.count(), 2)
+        self.assertFalse(Semester.objects.filter(is_published=True).exists())
+
+        result = import_projects_from_csv(self._make_csv(4), chunk_size=2, publish=True)
+        self.assertEqual((result.created, result.skipped), (2, 2))
+        self.assertEqual(Semester.objects.filter(is_published=True).count(), 2)
+
+    def test_uploaded_file_is_streamed_and_left_open(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        upload = SimpleUploadedFile("projects.csv", self._make_csv(3).getvalue().encode("utf-8-sig"))
+
+        result = import_projects_from_csv(upload)
+
+        self.assertEqual(result.created, 3)
+        self.assertFalse(upload.closed)
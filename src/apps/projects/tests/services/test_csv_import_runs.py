@@ -0,0 +1,107 @@
+import shutil
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.core.services.background_jobs import TransientJobError
+from apps.projects.models import Project, ProjectImportRun, Semester
+from apps.projects.services.csv_import import runs
+from apps.projects.tests.admin.test_semester import _make_superuser
+
+HEADER = "Year-Semester,ClassCode,Team#,TeamName,ProjectTitle,Organization,Industry,Col7,Abstract,StudentNames"
+
+
+def csv_upload(*rows):
+    return SimpleUploadedFile("archive.csv", "\n".join([HEADER, *rows]).encode("utf-8-sig"), content_type="text/csv")
+
+
+class ProjectImportRunTests(TestCase):
+    # noinspection PyPep8Naming,PyAttributeOutsideInit
+    def setUp(self):
+        self.temp_media_root = tempfile.mkdtemp()
+        self.media_override = override_settings(MEDIA_ROOT=self.temp_media_root)
+        self.media_override.enable()
+
+    def tearDown(self):
+        self.media_override.disable()
+        shutil.rmtree(self.temp_media_root, ignore_errors=True)
+
+    def _run(self, *rows, **kwargs):
+        return ProjectImportRun.objects.create(csv_file=csv_upload(*rows), filename="archive.csv", **kwargs)
+
+    def test_run_imports_the_stored_file_and_records_the_outcome(self):
+        run = self._run(
+            "2024-2 Fall,CSE,101,Alpha,Smart App,TechCorp,Software,,Abstract,Names",
+            "bad,CSE,102,Beta,Title,Org,Ind,,Abs,Names",
+            publish=True,
+        )
+        stored_name = run.csv_file.name
+
+        runs.execute_import_run(run.pk)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, ProjectImportRun.Status.SUCCESS)
+        self.assertEqual((run.rows_read, run.projects_created, run.semesters_created, run.error_count), (2, 1, 1, 1))
+        self.assertIn("unparseable", run.errors[0])
+        self.assertIsNotNone(run.finished_at)
+        self.assertTrue(Semester.objects.get(year=2024, season=2).is_published)
+        # The upload is removed once the run is done.
+        self.assertFalse(run.csv_file)
+        self.assertFalse(run.csv_file.storage.exists(stored_name))
+
+        runs.execute_import_run(run.pk)  # A finished run is not imported again.
+        self.assertEqual(Project.objects.count(), 1)
+
+    def test_job_retries_database_errors_and_keeps_the_file(self):
+        run = self._run("2024-2 Fall,CSE,101,Alpha,Smart App,TechCorp,Software,,Abstract,Names")
+        job = SimpleNamespace(payload={"run_id": str(run.pk)})
+
+        with patch.object(Project.objects, "bulk_create", side_effect=DatabaseError("locked")):
+            with self.assertRaises(TransientJobError):
+                runs.import_projects_csv_job(job)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, ProjectImportRun.Status.QUEUED)
+        self.assertTrue(run.csv_file)
+
+        runs.import_projects_csv_job(job)
+        run.refresh_from_db()
+        self.assertEqual((run.status, run.projects_created), (ProjectImportRun.Status.SUCCESS, 1))
+
+    def test_in_process_failure_marks_the_run_failed(self):
+        run = self._run("2024-2 Fall,CSE,101,Alpha,Smart App,TechCorp,Software,,Abstract,Names")
+
+        with patch.object(Project.objects, "bulk_create", side_effect=DatabaseError("locked")):
+            runs.execute_import_run(run.pk)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, ProjectImportRun.Status.FAILED)
+        self.assertIn("locked", run.error_message)
+
+    @override_settings(ADMIN_REQUIRE_CONFIRMATION=True, PROJECT_CSV_BACKGROUND_IMPORT_BYTES=64)
+    def test_admin_queues_large_uploads(self):
+        _make_superuser()
+        self.client.login(username="admin@example.com", password="testpass123")
+
+        with patch("apps.projects.admin.semester.schedule_import_run") as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    reverse("admin:projects_import_csv"),
+                    {
+                        "csv_file": csv_upload("2024-2 Fall,CSE,101,Alpha,Smart App,TechCorp,Software,,Abstract,Names"),
+                        "confirmation_text": "import",
+                        "publish": "1",
+                    },
+                )
+
+        run = ProjectImportRun.objects.get()
+        self.assertRedirects(response, reverse("admin:projects_projectimportrun_change", args=[run.pk]))
+        schedule.assert_called_once_with(run)
+        self.assertTrue(run.publish)
+        self.assertEqual(run.status, ProjectImportRun.Status.QUEUED)
+        self.assertEqual(Project.objects.count(), 0)
@@ -0,0 +1,59 @@
+from django.test import TestCase
+
+from apps.projects.models import Project, Semester
+from apps.projects.services.search import search_projects, search_words
+
+
+class SearchWordsTest(TestCase):
+    def test_drops_stop_words_duplicates_and_single_letters(self):
+        self.assertEqual(search_words("The Solar, solar & a B 3 panels!"), ["solar", "3", "panels"])
+
+    def test_punctuation_only_has_no_words(self):
+        self.assertEqual(search_words("C++ / -"), [])
+
+
+class SearchProjectsTest(TestCase):
+    def setUp(self):
+        self.semester = Semester.objects.create(year=2025, season=2, is_published=True)
+        self.title_match = self.create("Solar Forecasting", abstract="Dashboards for utilities")
+        self.abstract_match = self.create("Grid Dashboard", abstract="Uses solar irradiance data")
+        self.other = self.create("Water Monitor", organization="Acme Water", student_names="Jane Díaz")
+
+    def create(self, title, **kwargs):
+        return Project.objects.create(semester=self.semester, project_title=title, **kwargs)
+
+    def search(self, text, **kwargs):
+        return list(search_projects(Project.objects.order_by("id"), text, **kwargs))
+
+    def test_title_matches_rank_above_abstract_matches(self):
+        self.assertEqual(self.search("solar"), [self.title_match, self.abstract_match])
+
+    def test_words_match_as_prefixes(self):
+        self.assertEqual(self.search("forecast"), [self.title_match])
+        self.assertEqual(self.search("dash"), [self.abstract_match, self.title_match])
+
+    def test_all_words_must_match_unless_any_is_requested(self):
+        self.assertEqual(self.search("solar water"), [])
+        self.assertCountEqual(self.search("solar water", match_all=False), [*self.search("solar"), self.other])
+
+    def test_accents_are_folded(self):
+        self.assertEqual(self.search("diaz"), [self.other])
+
+    def test_index_follows_updates_bulk_writes_and_deletes(self):
+        self.other.project_title = "Solar Water Heater"
+        self.other.save()
+        self.assertIn(self.other, self.search("heater"))
+
+        Project.objects.filter(pk=self.other.pk).update(project_title="Wind Turbine")
+        self.assertEqual(self.search("heater"), [])
+        self.assertEqual(self.search("turbine"), [self.other])
+
+        (bulk,) = Project.objects.bulk_create([Project(semester=self.semester, project_title="Tidal Power")])
+        self.assertEqual([project.project_title for project in self.search("tidal")], ["Tidal Power"])
+        bulk.delete()
+        self.assertEqual(self.search("tidal"), [])
+
+    def test_queries_without_index_words_fall_back_to_substrings(self):
+        self.create("C++ Compiler")
+        self.assertEqual([project.project_title for project in self.search("C++")], ["C++ Compiler"])
+        self.assertEqual(self.search("W"), [self.other])
@@ -0,0 +1,76 @@
+import io
+
+from django.test import TestCase
+
+from apps.projects.models import PastProjectsSheetConfig, Project, ProjectStableKey, Semester
+from apps.projects.services.csv_import import import_projects_from_csv
+from apps.projects.services.share_keys import resolve_stable_keys, share_row_stable_key
+from apps.projects.services.sheet_sync import sync_past_projects
+
+CSV_HEADER = "Year-Semester,ClassCode,Team#,TeamName,ProjectTitle"
+
+
+def _key(semester_label, class_code="CSE", team_number="101"):
+    return share_row_stable_key(
+        {"semester_label": semester_label, "class_code": class_code, "team_number": team_number}
+    )
+
+
+class StableKeyIndexTest(TestCase):
+    # noinspection PyPep8Naming,PyAttributeOutsideInit
+    def setUp(self):
+        self.semester = Semester.objects.create(year=2024, season=Semester.Season.FALL)
+
+    def _project(self, **fields):
+        return Project.objects.create(
+            semester=self.semester, class_code="CSE", team_number="101", project_title="Smart App", **fields
+        )
+
+    def test_row_keys_normalize_the_semester_label(self):
+        self.assertEqual(_key("2024-2 Fall"), _key("2024   FALL"))
+        self.assertIsNone(_key("Fall 2024"))
+        self.assertIsNone(_key("2024-2 Fall", team_number=" "))
+
+    def test_saved_projects_are_indexed(self):
+        project = self._project()
+
+        self.assertEqual(resolve_stable_keys({_key("2024-2 Fall")}), {_key("2024-2 Fall"): str(project.pk)})
+
+        project.team_number = "102"
+        project.save()
+        resolved = resolve_stable_keys({_key("2024-2 Fall"), _key("2024 Fall", team_number="102")})
+        self.assertEqual(resolved, {_key("2024 Fall", team_number="102"): str(project.pk)})
+
+        project.delete()
+        self.assertFalse(ProjectStableKey.objects.exists())
+
+    def test_semester_change_rekeys_its_projects(self):
+        project = self._project()
+
+        self.semester.season = Semester.Season.SPRING
+        self.semester.save()
+
+        self.assertEqual(resolve_stable_keys({_key("2024 Spring")}), {_key("2024 Spring"): str(project.pk)})
+        self.assertEqual(resolve_stable_keys({_key("2024 Fall")}), {})
+
+    def test_sheet_project_wins_a_shared_key(self):
+        self._project(source=Project.Source.MANUAL)
+        sheet = self._project(source=Project.Source.SHEET)
+
+        with self.assertNumQueries(1):
+            resolved = resolve_stable_keys({_key("2024 Fall"), _key("2023 Fall")})
+
+        self.assertEqual(resolved, {_key("2024 Fall"): str(sheet.pk)})
+
+    def test_bulk_created_projects_are_indexed(self):
+        config = PastProjectsSheetConfig.objects.create(name="Prod", is_active=True)
+        record = {"Year-Semester": "2025-1 Spring", "Class": "ENGR", "Team#": "7", "Project Title": "Drone"}
+        sync_past_projects(config, records=[record])
+        import_projects_from_csv(io.StringIO(f"{CSV_HEADER}\n2023-2 Fall,ME,3,Beta,Bridge"))
+
+        synced = Project.objects.get(class_code="ENGR")
+        imported = Project.objects.get(class_code="ME")
+        self.assertEqual(
+            resolve_stable_keys({_key("2025 Spring", "ENGR", "7"), _key("2023 Fall", "ME", "3")}),
+            {_key("2025 Spring", "ENGR", "7"): str(synced.pk), _key("2023 Fall", "ME", "3"): str(imported.pk)},
+        )
@@ -298,3 +298,81 @@ class SyncPastProjectsRunnerTest(TestCase):
         project = Project.objects.get()
         self.assertEqual(project.project_title, "Smart App")
         self.assertEqual(project.class_code, "CSE")
+
+
+class IncrementalSheetSyncTest(TestCase):
+    def setUp(self):
+        self.config = PastProjectsSheetConfig.objects.create(name="Prod", is_active=True)
+        self.records = [_record(), _record(team="202", title="Second Project")]
+        sync_past_projects(self.config, records=self.records)
+
+    def test_unchanged_sheet_skips_the_run(self):
+        before = list(Project.objects.values_list("pk", "updated_at"))
+
+        with self.assertNumQueries(3):  # digest read, config touch, log insert
+            stats = sync_past_projects(self.config, records=self.records)
+
+        self.assertTrue(stats.sheet_unchanged)
+        self.assertEqual(stats.projects_updated, 0)
+        self.assertEqual(list(Project.objects.values_list("pk", "updated_at")), before)
+        log = PastProjectSyncLog.objects.order_by("-created_at").first()
+        self.assertTrue(log.sheet_unchanged)
+        self.assertEqual(log.rows_read, 2)
+
+    def test_force_compares_an_unchanged_sheet(self):
+        stats = sync_past_projects(self.config, records=self.records, force=True)
+
+        self.assertFalse(stats.sheet_unchanged)
+        self.assertEqual(stats.rows_unchanged, 2)
+        self.assertEqual(stats.projects_updated, 0)
+
+    def test_only_changed_rows_and_columns_are_written(self):
+        second = Project.objects.get(team_number="202")
+        records = [_record(), _record(team="202", title="Second Project", industry="Hardware")]
+
+        with patch("apps.projects.services.sheet_sync.runner.Project.objects.bulk_update") as bulk_update:
+            stats = sync_past_projects(self.config, records=records)
+
+        self.assertEqual(stats.rows_unchanged, 1)
+        self.assertEqual(stats.projects_updated, 1)
+        self.assertEqual(stats.fields_updated, 1)
+        (projects, columns), _kwargs = bulk_update.call_args
+        self.assertEqual([project.pk for project in projects], [second.pk])
+        self.assertEqual(columns, ["industry", "updated_at", "sync_fingerprint"])
+
+        log = PastProjectSyncLog.objects.order_by("-created_at").first()
+        self.assertEqual((log.rows_unchanged, log.fields_updated, log.projects_updated), (1, 1, 1))
+
+    def test_project_edited_outside_the_sync_is_restored(self):
+        project = Project.objects.get(team_number="101")
+        project.project_title = "Edited in admin"
+        project.save()
+        self.config.refresh_from_db()
+        self.assertEqual(self.config.sheet_digest, "")
+
+        stats = sync_past_projects(self.config, records=self.records)
+
+        project.refresh_from_db()
+        self.assertFalse(stats.sheet_unchanged)
+        self.assertEqual(project.project_title, "Smart App")
+        self.assertEqual(stats.projects_updated, 1)
+        self.assertEqual(stats.fields_updated, 1)
+
+    def test_deleted_sheet_project_is_recreated_from_an_unchanged_sheet(self):
+        Project.objects.get(team_number="202").delete()
+
+        stats = sync_past_projects(self.config, records=self.records)
+
+        self.assertEqual(stats.projects_created, 1)
+        self.assertTrue(Project.objects.filter(team_number="202").exists())
+
+    def test_rows_without_fingerprints_are_fingerprinted_without_an_update(self):
+        Project.objects.update(sync_fingerprint="")
+        before = dict(Project.objects.values_list("pk", "updated_at"))
+
+        stats = sync_past_projects(self.config, records=self.records, force=True)
+
+        self.assertEqual(stats.projects_updated, 0)
+        self.assertEqual(stats.rows_unchanged, 2)
+        self.assertEqual(dict(Project.objects.values_list("pk", "updated_at")), before)
+        self.assertFalse(Project.objects.filter(sync_fingerprint="").exists())
@@ -0,0 +1,88 @@
+import io
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.core.models import BackgroundJob
+from apps.core.services.background_jobs.registry import get_handler
+from apps.projects.models import Project, ProjectSimilarity, Semester
+from apps.projects.services import similarity
+from apps.projects.services.csv_import import import_projects_from_csv
+from apps.projects.services.similarity import nearest_neighbours, rebuild_similarity_index
+
+CATALOG = {
+    "solar-pump": {"project_title": "Solar Irrigation Pump", "abstract": "Photovoltaic pump for farm irrigation."},
+    "solar-drip": {"project_title": "Solar Drip Irrigation", "abstract": "Drip irrigation controller on solar power."},
+    "soil": {"project_title": "Soil Moisture Sensors", "abstract": "Sensors schedule irrigation for orchards."},
+    "clinic": {"project_title": "Clinic Scheduling App", "abstract": "Patients book clinic visits online."},
+    "telehealth": {"project_title": "Telehealth Clinic Kiosk", "abstract": "Video visits for rural patients."},
+    "robot": {"project_title": "Warehouse Robot", "abstract": "Counts pallets with computer vision."},
+}
+
+
+class NearestNeighboursTest(SimpleTestCase):
+    def test_neighbours_share_topic_and_are_ordered_by_cosine(self):
+        neighbours = nearest_neighbours(CATALOG.items(), limit=2)
+
+        self.assertEqual([doc_id for doc_id, _score in neighbours["solar-pump"]], ["solar-drip", "soil"])
+        self.assertEqual([doc_id for doc_id, _score in neighbours["clinic"]], ["telehealth"])
+        scores = [score for _doc_id, score in neighbours["solar-pump"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertTrue(all(0 < score <= 1 for score in scores))
+
+    def test_project_without_shared_terms_has_no_neighbours(self):
+        self.assertEqual(nearest_neighbours(CATALOG.items())["robot"], [])
+
+
+class SimilarityIndexTest(TestCase):
+    def setUp(self):
+        self.semester = Semester.objects.create(year=2025, season=1, is_published=True)
+        hidden = Semester.objects.create(year=2025, season=2, is_published=False)
+        self.projects = {
+            key: Project.objects.create(semester=self.semester, **fields) for key, fields in CATALOG.items()
+        }
+        self.hidden = Project.objects.create(semester=hidden, project_title="Solar Irrigation Secret")
+
+    def test_rebuild_replaces_the_table_with_published_neighbours(self):
+        ProjectSimilarity.objects.create(
+            project=self.projects["robot"], similar=self.projects["clinic"], rank=1, score=0.9
+        )
+
+        stored = rebuild_similarity_index()
+
+        self.assertEqual(stored, ProjectSimilarity.objects.count())
+        self.assertFalse(ProjectSimilarity.objects.filter(project=self.projects["robot"]).exists())
+        links = ProjectSimilarity.objects.filter(project=self.projects["solar-pump"]).order_by("rank")
+        self.assertEqual(links[0].similar, self.projects["solar-drip"])
+        self.assertEqual([link.rank for link in links], list(range(1, len(links) + 1)))
+        self.assertFalse(ProjectSimilarity.objects.filter(similar=self.hidden).exists())
+
+    @override_settings(PROJECT_SIMILARITY_REFRESH_ENABLED=True, BACKGROUND_JOBS_ENABLED=True)
+    def test_csv_import_queues_a_durable_rebuild_after_commit(self):
+        csv_text = "Year-Semester,Class,Team#,TeamName,Project Title\n2025-1 Spring,CAP,7,Sun,Solar Irrigation Valve\n"
+        with self.captureOnCommitCallbacks(execute=True):
+            import_projects_from_csv(io.StringIO(csv_text))
+
+        job = BackgroundJob.objects.get(kind=similarity.SIMILARITY_JOB_KIND)
+        get_handler(job.kind)(job)
+        valve = Project.objects.get(project_title="Solar Irrigation Valve")
+        self.assertTrue(ProjectSimilarity.objects.filter(project=valve).exists())
+
+    @override_settings(PROJECT_SIMILARITY_REFRESH_ENABLED=True, BACKGROUND_JOBS_ENABLED=True)
+    def test_queued_rebuilds_coalesce_until_one_is_claimed(self):
+        similarity.schedule_similarity_refresh()
+        similarity.schedule_similarity_refresh()
+        self.assertEqual(BackgroundJob.objects.filter(kind=similarity.SIMILARITY_JOB_KIND).count(), 1)
+
+        BackgroundJob.objects.filter(kind=similarity.SIMILARITY_JOB_KIND).update(status=BackgroundJob.Status.PROCESSING)
+        similarity.schedule_similarity_refresh()
+        self.assertEqual(BackgroundJob.objects.filter(kind=similarity.SIMILARITY_JOB_KIND).count(), 2)
+
+    @override_settings(PROJECT_SIMILARITY_REFRESH_ENABLED=True, BACKGROUND_JOBS_ENABLED=False)
+    def test_without_a_worker_the_rebuild_runs_on_one_background_thread(self):
+        with patch.object(similarity, "start_in_process_task") as start:
+            similarity.schedule_similarity_refresh()
+            similarity.schedule_similarity_refresh()
+        start.assert_called_once()
+        start.call_args.args[0]()
+        self.assertTrue(ProjectSimilarity.objects.exists())
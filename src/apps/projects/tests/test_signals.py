@@ -2,6 +2,7 @@ from django.core.cache import cache
 from django.test import TestCase
 
 from apps.projects.models import Project, Semester
+from apps.projects.services.catalog import bump_catalog_revision, catalog_revision
 from apps.projects.signals import PROJECT_ARCHIVE_VERSION_KEY
 
 
@@ -24,6 +25,17 @@ class ProjectCacheInvalidationSignalTests(TestCase):
         self.assertIsNone(cache.get("projects:past-all"))
         self.assertEqual(cache.get(PROJECT_ARCHIVE_VERSION_KEY), 8)
 
+    def test_catalog_revision_survives_a_cache_flush_without_repeating(self):
+        cache.set(PROJECT_ARCHIVE_VERSION_KEY, 7)
+        self.assertEqual(bump_catalog_revision(), 8)
+
+        cache.clear()
+        reseeded = catalog_revision()
+
+        self.assertGreater(reseeded, 8)
+        self.assertEqual(catalog_revision(), reseeded)
+        self.assertEqual(bump_catalog_revision(), reseeded + 1)
+
     def test_project_delete_clears_project_caches(self):
         semester = Semester.objects.create(year=2025, season=1, is_published=True)
         project = Project.objects.create(semester=semester, project_title="Delete Test")
@@ -10,6 +10,8 @@ from .views import (
     PastProjectShareDetailAPIView,
     PastProjectShareMineAPIView,
     ProjectDetailAPIView,
+    ProjectFacetsAPIView,
+    SimilarProjectsAPIView,
 )
 
 app_name = "projects"
@@ -19,9 +21,11 @@ urlpatterns = [
     path("past/", PastProjectsAPIView.as_view(), name="projects-past"),
     path("past-all/", AllPastProjectsAPIView.as_view(), name="projects-past-all"),
     path("archive/", CompactPastProjectsAPIView.as_view(), name="projects-archive"),
+    path("facets/", ProjectFacetsAPIView.as_view(), name="projects-facets"),
     path("past-ai-search/", PastProjectAISearchAPIView.as_view(), name="projects-past-ai-search"),
     path("past-shares/", PastProjectShareCreateAPIView.as_view(), name="projects-past-share-create"),
     path("past-shares/mine/", PastProjectShareMineAPIView.as_view(), name="projects-past-share-mine"),
     path("past-shares/<uuid:pk>/", PastProjectShareDetailAPIView.as_view(), name="projects-past-share-detail"),
     path("<uuid:pk>/", ProjectDetailAPIView.as_view(), name="project-detail"),
+    path("<uuid:pk>/similar/", SimilarProjectsAPIView.as_view(), name="project-similar"),
 ]
@@ -8,6 +8,8 @@ from .past_project_share import (
 )
 from .past_projects import PastProjectsAPIView
 from .project_detail import ProjectDetailAPIView
+from .project_facets import ProjectFacetsAPIView
+from .similar_projects import SimilarProjectsAPIView
 
 __all__ = [
     "AllPastProjectsAPIView",
@@ -18,4 +20,6 @@ __all__ = [
     "PastProjectShareMineAPIView",
     "PastProjectsAPIView",
     "ProjectDetailAPIView",
+    "ProjectFacetsAPIView",
+    "SimilarProjectsAPIView",
 ]
@@ -9,7 +9,12 @@ from rest_framework.views import APIView
 from apps.core.models import AWSCredentialConfig
 from apps.core.services.bedrock import normalize_bedrock_model_id
 from apps.projects.serializers import PastProjectAISearchSerializer, ProjectTableSerializer
-from apps.projects.services.ai_search import past_project_ai_queryset, run_past_project_ai_search
+from apps.projects.services.ai_search import (
+    ai_search_cache_key,
+    past_project_ai_queryset,
+    result_cache,
+    run_past_project_ai_search,
+)
 from apps.projects.throttles import PastProjectAISearchRateThrottle
 from apps.system_intelligence.models import AssistantConversationLog, AssistantMessageLog, SystemIntelligenceConfig
 from apps.system_intelligence.services.public_assistant import check_budget, client_ip, hash_ip, record_usage
@@ -20,6 +25,7 @@ logger = logging.getLogger(__name__)
 _BUDGET_MESSAGE = "You've reached the AI search usage limit for now. Please try again later."
 _ERROR_MESSAGE = "AI search ran into a problem. Please try again in a moment."
 _UNAVAILABLE_MESSAGE = "AI search is not configured yet. Check the AWS Bedrock credentials and model settings."
+_NO_USAGE = {"inputTokens": 0, "outputTokens": 0, "totalTokens": 0}
 
 
 def _unavailable_response(config: SystemIntelligenceConfig, query: str = "") -> Response:
@@ -35,6 +41,28 @@ def _unavailable_response(config: SystemIntelligenceConfig, query: str = "") ->
     )
 
 
+def _ordered_projects(project_ids: list[str]) -> list:
+    projects_by_id = {str(project.id): project for project in past_project_ai_queryset().filter(id__in=project_ids)}
+    return [projects_by_id[project_id] for project_id in project_ids if project_id in projects_by_id]
+
+
+def _result_summary(projects) -> list[dict]:
+    return [{"id": str(p.id), "project_title": p.project_title} for p in projects]
+
+
+def _results_response(query: str, projects, usage: dict, *, cached: bool) -> Response:
+    return Response(
+        {
+            "available": True,
+            "query": query,
+            "results": ProjectTableSerializer(projects, many=True).data,
+            "usage": usage,
+            "cached": cached,
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
 class PastProjectAISearchAPIView(APIView):
     permission_classes = [IsAuthenticated]
     throttle_classes = [PastProjectAISearchRateThrottle]
@@ -66,6 +94,26 @@ class PastProjectAISearchAPIView(APIView):
             )
             return _unavailable_response(config, query)
 
+        cache_key = ai_search_cache_key(query, limit=limit, model_id=model_id)
+        cached = result_cache.cached_answer(cache_key)
+        if cached is not None:
+            # Repeat queries cost no tokens, so they are served even past the budget.
+            ordered_projects = _ordered_projects(cached["project_ids"])
+            log_assistant_turn(
+                source=AssistantConversationLog.SOURCE_AI_SEARCH,
+                session_id=None,
+                ip_hash=ip_hash,
+                user=request.user,
+                prompt=query,
+                results=_result_summary(ordered_projects),
+                status=AssistantMessageLog.STATUS_OK,
+                model_id=model_id,
+                cache_hit=True,
+                saved_tokens=cached["total_tokens"],
+                config=config,
+            )
+            return _results_response(query, ordered_projects, _NO_USAGE, cached=True)
+
         if not check_budget(ip_hash, config.public_assistant_ip_token_limit):
             log_assistant_turn(
                 source=AssistantConversationLog.SOURCE_AI_SEARCH,
@@ -108,9 +156,8 @@ class PastProjectAISearchAPIView(APIView):
         spent = usage.get("totalTokens") or 0
         record_usage(ip_hash, spent, config.public_assistant_ip_token_window_seconds)
 
-        project_ids = outcome.get("project_ids") or []
-        projects_by_id = {str(project.id): project for project in past_project_ai_queryset().filter(id__in=project_ids)}
-        ordered_projects = [projects_by_id[project_id] for project_id in project_ids if project_id in projects_by_id]
+        ordered_projects = _ordered_projects(outcome.get("project_ids") or [])
+        result_cache.store_answer(cache_key, project_ids=[str(project.id) for project in ordered_projects], usage=usage)
 
         log_assistant_turn(
             source=AssistantConversationLog.SOURCE_AI_SEARCH,
@@ -118,7 +165,7 @@ class PastProjectAISearchAPIView(APIView):
             ip_hash=ip_hash,
             user=request.user,
             prompt=query,
-            results=[{"id": str(p.id), "project_title": p.project_title} for p in ordered_projects],
+            results=_result_summary(ordered_projects),
             status=AssistantMessageLog.STATUS_OK,
             model_id=model_id,
             token_usage=usage,
@@ -126,12 +173,4 @@ class PastProjectAISearchAPIView(APIView):
             config=config,
         )
 
-        return Response(
-            {
-                "available": True,
-                "query": query,
-                "results": ProjectTableSerializer(ordered_projects, many=True).data,
-                "usage": usage,
-            },
-            status=status.HTTP_200_OK,
-        )
+        return _results_response(query, ordered_projects, usage, cached=False)
@@ -1,10 +1,19 @@
-from django.core.cache import cache
+from rest_framework import status
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from apps.core.services.cache import tiered_cache
+from apps.core.utils.http_cache import encode_public_json, public_json_response
+
 from ..models import Project
-from ..serializers import ProjectTableSerializer
+from ..serializers import PastProjectDeltaQuerySerializer, ProjectTableSerializer
+from ..services.catalog import catalog_changes, catalog_watermark, prune_tombstones
+
+PAST_PROJECTS_CACHE_KEY = "projects:past-all"
+PAST_PROJECTS_CACHE_TAG = "projects"
+PAST_PROJECTS_CACHE_TIMEOUT = 600
+CATALOG_REVISION_HEADER = "X-Catalog-Revision"
 
 
 class AllPastProjectsAPIView(ListAPIView):
@@ -13,6 +22,10 @@ class AllPastProjectsAPIView(ListAPIView):
     Past projects come from the Google Sheet sync, which publishes the semesters it imports, so the
     newest published semester is a real past semester (e.g. the most recently completed term) and is
     included — it is never treated as a hidden "current" semester.
+
+    The full list is rendered and gzipped once per catalog revision; its ETag is that revision, which
+    is also sent as ``X-Catalog-Revision``. ``?since=<revision>`` returns only the projects changed
+    and the IDs removed after it, so a client holding a copy can catch up without the full list.
     """
 
     permission_classes = [AllowAny]
@@ -27,11 +40,45 @@ class AllPastProjectsAPIView(ListAPIView):
             .order_by("-semester__year", "-semester__season", "class_code", "team_number")
         )
 
+    def _build_catalog(self):
+        # Read the watermark before the rows: a write landing in between is then
+        # newer than the revision the client is given and reappears in its next delta.
+        revision = catalog_watermark()
+        prune_tombstones()
+        encoded = encode_public_json(self.get_serializer(self.get_queryset(), many=True).data)
+        return encoded._replace(etag=f'"{revision}"')
+
     def list(self, request, *args, **kwargs):
-        cache_key = "projects:past-all"
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return Response(cached)
-        response = super().list(request, *args, **kwargs)
-        cache.set(cache_key, response.data, timeout=600)
+        if "since" in request.query_params:
+            return self._delta(request)
+        encoded = tiered_cache.get_or_build(
+            PAST_PROJECTS_CACHE_KEY,
+            self._build_catalog,
+            PAST_PROJECTS_CACHE_TIMEOUT,
+            tags=(PAST_PROJECTS_CACHE_TAG,),
+        )
+        response = public_json_response(request, encoded)
+        response[CATALOG_REVISION_HEADER] = encoded.etag.strip('"')
+        return response
+
+    def _delta(self, request):
+        query_serializer = PastProjectDeltaQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        revision = catalog_watermark()
+        changes = catalog_changes(query_serializer.validated_data["since"])
+        if changes is None:
+            return Response(
+                {"detail": "This revision is too old; reload the full list.", "code": "revision_expired"},
+                status=status.HTTP_410_GONE,
+            )
+        changed = self.get_queryset().filter(pk__in=changes.changed.values("pk"))
+        response = public_json_response(
+            request,
+            {
+                "revision": revision,
+                "changed": self.get_serializer(changed, many=True).data,
+                "deleted": changes.deleted,
+            },
+        )
+        response[CATALOG_REVISION_HEADER] = str(revision)
         return response
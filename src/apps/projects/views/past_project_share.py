@@ -1,5 +1,6 @@
+from django.core.cache import cache
 from rest_framework import status
-from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveUpdateDestroyAPIView
+from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveUpdateDestroyAPIView, get_object_or_404
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
@@ -9,8 +10,18 @@ from ..serializers import (
     PastProjectShareSerializer,
     StalePastProjectShareSnapshot,
 )
+from ..services.catalog import catalog_revision, revision_from_datetime
 from ..throttles import PastProjectShareRateThrottle
 
+SHARE_PAYLOAD_CACHE_TIMEOUT = 3600
+# Depend on the request, so they are left out of the cached payload.
+SHARE_REQUEST_FIELDS = ("share_url", "can_edit")
+
+
+def share_payload_cache_key(share) -> str:
+    """Cache key of a share's payload: changes with every edit of the share and every catalog change."""
+    return f"projects:share:{share.pk}:{revision_from_datetime(share.updated_at)}:{catalog_revision()}"
+
 
 class PastProjectShareCreateAPIView(CreateAPIView):
     permission_classes = [IsAuthenticated]
@@ -39,6 +50,23 @@ class PastProjectShareDetailAPIView(RetrieveUpdateDestroyAPIView):
             return [IsAuthenticated()]
         return [AllowAny()]
 
+    def retrieve(self, request, *args, **kwargs):
+        # Share links are opened far more often than they change: the payload, with its backfilled
+        # project IDs, is cached per share edit and catalog revision, so a warm read only loads the
+        # share's ID, owner and timestamp instead of its rows.
+        share = get_object_or_404(PastProjectShare.objects.only("pk", "updated_at", "created_by"), pk=kwargs["pk"])
+        self.check_object_permissions(request, share)
+        payload = cache.get(share_payload_cache_key(share))
+        if payload is None:
+            full_share = get_object_or_404(PastProjectShare, pk=share.pk)
+            data = self.get_serializer(full_share).data
+            payload = {field: value for field, value in data.items() if field not in SHARE_REQUEST_FIELDS}
+            cache.set(share_payload_cache_key(full_share), payload, SHARE_PAYLOAD_CACHE_TIMEOUT)
+        serializer = self.get_serializer(share)
+        return Response(
+            {**payload, "share_url": serializer.get_share_url(share), "can_edit": serializer.get_can_edit(share)}
+        )
+
     def update(self, request, *args, **kwargs):
         # Re-filter by owner (not get_object) so a non-owner gets 404, not 403,
         # and existence is not leaked. Mirrors the delete path below.
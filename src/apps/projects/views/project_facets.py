@@ -0,0 +1,18 @@
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from apps.core.utils.http_cache import public_json_response
+
+from ..serializers import ProjectFacetQuerySerializer
+from ..services.facets import project_facets
+
+
+class ProjectFacetsAPIView(APIView):
+    """Year, season, semester and industry counts for the archive filters, optionally for a search."""
+
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        query_serializer = ProjectFacetQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        return public_json_response(request, project_facets(query_serializer.validated_data.get("search", "")))
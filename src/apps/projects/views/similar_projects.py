@@ -0,0 +1,25 @@
+from django.shortcuts import get_object_or_404
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from apps.core.utils.http_cache import public_json_response
+
+from ..models import Project, ProjectSimilarity
+from ..serializers import SimilarProjectSerializer
+
+
+class SimilarProjectsAPIView(APIView):
+    """Precomputed nearest neighbours of a published project, closest first."""
+
+    permission_classes = [AllowAny]
+
+    def get(self, request, pk):
+        get_object_or_404(Project.objects.filter(semester__is_published=True), pk=pk)
+        links = (
+            ProjectSimilarity.objects.filter(project_id=pk, similar__semester__is_published=True)
+            .select_related("similar__semester")
+            .order_by("rank")
+        )
+        return public_json_response(
+            request, {"project_id": str(pk), "results": SimilarProjectSerializer(links, many=True).data}
+        )
@@ -45,7 +45,7 @@ class AssistantMessageLogInline(TabularInline):
     """Read-only per-turn detail inside a conversation."""
 
     model = AssistantMessageLog
-    fields = ("prompt_short", "reply", "status", "token_total", "created_at")
+    fields = ("prompt_short", "reply", "status", "token_total", "cache_hit", "created_at")
     readonly_fields = fields
     extra = 0
     max_num = 0
@@ -74,6 +74,7 @@ class AssistantConversationLogAdmin(ReadOnlyModelAdmin):
         "user",
         "message_count",
         "total_tokens",
+        "saved_tokens",
         "last_activity_at",
     )
     list_filter = ("source", "last_activity_at")
@@ -90,6 +91,8 @@ class AssistantConversationLogAdmin(ReadOnlyModelAdmin):
         "user",
         "message_count",
         "total_tokens",
+        "cache_hits",
+        "saved_tokens",
         "last_activity_at",
         "created_at",
         "updated_at",
@@ -107,6 +110,8 @@ class AssistantConversationLogAdmin(ReadOnlyModelAdmin):
                     "ip_hash",
                     "message_count",
                     "total_tokens",
+                    "cache_hits",
+                    "saved_tokens",
                     "last_activity_at",
                 )
             },
@@ -148,6 +153,8 @@ class AssistantConversationLogAdmin(ReadOnlyModelAdmin):
                 f"Output: {_token_value(usage, 'outputTokens'):,}",
                 f"Latency: {message.latency_ms:,} ms",
             ]
+            if message.cache_hit:
+                meta.append(f"Cached: saved {message.saved_tokens:,} tokens")
             if message.model_id:
                 meta.append(message.model_id)
             if message.created_at:
@@ -207,8 +214,17 @@ class AssistantConversationLogAdmin(ReadOnlyModelAdmin):
 class AssistantMessageLogAdmin(ReadOnlyModelAdmin):
     """Read-only, flat per-message audit view."""
 
-    list_display = ("created_at", "status_badge", "model_id", "token_total", "latency_ms", "prompt_short")
-    list_filter = ("status", "created_at")
+    list_display = (
+        "created_at",
+        "status_badge",
+        "model_id",
+        "token_total",
+        "cache_hit",
+        "saved_tokens",
+        "latency_ms",
+        "prompt_short",
+    )
+    list_filter = ("status", "cache_hit", "created_at")
     list_select_related = ("conversation",)
     search_fields = ("prompt", "reply")
     date_hierarchy = "created_at"
@@ -0,0 +1,38 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("system_intelligence", "0007_public_assistant_token_budget"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="assistantconversationlog",
+            name="cache_hits",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Denormalized count of turns answered from the result cache without a model call."
+            ),
+        ),
+        migrations.AddField(
+            model_name="assistantconversationlog",
+            name="saved_tokens",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Denormalized sum of the tokens cache hits avoided spending."
+            ),
+        ),
+        migrations.AddField(
+            model_name="assistantmessagelog",
+            name="cache_hit",
+            field=models.BooleanField(
+                default=False, help_text="Answered from the result cache; no model call was made."
+            ),
+        ),
+        migrations.AddField(
+            model_name="assistantmessagelog",
+            name="saved_tokens",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Tokens the original model call spent, avoided by this cache hit."
+            ),
+        ),
+    ]
@@ -107,6 +107,14 @@ class AssistantConversationLog(ProjectControlModel):
         default=0,
         help_text="Denormalized sum of totalTokens across this conversation's turns.",
     )
+    cache_hits = models.PositiveIntegerField(
+        default=0,
+        help_text="Denormalized count of turns answered from the result cache without a model call.",
+    )
+    saved_tokens = models.PositiveIntegerField(
+        default=0,
+        help_text="Denormalized sum of the tokens cache hits avoided spending.",
+    )
     last_activity_at = models.DateTimeField(
         db_index=True,
         help_text="Timestamp of the most recent recorded turn.",
@@ -180,6 +188,14 @@ class AssistantMessageLog(ProjectControlModel):
         default=0,
         help_text="Wall-clock latency of the model call in milliseconds.",
     )
+    cache_hit = models.BooleanField(
+        default=False,
+        help_text="Answered from the result cache; no model call was made.",
+    )
+    saved_tokens = models.PositiveIntegerField(
+        default=0,
+        help_text="Tokens the original model call spent, avoided by this cache hit.",
+    )
 
     class Meta:
         ordering = ["created_at"]
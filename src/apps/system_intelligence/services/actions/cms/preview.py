@@ -8,6 +8,7 @@ from django.utils import timezone
 
 from apps.cms.models import CMSBlock, CMSPage
 from apps.cms.models.content.cms.cms_page import normalize_cms_route
+from apps.cms.views.cms import clear_cms_page_cache
 
 from ..constants import PREVIEW_TTL_SECONDS
 
@@ -64,8 +65,6 @@ def build_preview_url(route: str, token: str) -> str:
 
 
 def clear_cms_cache(old_route: str, new_route: str, preview_token: str) -> None:
-    if old_route:
-        cache.delete(f"cms:page:{old_route}")
-    cache.delete(f"cms:page:{new_route}")
+    clear_cms_page_cache(old_route, new_route)
     if preview_token:
         cache.delete(f"cms:preview:{preview_token}")
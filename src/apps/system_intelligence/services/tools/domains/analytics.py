@@ -1,7 +1,7 @@
 from typing import Any
 
-from django.db.models import Count
-from django.db.models.functions import TruncDay, TruncHour, TruncMonth
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth
 
 from apps.system_intelligence.services.actions.utils import json_safe
 
@@ -48,13 +48,28 @@ def _page_view_queryset(path=None, date_from=None, date_to=None):
 
 
 def _get_page_view_summary(path=None, date_from=None, date_to=None) -> dict[str, Any]:
+    from apps.cms.services.analytics import rollup_queryset
+
+    path_days = rollup_queryset("day", path=path, date_from=date_from, date_to=date_to).order_by()
+    # Unique counts are per day, summed; site-wide rows count a visitor once per day, not once per page.
+    days = path_days if path else rollup_queryset("day", date_from=date_from, date_to=date_to, site_wide=True)
+    totals = days.order_by().aggregate(
+        views=Sum("views"),
+        sessions=Sum("unique_sessions"),
+        visitors=Sum("unique_visitors"),
+        member_views=Sum("member_views"),
+        anonymous_views=Sum("anonymous_views"),
+    )
+    # Raw rows, which may be pruned, only back the sample of recent views.
     qs = _page_view_queryset(path, date_from, date_to)
     return {
         "filters": {"path": path, "date_from": date_from, "date_to": date_to},
-        "total_views": qs.count(),
-        "unique_paths": qs.values("path").distinct().count(),
-        "known_members": qs.exclude(member_id=None).values("member_id").distinct().count(),
-        "sessions": qs.exclude(session_key="").values("session_key").distinct().count(),
+        "total_views": totals["views"] or 0,
+        "unique_paths": path_days.values("path").distinct().count(),
+        "member_views": totals["member_views"] or 0,
+        "anonymous_views": totals["anonymous_views"] or 0,
+        "sessions": totals["sessions"] or 0,
+        "visitors": totals["visitors"] or 0,
         "recent_views": queryset_payload(
             qs.order_by("-timestamp"), ["path", "member_id", "session_key", "timestamp"], limit=10
         )["rows"],
@@ -62,9 +77,11 @@ def _get_page_view_summary(path=None, date_from=None, date_to=None) -> dict[str,
 
 
 def _get_top_paths(date_from=None, date_to=None, limit=None) -> dict[str, Any]:
-    qs = _page_view_queryset(date_from=date_from, date_to=date_to)
+    from apps.cms.services.analytics import rollup_queryset
+
+    qs = rollup_queryset("day", date_from=date_from, date_to=date_to).order_by()
     row_limit = bounded_limit(limit)
-    rows = list(qs.values("path").annotate(views=Count("id")).order_by("-views", "path")[:row_limit])
+    rows = list(qs.values("path").annotate(views=Sum("views")).order_by("-views", "path")[:row_limit])
     return {
         "filters": {"date_from": date_from, "date_to": date_to},
         "shown": len(rows),
@@ -74,14 +91,20 @@ def _get_top_paths(date_from=None, date_to=None, limit=None) -> dict[str, Any]:
 
 
 def _get_page_view_trend(path=None, date_from=None, date_to=None, granularity="day", limit=None) -> dict[str, Any]:
-    qs = _page_view_queryset(path, date_from, date_to)
-    trunc = {"hour": TruncHour, "day": TruncDay, "month": TruncMonth}.get((granularity or "day").lower(), TruncDay)
+    from apps.cms.services.analytics import rollup_queryset
+
+    granularity_key = (granularity or "day").lower()
+    hourly = granularity_key == "hour"
+    qs = rollup_queryset("hour" if hourly else "day", path=path, date_from=date_from, date_to=date_to).order_by()
+    if hourly:
+        period = F("hour")
+    elif granularity_key == "month":
+        period = TruncMonth("day")
+    else:
+        period = F("day")
     row_limit = bounded_limit(limit, default=30)
     rows = list(
-        qs.annotate(period=trunc("timestamp"))
-        .values("period")
-        .annotate(views=Count("id"))
-        .order_by("-period")[:row_limit]
+        qs.annotate(period=period).values("period").annotate(views=Sum("views")).order_by("-period")[:row_limit]
     )
     rows.reverse()
     return {
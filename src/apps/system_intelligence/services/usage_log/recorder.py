@@ -47,13 +47,16 @@ def log_assistant_turn(
     model_id="",
     token_usage=None,
     latency_ms=0,
+    cache_hit=False,
+    saved_tokens=0,
     config=None,
 ) -> None:
     """Persist one audited assistant turn. Never raises.
 
     A garbage/blank ``session_id`` is treated as None (standalone
     conversation). Callers that already loaded the active config may pass it in
-    via ``config`` to avoid a second DB read.
+    via ``config`` to avoid a second DB read. A turn answered from a result
+    cache passes ``cache_hit=True`` and the tokens it avoided as ``saved_tokens``.
     """
     try:
         if config is None:
@@ -66,6 +69,7 @@ def log_assistant_turn(
         now = timezone.now()
         session_uuid = _coerce_session_uuid(session_id)
         spent = token_usage.get("totalTokens") or 0
+        hits = 1 if cache_hit else 0
 
         with transaction.atomic():
             # New conversations are created with this turn's counters baked in
@@ -81,6 +85,8 @@ def log_assistant_turn(
                         "user": user,
                         "message_count": 1,
                         "total_tokens": spent,
+                        "cache_hits": hits,
+                        "saved_tokens": saved_tokens,
                         "last_activity_at": now,
                     },
                 )
@@ -92,6 +98,8 @@ def log_assistant_turn(
                     user=user,
                     message_count=1,
                     total_tokens=spent,
+                    cache_hits=hits,
+                    saved_tokens=saved_tokens,
                     last_activity_at=now,
                 )
 
@@ -104,15 +112,26 @@ def log_assistant_turn(
                 model_id=model_id or "",
                 token_usage=token_usage,
                 latency_ms=latency_ms,
+                cache_hit=cache_hit,
+                saved_tokens=saved_tokens,
             )
 
             if not created:
                 # F() expressions so concurrent turns on the same session
                 # increment atomically in the database (no lost updates from
                 # read-modify-write races).
-                update_fields = ["message_count", "total_tokens", "last_activity_at", "updated_at"]
+                update_fields = [
+                    "message_count",
+                    "total_tokens",
+                    "cache_hits",
+                    "saved_tokens",
+                    "last_activity_at",
+                    "updated_at",
+                ]
                 conversation.message_count = F("message_count") + 1
                 conversation.total_tokens = F("total_tokens") + spent
+                conversation.cache_hits = F("cache_hits") + hits
+                conversation.saved_tokens = F("saved_tokens") + saved_tokens
                 conversation.last_activity_at = now
                 if not conversation.ip_hash and ip_hash:
                     conversation.ip_hash = ip_hash
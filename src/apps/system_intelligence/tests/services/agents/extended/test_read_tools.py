@@ -16,6 +16,7 @@ from apps.cms.models import (
     SiteSettings,
     StyleSheet,
 )
+from apps.cms.services.analytics import refresh_page_view_rollups
 from apps.event.models import CheckIn, CheckInRecord, CurrentProject, CurrentProjectSchedule, Question
 from apps.event.tests.helpers import make_event, make_member, make_registration, make_superuser, make_ticket
 from apps.mail.models import EmailCampaign, RecipientLog
@@ -195,6 +196,7 @@ class SystemIntelligenceExtendedToolTests(TransactionTestCase):
             error_message="Rejected",
         )
         PageView.objects.create(path="/event", member=member, session_key="session-1")
+        refresh_page_view_rollups()
 
         return {
             "member": member,
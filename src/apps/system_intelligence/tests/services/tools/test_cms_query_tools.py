@@ -4,10 +4,12 @@ from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
 
 from apps.cms.models import CMSPage, NewsArticle, PageView
+from apps.cms.services.analytics import refresh_page_view_rollups
 from apps.core.services.db_tools.tool_modules.analytics import get_page_views
 from apps.core.services.db_tools.tool_modules.cms import search_cms_pages, search_news
 from apps.core.services.db_tools.tool_modules.custom.query import is_allowed_query_key, run_custom_query
 from apps.projects.models import Semester
+from apps.system_intelligence.services.tools.domains.analytics import _get_page_view_summary
 
 
 class SearchCmsPagesToolTests(TestCase):
@@ -71,6 +73,7 @@ class GetPageViewsToolTests(TestCase):
         PageView.objects.create(path="/about")
         PageView.objects.create(path="/about")
         PageView.objects.create(path="/contact")
+        refresh_page_view_rollups()
 
     def test_returns_total_views(self):
         result = get_page_views({})
@@ -85,6 +88,30 @@ class GetPageViewsToolTests(TestCase):
         self.assertEqual(result, "Page view count: 3")
 
 
+class PageViewSummaryToolTests(TestCase):
+    def setUp(self):
+        PageView.objects.create(path="/about", session_key="a", ip_address="1.1.1.1")
+        PageView.objects.create(path="/contact", session_key="a", ip_address="1.1.1.1")
+        PageView.objects.create(path="/about/team", session_key="b", ip_address="2.2.2.2")
+        refresh_page_view_rollups()
+        # Pruned raw rows still count through the rollups.
+        PageView.objects.filter(path="/contact").delete()
+
+    def test_site_wide_totals_come_from_the_rollups(self):
+        summary = _get_page_view_summary()
+
+        self.assertEqual((summary["total_views"], summary["unique_paths"]), (3, 3))
+        self.assertEqual((summary["sessions"], summary["visitors"]), (2, 2))
+        self.assertEqual(summary["anonymous_views"], 3)
+        self.assertEqual(len(summary["recent_views"]), 2)
+
+    def test_path_filter_uses_the_per_path_rollups(self):
+        summary = _get_page_view_summary(path="/about")
+
+        self.assertEqual((summary["total_views"], summary["unique_paths"], summary["sessions"]), (2, 2, 2))
+        self.assertFalse(_get_page_view_summary(date_from="2000-01-01", date_to="2000-01-02")["total_views"])
+
+
 class RunCustomQueryToolTests(TestCase):
     def setUp(self):
         self.sem = Semester.objects.create(year=2025, season=1, is_published=True)
@@ -23,7 +23,7 @@ from django.urls import include, path
 from django.views.static import serve as static_serve
 
 from apps.authn.views.admin.login import AdminLoginView
-from apps.cms.views import LayoutAPIView, LayoutStylesheetView
+from apps.cms.views import LayoutAPIView, LayoutStylesheetView, LayoutVersionedStylesheetView
 from apps.core.middleware import csp_report
 from apps.core.views import MaintenanceBypassView, robots_txt, root_index, sitemap_xml
 
@@ -51,6 +51,12 @@ urlpatterns = [
     path("layout/", LayoutAPIView.as_view(), name="layout-data"),
     # render-blocking stylesheet (linked from index.html to prevent FOUC)
     path("layout/styles.css", LayoutStylesheetView.as_view(), name="layout-styles"),
+    # the same stylesheet under its content hash, served immutable (URL is in the layout payload)
+    path(
+        "layout/stylesheet.<str:digest>.css",
+        LayoutVersionedStylesheetView.as_view(),
+        name="layout-stylesheet-versioned",
+    ),
     # event
     path("event/", include("apps.event.urls")),
     # news
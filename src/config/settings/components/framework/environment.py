@@ -62,6 +62,68 @@ BACKGROUND_JOB_METRICS_NAMESPACE = os.environ.get(
     "",
 ).strip()
 
+# Page-view ingestion. "redis" (a shared stream drained by the durable worker),
+# "spool" (an append-only file shared by the web processes on one host) or
+# "memory" (per-process; local development and tests only).
+PAGEVIEW_INGEST_BACKEND = os.environ.get("PAGEVIEW_INGEST_BACKEND", "memory").strip().lower()
+PAGEVIEW_SPOOL_DIR = os.environ.get("PAGEVIEW_SPOOL_DIR", "").strip()
+# Raw page views older than this many days are pruned by the hourly rollup
+# repair (and ``rollup_page_views``) once rolled up; 0 keeps them forever.
+PAGEVIEW_RAW_RETENTION_DAYS = int(os.environ.get("PAGEVIEW_RAW_RETENTION_DAYS", "90"))
+# Let drains queue the hourly rollup repair and prune (a ``cms.pageview_rollup``
+# job, or a background thread without a worker).
+PAGEVIEW_ROLLUP_REPAIR_ENABLED = os.environ.get("PAGEVIEW_ROLLUP_REPAIR_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+}
+
+# Process-local (L1) tier of ``apps.core.services.cache`` in front of the shared
+# cache for hot public payloads. Seconds an L1 copy may be served; 0 disables it.
+TIERED_CACHE_L1_TTL = float(os.environ.get("TIERED_CACHE_L1_TTL", "5"))
+TIERED_CACHE_L1_MAX_ENTRIES = int(os.environ.get("TIERED_CACHE_L1_MAX_ENTRIES", "256"))
+# Seconds a stale copy outlives its entry, served while one request rebuilds it.
+TIERED_CACHE_STALE_TTL = int(os.environ.get("TIERED_CACHE_STALE_TTL", "300"))
+# Single-flight build lock: "cache" (atomic add / Redis SET NX) or "database"
+# (PostgreSQL advisory lock, for shared caches without an atomic add).
+CACHE_BUILD_LOCK_BACKEND = os.environ.get("CACHE_BUILD_LOCK_BACKEND", "cache").strip().lower()
+# Rebuild the public CMS caches a publish invalidated (pages, homepage, layout)
+# right after it commits, instead of on the first visitor's request.
+CMS_CACHE_WARMING_ENABLED = os.environ.get("CMS_CACHE_WARMING_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+}
+# Generate resized WebP/JPEG variants of uploaded CMS images (a
+# ``cms.asset_derivatives`` job, or a background thread without a worker).
+CMS_IMAGE_DERIVATIVES_ENABLED = os.environ.get("CMS_IMAGE_DERIVATIVES_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+}
+# Rebuild the precomputed similar-projects table after the sheet sync and CSV
+# import (a ``projects.similarity_index`` job, or a background thread).
+PROJECT_SIMILARITY_REFRESH_ENABLED = os.environ.get("PROJECT_SIMILARITY_REFRESH_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+}
+# Admin CSV project uploads of at least this many bytes are imported by a
+# background ``projects.csv_import`` run instead of inside the request.
+PROJECT_CSV_BACKGROUND_IMPORT_BYTES = int(os.environ.get("PROJECT_CSV_BACKGROUND_IMPORT_BYTES", str(1024 * 1024)))
+# Reuse authorized Google Sheets clients and spreadsheet handles across syncs
+# in a process (one client per service-account key, until its token expires).
+GOOGLE_SHEETS_CLIENT_POOL_ENABLED = os.environ.get("GOOGLE_SHEETS_CLIENT_POOL_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+}
+# Seconds an AI project search answer is reused for the same normalized query,
+# limit, catalog revision and model; answers with no matches use the shorter
+# negative TTL. 0 disables the cache.
+PROJECT_AI_SEARCH_CACHE_TTL = int(os.environ.get("PROJECT_AI_SEARCH_CACHE_TTL", "3600"))
+PROJECT_AI_SEARCH_NEGATIVE_CACHE_TTL = int(os.environ.get("PROJECT_AI_SEARCH_NEGATIVE_CACHE_TTL", "300"))
+
 # ---------------------------------------------------------------------------
 # Internationalization / timezone
 # ---------------------------------------------------------------------------
@@ -114,10 +114,11 @@ UNFOLD = {
             ],
         },
         {
-            "models": ["projects.project", "projects.semester"],
+            "models": ["projects.project", "projects.semester", "projects.projectimportrun"],
             "items": [
                 {"title": "Projects", "link": "/admin/projects/project/"},
                 {"title": "Semesters", "link": "/admin/projects/semester/"},
+                {"title": "CSV Imports", "link": "/admin/projects/projectimportrun/"},
             ],
         },
         {
@@ -215,3 +215,13 @@ CACHES = (
         }
     }
 )
+
+# The file-based fallback cache cannot add atomically across processes, so
+# single-flight rebuilds lock in PostgreSQL instead.
+CACHE_BUILD_LOCK_BACKEND = (
+    os.environ.get("CACHE_BUILD_LOCK_BACKEND", "cache" if REDIS_URL else "database").strip().lower()
+)
+
+# Page views must survive gunicorn's multiple processes and abrupt restarts, so
+# production never uses the per-process in-memory stand-in.
+PAGEVIEW_INGEST_BACKEND = os.environ.get("PAGEVIEW_INGEST_BACKEND", "redis" if REDIS_URL else "spool").strip().lower()
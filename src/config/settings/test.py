@@ -37,3 +37,20 @@ ADMIN_REQUIRE_CONFIRMATION = os.environ.get("ADMIN_REQUIRE_CONFIRMATION", "false
     "true",
     "yes",
 }
+
+# Tests seed and clear the shared cache directly; keep the per-process L1 tier
+# out of the way unless a test enables it explicitly.
+TIERED_CACHE_L1_TTL = 0
+
+# Tests assert on the caches a publish leaves cold; warming is exercised
+# explicitly where it is under test.
+CMS_CACHE_WARMING_ENABLED = False
+
+# Uploads in unrelated tests must not resize images on background threads.
+CMS_IMAGE_DERIVATIVES_ENABLED = False
+# Drains in unrelated tests must not recompute rollups or prune on background threads.
+PAGEVIEW_ROLLUP_REPAIR_ENABLED = False
+# Syncs and imports in unrelated tests must not rebuild the similar-projects index on threads.
+PROJECT_SIMILARITY_REFRESH_ENABLED = False
+# Sheet tests patch gspread per test; pooled clients would outlive the patch.
+GOOGLE_SHEETS_CLIENT_POOL_ENABLED = False